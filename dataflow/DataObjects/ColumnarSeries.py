@@ -0,0 +1,340 @@
+'''
+Created on 18.10.2026
+
+@author: yvo
+'''
+
+from collections.abc import MutableMapping
+import datetime
+
+import numpy
+import pandas
+
+from dataflow.DataObjects.Enumerations.GlamosEnum import GlamosEnum
+from dataflow.DataObjects.MassBalanceIndexSpatialDaily import MassBalanceIndexSpatialDaily
+from dataflow.DataObjects.MassBalanceIndexTimeDaily import MassBalanceIndexTimeDaily
+from dataflow.DataObjects.MassBalancePoint import MassBalancePoint
+from dataflow.DataObjects.MassBalanceSwissWide import MassBalanceSwissWide
+
+class ColumnarSeries(MutableMapping):
+    '''
+    Time series of data objects of one type stored as struct of arrays (one NumPy column per member).
+    The series can be used everywhere a dictionary of data objects is expected (e.g. the series of a glacier).
+
+    Adding a data object appends its members to the growable column buffers, the object itself is not kept.
+    Reading an item creates a new data object from the row (object view). Changes of an object view are
+    therefore not written back to the series.
+
+    The columns are given as tuples (name, type) with the name of the property of the data object (member
+    _<name>) and a type of DataFrameBuilder. By default, the columns of the data object type (COLUMNS) are used,
+    the data frame of the series has therefore the same columns for a dictionary and a ColumnarSeries. The
+    columns are stored as:
+        - int              int64 column. None values are marked as missing.
+        - Enumeration      int64 column of the codes. Members are stored by their code, None values are marked as missing.
+        - float            float64 column. None values are marked as missing, NaN values are kept.
+        - datetime.date    datetime64[D] column. None values are NaT.
+        - Date format      Object column of the string dates.
+        - object           Object column for strings, keys and other values.
+
+    Attributes:
+        - __INITIAL_CAPACITY     Initial number of rows of the column buffers.
+        - __SUPPORTED_CLASSES    Data object types stored with their columns by default.
+        - __DTYPES               NumPy data types of the stored column types.
+        - _dataObjectClass   Type of the data objects of the series.
+        - _columns           Stored columns (name, type) of the series.
+        - _buffers           Dictionary of the column buffers with the column name as key.
+        - _missings          Dictionary of the missing-value masks of the int and float columns.
+        - _keys              Keys of the rows in the order of insertion.
+        - _rowIndexes        Dictionary of the row index with the key as key.
+        - _numberRows        Number of rows used of the buffers.
+    '''
+
+    __INITIAL_CAPACITY = 64
+
+    __SUPPORTED_CLASSES = (
+        MassBalanceIndexTimeDaily,
+        MassBalanceIndexSpatialDaily,
+        MassBalancePoint,
+        MassBalanceSwissWide)
+
+    __DTYPES = {
+        int:           numpy.int64,
+        float:         numpy.float64,
+        datetime.date: "datetime64[D]",
+        object:        object}
+
+    _dataObjectClass = None
+    _columns = None
+    _buffers = None
+    _missings = None
+    _keys = None
+    _rowIndexes = None
+    _numberRows = None
+
+    @staticmethod
+    def isSupported(dataObjectClass):
+        '''
+        Checks if columns are defined by default for the given type of data objects.
+
+        @type dataObjectClass: type
+        @param dataObjectClass: Type of the data objects.
+
+        @rtype: bool
+        @return: True if the type can be stored without giving the columns.
+        '''
+
+        return dataObjectClass in ColumnarSeries.__SUPPORTED_CLASSES
+
+    def __init__(self, dataObjectClass, columns=None):
+        '''
+        Constructor of an empty series.
+
+        @type dataObjectClass: type
+        @param dataObjectClass: Type of the data objects (sub-class of dataflow.DataObjects.Glamos.GlamosData).
+        @type columns: list
+        @param columns: Columns (name, type) of the series in the types of DataFrameBuilder. In case of None, the columns of the type (COLUMNS) and the data source are used.
+
+        @raise ValueError: No columns given and the type not supported, or unknown column type.
+        '''
+
+        if columns == None:
+            if not ColumnarSeries.isSupported(dataObjectClass):
+                raise ValueError("No columns defined for data objects of type {0}".format(dataObjectClass.__name__))
+            columns = dataObjectClass.COLUMNS + [("dataSource", object)]
+
+        self._columns = list()
+
+        for name, columnType in columns:
+            if isinstance(columnType, str):
+                columnType = object
+            elif isinstance(columnType, type) and issubclass(columnType, GlamosEnum):
+                columnType = int
+
+            if columnType not in self.__DTYPES:
+                raise ValueError("Column {0}: Type {1} is not supported".format(name, columnType))
+
+            self._columns.append((name, columnType))
+
+        self._dataObjectClass = dataObjectClass
+
+        self.clear()
+
+    @property
+    def dataObjectClass(self):
+        '''
+        Gets the type of the data objects of the series.
+        '''
+        return self._dataObjectClass
+
+    @property
+    def columnNames(self):
+        '''
+        Gets the names of the columns of the series.
+        '''
+        return [name for name, columnType in self._columns]
+
+    def column(self, name):
+        '''
+        Gets the values of the given column of all rows in the order of insertion. Missing values of float
+        columns are NaN. int columns with missing values are returned as float64 with NaN (as done by pandas).
+
+        The returned array is a copy, changes are not written back to the series.
+
+        @type name: string
+        @param name: Name of the column.
+
+        @rtype: numpy.ndarray
+        @return: Values of the column.
+        '''
+
+        values = self._buffers[name][:self._numberRows].copy()
+
+        if name in self._missings:
+            missings = self._missings[name][:self._numberRows]
+            if missings.any():
+                values = values.astype(numpy.float64)
+                values[missings] = numpy.nan
+
+        return values
+
+    def toDataFrame(self):
+        '''
+        Gets all columns of the series as pandas.DataFrame with one row per data object.
+
+        @rtype: pandas.DataFrame
+        @return: Data frame with the column names as labels.
+        '''
+
+        return pandas.DataFrame({name: self.column(name) for name in self.columnNames})
+
+    def addDataObject(self, key, dataObject):
+        '''
+        Appends the members of the given data object as new row. In case of an existing key, the row of the
+        key is overwritten.
+
+        @type key: object
+        @param key: Key of the data object within the series (e.g. primary key).
+        @type dataObject: dataflow.DataObjects.Glamos.GlamosData
+        @param dataObject: Data object of the type of the series.
+        '''
+
+        rowIndex = self._rowIndexes.get(key)
+
+        if rowIndex == None:
+            if self._numberRows == self._capacity():
+                self._grow()
+            rowIndex = self._numberRows
+            self._numberRows += 1
+            self._keys.append(key)
+            self._rowIndexes[key] = rowIndex
+
+        for name, columnType in self._columns:
+            # The primary key is read by its property to create the lazy identifier before it is stored.
+            value = dataObject.pk if name == "pk" else getattr(dataObject, "_" + name)
+
+            if name in self._missings:
+                self._missings[name][rowIndex] = value == None
+                if value == None:
+                    value = 0
+                else:
+                    # Members of enumerations are stored by their code.
+                    value = getattr(value, "value", value)
+            elif columnType == datetime.date and value == None:
+                value = "NaT"
+
+            self._buffers[name][rowIndex] = value
+
+    def iterDataObjects(self):
+        '''
+        Generator of the object views of all rows in the order of insertion. The columns are converted once
+        for all rows, which is faster than reading the items one by one.
+
+        @rtype: generator
+        @return: Data objects of the type of the series.
+        '''
+
+        columnValues = [self._rowValues(name, slice(0, self._numberRows)) for name in self.columnNames]
+        memberNames = ["_" + name for name in self.columnNames]
+
+        for rowValues in zip(*columnValues):
+            yield self._createDataObject(memberNames, rowValues)
+
+    def _rowValues(self, name, rows):
+        '''
+        Gets the Python values of the given rows of a column. Missing values are None.
+
+        @type name: string
+        @param name: Name of the column.
+        @type rows: slice
+        @param rows: Rows of the column.
+
+        @rtype: list
+        @return: Python values (int, float, datetime.date or object) of the rows.
+        '''
+
+        values = self._buffers[name][rows].tolist()
+
+        if name in self._missings:
+            missings = self._missings[name][rows].tolist()
+            values = [None if missing else value for value, missing in zip(values, missings)]
+
+        return values
+
+    def _createDataObject(self, memberNames, rowValues):
+        '''
+        Creates an object view of a row. The constructor of the data object is not called, the members are
+        set directly (e.g. no new primary key is created).
+
+        @type memberNames: list
+        @param memberNames: Names of the members in the order of the values.
+        @type rowValues: iterable
+        @param rowValues: Values of the row.
+
+        @rtype: dataflow.DataObjects.Glamos.GlamosData
+        @return: Data object of the type of the series.
+        '''
+
+        dataObject = self._dataObjectClass.__new__(self._dataObjectClass)
+
+        for memberName, value in zip(memberNames, rowValues):
+            setattr(dataObject, memberName, value)
+
+        return dataObject
+
+    def _capacity(self):
+        '''
+        Gets the number of rows of the column buffers.
+        '''
+
+        return len(self._buffers[self._columns[0][0]])
+
+    def _grow(self):
+        '''
+        Doubles the capacity of all column buffers.
+        '''
+
+        capacity = max(self.__INITIAL_CAPACITY, 2 * self._capacity())
+
+        for name, columnType in self._columns:
+            buffer = numpy.empty(capacity, dtype=self.__DTYPES[columnType])
+            buffer[:self._numberRows] = self._buffers[name][:self._numberRows]
+            self._buffers[name] = buffer
+
+            if name in self._missings:
+                missings = numpy.zeros(capacity, dtype=bool)
+                missings[:self._numberRows] = self._missings[name][:self._numberRows]
+                self._missings[name] = missings
+
+    def clear(self):
+        '''
+        Removes all rows of the series.
+        '''
+
+        self._buffers = {name: numpy.empty(0, dtype=self.__DTYPES[columnType]) for name, columnType in self._columns}
+        self._missings = {name: numpy.zeros(0, dtype=bool) for name, columnType in self._columns if columnType in (int, float)}
+        self._keys = list()
+        self._rowIndexes = dict()
+        self._numberRows = 0
+
+    def __getitem__(self, key):
+
+        rowIndex = self._rowIndexes[key]
+        rows = slice(rowIndex, rowIndex + 1)
+
+        return self._createDataObject(
+            ["_" + name for name in self.columnNames],
+            [self._rowValues(name, rows)[0] for name in self.columnNames])
+
+    def __setitem__(self, key, dataObject):
+
+        self.addDataObject(key, dataObject)
+
+    def __delitem__(self, key):
+        '''
+        Removes the row of the given key. All rows after the removed row are moved (O(n)).
+        '''
+
+        rowIndex = self._rowIndexes.pop(key)
+
+        for name in self.columnNames:
+            self._buffers[name] = numpy.delete(self._buffers[name], rowIndex)
+            if name in self._missings:
+                self._missings[name] = numpy.delete(self._missings[name], rowIndex)
+
+        del self._keys[rowIndex]
+        self._numberRows -= 1
+
+        for movedRowIndex in range(rowIndex, self._numberRows):
+            self._rowIndexes[self._keys[movedRowIndex]] = movedRowIndex
+
+    def __iter__(self):
+
+        return iter(list(self._keys))
+
+    def __len__(self):
+
+        return self._numberRows
+
+    def __str__(self):
+
+        return "Columnar series of {0}: {1} rows".format(self._dataObjectClass.__name__, self._numberRows)
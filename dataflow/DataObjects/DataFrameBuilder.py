@@ -0,0 +1,162 @@
+'''
+Created on 18.10.2026
+
+@author: yvo
+'''
+
+import datetime
+
+import numpy
+import pandas
+
+from dataflow.DataObjects.Enumerations.GlamosEnum import GlamosEnum
+
+class DataFrameBuilder(object):
+    '''
+    Column-oriented builder of pandas.DataFrame objects from a series of data objects (e.g. the length changes
+    of a glacier). Each column is read once over all data objects into a pre-allocated array of its type,
+    the data frame is created from the typed arrays in one step.
+
+    The columns are given as tuples (name, type) with the name of the property of the data objects and one
+    of the types. The columns of a data object type (GlamosData.COLUMNS) define its data frame as well as the
+    column buffers of a ColumnarSeries of the type.
+        - int              Nullable integer column (pandas Int64). None values are <NA>, float values have to be integral.
+        - float            float64 column. None values are NaN.
+        - datetime.date    datetime64[ns] column. None values are NaT.
+        - Date format      String dates of the given format (e.g. "%Y%m%d") as datetime64[ns] column.
+        - Enumeration      Categorical column with the names of the members as categories. Members and codes
+                           of the enumeration are accepted as values.
+        - object           Column of the values as they are (e.g. strings, identifiers).
+
+    Attributes:
+        - __DATE_DTYPE     Data type of the date columns.
+    '''
+
+    __DATE_DTYPE = "datetime64[ns]"
+
+    @staticmethod
+    def build(dataObjects, columns):
+        '''
+        Creates the data frame of the given data objects with one row per data object. This is the data frame of
+        all series of a glacier (e.g. Glacier.lengthChangeDataFrame), created by GlamosData.createDataFrame()
+        with the columns of the data object type.
+
+        The columns of a ColumnarSeries are read as arrays, no data objects are created. The columns of other
+        series are read by the properties of the data objects. The primary key is read by its member, the
+        identifiers of new data objects are not created by the data frame (missing values).
+
+        @type dataObjects: iterable
+        @param dataObjects: Data objects as dictionary (e.g. series of a glacier), ColumnarSeries or list.
+        @type columns: list
+        @param columns: Columns (name, type) of the data frame in the order of the data frame.
+
+        @rtype: pandas.DataFrame
+        @return: Data frame with the property names as column labels.
+
+        @raise ValueError: Values of an int column which are not integral or values of an enumeration column which are not members of the enumeration.
+        '''
+
+        if hasattr(dataObjects, "column"):
+            numberRows = len(dataObjects)
+            columnValues = {name: dataObjects.column(name) for name, columnType in columns}
+
+        else:
+            if hasattr(dataObjects, "values"):
+                dataObjects = dataObjects.values()
+
+            dataObjects = list(dataObjects)
+            numberRows = len(dataObjects)
+            columnValues = {
+                name: [getattr(dataObject, "_pk" if name == "pk" else name) for dataObject in dataObjects]
+                for name, columnType in columns}
+
+        return pandas.DataFrame(
+            {name: DataFrameBuilder.toColumn(columnValues[name], columnType) for name, columnType in columns},
+            index=pandas.RangeIndex(numberRows))
+
+    @staticmethod
+    def toColumn(values, columnType):
+        '''
+        Converts the values of a column into a typed array.
+
+        @type values: list or numpy.ndarray
+        @param values: Values of the column. Missing values are None (list) or NaN (array of a ColumnarSeries).
+        @type columnType: type or string
+        @param columnType: Type of the column (see class description).
+
+        @rtype: numpy.ndarray or pandas.api.extensions.ExtensionArray
+        @return: Typed array of the values.
+
+        @raise ValueError: Values of an int column which are not integral or values of an enumeration column which are not members of the enumeration.
+        '''
+
+        numberValues = len(values)
+
+        if columnType is int:
+            integers, isMissing = DataFrameBuilder._toIntegers(values)
+            return pandas.arrays.IntegerArray(integers, isMissing)
+
+        elif columnType is float:
+            if isinstance(values, numpy.ndarray):
+                return values.astype(numpy.float64)
+            return numpy.fromiter((numpy.nan if value == None else value for value in values), dtype=numpy.float64, count=numberValues)
+
+        elif columnType is datetime.date:
+            return numpy.array(values, dtype="datetime64[D]").astype(DataFrameBuilder.__DATE_DTYPE)
+
+        elif isinstance(columnType, str):
+            return pandas.to_datetime(pandas.Series(values, dtype=object), format=columnType, errors="coerce").to_numpy(DataFrameBuilder.__DATE_DTYPE)
+
+        elif isinstance(columnType, type) and issubclass(columnType, GlamosEnum):
+            values, isMissing = DataFrameBuilder._toIntegers(values)
+
+            # Raising the ValueError of codes without member, the members are not needed.
+            columnType.fromValues(values[~isMissing])
+
+            # Position of the members in the categories by their code.
+            memberValues = columnType.toValues(columnType)
+            positions = numpy.full(memberValues.max() + 1, -1, dtype=numpy.int64)
+            positions[memberValues] = numpy.arange(len(memberValues))
+
+            codes = numpy.where(isMissing, -1, positions[numpy.where(isMissing, 0, values)])
+            return pandas.Categorical.from_codes(codes, categories=[member.name for member in columnType])
+
+        elif isinstance(values, numpy.ndarray):
+            return values.astype(object)
+
+        else:
+            return numpy.array(values + [None], dtype=object)[:numberValues]
+
+    @staticmethod
+    def _toIntegers(values):
+        '''
+        Converts the values of an int or enumeration column into int64 values. Members of enumerations are
+        converted into their codes. Float values are accepted as long as they are integral, they are not truncated.
+
+        @type values: list or numpy.ndarray
+        @param values: Values of the column. Missing values are None or NaN.
+
+        @rtype: tuple
+        @return: int64 values (0 for missing values) and the mask of the missing values.
+
+        @raise ValueError: Values which are not integral or not numeric.
+        '''
+
+        if isinstance(values, numpy.ndarray):
+            isMissing = numpy.zeros(len(values), dtype=bool)
+        else:
+            isMissing = numpy.fromiter((value == None for value in values), dtype=bool, count=len(values))
+            values = numpy.array([0 if value == None else getattr(value, "value", value) for value in values])
+
+        if values.dtype.kind == "f":
+            isMissing = isMissing | numpy.isnan(values)
+            values = numpy.where(isMissing, 0.0, values)
+
+            isNotIntegral = ~numpy.isfinite(values) | (values != numpy.trunc(values))
+            if isNotIntegral.any():
+                raise ValueError("Values {0} of an integer column are not integral".format(values[isNotIntegral][:3].tolist()))
+
+        elif values.dtype.kind not in "biu":
+            raise ValueError("Values of type {0} are not integers".format(values.dtype))
+
+        return values.astype(numpy.int64), isMissing
@@ -1,7 +1,9 @@
-from enum import Enum, unique
+from enum import unique
+
+from dataflow.DataObjects.Enumerations.GlamosEnum import GlamosEnum
 
 @unique
-class DataEmbargoTypeEnum(Enum):
+class DataEmbargoTypeEnum(GlamosEnum):
     '''
     Enumeration defining the quality of dates.
     
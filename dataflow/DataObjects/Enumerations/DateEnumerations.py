@@ -4,10 +4,12 @@ Created on 04.06.2018
 @author: yvo
 '''
 
-from enum import Enum, unique
+from enum import unique
+
+from dataflow.DataObjects.Enumerations.GlamosEnum import GlamosEnum
 
 @unique
-class DateQualityTypeEnum(Enum):
+class DateQualityTypeEnum(GlamosEnum):
     '''
     Enumeration defining the quality of dates.
     
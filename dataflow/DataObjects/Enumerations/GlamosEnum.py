@@ -0,0 +1,119 @@
+'''
+Created on 18.10.2026
+
+@author: yvo
+'''
+
+from enum import Enum
+
+import numpy
+
+# Lookup tables of the enumerations with the enumeration class as key. The tables cannot be members of
+# the classes, as attributes assigned in the body of an enumeration are members of the enumeration.
+_LOOKUP_TABLES = dict()
+
+class GlamosEnum(Enum):
+    '''
+    Base class of all enumerations of the GLAMOS data objects with integer codes as values.
+
+    Converting a code by the constructor of an enumeration (e.g. AnalysisMethodEnum(3)) runs through the
+    metaclass of Enum for every call. The lookups of GlamosEnum use a precomputed table per enumeration:
+    a list of the members indexed by their code for single values, and the same table as NumPy object
+    array for vectorised conversions of columns of codes.
+
+    Codes without member raise a ValueError as the constructor of the enumeration does.
+    '''
+
+    @classmethod
+    def _lookupTable(cls):
+        '''
+        Gets the lookup table of the enumeration. The table is created with the first lookup.
+
+        @rtype: list
+        @return: List of the members indexed by their code. Codes without member are None.
+        '''
+
+        lookupTable = _LOOKUP_TABLES.get(cls)
+
+        if lookupTable == None:
+            lookupTable = [None] * (max([member.value for member in cls]) + 1)
+            for member in cls:
+                lookupTable[member.value] = member
+            _LOOKUP_TABLES[cls] = lookupTable
+            _LOOKUP_TABLES[(cls, numpy.ndarray)] = numpy.array(lookupTable + [None], dtype=object)
+
+        return lookupTable
+
+    @classmethod
+    def fromValue(cls, value):
+        '''
+        Gets the member of the given code. Members are returned unchanged.
+
+        @type value: int
+        @param value: Code of the member (e.g. value of a database column).
+
+        @rtype: GlamosEnum
+        @return: Member of the enumeration.
+
+        @raise ValueError: No member with the given code.
+        '''
+
+        if value.__class__ is cls:
+            return value
+
+        lookupTable = _LOOKUP_TABLES.get(cls)
+        if lookupTable == None:
+            lookupTable = cls._lookupTable()
+
+        try:
+            member = lookupTable[value] if value >= 0 else None
+        except (IndexError, TypeError):
+            member = None
+
+        if member == None:
+            return cls(value)
+
+        return member
+
+    @classmethod
+    def fromValues(cls, values):
+        '''
+        Converts an array of codes into an array of members.
+
+        @type values: numpy.ndarray
+        @param values: Integer codes of the members.
+
+        @rtype: numpy.ndarray
+        @return: Object array of the members in the order of the codes.
+
+        @raise ValueError: Codes without member.
+        '''
+
+        cls._lookupTable()
+        lookupArray = _LOOKUP_TABLES[(cls, numpy.ndarray)]
+
+        values = numpy.asarray(values, dtype=numpy.int64)
+
+        # Invalid codes are mapped to the last element of the array (None).
+        isInvalid = (values < 0) | (values >= len(lookupArray) - 1)
+        members = lookupArray[numpy.where(isInvalid, len(lookupArray) - 1, values)]
+
+        isInvalid |= numpy.equal(members, None)
+        if isInvalid.any():
+            raise ValueError("{0} are not valid {1}".format(numpy.unique(values[isInvalid]).tolist(), cls.__name__))
+
+        return members
+
+    @classmethod
+    def toValues(cls, members):
+        '''
+        Converts an iterable of members into an array of their codes.
+
+        @type members: iterable
+        @param members: Members of the enumeration.
+
+        @rtype: numpy.ndarray
+        @return: int64 array of the codes in the order of the members.
+        '''
+
+        return numpy.fromiter((member.value for member in members), dtype=numpy.int64)
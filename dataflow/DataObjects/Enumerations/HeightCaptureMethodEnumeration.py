@@ -4,11 +4,12 @@ Created on 02.08.2018
 @author: yvo
 '''
 
-from enum import Enum
 from enum import unique
 
+from dataflow.DataObjects.Enumerations.GlamosEnum import GlamosEnum
+
 @unique
-class HeightCaptureMethodEnum(Enum):
+class HeightCaptureMethodEnum(GlamosEnum):
     '''
     Enumeration of the different methods for height capturing.
      
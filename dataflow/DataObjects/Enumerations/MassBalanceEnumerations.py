@@ -4,10 +4,12 @@ Created on 04.06.2018
 @author: yvo
 '''
 
-from enum import Enum, unique
+from enum import unique
+
+from dataflow.DataObjects.Enumerations.GlamosEnum import GlamosEnum
 
 @unique
-class MassBalanceTypeEnum(Enum):
+class MassBalanceTypeEnum(GlamosEnum):
     '''
     Enumeration defining the type of mass balance observation.
     
@@ -21,7 +23,7 @@ class MassBalanceTypeEnum(Enum):
     FixDate = 2
 
 @unique
-class AnalysisMethodEnum(Enum):
+class AnalysisMethodEnum(GlamosEnum):
     '''
     Enumeration of the analysis methods for mass balance observations.
     
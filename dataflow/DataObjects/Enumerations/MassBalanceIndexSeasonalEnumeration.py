@@ -4,10 +4,12 @@ Created on 22.03.2021
 @author: elias
 '''
 
-from enum import Enum, unique
+from enum import unique
+
+from dataflow.DataObjects.Enumerations.GlamosEnum import GlamosEnum
 
 @unique
-class ValueTypeEnum(Enum):
+class ValueTypeEnum(GlamosEnum):
     '''
     Enumeration defining the value type of mass balance index.
 
@@ -4,10 +4,12 @@ Created on 22.03.2021
 @author: elias
 '''
 
-from enum import Enum, unique
+from enum import unique
+
+from dataflow.DataObjects.Enumerations.GlamosEnum import GlamosEnum
 
 @unique
-class DateAccuracyEnum(Enum):
+class DateAccuracyEnum(GlamosEnum):
     '''
     Enumeration defining the type of data accuracy.
 
@@ -22,7 +24,7 @@ class DateAccuracyEnum(Enum):
     StartUnknownEndKnown = 3
 
 @unique
-class DensityAccuracyEnum(Enum):
+class DensityAccuracyEnum(GlamosEnum):
     '''
     Enumeration defining the type of density accuracy
     0 = Not defined or unknown
@@ -43,7 +45,7 @@ class DensityAccuracyEnum(Enum):
     EstimatedLinearRegression = 6
 
 @unique
-class MeasurementQualityEnum(Enum):
+class MeasurementQualityEnum(GlamosEnum):
     '''
     Enumeration defining the type of measurement quality
 
@@ -66,7 +68,7 @@ class MeasurementQualityEnum(Enum):
     ReconstructedValue_OtherReason = 5
 
 @unique
-class MeasurementTypeEnum(Enum):
+class MeasurementTypeEnum(GlamosEnum):
     '''
     Enumeration defining the type of measurement type
 
@@ -89,7 +91,7 @@ class MeasurementTypeEnum(Enum):
     Other = 9
 
 @unique
-class ObservationTypeEnum(Enum):
+class ObservationTypeEnum(GlamosEnum):
     '''
     Enumeration defining the type of observation type
 
@@ -104,7 +106,7 @@ class ObservationTypeEnum(Enum):
     Intermediate = 3
 
 @unique
-class PositionAccuracyEnum(Enum):
+class PositionAccuracyEnum(GlamosEnum):
     '''
     Enumeration defining the type of position accuracy
 
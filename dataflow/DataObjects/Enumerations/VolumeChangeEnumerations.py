@@ -4,11 +4,12 @@ Created on 02.08.2018
 @author: yvo
 '''
 
-from enum import Enum
 from enum import unique
 
+from dataflow.DataObjects.Enumerations.GlamosEnum import GlamosEnum
+
 @unique
-class AnalysisMethodEnum(Enum):
+class AnalysisMethodEnum(GlamosEnum):
     '''
     Enumeration of the different methods for the volume change analysis.
      
@@ -8,12 +8,26 @@ from dataflow.DataObjects.Glamos import GlamosData
 from dataflow.DataObjects.MassBalance import MassBalance
 from dataflow.DataObjects.Enumerations.MassBalanceEnumerations import MassBalanceTypeEnum
 from dataflow.DataObjects.Inventory import Inventory
+from dataflow.DataObjects.ColumnarSeries import ColumnarSeries
+from dataflow.DataObjects.LengthChange import LengthChange
+from dataflow.DataObjects.MassBalanceIndexSpatialDaily import MassBalanceIndexSpatialDaily
+from dataflow.DataObjects.MassBalanceIndexSpatialSeasonal import MassBalanceIndexSpatialSeasonal
+from dataflow.DataObjects.MassBalanceIndexTimeDaily import MassBalanceIndexTimeDaily
+from dataflow.DataObjects.MassBalanceIndexTimeSeasonal import MassBalanceIndexTimeSeasonal
+from dataflow.DataObjects.MassBalancePoint import MassBalancePoint
+from dataflow.DataObjects.MassBalanceSwissWide import MassBalanceSwissWide
+from dataflow.DataObjects.VolumeChange import VolumeChange
 #import dataflow.DataObjects.Enumerations.MassBalanceEnumerations.MassBalanceTypeEnum
 
 class Glacier(GlamosData):
     '''
     Class representing a specific glacier of the GLAMOS dataset.
     
+    The high-volume series (daily index mass balances, point mass balances and swiss wide mass balances)
+    can optionally be stored as dataflow.DataObjects.ColumnarSeries.ColumnarSeries instead of dictionaries
+    of objects. The accessors and add-methods are the same for both storages, the columnar series offer
+    additionally NumPy columns per attribute for vectorised analyses (e.g. glacier.massBalancePoints.column("massbalance_we")).
+    
     Attributes:
         _pk              uuid of glacier
         _pkVaw           Integer-based key used by the VAW and the Annual Glacier Report for the glacier identification.
@@ -87,6 +101,17 @@ class Glacier(GlamosData):
         Get the entire length change time series of the glacier.
         '''
         return self._lengthChanges
+
+    @property
+    def lengthChangeDataFrame(self):
+        '''
+        Get the entire length change time series of the glacier as pandas.DataFrame.
+
+        @rtype: pandas.DataFrame
+        @return: Data frame (table) with one row per length change.
+        '''
+
+        return LengthChange.createDataFrame(self._lengthChanges)
     
     @property
     def massBalances(self):
@@ -108,6 +133,30 @@ class Glacier(GlamosData):
         
         return MassBalance.createDataFrame(self._massBalances)
 
+    @property
+    def massBalanceExtendedDataFrame(self):
+        '''
+        Get the entire mass-balance time series of the glacier as pandas.DataFrame with all columns of
+        the mass balances (see MassBalance.COLUMNS) as typed columns.
+
+        @rtype: pandas.DataFrame
+        @return: Data frame (table) of the mass-balance observations.
+        '''
+
+        return MassBalance.createExtendedDataFrame(self._massBalances)
+
+    @property
+    def elevationBandDataFrame(self):
+        '''
+        Get the elevation bands of the entire mass-balance time series of the glacier as pandas.DataFrame
+        in long format (one row per elevation band and mass balance).
+
+        @rtype: pandas.DataFrame
+        @return: Data frame (table) of the elevation bands of the mass-balance observations.
+        '''
+
+        return MassBalance.createElevationBandDataFrame(self._massBalances)
+
     @property
     def massBalanceIndexTimeSeasonals(self):
         '''
@@ -115,6 +164,17 @@ class Glacier(GlamosData):
         '''
         return self._massBalanceIndexTimeSeasonals
 
+    @property
+    def massBalanceIndexTimeSeasonalDataFrame(self):
+        '''
+        Get the entire index time seasonal mass balance series of the glacier as pandas.DataFrame.
+
+        @rtype: pandas.DataFrame
+        @return: Data frame (table) with one row per index time seasonal mass balance.
+        '''
+
+        return MassBalanceIndexTimeSeasonal.createDataFrame(self._massBalanceIndexTimeSeasonals)
+
     @property
     def massBalanceIndexTimeDailys(self):
         '''
@@ -122,6 +182,17 @@ class Glacier(GlamosData):
         '''
         return self._massBalanceIndexTimeDailys
 
+    @property
+    def massBalanceIndexTimeDailyDataFrame(self):
+        '''
+        Get the entire index time daily mass balance series of the glacier as pandas.DataFrame.
+
+        @rtype: pandas.DataFrame
+        @return: Data frame (table) with one row per index time daily mass balance.
+        '''
+
+        return MassBalanceIndexTimeDaily.createDataFrame(self._massBalanceIndexTimeDailys)
+
     @property
     def massBalanceIndexSpatialSeasonals(self):
         '''
@@ -129,6 +200,17 @@ class Glacier(GlamosData):
         '''
         return self._massBalanceIndexSpatialSeasonals
 
+    @property
+    def massBalanceIndexSpatialSeasonalDataFrame(self):
+        '''
+        Get the entire index spatial seasonal mass balance series of the glacier as pandas.DataFrame.
+
+        @rtype: pandas.DataFrame
+        @return: Data frame (table) with one row per index spatial seasonal mass balance.
+        '''
+
+        return MassBalanceIndexSpatialSeasonal.createDataFrame(self._massBalanceIndexSpatialSeasonals)
+
     @property
     def massBalanceIndexSpatialDailys(self):
         '''
@@ -136,6 +218,17 @@ class Glacier(GlamosData):
         '''
         return self._massBalanceIndexSpatialDailys
 
+    @property
+    def massBalanceIndexSpatialDailyDataFrame(self):
+        '''
+        Get the entire index spatial daily mass balance series of the glacier as pandas.DataFrame.
+
+        @rtype: pandas.DataFrame
+        @return: Data frame (table) with one row per index spatial daily mass balance.
+        '''
+
+        return MassBalanceIndexSpatialDaily.createDataFrame(self._massBalanceIndexSpatialDailys)
+
     @property
     def massBalancePoints(self):
         '''
@@ -143,12 +236,34 @@ class Glacier(GlamosData):
         '''
         return self._massBalancePoints
 
+    @property
+    def massBalancePointDataFrame(self):
+        '''
+        Get the entire point mass balance series of the glacier as pandas.DataFrame.
+
+        @rtype: pandas.DataFrame
+        @return: Data frame (table) with one row per point mass balance.
+        '''
+
+        return MassBalancePoint.createDataFrame(self._massBalancePoints)
+
     @property
     def massBalanceSwissWide(self):
         '''
         Get the entire mass balance swiss wide time series of the glacier.
         '''
         return self._massBalanceSwissWide
+
+    @property
+    def massBalanceSwissWideDataFrame(self):
+        '''
+        Get the entire swiss wide mass balance series of the glacier as pandas.DataFrame.
+
+        @rtype: pandas.DataFrame
+        @return: Data frame (table) with one row per swiss wide mass balance.
+        '''
+
+        return MassBalanceSwissWide.createDataFrame(self._massBalanceSwissWide)
     
     @property
     def latestInventoryGeometry(self):
@@ -167,6 +282,17 @@ class Glacier(GlamosData):
         Get the entire volume change time series of the glacier.
         '''
         return self._volumeChanges
+
+    @property
+    def volumeChangeDataFrame(self):
+        '''
+        Get the entire volume change time series of the glacier as pandas.DataFrame.
+
+        @rtype: pandas.DataFrame
+        @return: Data frame (table) with one row per volume change.
+        '''
+
+        return VolumeChange.createDataFrame(self._volumeChanges)
     
     @property
     def inventories(self):
@@ -176,7 +302,7 @@ class Glacier(GlamosData):
         
         return self._inventories
 
-    def __init__(self, pk = None, pkVaw = None, pkSgi = None, name = None):
+    def __init__(self, pk = None, pkVaw = None, pkSgi = None, name = None, columnarSeries = False):
         '''
         Constructor of the Glacier class.
         
@@ -191,6 +317,9 @@ class Glacier(GlamosData):
         
         @type name: string
         @param name: Common name of the glacier.
+        
+        @type columnarSeries: bool
+        @param columnarSeries: Storing the high-volume series as columnar series instead of dictionaries of objects.
         '''
         
         super().__init__(pk)
@@ -204,11 +333,18 @@ class Glacier(GlamosData):
         self._lengthChanges = dict()
         self._massBalances  = dict()
         self._massBalanceIndexTimeSeasonals = dict()
-        self._massBalanceIndexTimeDailys = dict()
         self._massBalanceIndexSpatialSeasonals = dict()
-        self._massBalanceIndexSpatialDailys = dict()
-        self._massBalancePoints = dict()
-        self._massBalanceSwissWide = dict()
+        
+        if columnarSeries:
+            self._massBalanceIndexTimeDailys = ColumnarSeries(MassBalanceIndexTimeDaily)
+            self._massBalanceIndexSpatialDailys = ColumnarSeries(MassBalanceIndexSpatialDaily)
+            self._massBalancePoints = ColumnarSeries(MassBalancePoint)
+            self._massBalanceSwissWide = ColumnarSeries(MassBalanceSwissWide)
+        else:
+            self._massBalanceIndexTimeDailys = dict()
+            self._massBalanceIndexSpatialDailys = dict()
+            self._massBalancePoints = dict()
+            self._massBalanceSwissWide = dict()
         self._volumeChanges = dict()
         
         self._inventories   = dict()
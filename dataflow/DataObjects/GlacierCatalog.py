@@ -0,0 +1,179 @@
+'''
+Created on 18.10.2026
+
+@author: yvo
+'''
+
+from collections.abc import MutableMapping
+import unicodedata
+
+class GlacierCatalog(MutableMapping):
+    '''
+    Collection of glaciers with the Swiss Glacier Inventory key as key. The catalog can be used
+    everywhere a dictionary of glaciers by pkSgi is expected.
+
+    In addition to the lookup by pkSgi the catalog holds indexes by the primary key, the VAW identifier
+    and the normalised name of the glaciers. All lookups are O(1). The indexes are updated when glaciers
+    are added or removed, a later change of the keys of a glacier object is not tracked.
+
+    Attributes:
+        _glaciersBySgi   Dictionary of the glaciers with pkSgi as key.
+        _glaciersByPk    Dictionary of the glaciers with pk as key.
+        _glaciersByVaw   Dictionary of the glaciers with pkVaw as key.
+        _glaciersByName  Dictionary of lists of glaciers with the normalised name as key.
+    '''
+
+    _glaciersBySgi = None
+    _glaciersByPk = None
+    _glaciersByVaw = None
+    _glaciersByName = None
+
+    @staticmethod
+    def normaliseName(name):
+        '''
+        Normalises the name of a glacier for lookups: Accents are removed, the name is case-folded and
+        hyphens and repeated whitespaces are replaced by a single space.
+
+        @type name: string
+        @param name: Name of a glacier (e.g. "Glacier de la Plaine Morte").
+
+        @rtype: string
+        @return: Normalised name of the glacier (e.g. "glacier de la plaine morte").
+        '''
+
+        decomposedName = unicodedata.normalize("NFKD", name)
+        asciiName = "".join([character for character in decomposedName if not unicodedata.combining(character)])
+
+        return " ".join(asciiName.replace("-", " ").casefold().split())
+
+    def __init__(self, glaciers=None):
+        '''
+        Constructor of the glacier catalog.
+
+        @type glaciers: Iterable or dictionary
+        @param glaciers: Optional glaciers to be added to the catalog. In case of a dictionary, its values are added.
+        '''
+
+        self._glaciersBySgi = dict()
+        self._glaciersByPk = dict()
+        self._glaciersByVaw = dict()
+        self._glaciersByName = dict()
+
+        if glaciers != None:
+            if isinstance(glaciers, (dict, MutableMapping)):
+                glaciers = glaciers.values()
+
+            for glacier in glaciers:
+                self.addGlacier(glacier)
+
+    def addGlacier(self, glacier):
+        '''
+        Adds a glacier to the catalog with its pkSgi as key.
+
+        @type glacier: dataflow.DataObjects.Glacier.Glacier
+        @param glacier: Glacier to be added.
+        '''
+
+        self[glacier.pkSgi] = glacier
+
+    def getBySgi(self, pkSgi):
+        '''
+        Get the glacier with the given Swiss Glacier Inventory key.
+
+        @type pkSgi: string
+        @param pkSgi: Swiss Glacier Inventory key of the glacier.
+
+        @rtype: dataflow.DataObjects.Glacier.Glacier
+        @return: Glacier with the given key. None if the glacier is not part of the catalog.
+        '''
+
+        return self._glaciersBySgi.get(pkSgi)
+
+    def getByPk(self, pk):
+        '''
+        Get the glacier with the given primary key.
+
+        @type pk: uuid.UUID
+        @param pk: Primary key of the glacier.
+
+        @rtype: dataflow.DataObjects.Glacier.Glacier
+        @return: Glacier with the given key. None if the glacier is not part of the catalog.
+        '''
+
+        return self._glaciersByPk.get(pk)
+
+    def getByVaw(self, pkVaw):
+        '''
+        Get the glacier with the given VAW identifier.
+
+        @type pkVaw: int
+        @param pkVaw: VAW identifier of the glacier.
+
+        @rtype: dataflow.DataObjects.Glacier.Glacier
+        @return: Glacier with the given identifier. None if the glacier is not part of the catalog.
+        '''
+
+        return self._glaciersByVaw.get(pkVaw)
+
+    def getByName(self, name):
+        '''
+        Get all glaciers with the given name. The name is compared in its normalised form.
+
+        @type name: string
+        @param name: Name of the glaciers.
+
+        @rtype: list
+        @return: List of the glaciers with the given name. Empty list if no glacier was found.
+        '''
+
+        return list(self._glaciersByName.get(GlacierCatalog.normaliseName(name), []))
+
+    def __getitem__(self, pkSgi):
+
+        return self._glaciersBySgi[pkSgi]
+
+    def __setitem__(self, pkSgi, glacier):
+
+        if pkSgi in self._glaciersBySgi:
+            del self[pkSgi]
+
+        self._glaciersBySgi[pkSgi] = glacier
+
+        if glacier.pk != None:
+            self._glaciersByPk[glacier.pk] = glacier
+
+        if glacier.pkVaw != None:
+            self._glaciersByVaw[glacier.pkVaw] = glacier
+
+        if glacier.name != None:
+            self._glaciersByName.setdefault(GlacierCatalog.normaliseName(glacier.name), []).append(glacier)
+
+    def __delitem__(self, pkSgi):
+
+        glacier = self._glaciersBySgi.pop(pkSgi)
+
+        if self._glaciersByPk.get(glacier.pk) is glacier:
+            del self._glaciersByPk[glacier.pk]
+
+        if self._glaciersByVaw.get(glacier.pkVaw) is glacier:
+            del self._glaciersByVaw[glacier.pkVaw]
+
+        if glacier.name != None:
+            normalisedName = GlacierCatalog.normaliseName(glacier.name)
+            glaciersWithName = [glacierWithName for glacierWithName in self._glaciersByName.get(normalisedName, []) if glacierWithName is not glacier]
+            if len(glaciersWithName) > 0:
+                self._glaciersByName[normalisedName] = glaciersWithName
+            else:
+                self._glaciersByName.pop(normalisedName, None)
+
+    def __iter__(self):
+
+        return iter(self._glaciersBySgi)
+
+    def __len__(self):
+
+        return len(self._glaciersBySgi)
+
+    def __str__(self):
+
+        return "Glacier catalog with {0} glaciers".format(len(self._glaciersBySgi))
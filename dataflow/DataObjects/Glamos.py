@@ -6,6 +6,9 @@ Created on 18.05.2018
 
 import uuid
 
+from dataflow.DataObjects.DataFrameBuilder import DataFrameBuilder
+from dataflow.DataObjects.UuidAllocator import UuidAllocator
+
 class GlamosData(object):
     '''
     Main class for all GLAMOS-related data-objects sharing the common basic attributes and methods.
@@ -13,22 +16,70 @@ class GlamosData(object):
     A GlamosData object always owns an unique object identifier:
     In case of existing (database) data objects the unique identifier will be derived by the DataReader
     object from the data source (e.g. database).
-    In case of new data objects a new identifier will be created.
+    In case of new data objects a new identifier will be created lazily, as soon as the identifier is read
+    the first time. Identifiers of many new data objects (e.g. a batch of a writer) are created at once by
+    assignPks().
+    
+    The members of GlamosData are stored in __slots__. Sub-classes of high-volume records (e.g. daily or point
+    mass balances) declare __slots__ as well and are stored without a per-instance dictionary. Sub-classes
+    without __slots__ keep their dictionary and are not affected.
     
     Attributes:
+        COLUMNS      Columns (name, type) of a series of the data objects (see DataFrameBuilder). None if no series of the type is supported.
         _pk          Unique object identifier of the GLAMOS data object. The identifier will be unique during the whole lifetime of the data record.
         _dataSource  Source of the data   # TODO: Improving the dealing with data source(s)
     '''
 
-    _pk = None
-    
-    _dataSource = None
+    __slots__ = ("_pk", "_dataSource")
+
+    COLUMNS = None
+
+    @classmethod
+    def createDataFrame(cls, dataObjects):
+        '''
+        Creates the data frame of a series of data objects of the type by DataFrameBuilder.build() with the
+        columns COLUMNS of the type.
+
+        @type dataObjects: iterable
+        @param dataObjects: Data objects as dictionary (e.g. series of a glacier), ColumnarSeries or list.
+
+        @rtype: pandas.DataFrame
+        @return: Data frame (table) with one row per data object.
+        '''
+
+        return DataFrameBuilder.build(dataObjects, cls.COLUMNS)
     
+    @staticmethod
+    def assignPks(dataObjects):
+        '''
+        Assigns new unique identifiers to all given data objects without identifier. The identifiers are
+        allocated in one call by the UuidAllocator instead of one uuid.uuid1() call per object.
+
+        @type dataObjects: iterable
+        @param dataObjects: Data objects of type GlamosData.
+
+        @rtype: list
+        @return: List of the given data objects, all with identifier.
+        '''
+
+        dataObjects = list(dataObjects)
+
+        dataObjectsWithoutPk = [dataObject for dataObject in dataObjects if dataObject._pk == None]
+
+        for dataObject, pk in zip(dataObjectsWithoutPk, UuidAllocator.allocate(len(dataObjectsWithoutPk))):
+            dataObject._pk = pk
+
+        return dataObjects
+
     @property
     def pk(self):
         '''
-        Gets the unique identifier of the data object.
+        Gets the unique identifier of the data object. A new identifier is created if the object has none yet.
         '''
+
+        if self._pk == None:
+            self._pk = uuid.uuid1()
+
         return self._pk
     
     @property
@@ -52,10 +103,9 @@ class GlamosData(object):
         Main constructor of the super class GlamosData.
         
         @type pk: UUID
-        @param pk: Unique identifier of the data object. In case of None, a new identifier will be created.
+        @param pk: Unique identifier of the data object. In case of None, a new identifier will be created on first access.
         '''
         
-        if pk == None:
-            self._pk = uuid.uuid1()
-        else:
-            self._pk = pk
\ No newline at end of file
+        self._pk = pk
+        
+        self._dataSource = None
\ No newline at end of file
@@ -4,6 +4,10 @@ Created on 18.05.2018
 @author: yvo
 '''
 
+import datetime
+
+from .DataFrameBuilder import DataFrameBuilder
+from .Enumerations.DateEnumerations import DateQualityTypeEnum
 from .Glamos import GlamosData
 
 class LengthChange(GlamosData):
@@ -25,6 +29,24 @@ class LengthChange(GlamosData):
         _remarks: Remarks about the measurement.
     '''
 
+    # Columns (name, type) of the data frame of a length change series.
+    COLUMNS = [
+        ("pk",                            object),
+        ("dateFrom",                      datetime.date),
+        ("dateFromQuality",               DateQualityTypeEnum),
+        ("dateTo",                        datetime.date),
+        ("dateToQuality",                 DateQualityTypeEnum),
+        ("measurementType",               object),
+        ("measurementMethod",             object),
+        ("measurementCondition",          object),
+        ("variationQuantitative",         float),
+        ("variationQuantitativeAccuracy", object),
+        ("elevationMin",                  float),
+        ("observer",                      object),
+        ("remarks",                       object)]
+
+    # ---- Members of the class ---
+
     _dateFrom = None
     _dateFromQuality = None
     _dateTo = None
@@ -0,0 +1,172 @@
+'''
+Created on 18.10.2026
+
+@author: yvo
+'''
+
+import numpy
+
+from .LengthChange import LengthChange
+
+
+class LengthChangeSeries(object):
+    '''
+    Time series of the length change measurements of a glacier as typed arrays (one element per measurement).
+
+    The series is created by the length change reader from the fixed-width columns of a file. Objects of
+    type LengthChange are only created on demand by iterLengthChanges(). Missing values are NaN for the
+    elevation and empty strings for the observers.
+
+    Attributes:
+        - _dateFroms                Start dates of the measurements (datetime64[D]).
+        - _dateFromQualities        Quality of the start dates (values of DateQualityTypeEnum).
+        - _dateTos                  End dates of the measurements (datetime64[D]).
+        - _dateToQualities          Quality of the end dates (values of DateQualityTypeEnum).
+        - _measurementTypes         Types of the measurements (e.g. m = measured, r = reconstructed).
+        - _measurementMethods       Methods of the measurements.
+        - _measurementConditions    Conditions during the measurements.
+        - _variationQuantitatives   Length changes in m.
+        - _elevationMins            Minimal elevations of the glacier tongue in m asl.
+        - _observers                Observers of the measurements.
+    '''
+
+    _dateFroms              = None
+    _dateFromQualities      = None
+    _dateTos                = None
+    _dateToQualities        = None
+    _measurementTypes       = None
+    _measurementMethods     = None
+    _measurementConditions  = None
+    _variationQuantitatives = None
+    _elevationMins          = None
+    _observers              = None
+
+    def __init__(self, dateFroms, dateFromQualities, dateTos, dateToQualities,
+                 measurementTypes, measurementMethods, measurementConditions,
+                 variationQuantitatives, elevationMins, observers):
+        '''
+        Constructor of the series. All arrays have the same length.
+
+        @type dateFroms: numpy.ndarray
+        @param dateFroms: Start dates of the measurements (datetime64[D]).
+        @type dateFromQualities: numpy.ndarray
+        @param dateFromQualities: Quality of the start dates (values of DateQualityTypeEnum).
+        @type dateTos: numpy.ndarray
+        @param dateTos: End dates of the measurements (datetime64[D]).
+        @type dateToQualities: numpy.ndarray
+        @param dateToQualities: Quality of the end dates (values of DateQualityTypeEnum).
+        @type measurementTypes: numpy.ndarray
+        @param measurementTypes: Types of the measurements.
+        @type measurementMethods: numpy.ndarray
+        @param measurementMethods: Methods of the measurements.
+        @type measurementConditions: numpy.ndarray
+        @param measurementConditions: Conditions during the measurements.
+        @type variationQuantitatives: numpy.ndarray
+        @param variationQuantitatives: Length changes in m.
+        @type elevationMins: numpy.ndarray
+        @param elevationMins: Minimal elevations of the glacier tongue in m asl, NaN if not given.
+        @type observers: numpy.ndarray
+        @param observers: Observers of the measurements, empty if not given.
+        '''
+
+        self._dateFroms              = dateFroms
+        self._dateFromQualities      = dateFromQualities
+        self._dateTos                = dateTos
+        self._dateToQualities        = dateToQualities
+        self._measurementTypes       = measurementTypes
+        self._measurementMethods     = measurementMethods
+        self._measurementConditions  = measurementConditions
+        self._variationQuantitatives = variationQuantitatives
+        self._elevationMins          = elevationMins
+        self._observers              = observers
+
+    @property
+    def dateFroms(self):
+        '''
+        Start dates of the measurements (datetime64[D]).
+        '''
+        return self._dateFroms
+
+    @property
+    def dateTos(self):
+        '''
+        End dates of the measurements (datetime64[D]).
+        '''
+        return self._dateTos
+
+    @property
+    def measurementTypes(self):
+        '''
+        Types of the measurements (e.g. m = measured, r = reconstructed).
+        '''
+        return self._measurementTypes
+
+    @property
+    def variationQuantitatives(self):
+        '''
+        Length changes in m.
+        '''
+        return self._variationQuantitatives
+
+    @property
+    def elevationMins(self):
+        '''
+        Minimal elevations of the glacier tongue in m asl, NaN if not given.
+        '''
+        return self._elevationMins
+
+    def select(self, mask):
+        '''
+        Gets the measurements selected by the given mask as new series.
+
+        @type mask: numpy.ndarray
+        @param mask: Boolean mask or indexes of the selected measurements.
+
+        @rtype: dataflow.DataObjects.LengthChangeSeries.LengthChangeSeries
+        @return: Series with the selected measurements.
+        '''
+
+        return LengthChangeSeries(
+            self._dateFroms[mask], self._dateFromQualities[mask],
+            self._dateTos[mask], self._dateToQualities[mask],
+            self._measurementTypes[mask], self._measurementMethods[mask], self._measurementConditions[mask],
+            self._variationQuantitatives[mask], self._elevationMins[mask], self._observers[mask])
+
+    def iterLengthChanges(self):
+        '''
+        Generator of the LengthChange objects of the series. The objects are created one by one while iterating.
+
+        @rtype: generator
+        @return: Objects of type dataflow.DataObjects.LengthChange.LengthChange
+        '''
+
+        elevationMins = [None if numpy.isnan(elevationMin) else elevationMin for elevationMin in self._elevationMins.tolist()]
+        observers = [observer if len(observer) > 0 else None for observer in self._observers.tolist()]
+
+        for dateFrom, dateFromQuality, dateTo, dateToQuality, measurementType, measurementMethod, measurementCondition, variationQuantitative, elevationMin, observer in zip(
+                self._dateFroms.tolist(), self._dateFromQualities.tolist(),
+                self._dateTos.tolist(), self._dateToQualities.tolist(),
+                self._measurementTypes.tolist(), self._measurementMethods.tolist(), self._measurementConditions.tolist(),
+                self._variationQuantitatives.tolist(), elevationMins, observers):
+
+            # The accuracy and the remarks are not supported by the VAW files.
+            yield LengthChange(
+                None,
+                dateFrom, dateFromQuality,
+                dateTo, dateToQuality,
+                measurementType, measurementMethod, measurementCondition,
+                variationQuantitative, "",
+                elevationMin,
+                observer,
+                None)
+
+    def __len__(self):
+        '''
+        Number of measurements of the series.
+        '''
+
+        return len(self._dateFroms)
+
+    def __str__(self):
+
+        return "Length change series: {0} measurements".format(len(self))
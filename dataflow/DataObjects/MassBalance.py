@@ -4,21 +4,51 @@ Created on 31.05.2018
 @author: yvo
 '''
 
+from dataflow.DataObjects.DataFrameBuilder import DataFrameBuilder
 from dataflow.DataObjects.Glamos import GlamosData
 from dataflow.DataObjects.Enumerations.MassBalanceEnumerations import MassBalanceTypeEnum
 from dataflow.DataObjects.Enumerations.MassBalanceEnumerations import AnalysisMethodEnum
 
 from datetime import date
-from pandas import DataFrame
+import numpy
+import pandas
 
 class MassBalance(GlamosData):
     # TODO: Class documentation
     
+    # Columns (name, type) of the extended data frame of a mass balance series (see createExtendedDataFrame()).
+    COLUMNS = [
+        ("dateFromAnnual",          date),
+        ("dateToWinter",            date),
+        ("dateToAnnual",            date),
+        ("winterMassBalance",       int),
+        ("annualMassBalance",       int),
+        ("massBalanceType",         MassBalanceTypeEnum),
+        ("dateFromWinter",          date),
+        ("analysisMethodType",      AnalysisMethodEnum),
+        ("elevationMinimum",        int),
+        ("elevationMaximum",        int),
+        ("surface",                 float),
+        ("equilibriumLineAltitude", int),
+        ("accumulationAreaRatio",   int),
+        ("pk",                      object)]
+
+    # Columns of the data frame of a mass balance series based on the original definition of the VAW ASCII files.
+    # date0;date_s;date1;winter balance; annual balance
+    __VAW_COLUMNS = ['dateFromAnnual', 'dateToWinter', 'dateToAnnual', 'winterMassBalance', 'annualMassBalance', 'massBalanceType']
+
+    # Columns of the mass balance repeated for each of its elevation bands.
+    __ELEVATION_BAND_KEY_COLUMNS = [
+        ("dateFromAnnual",  date),
+        ("dateToAnnual",    date),
+        ("massBalanceType", MassBalanceTypeEnum)]
+
     # ---- Static methods of the class ---
-    @staticmethod
-    def createDataFrame(massBalances):
+    @classmethod
+    def createDataFrame(cls, massBalances):
         '''
-        Reformats the given dictionary of mass-balances into a pandas.DataFrame.
+        Reformats the given dictionary of mass-balances into a pandas.DataFrame with the columns of the
+        VAW ASCII files. The values are kept as they are (dates, integers and MassBalanceTypeEnum members).
         
         @type massBalances: dict
         @param massBalances: Dictionary with mass-balances of an individual glacier.
@@ -27,13 +57,49 @@ class MassBalance(GlamosData):
         @return: Data frame (table) of the mass-balance observations.
         '''
 
-        # Definition of the data-frame based on the original definition of the VAW ASCII files.
-        # date0;date_s;date1;winter balance; annual balance
-    
-        plist = ['dateFromAnnual', 'dateToWinter', 'dateToAnnual', 'winterMassBalance', 'annualMassBalance', 'massBalanceType']
-        dataFrame = DataFrame([[getattr(massBalances[i], p) for p in plist ] for i in massBalances.keys()], columns = plist)
+        return pandas.DataFrame(
+            [[getattr(massBalance, name) for name in MassBalance.__VAW_COLUMNS] for massBalance in massBalances.values()],
+            columns=MassBalance.__VAW_COLUMNS)
+
+    @classmethod
+    def createExtendedDataFrame(cls, massBalances):
+        '''
+        Reformats the given dictionary of mass-balances into a pandas.DataFrame with all columns COLUMNS
+        of the mass-balances. The columns are typed by DataFrameBuilder.build(): Dates as datetime64,
+        nullable integers and the enumerations as categoricals of the names of their members.
+        
+        @type massBalances: dict
+        @param massBalances: Dictionary with mass-balances of an individual glacier.
+
+        @rtype: pandas.DataFrame
+        @return: Data frame (table) of the mass-balance observations.
+        '''
+
+        return DataFrameBuilder.build(massBalances, cls.COLUMNS)
+
+    @staticmethod
+    def createElevationBandDataFrame(massBalances):
+        '''
+        Reformats the elevation bands of the given dictionary of mass-balances into a pandas.DataFrame
+        in long format: one row per elevation band with the dates and the type of its mass balance.
         
-        return dataFrame
+        @type massBalances: dict
+        @param massBalances: Dictionary with mass-balances of an individual glacier.
+
+        @rtype: pandas.DataFrame
+        @return: Data frame (table) of the elevation bands of all mass-balance observations.
+        '''
+
+        massBalances = list(massBalances.values())
+        elevationBands = [elevationBand for massBalance in massBalances for elevationBand in massBalance.elevationBands.values()]
+        numberElevationBands = numpy.fromiter(
+            (len(massBalance.elevationBands) for massBalance in massBalances), dtype=numpy.int64, count=len(massBalances))
+
+        # The columns of the mass balances are repeated by row index instead of being read once per band.
+        keyDataFrame = DataFrameBuilder.build(massBalances, MassBalance.__ELEVATION_BAND_KEY_COLUMNS)
+        keyDataFrame = keyDataFrame.take(numpy.repeat(numpy.arange(len(massBalances)), numberElevationBands)).reset_index(drop=True)
+
+        return pandas.concat([keyDataFrame, ElevationBand.createDataFrame(elevationBands)], axis=1)
 
     # ---- Members of the class ---
     
@@ -99,7 +165,7 @@ class MassBalance(GlamosData):
         
         super().__init__(pk)
         
-        self._analysisMethod          = AnalysisMethodEnum(analysisMethod)
+        self._analysisMethod          = AnalysisMethodEnum.fromValue(analysisMethod)
         
         self._dateFrom                = dateFrom
         self._dateTo                  = dateTo
@@ -308,14 +374,26 @@ class ElevationBand(GlamosData):
         _surface            float   Total glacier surface of the band in km2.
     '''
     
-    _elevationFrom = None
-    _elevationTo = None
-    _winterMassBalance = None
-    _n_meas_winter = None
-    _annualMassBalance = None
-    _n_meas_annual = None
-    _surface = None
-    
+    __slots__ = (
+        "_elevationFrom",
+        "_elevationTo",
+        "_winterMassBalance",
+        "_n_meas_winter",
+        "_annualMassBalance",
+        "_n_meas_annual",
+        "_surface")
+
+    # Columns (name, type) of the data frame of elevation bands.
+    COLUMNS = [
+        ("elevationFrom",     int),
+        ("elevationTo",       int),
+        ("surface",           float),
+        ("winterMassBalance", int),
+        ("n_meas_winter",     int),
+        ("annualMassBalance", int),
+        ("n_meas_annual",     int),
+        ("pk",                object)]
+
     #FIXME: Adding _remarks as member.
     
     # FIXME: Adding remarks = None to the constructor as soon as _remarks is implemented as member in the ElevationBand class.
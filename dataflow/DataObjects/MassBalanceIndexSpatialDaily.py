@@ -4,6 +4,10 @@ Created on 8.2.2024
 @author: elias
 '''
 
+import datetime
+
+from dataflow.DataObjects.DataFrameBuilder import DataFrameBuilder
+from dataflow.DataObjects.Enumerations.MassBalanceIndexDailyEnumerations import SurfaceTypeEnum
 from dataflow.DataObjects.Glamos import GlamosData
 
 
@@ -27,20 +31,39 @@ class MassBalanceIndexSpatialDaily(GlamosData):
 
     '''
 
-    _name = None
-    _date = None
-    _latitude = None
-    _longitude = None
-    _altitude = None
-    _balance = None
-    _accumulation = None
-    _melt = None
-    _surface_type = None
-    _temp = None
-    _precip_solid = None
-    _reference = None
-    _investigator = None
-    _creation_date = None
+    __slots__ = (
+        "_name",
+        "_date",
+        "_latitude",
+        "_longitude",
+        "_altitude",
+        "_balance",
+        "_accumulation",
+        "_melt",
+        "_surface_type",
+        "_temp",
+        "_precip_solid",
+        "_reference",
+        "_investigator",
+        "_creation_date")
+
+    # Columns (name, type) of the data frame and of the ColumnarSeries of an index spatial daily mass balance series.
+    COLUMNS = [
+        ("pk",            object),
+        ("name",          object),
+        ("date",          datetime.date),
+        ("latitude",      float),
+        ("longitude",     float),
+        ("altitude",      float),
+        ("balance",       int),
+        ("accumulation",  int),
+        ("melt",          int),
+        ("surface_type",  SurfaceTypeEnum),
+        ("temp",          float),
+        ("precip_solid",  float),
+        ("reference",     object),
+        ("investigator",  object),
+        ("creation_date", object)]
 
     def __init__(self,
         pk = None,
@@ -4,6 +4,7 @@ Created on 9.2.2024
 @author: elias
 '''
 
+from dataflow.DataObjects.DataFrameBuilder import DataFrameBuilder
 from dataflow.DataObjects.Glamos import GlamosData
 from dataflow.DataObjects.Enumerations.MassBalanceEnumerations import AnalysisMethodEnum
 
@@ -40,6 +41,38 @@ class MassBalanceIndexSpatialSeasonal(GlamosData):
         _reference      string  reference of data
         '''
 
+    # Columns (name, type) of the data frame of an index spatial seasonal mass balance series.
+    COLUMNS = [
+        ("pk",                   object),
+        ("name",                 object),
+        ("date_0",               date),
+        ("date_fmeas",           date),
+        ("date_fmin",            date),
+        ("date_smeas",           date),
+        ("date_smax",            date),
+        ("date_1",               date),
+        ("analysis_method_type", int),
+        ("embargo_type",         int),
+        ("latitude",             float),
+        ("longitude",            float),
+        ("altitude",             float),
+        ("b_w_meas",             int),
+        ("b_a_meas",             int),
+        ("c_w_obs",              int),
+        ("c_a_obs",              int),
+        ("a_w_obs",              int),
+        ("a_a_obs",              int),
+        ("b_w_fix",              int),
+        ("b_a_fix",              int),
+        ("c_w_fix",              int),
+        ("c_a_fix",              int),
+        ("a_w_fix",              int),
+        ("a_a_fix",              int),
+        ("investigator",         object),
+        ("reference",            object)]
+
+    # ---- Members of the class ---
+
     _name = None
     _date_0 = None
     _date_fmeas = None
@@ -4,6 +4,7 @@ Created on 22.03.2021
 @author: elias
 '''
 
+from dataflow.DataObjects.DataFrameBuilder import DataFrameBuilder
 from dataflow.DataObjects.Glamos import GlamosData
 from dataflow.DataObjects.Enumerations.MassBalancePointEnumerations import DateAccuracyEnum
 from dataflow.DataObjects.Enumerations.MassBalancePointEnumerations import DensityAccuracyEnum
@@ -43,28 +44,56 @@ class MassBalancePoint(GlamosData):
 
     '''
 
-    _name = None
-    _observationType = None
-    _dateFrom = None
-    _timeFrom = None
-    _dateTo = None
-    _timeTo = None
-    _period = None
-    _dateAccuracy = None
-    _latitude = None
-    _longitude = None
-    _altitude = None
-    _positionAccuracy = None
-    _massbalance_raw = None
-    _density = None
-    _densityAccuracy = None
-    _massbalance_we = None
-    _measurement_quality = None
-    _measurement_type = None
-    _massbalance_error = None
-    _reading_error = None
-    _density_error = None
-    _source = None
+    __slots__ = (
+        "_name",
+        "_observationType",
+        "_dateFrom",
+        "_timeFrom",
+        "_dateTo",
+        "_timeTo",
+        "_period",
+        "_dateAccuracy",
+        "_latitude",
+        "_longitude",
+        "_altitude",
+        "_positionAccuracy",
+        "_massbalance_raw",
+        "_density",
+        "_densityAccuracy",
+        "_massbalance_we",
+        "_measurement_quality",
+        "_measurement_type",
+        "_massbalance_error",
+        "_reading_error",
+        "_density_error",
+        "_source")
+
+    # Columns (name, type) of the data frame and of the ColumnarSeries of a point mass balance series. The dates are
+    # given as strings yyyymmdd.
+    COLUMNS = [
+        ("pk",                  object),
+        ("name",                object),
+        ("observationType",     ObservationTypeEnum),
+        ("dateFrom",            "%Y%m%d"),
+        ("timeFrom",            object),
+        ("dateTo",              "%Y%m%d"),
+        ("timeTo",              object),
+        ("period",              float),
+        ("dateAccuracy",        DateAccuracyEnum),
+        ("latitude",            float),
+        ("longitude",           float),
+        ("altitude",            float),
+        ("positionAccuracy",    PositionAccuracyEnum),
+        ("massbalance_raw",     int),
+        ("density",             int),
+        ("densityAccuracy",     DensityAccuracyEnum),
+        ("massbalance_we",      int),
+        ("measurement_quality", MeasurementQualityEnum),
+        ("measurement_type",    MeasurementTypeEnum),
+        ("massbalance_error",   int),
+        ("reading_error",       int),
+        ("density_error",       int),
+        ("source",              object)]
 
     def __init__(self,
         pk=None,
@@ -4,6 +4,7 @@ Created on 31.1.2024
 @author: elias
 '''
 
+from .DataFrameBuilder import DataFrameBuilder
 from .Glamos import GlamosData
 
 
@@ -20,12 +21,23 @@ class MassBalanceSwissWide(GlamosData):
     '''
 
 
-    _sgi_id=None
-    _fk_glacier=None
-    _year=None
-    _area = None
-    _mb_evolution = None
-    _vol_evolution = None
+    __slots__ = (
+        "_sgi_id",
+        "_fk_glacier",
+        "_year",
+        "_area",
+        "_mb_evolution",
+        "_vol_evolution")
+
+    # Columns (name, type) of the data frame and of the ColumnarSeries of a swiss wide mass balance series.
+    COLUMNS = [
+        ("pk",            object),
+        ("sgi_id",        object),
+        ("fk_glacier",    object),
+        ("year",          int),
+        ("area",          float),
+        ("mb_evolution",  float),
+        ("vol_evolution", float)]
 
     @property
     def sgi_id(self):
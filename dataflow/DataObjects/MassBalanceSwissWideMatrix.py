@@ -0,0 +1,160 @@
+'''
+Created on 18.10.2026
+
+@author: yvo
+'''
+
+import numpy
+
+from .MassBalanceSwissWide import MassBalanceSwissWide
+
+
+class MassBalanceSwissWideMatrix(object):
+    '''
+    Swiss wide mass balance extrapolation of all glaciers as aligned matrices (glaciers x years).
+
+    The rows of the matrices are the glaciers in the order of the files, the columns are the years of the
+    header line. The area, the mass balance evolution and the volume evolution of a glacier in a year are
+    found in the same cell of the three matrices. Lines of the files with less values than years are padded
+    by NaN; the cells given by the files are marked by cellMask.
+
+    Objects of type MassBalanceSwissWide are only created on demand by iterMassBalanceSwissWides().
+
+    Attributes:
+        - _sgiIds                  SGI-IDs of the glaciers (row index of the matrices).
+        - _glacierPks              Primary keys of the glaciers in the order of _sgiIds.
+        - _years                   Years of the columns of the matrices.
+        - _numberValues            Number of values given by the files for each glacier.
+        - _areas                   Area of the glaciers in km2 (glaciers x years).
+        - _massBalanceEvolutions   Annual mass balance change in m w.e. (glaciers x years).
+        - _volumeEvolutions        Annual volume change in km3 (glaciers x years).
+    '''
+
+    _sgiIds                = None
+    _glacierPks            = None
+    _years                 = None
+    _numberValues          = None
+    _areas                 = None
+    _massBalanceEvolutions = None
+    _volumeEvolutions      = None
+
+    def __init__(self, sgiIds, glacierPks, years, numberValues, areas, massBalanceEvolutions, volumeEvolutions):
+        '''
+        Constructor of the matrices.
+
+        @type sgiIds: list
+        @param sgiIds: SGI-IDs of the glaciers (row index of the matrices).
+        @type glacierPks: list
+        @param glacierPks: Primary keys of the glaciers in the order of sgiIds.
+        @type years: numpy.ndarray
+        @param years: Years of the columns of the matrices.
+        @type numberValues: numpy.ndarray
+        @param numberValues: Number of values given by the files for each glacier.
+        @type areas: numpy.ndarray
+        @param areas: Area of the glaciers in km2 (glaciers x years).
+        @type massBalanceEvolutions: numpy.ndarray
+        @param massBalanceEvolutions: Annual mass balance change in m w.e. (glaciers x years).
+        @type volumeEvolutions: numpy.ndarray
+        @param volumeEvolutions: Annual volume change in km3 (glaciers x years).
+        '''
+
+        self._sgiIds                = list(sgiIds)
+        self._glacierPks            = list(glacierPks)
+        self._years                 = numpy.asarray(years, dtype=int)
+        self._numberValues          = numpy.asarray(numberValues, dtype=int)
+        self._areas                 = areas
+        self._massBalanceEvolutions = massBalanceEvolutions
+        self._volumeEvolutions      = volumeEvolutions
+
+    @property
+    def sgiIds(self):
+        '''
+        SGI-IDs of the glaciers (row index of the matrices).
+        '''
+        return self._sgiIds
+
+    @property
+    def glacierPks(self):
+        '''
+        Primary keys of the glaciers in the order of sgiIds.
+        '''
+        return self._glacierPks
+
+    @property
+    def years(self):
+        '''
+        Years of the columns of the matrices.
+        '''
+        return self._years
+
+    @property
+    def areas(self):
+        '''
+        Area of the glaciers in km2 (glaciers x years).
+        '''
+        return self._areas
+
+    @property
+    def massBalanceEvolutions(self):
+        '''
+        Annual mass balance change in m w.e. (glaciers x years).
+        '''
+        return self._massBalanceEvolutions
+
+    @property
+    def volumeEvolutions(self):
+        '''
+        Annual volume change in km3 (glaciers x years).
+        '''
+        return self._volumeEvolutions
+
+    @property
+    def cellMask(self):
+        '''
+        Boolean matrix (glaciers x years) of the cells given by the files.
+        '''
+        return numpy.arange(len(self._years)) < self._numberValues[:, numpy.newaxis]
+
+    def cells(self):
+        '''
+        Gets the values of all cells given by the files as flat lists, glacier by glacier and year by year.
+
+        @rtype: tuple
+        @return: Lists of the row indexes (glaciers), years, areas, mass balance evolutions and volume evolutions.
+        '''
+
+        cellMask = self.cellMask
+        glacierIndexes, yearIndexes = numpy.nonzero(cellMask)
+
+        return (
+            glacierIndexes.tolist(),
+            self._years[yearIndexes].tolist(),
+            self._areas[cellMask].tolist(),
+            self._massBalanceEvolutions[cellMask].tolist(),
+            self._volumeEvolutions[cellMask].tolist())
+
+    def iterMassBalanceSwissWides(self):
+        '''
+        Generator of the MassBalanceSwissWide objects of all cells given by the files. The objects are
+        created one by one while iterating.
+
+        @rtype: generator
+        @return: Objects of type dataflow.DataObjects.MassBalanceSwissWide.MassBalanceSwissWide
+        '''
+
+        for glacierIndex, year, area, massBalanceEvolution, volumeEvolution in zip(*self.cells()):
+
+            yield MassBalanceSwissWide(
+                self._sgiIds[glacierIndex], self._glacierPks[glacierIndex], year, area, massBalanceEvolution, volumeEvolution)
+
+    def __len__(self):
+        '''
+        Number of cells given by the files.
+        '''
+
+        return int(self._numberValues.sum())
+
+    def __str__(self):
+
+        return "Swiss wide mass balance matrices: {0} glaciers x {1} years ({2} values)".format(
+            len(self._sgiIds), len(self._years), len(self))
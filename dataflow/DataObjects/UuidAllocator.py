@@ -0,0 +1,71 @@
+'''
+Created on 18.10.2026
+
+@author: yvo
+'''
+
+import random
+import threading
+import time
+import uuid
+
+class UuidAllocator(object):
+    '''
+    Allocator of time-based (version 1) UUIDs for whole batches of data objects.
+
+    uuid.uuid1() reads the clock and takes a lock for every single identifier. The allocator reads the clock
+    once per batch and reserves a range of consecutive 100-ns timestamps. All UUIDs of a batch share the node
+    of the host and a random clock sequence, the clock sequence separates the batch from identifiers created
+    by uuid.uuid1() with the same timestamps. Ranges of subsequent batches do not overlap.
+
+    Attributes:
+        - __UUID_EPOCH_OFFSET   Number of 100-ns intervals between 1582-10-15 (UUID epoch) and 1970-01-01.
+        - _lock                 Lock of the reservation of the timestamps.
+        - _lastTimestamp        Last timestamp reserved.
+        - _node                 Hardware address of the host (48 bits).
+    '''
+
+    __UUID_EPOCH_OFFSET = 0x01b21dd213814000
+
+    _lock = threading.Lock()
+
+    _lastTimestamp = 0
+
+    _node = None
+
+    @staticmethod
+    def allocate(numberUuids):
+        '''
+        Allocates the given number of new UUIDs with a single clock read.
+
+        @type numberUuids: int
+        @param numberUuids: Number of UUIDs needed (e.g. number of rows of a batch).
+
+        @rtype: list
+        @return: List of uuid.UUID objects (version 1), ordered by their timestamp.
+        '''
+
+        if numberUuids <= 0:
+            return list()
+
+        if UuidAllocator._node == None:
+            UuidAllocator._node = uuid.getnode()
+
+        with UuidAllocator._lock:
+            firstTimestamp = max(time.time_ns() // 100 + UuidAllocator.__UUID_EPOCH_OFFSET, UuidAllocator._lastTimestamp + 1)
+            UuidAllocator._lastTimestamp = firstTimestamp + numberUuids - 1
+
+        # Variant bits (RFC 4122) with a random clock sequence of 14 bits and the node.
+        clockSequenceAndNode = ((0x8000 | random.getrandbits(14)) << 48) | UuidAllocator._node
+
+        uuids = list()
+
+        for timestamp in range(firstTimestamp, firstTimestamp + numberUuids):
+
+            timeLow = timestamp & 0xffffffff
+            timeMid = (timestamp >> 32) & 0xffff
+            timeHighAndVersion = ((timestamp >> 48) & 0x0fff) | 0x1000
+
+            uuids.append(uuid.UUID(int=(timeLow << 96) | (timeMid << 80) | (timeHighAndVersion << 64) | clockSequenceAndNode))
+
+        return uuids
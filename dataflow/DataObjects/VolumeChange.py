@@ -4,7 +4,11 @@ Created on 11.07.2018
 @author: yvo
 '''
 
+import datetime
+
+from dataflow.DataObjects.DataFrameBuilder import DataFrameBuilder
 from dataflow.DataObjects.Glamos import GlamosData
+from dataflow.DataObjects.Enumerations.DateEnumerations import DateQualityTypeEnum
 from dataflow.DataObjects.Enumerations.HeightCaptureMethodEnumeration import HeightCaptureMethodEnum
 from dataflow.DataObjects.Enumerations.VolumeChangeEnumerations import AnalysisMethodEnum
 
@@ -30,6 +34,27 @@ class VolumeChange(GlamosData):
     _heightChangeMean        float                      Mean difference of surface height between t1 - t0 [m]
     '''
 
+    # Columns (name, type) of the data frame of a volume change series.
+    COLUMNS = [
+        ("pk",                      object),
+        ("dateFrom",                datetime.date),
+        ("dateFromQuality",         DateQualityTypeEnum),
+        ("dateTo",                  datetime.date),
+        ("dateToQuality",           DateQualityTypeEnum),
+        ("areaFrom",                float),
+        ("areaTo",                  float),
+        ("heightCaptureMethodFrom", HeightCaptureMethodEnum),
+        ("heightCaptureMethodTo",   HeightCaptureMethodEnum),
+        ("analysisMethod",          AnalysisMethodEnum),
+        ("elevationMaximumFrom",    float),
+        ("elevationMinimumFrom",    float),
+        ("elevationMaximumTo",      float),
+        ("elevationMinimumTo",      float),
+        ("volumeChange",            float),
+        ("heightChangeMean",        float)]
+
+    # ---- Members of the class ---
+
     _dateFrom                = None
     _dateFromQuality         = None
     _dateTo                  = None
@@ -0,0 +1,281 @@
+'''
+Created on 18.10.2026
+
+@author: yvo
+'''
+
+from .Exceptions.DatabaseConnectionError import DatabaseConnectionError
+
+from psycopg2 import OperationalError
+from psycopg2.pool import PoolError
+from psycopg2.pool import ThreadedConnectionPool
+import configparser
+import os
+import threading
+
+class DatabaseConnectionPool(ThreadedConnectionPool):
+    '''
+    Process-wide pool of connections to the GLAMOS database shared by all database readers and writers.
+
+    One pool exists per database access configuration file. The pool is created with the first
+    call of DatabaseConnectionPool.getPool() and reused by all subsequent readers and writers
+    with the same access configuration.
+
+    Borrowing a connection of an exhausted pool blocks until another thread gives back a connection,
+    a pool can therefore be shared by more threads than it has connections.
+
+    A pool belongs to the process which created it. Child processes (e.g. the workers of a
+    ProcessPoolExecutor) inherit the pools of the parent but get their own pools with new
+    connections, the inherited connections are neither used nor closed by the child.
+
+    The size of the pool can be defined by the optional section [Pool] of the access configuration file:
+
+        [Pool]
+        minConnections = 1
+        maxConnections = 10
+
+    Attributes:
+        _CONNECTION_STRING_TEMPLATE: Template of the connection to the database.
+        _CONNECTION_TIMEOUT_TEMPLATE: Optional part of the connection string defining the timeout.
+        _DEFAULT_MINIMUM_CONNECTIONS: Number of connections opened at the creation of the pool if not configured.
+        _DEFAULT_MAXIMUM_CONNECTIONS: Maximum number of connections of the pool if not configured.
+        _pools: Dictionary of all pools of the process. Key: access configuration file; Value: DatabaseConnectionPool
+        _poolsLock: Lock protecting the creation of pools.
+        _accessConfigurationFullFileName: Full file name of the database access configuration file of the pool.
+        _pid: Identifier of the process which created the pool.
+        _connectionSlots: Semaphore with one slot per connection of the pool, held while a connection is borrowed.
+        _connectionsOpenedCounter: Number of physical connections opened by the pool. Updated under the lock of the pool.
+        _connectionsBorrowedCounter: Number of connections handed out by the pool. Updated under the lock of the pool.
+    '''
+
+    _CONNECTION_STRING_TEMPLATE = "host='{0}' dbname='{1}' user='{2}' password='{3}'"
+
+    _CONNECTION_TIMEOUT_TEMPLATE = " connect_timeout={0}"
+
+    _DEFAULT_MINIMUM_CONNECTIONS = 1
+
+    _DEFAULT_MAXIMUM_CONNECTIONS = 10
+
+    _pools = dict()
+
+    _poolsLock = threading.Lock()
+
+    _accessConfigurationFullFileName = ""
+
+    _pid = None
+
+    _connectionSlots = None
+
+    _connectionsOpenedCounter = 0
+
+    _connectionsBorrowedCounter = 0
+
+    @property
+    def accessConfigurationFullFileName(self):
+        '''
+        Get the full file name of the database access configuration file of the pool.
+        '''
+        return self._accessConfigurationFullFileName
+
+    @property
+    def pid(self):
+        '''
+        Get the identifier of the process which created the pool.
+        '''
+        return self._pid
+
+    @property
+    def connectionsOpened(self):
+        '''
+        Get the number of physical connections opened by the pool since its creation.
+        '''
+        return self._connectionsOpenedCounter
+
+    @property
+    def connectionsBorrowed(self):
+        '''
+        Get the number of connections handed out by the pool since its creation.
+        '''
+        return self._connectionsBorrowedCounter
+
+    @property
+    def connectionsReused(self):
+        '''
+        Get the number of connections handed out without opening a new physical connection.
+        '''
+        return max(0, self._connectionsBorrowedCounter - self._connectionsOpenedCounter)
+
+    def __init__(self, accessConfigurationFullFileName):
+        '''
+        Constructor. Readers and writers should use DatabaseConnectionPool.getPool() instead of creating
+        their own pool.
+
+        @type accessConfigurationFullFileName: string
+        @param accessConfigurationFullFileName: Full file name of a database access configuration file.
+        '''
+
+        self._accessConfigurationFullFileName = accessConfigurationFullFileName
+        self._pid = os.getpid()
+        self._connectionsOpenedCounter = 0
+        self._connectionsBorrowedCounter = 0
+
+        config = configparser.ConfigParser()
+        config.read(self._accessConfigurationFullFileName)
+
+        host = config.get("Access", "host")
+        dbName = config.get("Access", "dbname")
+        dbUser = config.get("Access", "user")
+        dbPassword = config.get("Access", "password")
+
+        connectionString = self._CONNECTION_STRING_TEMPLATE.format(
+            host, dbName, dbUser, dbPassword)
+
+        if config.has_option("Access", "timeout"):
+            connectionString += self._CONNECTION_TIMEOUT_TEMPLATE.format(config.getint("Access", "timeout"))
+
+        minimumConnections = config.getint("Pool", "minConnections", fallback=self._DEFAULT_MINIMUM_CONNECTIONS)
+        maximumConnections = config.getint("Pool", "maxConnections", fallback=self._DEFAULT_MAXIMUM_CONNECTIONS)
+
+        self._connectionSlots = threading.BoundedSemaphore(maximumConnections)
+
+        try:
+            super().__init__(minimumConnections, maximumConnections, connectionString)
+        except OperationalError as operationalError:
+            raise DatabaseConnectionError(DatabaseConnectionPool._operationalErrorMessage(operationalError))
+
+    @staticmethod
+    def getPool(accessConfigurationFullFileName):
+        '''
+        Get the pool of the given database access configuration. The pool is created with the first call.
+
+        @type accessConfigurationFullFileName: string
+        @param accessConfigurationFullFileName: Full file name of a database access configuration file.
+
+        @rtype: DatabaseConnectionPool
+        @return: Pool shared by all readers and writers using the same access configuration.
+
+        @raise DatabaseConnectionError: Error during opening the initial connections of the pool.
+        '''
+
+        with DatabaseConnectionPool._poolsLock:
+
+            pool = DatabaseConnectionPool._pools.get(accessConfigurationFullFileName)
+
+            # Pools inherited from a parent process are replaced by a pool of the current process.
+            if pool == None or pool.closed or pool.pid != os.getpid():
+                pool = DatabaseConnectionPool(accessConfigurationFullFileName)
+                DatabaseConnectionPool._pools[accessConfigurationFullFileName] = pool
+
+            return pool
+
+    @staticmethod
+    def maximumConnections(accessConfigurationFullFileName):
+        '''
+        Get the maximum number of connections of the pool of the given database access configuration
+        without creating the pool.
+
+        @type accessConfigurationFullFileName: string
+        @param accessConfigurationFullFileName: Full file name of a database access configuration file.
+
+        @rtype: int
+        @return: Configured maximum number of connections, _DEFAULT_MAXIMUM_CONNECTIONS if not configured.
+        '''
+
+        config = configparser.ConfigParser()
+        config.read(accessConfigurationFullFileName)
+
+        return config.getint("Pool", "maxConnections", fallback=DatabaseConnectionPool._DEFAULT_MAXIMUM_CONNECTIONS)
+
+    @staticmethod
+    def closeAllPools():
+        '''
+        Closing all connections of all pools of the process. Pools inherited from a parent process
+        are only dropped, their connections are still used by the parent.
+        '''
+
+        with DatabaseConnectionPool._poolsLock:
+
+            for pool in DatabaseConnectionPool._pools.values():
+                if not pool.closed and pool.pid == os.getpid():
+                    pool.closeall()
+
+            DatabaseConnectionPool._pools.clear()
+
+    def borrowConnection(self):
+        '''
+        Borrowing a connection of the pool. The connection has to be given back by returnConnection().
+        In case of an exhausted pool, the call waits until a connection is given back.
+
+        @rtype: connection
+        @return: Open connection to the database.
+
+        @raise DatabaseConnectionError: Error during connecting to database (e.g. timeout) or closed pool.
+        '''
+
+        # Writers of parallel ingestions borrow connections from several threads.
+        self._connectionSlots.acquire()
+
+        try:
+            connection = self.getconn()
+        except OperationalError as operationalError:
+            self._connectionSlots.release()
+            raise DatabaseConnectionError(DatabaseConnectionPool._operationalErrorMessage(operationalError))
+        except PoolError as poolError:
+            self._connectionSlots.release()
+            raise DatabaseConnectionError("Problem of the connection pool: {0}".format(poolError))
+
+        with self._lock:
+            self._connectionsBorrowedCounter += 1
+
+        return connection
+
+    def returnConnection(self, connection):
+        '''
+        Giving back a borrowed connection to the pool. Pending transactions are rolled back by the pool,
+        broken connections are discarded.
+
+        @type connection: connection
+        @param connection: Connection borrowed by borrowConnection().
+        '''
+
+        try:
+            if self.closed:
+                connection.close()
+            else:
+                self.putconn(connection, close=connection.closed != 0)
+        finally:
+            self._connectionSlots.release()
+
+    def _connect(self, key=None):
+        '''
+        Overwriting the creation of a new physical connection to keep track of the opened connections.
+        The pool calls the method under its lock (getconn()) or before the pool is shared (constructor).
+        '''
+
+        connection = super()._connect(key)
+        self._connectionsOpenedCounter += 1
+
+        return connection
+
+    @staticmethod
+    def _operationalErrorMessage(operationalError):
+        '''
+        Creating the message of a DatabaseConnectionError based on an OperationalError of psycopg2.
+
+        @type operationalError: psycopg2.OperationalError
+        @param operationalError: Error raised by psycopg2.
+
+        @rtype: string
+        @return: Message for the DatabaseConnectionError.
+        '''
+
+        if len(operationalError.args) > 0:
+            return "Error message from the database: " + operationalError.args[0]
+        else:
+            return "Undefined operational error of the database"
+
+    def __str__(self):
+
+        message = "Connection pool of {0}: {1} connections opened, {2} reused"
+
+        return message.format(self._accessConfigurationFullFileName, self.connectionsOpened, self.connectionsReused)
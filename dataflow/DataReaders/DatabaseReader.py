@@ -31,25 +31,34 @@ class DatabaseReader(DataReader):
 
 
 
-import psycopg2
 from psycopg2 import OperationalError
-from .Exceptions.DatabaseConnectionError import DatabaseConnectionError
+from psycopg2.pool import PoolError
 import configparser
+import logging
+from .DatabaseConnectionPool import DatabaseConnectionPool
+from .Exceptions.DatabaseConnectionError import DatabaseConnectionError
+import itertools
      
 class PostgreSqlReader(DatabaseReader):
     '''
     Specialised main class for PostgreSQL and PostGIS access.
     
+    The connections are borrowed from the process-wide DatabaseConnectionPool of the access configuration
+    and given back after each query.
+    
     Attributes:
-        _CONNECTION_STRING_TEMPLATE: Template of the connection to the database. host address, database name, user name and password have to be stored in a private configuration file.
-        _connectionString: Entire string to access the database.
+        _DEFAULT_ITERSIZE: Number of records fetched per round trip by the server-side cursors of streamData().
+        _STREAMING_CURSOR_NAME_TEMPLATE: Template of the names of the server-side cursors.
+        _streamingCursorCounter: Counter used to get unique names of the server-side cursors.
         _connection: Connection object to the database
         _cursor: Data cursor with the results of the queries.
     '''
-
-    _CONNECTION_STRING_TEMPLATE = "host='{0}' dbname='{1}' user='{2}' password='{3}' connect_timeout={4}"
     
-    _connectionString = ""
+    _DEFAULT_ITERSIZE = 2000
+    
+    _STREAMING_CURSOR_NAME_TEMPLATE = "glamos_streaming_cursor_{0}"
+    
+    _streamingCursorCounter = itertools.count()
     
     _connection = None
     
@@ -67,18 +76,17 @@ class PostgreSqlReader(DatabaseReader):
         
         self._connection = None
         self._cursor = None
+    
+    @property
+    def connectionPool(self):
+        '''
+        Get the connection pool shared by all readers and writers with the same access configuration.
         
-        config = configparser.ConfigParser()
-        config.read(self._accessConfigurationFullFileName)
-        
-        host = config.get("Access", "host")
-        dbName = config.get("Access", "dbname")
-        dbUser = config.get("Access", "user")
-        dbPassword = config.get("Access", "password")
-        timeout = config.getint("Access", "timeout")
+        @rtype: DatabaseConnectionPool
+        @return: Connection pool of the access configuration.
+        '''
         
-        self._connectionString = self._CONNECTION_STRING_TEMPLATE.format(
-            host, dbName, dbUser, dbPassword, timeout)
+        return DatabaseConnectionPool.getPool(self._accessConfigurationFullFileName)
     
     @property
     def isDatabaseAvailable(self):
@@ -90,15 +98,16 @@ class PostgreSqlReader(DatabaseReader):
         '''
         
         try:
-            self._connection = psycopg2.connect(self._connectionString)
+            connectionPool = self.connectionPool
+            connectionPool.returnConnection(connectionPool.borrowConnection())
             
             return True
         
-        except OperationalError:
+        except (DatabaseConnectionError, OperationalError, configparser.Error, PoolError):
             return False
     
     
-    def retriveData(self, statement):
+    def retriveData(self, statement, parameters=None):
         '''
         Retrieving all the data records found by the query based on the given statement.
         The results are returned as list object.
@@ -107,20 +116,25 @@ class PostgreSqlReader(DatabaseReader):
         
         @type statement: string
         @param statement: SQL statement for the GLAMOS PostGIS database.
+        @type parameters: sequence
+        @param parameters: Optional values of the %s placeholders of the statement.
         
         @rtype: List
         @return: List of all returned records found by the statement.
         
-        @raise DatabaseConnectionError: Error during connecting to database (e.g. timeout).
+        @raise DatabaseConnectionError: Error during connecting to database (e.g. timeout, invalid access configuration).
         '''
         
+        connectionPool = None
+        
         try:
             results = list()
             
-            self._connection = psycopg2.connect(self._connectionString)
+            connectionPool = self.connectionPool
+            self._connection = connectionPool.borrowConnection()
             self._cursor = self._connection.cursor()
 
-            self._cursor.execute(statement)
+            self._cursor.execute(statement, parameters)
 
             for recordReturned in self._cursor:
                 results.append(recordReturned)
@@ -138,6 +152,12 @@ class PostgreSqlReader(DatabaseReader):
             
             raise DatabaseConnectionError(errorMessage)
         
+        except (configparser.Error, PoolError) as connectionError:
+            raise DatabaseConnectionError("Problem during connecting to the database: {0}".format(connectionError))
+        
+        except DatabaseConnectionError:
+            raise
+        
         except Exception as e:
             
             errorMessage = "Problem during accessing or retrieving data from the database: {0}".format(e)
@@ -146,7 +166,81 @@ class PostgreSqlReader(DatabaseReader):
             #TODO: Improving the error handling, logging etc.
         
         finally:
-            if self._connection != None:
-                self._connection.close()
             if self._cursor != None:
-                self._cursor.close()
\ No newline at end of file
+                self._cursor.close()
+                self._cursor = None
+            if self._connection != None:
+                connectionPool.returnConnection(self._connection)
+                self._connection = None
+    
+    def streamData(self, statement, itersize=None, parameters=None):
+        '''
+        Generator retrieving the data records found by the query based on the given statement.
+        In contrast to retriveData() the records are not collected in a list but fetched by a
+        named (server-side) cursor in portions of itersize records and returned one by one. The
+        memory used is therefore independent of the number of records found.
+        
+        The connection is borrowed from the pool until the generator is exhausted or closed.
+        
+        @type statement: string
+        @param statement: SQL statement for the GLAMOS PostGIS database.
+        @type itersize: int
+        @param itersize: Number of records fetched per round trip. Default: _DEFAULT_ITERSIZE
+        @type parameters: sequence
+        @param parameters: Optional values of the %s placeholders of the statement.
+        
+        @rtype: Generator
+        @return: Generator over all records found by the statement.
+        
+        @raise DatabaseConnectionError: Error during connecting to database (e.g. timeout, invalid access configuration).
+        @raise Exception: Any other error while streaming is logged and raised again, the stream is not truncated silently.
+        '''
+        
+        if itersize == None:
+            itersize = self._DEFAULT_ITERSIZE
+        
+        connectionPool = None
+        connection = None
+        cursor = None
+        
+        try:
+            connectionPool = self.connectionPool
+            connection = connectionPool.borrowConnection()
+            
+            cursorName = self._STREAMING_CURSOR_NAME_TEMPLATE.format(next(PostgreSqlReader._streamingCursorCounter))
+            cursor = connection.cursor(name=cursorName)
+            cursor.itersize = itersize
+            
+            cursor.execute(statement, parameters)
+            
+            for recordReturned in cursor:
+                yield recordReturned
+        
+        except OperationalError as operationalError:
+            
+            errorMessage = ""
+            
+            if len(operationalError.args) > 0:
+                errorMessage = "Error message from the database: " + operationalError.args[0]
+            else:
+                errorMessage = "Undefined operational error of the database"
+            
+            raise DatabaseConnectionError(errorMessage)
+        
+        except (configparser.Error, PoolError) as connectionError:
+            raise DatabaseConnectionError("Problem during connecting to the database: {0}".format(connectionError))
+        
+        except DatabaseConnectionError:
+            raise
+        
+        except Exception as e:
+            
+            # The error is raised again, an aborted stream cannot be told apart from a complete one otherwise.
+            logging.error("Problem during streaming data from the database: %s", e)
+            raise
+        
+        finally:
+            if cursor != None and not cursor.closed and not connection.closed:
+                cursor.close()
+            if connection != None:
+                connectionPool.returnConnection(connection)
\ No newline at end of file
@@ -6,19 +6,52 @@ Created on 22.05.2018
 
 from dataflow.DataReaders.DatabaseReaders.GlamosDatabaseReader import GlamosDatabaseReader
 from dataflow.DataObjects.Glacier import Glacier
+from dataflow.DataObjects.GlacierCatalog import GlacierCatalog
 from dataflow.DataReaders.Exceptions.InvalidCoordinatesError import InvalidCoordinatesError
 from dataflow.DataReaders.Exceptions.InvalidGeometryError import InvalidGeometryError
 
+import threading
+import time
 import uuid
 
 class GlacierReader(GlamosDatabaseReader):
     '''
     Reader object to retrieve glacier related data stored in the GLAMOS PostGIS database.
+    
+    Optionally, lookups of individual glaciers are answered by an in-process glacier catalog instead of a
+    query per glacier. The catalog is loaded once by getAllGlaciers() and shared by all glacier readers
+    using the same access configuration. It is reloaded after catalogTimeToLive seconds or by refreshCatalog().
+    Glacier objects of the catalog are shared between all callers.
+    
+    With columnarSeries, the glaciers store their high-volume series (daily index and point mass balances,
+    swiss wide mass balances) as columnar series (see dataflow.DataObjects.Glacier.Glacier).
+    
+    Attributes:
+        _TABLE_GLACIER: Absolute name of the view to retrieve the glaciers from (<schema>.<table | view>).
+        _TABLE_GLACIER_EPSG: EPSG code of the geometries of the glacier view.
+        _DEFAULT_CATALOG_TIME_TO_LIVE: Seconds after which a loaded catalog is reloaded if not configured.
+        _catalogs: Catalogs of the process. Key: Tuple of access configuration file and columnar series flag; Value: Tuple of load time and GlacierCatalog.
+        _catalogsLock: Lock protecting the loading of catalogs.
+        _useCatalog: True if lookups by getGlacierBySgi() and getGlaciersBySgi() are answered by the catalog.
+        _catalogTimeToLive: Seconds after which the catalog is reloaded.
+        _columnarSeries: True if the glaciers are created with columnar series.
     '''
     
     _TABLE_GLACIER      = "base_data.vw_glacier"
     _TABLE_GLACIER_EPSG = 2056
     
+    _DEFAULT_CATALOG_TIME_TO_LIVE = 3600.0
+    
+    _catalogs = dict()
+    
+    _catalogsLock = threading.Lock()
+    
+    _useCatalog = False
+    
+    _catalogTimeToLive = _DEFAULT_CATALOG_TIME_TO_LIVE
+    
+    _columnarSeries = False
+    
     @staticmethod
     def getEpsgCode(eastingToCheck, nortingToCheck):
         '''
@@ -71,15 +104,98 @@ class GlacierReader(GlamosDatabaseReader):
         
         super().__init__(accessConfigurationFullFileName)
         
+        self._useCatalog = False
+        self._catalogTimeToLive = self._DEFAULT_CATALOG_TIME_TO_LIVE
+        self._columnarSeries = False
+        
+    @property
+    def useCatalog(self):
+        '''
+        Get the flag if lookups by getGlacierBySgi() and getGlaciersBySgi() are answered by the glacier catalog.
+        '''
+        return self._useCatalog
+    
+    @useCatalog.setter
+    def useCatalog(self, value):
+        '''
+        Set the flag if lookups by getGlacierBySgi() and getGlaciersBySgi() are answered by the glacier catalog.
+        
+        @type value: bool
+        @param value: True to use the glacier catalog, False to query the database for each lookup.
+        '''
+        self._useCatalog = value
+        
+    @property
+    def catalogTimeToLive(self):
+        '''
+        Get the number of seconds after which the glacier catalog is reloaded from the database.
+        '''
+        return self._catalogTimeToLive
+    
+    @catalogTimeToLive.setter
+    def catalogTimeToLive(self, value):
+        '''
+        Set the number of seconds after which the glacier catalog is reloaded from the database.
+        
+        @type value: float
+        @param value: Time to live of the glacier catalog in seconds.
+        '''
+        self._catalogTimeToLive = value
+        
+    @property
+    def columnarSeries(self):
+        '''
+        Get the flag if the glaciers are created with columnar series instead of dictionaries of objects.
+        '''
+        return self._columnarSeries
+    
+    @columnarSeries.setter
+    def columnarSeries(self, value):
+        '''
+        Set the flag if the glaciers are created with columnar series instead of dictionaries of objects.
+        
+        @type value: bool
+        @param value: True to store the high-volume series of the glaciers as columnar series.
+        '''
+        self._columnarSeries = value
+    
+    def refreshCatalog(self):
+        '''
+        Reloads the glacier catalog of the access configuration from the database.
+        '''
+        
+        glaciers = self.getAllGlaciers()
+        
+        with GlacierReader._catalogsLock:
+            GlacierReader._catalogs[(self._accessConfigurationFullFileName, self._columnarSeries)] = (time.monotonic(), glaciers)
+            
+    def _catalog(self):
+        '''
+        Get the glacier catalog of the access configuration. The catalog is loaded if not available or expired.
+        
+        @rtype: dataflow.DataObjects.GlacierCatalog.GlacierCatalog
+        @return: Catalog of all glaciers.
+        '''
+        
+        with GlacierReader._catalogsLock:
+            catalog = GlacierReader._catalogs.get((self._accessConfigurationFullFileName, self._columnarSeries))
+        
+        if catalog == None or time.monotonic() - catalog[0] > self._catalogTimeToLive:
+            self.refreshCatalog()
+            with GlacierReader._catalogsLock:
+                catalog = GlacierReader._catalogs[(self._accessConfigurationFullFileName, self._columnarSeries)]
+        
+        return catalog[1]
+        
     def getAllGlaciers(self):
         '''
         Retrieves all individual glacier objects from the database.
         
-        @rtype: dictionary
-        @return: Dictionary with the SGI-ID as key and the corresponding glacier object.
+        @rtype: dataflow.DataObjects.GlacierCatalog.GlacierCatalog
+        @return: Catalog with the SGI-ID as key and the corresponding glacier object, indexed by pk, pkVaw and name.
         '''
         
-        glaciers = dict()
+        glaciers = GlacierCatalog()
         
         statement = "SELECT * FROM {0};".format(self._TABLE_GLACIER)
         
@@ -109,11 +225,14 @@ class GlacierReader(GlamosDatabaseReader):
         @raise OperationalError: Error during connecting to database (e.g. timeout).
         '''
         
+        if self._useCatalog:
+            return self._catalogLookup(self._catalog().getBySgi(pkSgi))
+        
         glaciers = dict()
         
-        statement = "SELECT * FROM {0} WHERE pk_sgi = '{1}';".format(self._TABLE_GLACIER, pkSgi)
+        statement = "SELECT * FROM {0} WHERE pk_sgi = %s;".format(self._TABLE_GLACIER)
         
-        results = super().retriveData(statement)
+        results = super().retriveData(statement, [pkSgi])
         
         for result in results:
             
@@ -129,6 +248,90 @@ class GlacierReader(GlamosDatabaseReader):
             raise Exception("Too many entries found!")
             #TODO: Implementation and raising of own database exception.
 
+    def getGlaciersBySgi(self, pkSgis):
+        '''
+        Retrieves the glaciers of all given Swiss Glacier Inventory keys with one single query or,
+        if useCatalog is set, from the glacier catalog. Keys without glacier are not part of the result.
+        
+        @type pkSgis: list
+        @param pkSgis: List of string representations of Swiss Glacier Inventory keys.
+        
+        @rtype: dictionary
+        @return: Dictionary with the SGI-ID as key and the corresponding glacier object.
+        
+        @raise DatabaseConnectionError: Error during connecting to database (e.g. timeout).
+        '''
+        
+        glaciers = dict()
+        
+        if self._useCatalog:
+            catalog = self._catalog()
+            for pkSgi in pkSgis:
+                if pkSgi in catalog:
+                    glaciers[pkSgi] = catalog[pkSgi]
+            return glaciers
+        
+        statement = "SELECT * FROM {0} WHERE pk_sgi = ANY(%s);".format(self._TABLE_GLACIER)
+        
+        results = super().retriveData(statement, [list(pkSgis)])
+        
+        if results != None:
+            for result in results:
+                
+                glacier = self._recordToObject(result)
+                glaciers[glacier.pkSgi] = glacier
+        
+        return glaciers
+    
+    def getGlacierByVaw(self, pkVaw):
+        '''
+        Retrieves an individual glacier from the glacier catalog based on the given VAW identifier.
+        
+        @type pkVaw: int
+        @param pkVaw: VAW identifier of the glacier.
+        
+        @rtype: Glacier
+        @return: Object representing the glacier with the given VAW identifier.
+        
+        @raise Exception: In case of none glacier found.
+        '''
+        
+        return self._catalogLookup(self._catalog().getByVaw(pkVaw))
+    
+    def getGlacierByPk(self, pk):
+        '''
+        Retrieves an individual glacier from the glacier catalog based on the given primary key.
+        
+        @type pk: uuid.UUID
+        @param pk: Primary key of the glacier.
+        
+        @rtype: Glacier
+        @return: Object representing the glacier with the given primary key.
+        
+        @raise Exception: In case of none glacier found.
+        '''
+        
+        return self._catalogLookup(self._catalog().getByPk(pk))
+    
+    def _catalogLookup(self, glacier):
+        '''
+        Checks the result of a lookup in the glacier catalog.
+        
+        @type glacier: Glacier
+        @param glacier: Glacier found in the catalog or None.
+        
+        @rtype: Glacier
+        @return: Object representing the glacier found.
+        
+        @raise Exception: In case of none glacier found.
+        '''
+        
+        if glacier == None:
+            raise Exception("No entry found!")
+            #TODO: Implementation and raising of own database exception.
+        
+        return glacier
+
     def getGlacierByPolygon(self, polygonVertices, epsg):
         '''
         Retrieves all glaciers from the database based on the given polygon defined as an array of 2D- or 3D-vertices. 
@@ -316,7 +519,7 @@ class GlacierReader(GlamosDatabaseReader):
         name = dbRecord[7]
 
 
-        return Glacier(pk, pkVaw, pkSgi, name)
+        return Glacier(pk, pkVaw, pkSgi, name, columnarSeries=self._columnarSeries)
         
     def _verticesToWktPolygon(self, polygonVertices):
         '''
@@ -10,8 +10,35 @@ from abc import abstractmethod
 class GlamosDatabaseReader(PostgreSqlReader):
     '''
     Main class to access the PostGIS database of GLAMOS.
+    
+    By default the records of a query are collected in a list before the glacier objects are filled.
+    With a defined streamingItersize the records are streamed by a server-side cursor instead.
+    
+    Data of several glaciers can be retrieved by getDataForGlaciers() with one query per
+    _GLACIERS_CHUNK_SIZE glaciers. The specialised readers define the view and the key column to
+    select the records of the glaciers from and implement _glacierKey() and _addRecord().
+    
+    Attributes:
+        _GLACIERS_STATEMENT_TEMPLATE: Template of the statement retrieving the records of several glaciers.
+        _GLACIERS_CHUNK_SIZE: Maximum number of glaciers retrieved by one statement.
+        _GLACIERS_TABLE: Absolute name of the table or view of the records of several glaciers (<schema>.<table | view>).
+        _GLACIERS_KEY_COLUMN: Column of the table or view identifying the glacier of a record.
+        _GLACIERS_KEY_TYPE: Database type of the key column.
+        _streamingItersize: Number of records fetched per round trip in streaming mode. None if streaming is disabled.
     '''
     
+    _GLACIERS_STATEMENT_TEMPLATE = "SELECT {1}::text, * FROM {0} WHERE {1} = ANY(%s::{2}[]);"
+    
+    _GLACIERS_CHUNK_SIZE = 500
+    
+    _GLACIERS_TABLE = None
+    
+    _GLACIERS_KEY_COLUMN = None
+    
+    _GLACIERS_KEY_TYPE = None
+    
+    _streamingItersize = None
+    
     def __init__(self, accessConfigurationFullFileName):
         '''
         Constructor of the GlamosDatabaseReader class. The constructor
@@ -24,6 +51,44 @@ class GlamosDatabaseReader(PostgreSqlReader):
         
         super().__init__(accessConfigurationFullFileName)
         
+        self._streamingItersize = None
+    
+    @property
+    def streamingItersize(self):
+        '''
+        Get the number of records fetched per round trip in streaming mode. None if streaming is disabled.
+        '''
+        return self._streamingItersize
+    
+    @streamingItersize.setter
+    def streamingItersize(self, value):
+        '''
+        Set the number of records fetched per round trip by a server-side cursor. With a defined value
+        getData() fills the glacier objects while the records are still arriving. None disables streaming.
+        
+        @type value: int
+        @param value: Number of records fetched per round trip or None.
+        '''
+        self._streamingItersize = value
+    
+    def _retrieveRecords(self, statement, parameters=None):
+        '''
+        Retrieving the records of the given statement either as list or, in streaming mode, as generator.
+        
+        @type statement: string
+        @param statement: SQL statement for the GLAMOS PostGIS database.
+        @type parameters: sequence
+        @param parameters: Optional values of the %s placeholders of the statement.
+        
+        @rtype: Iterable
+        @return: Records found by the statement. None in case of problems during the non-streaming retrieval.
+        '''
+        
+        if self._streamingItersize != None:
+            return self.streamData(statement, self._streamingItersize, parameters)
+        else:
+            return self.retriveData(statement, parameters)
+        
     @abstractmethod
     def getData(self, glacier):
         '''
@@ -34,4 +99,71 @@ class GlamosDatabaseReader(PostgreSqlReader):
         @type glacier: DataObject.Glacier.Glacier
         @param glacier: Glacier of which the attributes given by the reader class has to be retrieved.
         '''
-        raise NotImplementedError("The abstract method getData() is not implemented yet.")
\ No newline at end of file
+        raise NotImplementedError("The abstract method getData() is not implemented yet.")
+        
+    def getDataForGlaciers(self, glaciers):
+        '''
+        Retrieves the data of all given glaciers. In contrast to calling getData() for each glacier, the
+        records are retrieved with one query per _GLACIERS_CHUNK_SIZE glaciers and routed to their glacier
+        objects by the key of the glacier.
+        
+        @type glaciers: list
+        @param glaciers: List of DataObject.Glacier.Glacier objects of which the data has to be retrieved.
+        '''
+        
+        for glacier, dbRecord in self._retrieveRecordsForGlaciers(glaciers):
+            self._addRecord(glacier, dbRecord)
+            
+    def _retrieveRecordsForGlaciers(self, glaciers):
+        '''
+        Generator retrieving the records of all given glaciers from _GLACIERS_TABLE. Glaciers without key are ignored.
+        
+        @type glaciers: list
+        @param glaciers: List of DataObject.Glacier.Glacier objects of which the records has to be retrieved.
+        
+        @rtype: Generator
+        @return: Tuples of the glacier and one of its database records (without the leading key column).
+        '''
+        
+        glaciersByKey = dict()
+        for glacier in glaciers:
+            key = self._glacierKey(glacier)
+            if key != None:
+                glaciersByKey[str(key)] = glacier
+        
+        keys = list(glaciersByKey.keys())
+        
+        statement = self._GLACIERS_STATEMENT_TEMPLATE.format(
+            self._GLACIERS_TABLE, self._GLACIERS_KEY_COLUMN, self._GLACIERS_KEY_TYPE)
+        
+        for chunkStart in range(0, len(keys), self._GLACIERS_CHUNK_SIZE):
+            
+            results = self._retrieveRecords(statement, [keys[chunkStart:chunkStart + self._GLACIERS_CHUNK_SIZE]])
+            
+            if results != None:
+                for result in results:
+                    yield glaciersByKey[result[0]], result[1:]
+                    
+    def _glacierKey(self, glacier):
+        '''
+        Get the key of the given glacier used in _GLACIERS_KEY_COLUMN.
+        
+        The method has to be implemented by all readers supporting getDataForGlaciers().
+        
+        @type glacier: DataObject.Glacier.Glacier
+        @param glacier: Glacier of which the key is needed.
+        '''
+        raise NotImplementedError("The method _glacierKey() is not implemented by {0}.".format(self.__class__.__name__))
+    
+    def _addRecord(self, glacier, dbRecord):
+        '''
+        Converts a single record of the database into a data object and adds it to the given glacier.
+        
+        The method has to be implemented by all readers supporting getDataForGlaciers().
+        
+        @type glacier: DataObject.Glacier.Glacier
+        @param glacier: Glacier the record belongs to.
+        @type dbRecord: list
+        @param dbRecord: List with all values of one database record.
+        '''
+        raise NotImplementedError("The method _addRecord() is not implemented by {0}.".format(self.__class__.__name__))
@@ -17,6 +17,12 @@ class InventoryReader(GlamosDatabaseReader):
     # ---- Members of the class ---
 
     _TABLE_INVENTORY = "inventory.vw_inventory"
+    
+    _GLACIERS_TABLE = _TABLE_INVENTORY
+    
+    _GLACIERS_KEY_COLUMN = "pk_sgi"
+    
+    _GLACIERS_KEY_TYPE = "varchar"
 
     def __init__(self, accessConfigurationFullFileName):
         '''
@@ -39,14 +45,33 @@ class InventoryReader(GlamosDatabaseReader):
         '''
         
         # FIXME: Working with glacier.pk instead of glacier.pkVaw. View has to be improved.        
-        statement = "SELECT * FROM {0} WHERE pk_sgi = '{1}';".format(self._TABLE_INVENTORY, glacier.pkSgi)
+        statement = "SELECT * FROM {0} WHERE pk_sgi = %s;".format(self._TABLE_INVENTORY)
         
-        results = super().retriveData(statement)
+        results = self._retrieveRecords(statement, [glacier.pkSgi])
         
         if results != None:
             for result in results:
-                glacier.addInventory(self._recordToObject(result))
+                self._addRecord(glacier, result)
             
+    def _glacierKey(self, glacier):
+        '''
+        Get the SGI identifier of the given glacier used in pk_sgi.
+        
+        @type glacier: DataObject.Glacier.Glacier
+        @param glacier: Glacier of which the key is needed.
+        '''
+        return glacier.pkSgi
+    
+    def _addRecord(self, glacier, dbRecord):
+        '''
+        Converts a single record of the database into a inventory object and adds it to the given glacier.
+        
+        @type glacier: DataObject.Glacier.Glacier
+        @param glacier: Glacier the record belongs to.
+        @type dbRecord: list
+        @param dbRecord: List with all values of one database record.
+        '''
+        glacier.addInventory(self._recordToObject(dbRecord))
             
     def _recordToObject(self, dbRecord):
         
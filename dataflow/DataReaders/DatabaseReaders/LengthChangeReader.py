@@ -22,6 +22,12 @@ class LengthChangeReader(GlamosDatabaseReader):
 
     # FIXME: Better view to read the data from.
     _TABLE_VOLUME_CHANGE = "length_change.length_change_data"
+    
+    _GLACIERS_TABLE = _TABLE_VOLUME_CHANGE
+    
+    _GLACIERS_KEY_COLUMN = "fk_glacier"
+    
+    _GLACIERS_KEY_TYPE = "integer"
 
     def __init__(self, accessConfigurationFullFileName):
         '''
@@ -44,13 +50,33 @@ class LengthChangeReader(GlamosDatabaseReader):
         '''
         
         # FIXME: Working with glacier.pk instead of glacier.pkVaw. View has to be improved.        
-        statement = "SELECT * FROM {0} WHERE fk_glacier = '{1}';".format(self._TABLE_VOLUME_CHANGE, glacier.pkVaw)
+        statement = "SELECT * FROM {0} WHERE fk_glacier = %s;".format(self._TABLE_VOLUME_CHANGE)
         
-        results = super().retriveData(statement)
+        results = self._retrieveRecords(statement, [glacier.pkVaw])
         
         if results != None:
             for result in results:
-                glacier.addLengthChange(self._recordToObject(result))
+                self._addRecord(glacier, result)
+            
+    def _glacierKey(self, glacier):
+        '''
+        Get the VAW identifier of the given glacier used in fk_glacier.
+        
+        @type glacier: DataObject.Glacier.Glacier
+        @param glacier: Glacier of which the key is needed.
+        '''
+        return glacier.pkVaw
+    
+    def _addRecord(self, glacier, dbRecord):
+        '''
+        Converts a single record of the database into a length change object and adds it to the given glacier.
+        
+        @type glacier: DataObject.Glacier.Glacier
+        @param glacier: Glacier the record belongs to.
+        @type dbRecord: list
+        @param dbRecord: List with all values of one database record.
+        '''
+        glacier.addLengthChange(self._recordToObject(dbRecord))
             
     def _recordToObject(self, dbRecord):
         '''
@@ -72,9 +98,9 @@ class LengthChangeReader(GlamosDatabaseReader):
         variationQuantitative         = float(dbRecord[7])      # variation_quantitative   decimal(10,2)  NOT NULL
         
         # Mandatory attributes and conversion from database integer-based lookup-values to enumeration.
-        dateFromQuality               = DateQualityTypeEnum(
+        dateFromQuality               = DateQualityTypeEnum.fromValue(
                                            int(dbRecord[3]))    # date_from_quality        smallint       NOT NULL
-        dateToQuality                 = DateQualityTypeEnum(
+        dateToQuality                 = DateQualityTypeEnum.fromValue(
                                            int(dbRecord[5]))    # date_to_quality          smallint       NOT NULL
 
         # Optional attributes:
@@ -6,7 +6,7 @@ Created on 19.07.2021
 
 from dataflow.DataReaders.DatabaseReaders.GlamosDatabaseReader import GlamosDatabaseReader
 from dataflow.DataObjects.Glacier import Glacier
-from dataflow.DataObjects.MassBalanceIndexTimeSeasonal import MassBalanceIndexSeasonal
+from dataflow.DataObjects.MassBalanceIndexTimeSeasonal import MassBalanceIndexTimeSeasonal
 from dataflow.DataObjects.Enumerations.DateEnumerations import DateQualityTypeEnum
 
 import uuid
@@ -22,6 +22,12 @@ class MassBalanceIndexSeasonalReader(GlamosDatabaseReader):
 
     _VIEW_MASS_BALANCE_INDEX_SEASONAL = "mass_balance.vw_mass_balance_index_seasonal"
 
+    _GLACIERS_TABLE = _VIEW_MASS_BALANCE_INDEX_SEASONAL
+
+    _GLACIERS_KEY_COLUMN = "pk_glacier"
+
+    _GLACIERS_KEY_TYPE = "uuid"
+
     def __init__(self, accessConfigurationFullFileName):
         '''
         Constructor
@@ -42,13 +48,33 @@ class MassBalanceIndexSeasonalReader(GlamosDatabaseReader):
         @param glacier: Glacier of which the mass balance index seasonal data has to be retrieved.
         '''
 
-        statement = "SELECT * FROM {0} WHERE pk_glacier = '{1}';".format(self._VIEW_MASS_BALANCE_INDEX_SEASONAL, glacier.pk)
+        statement = "SELECT * FROM {0} WHERE pk_glacier = %s;".format(self._VIEW_MASS_BALANCE_INDEX_SEASONAL)
 
-        results = super().retriveData(statement)
+        results = self._retrieveRecords(statement, [str(glacier.pk)])
 
         if results != None:
             for result in results:
-                glacier.addMassBalanceIndexSeasonal(self._recordToObject(result))
+                self._addRecord(glacier, result)
+
+    def _glacierKey(self, glacier):
+        '''
+        Get the uuid-based primary key of the given glacier used in pk_glacier.
+
+        @type glacier: DataObject.Glacier.Glacier
+        @param glacier: Glacier of which the key is needed.
+        '''
+        return glacier.pk
+
+    def _addRecord(self, glacier, dbRecord):
+        '''
+        Converts a single record of the database into a mass balance index seasonal object and adds it to the given glacier.
+
+        @type glacier: DataObject.Glacier.Glacier
+        @param glacier: Glacier the record belongs to.
+        @type dbRecord: list
+        @param dbRecord: List with all values of one database record.
+        '''
+        glacier.addMassBalanceIndexTimeSeasonal(self._recordToObject(dbRecord))
 
     def _recordToObject(self, dbRecord):
         '''
@@ -57,42 +83,43 @@ class MassBalanceIndexSeasonalReader(GlamosDatabaseReader):
         @type dbRecord: list
         @param dbRecord: List with all values of one database record.
 
-        @rtype: DataObjects.MassBalanceIndexSeasonal
+        @rtype: DataObjects.MassBalanceIndexTimeSeasonal.MassBalanceIndexTimeSeasonal
         @return: Mass balance index seasonal object of the database record.
         '''
 
         # Getting the individual attributes from the returned database record.
         # Mandatory attributes:
-        _name = dbRecord[5]
-        _date_0 = dbRecord[8]
-        _date_fmeas = dbRecord[9]
-        _date_fmin = dbRecord[10]
-        _date_smeas = dbRecord[11]
-        _date_smax = dbRecord[13]
-        _date_1 = dbRecord[12]
-        _analysis_method_type = dbRecord[6]
-        _embargo_type = dbRecord[7]
-        _latitude = dbRecord[15]
-        _longitude = dbRecord[16]
-        _altitude = dbRecord[17]
-        _b_w_meas = dbRecord[19]
-        _b_a_meas = dbRecord[19]
-        _c_w_obs = dbRecord[21]
-        _c_a_obs = dbRecord[20]
-        _a_w_obs = dbRecord[23]
-        _a_a_obs = dbRecord[22]
-        _b_w_fix = dbRecord[25]
-        _b_a_fix = dbRecord[24]
-        _c_w_fix = dbRecord[27]
-        _c_a_fix = dbRecord[26]
-        _a_w_fix = dbRecord[29]
-        _a_a_fix = dbRecord[28]
-        _reference = dbRecord[30]
+        name = dbRecord[5]
+        date_0 = dbRecord[8]
+        date_fmeas = dbRecord[9]
+        date_fmin = dbRecord[10]
+        date_smeas = dbRecord[11]
+        date_smax = dbRecord[13]
+        date_1 = dbRecord[12]
+        analysis_method_type = dbRecord[6]
+        embargo_type = dbRecord[7]
+        latitude = dbRecord[15]
+        longitude = dbRecord[16]
+        altitude = dbRecord[17]
+        b_w_meas = dbRecord[19]
+        b_a_meas = dbRecord[18]
+        c_w_obs = dbRecord[21]
+        c_a_obs = dbRecord[20]
+        a_w_obs = dbRecord[23]
+        a_a_obs = dbRecord[22]
+        b_w_fix = dbRecord[25]
+        b_a_fix = dbRecord[24]
+        c_w_fix = dbRecord[27]
+        c_a_fix = dbRecord[26]
+        a_w_fix = dbRecord[29]
+        a_a_fix = dbRecord[28]
+        reference = dbRecord[30]
 
         # Optional attributes:
 
         # Returning the created data object.
-        return MassBalanceIndexSeasonal(
+        return MassBalanceIndexTimeSeasonal(
+            None,
             name, date_0, date_fmeas, date_fmin, date_smeas, date_smax, date_1, analysis_method_type, embargo_type,
             latitude, longitude, altitude, b_w_meas, b_a_meas, c_w_obs, c_a_obs, a_w_obs, a_a_obs, b_w_fix, b_a_fix,
-            c_w_fix, c_a_fix, a_w_fix, a_a_fix, investigator, reference)
\ No newline at end of file
+            c_w_fix, c_a_fix, a_w_fix, a_a_fix, None, reference)
\ No newline at end of file
@@ -27,6 +27,12 @@ class MassBalanceReader(GlamosDatabaseReader):
     _TABLE_MASS_BALANCE            = "mass_balance.glacier_seasonal"
     
     _TABLE_ELEVATION_DISTRIBUTION  = "mass_balance.elevation_distribution"
+    
+    _GLACIERS_TABLE                = _TABLE_MASS_BALANCE
+    
+    _GLACIERS_KEY_COLUMN           = "fk_glacier"
+    
+    _GLACIERS_KEY_TYPE             = "uuid"
 
     def __init__(self, accessConfigurationFullFileName):
         '''
@@ -43,33 +49,94 @@ class MassBalanceReader(GlamosDatabaseReader):
         Retrieves all mass-balance data of the given glacier.
         
         The measurements are stored in the massBalances dictionary of the glacier instance.
+        The elevation-bands are retrieved with one query per _GLACIERS_CHUNK_SIZE mass-balances.
         
         @type glacier: DataObject.Glacier.Glacier
         @param glacier: Glacier of which the time series of mass-balances has to be retrieved.
         '''
         
         # FIXME: View has to be improved.        
-        statement = "SELECT * FROM {0} WHERE fk_glacier = '{1}';".format(self._TABLE_MASS_BALANCE, glacier.pk)
-        results = super().retriveData(statement)
+        statement = "SELECT * FROM {0} WHERE fk_glacier = %s;".format(self._TABLE_MASS_BALANCE)
+        results = self._retrieveRecords(statement, [str(glacier.pk)])
         
         if results != None:
-            for result in results:
-
-                # OR-mapping of mass-balance database-record to mass-balance object.
-                massbalance = self._recordToObject(result)
+            self._addMassBalances((glacier, result) for result in results)
                 
-                statementElevationBands = "SELECT * FROM {0} WHERE fk_glacier_seasonal = '{1}';".format(self._TABLE_ELEVATION_DISTRIBUTION, massbalance.pk)
-                resultElevationBands = super().retriveData(statementElevationBands)
+    def getDataForGlaciers(self, glaciers):
+        '''
+        Retrieves all mass-balance data of the given glaciers.
+        
+        The mass-balances are retrieved with one query per _GLACIERS_CHUNK_SIZE glaciers, their elevation-bands
+        with one query per _GLACIERS_CHUNK_SIZE mass-balances.
+        
+        @type glaciers: list
+        @param glaciers: List of DataObject.Glacier.Glacier objects of which the mass-balances has to be retrieved.
+        '''
+        
+        self._addMassBalances(self._retrieveRecordsForGlaciers(glaciers))
+    
+    def _addMassBalances(self, glacierRecords):
+        '''
+        Converts the mass-balance records into mass-balance objects and adds them to their glaciers while the
+        records are arriving. Only the mass-balances waiting for their elevation-bands are kept by the reader,
+        the elevation-bands are retrieved with one query per _GLACIERS_CHUNK_SIZE mass-balances.
+        
+        In streaming mode the elevation-bands are retrieved with a second connection of the pool while the
+        connection streaming the mass-balances is still borrowed.
+        
+        @type glacierRecords: Iterable
+        @param glacierRecords: Tuples of the glacier and one of its mass-balance database records.
+        '''
+        
+        pendingMassBalances = list()
+        
+        for glacier, dbRecord in glacierRecords:
+            
+            # OR-mapping of mass-balance database-records to mass-balance objects.
+            massBalance = self._recordToObject(dbRecord)
+            glacier.addMassBalance(massBalance)
+            
+            pendingMassBalances.append(massBalance)
+            
+            if len(pendingMassBalances) == self._GLACIERS_CHUNK_SIZE:
+                self._addElevationBands(pendingMassBalances)
+                pendingMassBalances = list()
+        
+        if len(pendingMassBalances) > 0:
+            self._addElevationBands(pendingMassBalances)
+    
+    def _glacierKey(self, glacier):
+        '''
+        Get the uuid-based primary key of the given glacier used in fk_glacier.
+        
+        @type glacier: DataObject.Glacier.Glacier
+        @param glacier: Glacier of which the key is needed.
+        '''
+        return glacier.pk
                 
-                if resultElevationBands != None:
-                    for resultElevationBand in resultElevationBands:
-                        
-                        # OR-mapping of mass-balance elevation-band database-record to mass-balance elevation-band object.
-                        elevationBand = self._recordToElevationBucketObject(resultElevationBand)
-                        # Adding the individual bands to the collection of bands.
-                        massbalance.addElevationBand(elevationBand)       
-
-                glacier.addMassBalance(massbalance)
+    def _addElevationBands(self, massBalances):
+        '''
+        Retrieves the elevation-bands of all given mass-balances with one single query and adds
+        them to their mass-balance objects.
+        
+        @type massBalances: list
+        @param massBalances: List of dataflow.DataObjects.MassBalance.MassBalance objects.
+        '''
+        
+        massBalancesByPk = dict()
+        for massBalance in massBalances:
+            massBalancesByPk[str(massBalance.pk)] = massBalance
+        
+        statement = "SELECT * FROM {0} WHERE fk_glacier_seasonal = ANY(%s::uuid[]);".format(self._TABLE_ELEVATION_DISTRIBUTION)
+        resultElevationBands = self._retrieveRecords(statement, [list(massBalancesByPk.keys())])
+        
+        if resultElevationBands != None:
+            for resultElevationBand in resultElevationBands:
+                
+                # OR-mapping of mass-balance elevation-band database-record to mass-balance elevation-band object.
+                elevationBand = self._recordToElevationBucketObject(resultElevationBand)
+                # Adding the individual band to the collection of bands of its mass-balance.
+                massBalancesByPk[str(resultElevationBand[1])].addElevationBand(elevationBand)
                 
     def _recordToElevationBucketObject(self, dbRecordElevationBand):
         '''
@@ -118,7 +185,7 @@ class MassBalanceReader(GlamosDatabaseReader):
         '''
        
         # Key attribute for mass-balance inheritance
-        massBalanceType         = MassBalanceTypeEnum(int(dbRecord[2])) # fk_mass_balance_type smallint NOT NULL,
+        massBalanceType         = MassBalanceTypeEnum.fromValue(int(dbRecord[2])) # fk_mass_balance_type smallint NOT NULL,
        
         # Mandatory attributes
         pk                      = uuid.UUID(dbRecord[0])                # pk                        uuid          NOT NULL
@@ -135,7 +202,7 @@ class MassBalanceReader(GlamosDatabaseReader):
         elevationMaximum        = int(dbRecord[15])                     # elevation_maximum         smallint      NOT NULL
 
         # Mandatory attributes and conversion from database integer-based lookup-values to enumeration.
-        analysisMethod          = AnalysisMethodEnum(int(dbRecord[4]))  # fk_analysis_method        smallint      NOT NULL,
+        analysisMethod          = AnalysisMethodEnum.fromValue(int(dbRecord[4]))  # fk_analysis_method        smallint      NOT NULL,
 
         #int(dbRecord[3]) # fk_embargo_type smallint NOT NULL   DEFAULT 0,
 
@@ -21,6 +21,12 @@ class VolumeChangeReader(GlamosDatabaseReader):
     '''
 
     _TABLE_VOLUME_CHANGE = "volume_change.vw_volume_change"
+    
+    _GLACIERS_TABLE = _TABLE_VOLUME_CHANGE
+    
+    _GLACIERS_KEY_COLUMN = "pk_glacier"
+    
+    _GLACIERS_KEY_TYPE = "uuid"
 
     def __init__(self, accessConfigurationFullFileName):
         '''
@@ -44,13 +50,33 @@ class VolumeChangeReader(GlamosDatabaseReader):
         @param glacier: Glacier of which the time series of volume changes has to be retrieved.
         '''
         
-        statement = "SELECT * FROM {0} WHERE pk_glacier = '{1}';".format(self._TABLE_VOLUME_CHANGE, glacier.pk)
+        statement = "SELECT * FROM {0} WHERE pk_glacier = %s;".format(self._TABLE_VOLUME_CHANGE)
         
-        results = super().retriveData(statement)
+        results = self._retrieveRecords(statement, [str(glacier.pk)])
         
-        for result in results:
+        if results != None:
+            for result in results:
+                self._addRecord(glacier, result)
             
-            glacier.addVolumeChange(self._recordToObject(result))
+    def _glacierKey(self, glacier):
+        '''
+        Get the uuid-based primary key of the given glacier used in pk_glacier.
+        
+        @type glacier: DataObject.Glacier.Glacier
+        @param glacier: Glacier of which the key is needed.
+        '''
+        return glacier.pk
+    
+    def _addRecord(self, glacier, dbRecord):
+        '''
+        Converts a single record of the database into a volume change object and adds it to the given glacier.
+        
+        @type glacier: DataObject.Glacier.Glacier
+        @param glacier: Glacier the record belongs to.
+        @type dbRecord: list
+        @param dbRecord: List with all values of one database record.
+        '''
+        glacier.addVolumeChange(self._recordToObject(dbRecord))
             
     def _recordToObject(self, dbRecord):
         '''
@@ -71,9 +97,9 @@ class VolumeChangeReader(GlamosDatabaseReader):
         dateToQuality         = None
         areaFrom                = float(dbRecord[13])
         areaTo                  = float(dbRecord[14])
-        heightCaptureMethodFrom = HeightCaptureMethodEnum(int(dbRecord[5]))
-        heightCaptureMethodTo   = HeightCaptureMethodEnum(int(dbRecord[7]))
-        analysisMethod          = AnalysisMethodEnum(int(dbRecord[9]))
+        heightCaptureMethodFrom = HeightCaptureMethodEnum.fromValue(int(dbRecord[5]))
+        heightCaptureMethodTo   = HeightCaptureMethodEnum.fromValue(int(dbRecord[7]))
+        analysisMethod          = AnalysisMethodEnum.fromValue(int(dbRecord[9]))
         elevationMaximumFrom    = float(dbRecord[15])
         elevationMinimumFrom    = float(dbRecord[16])
         elevationMaximumTo      = float(dbRecord[17])
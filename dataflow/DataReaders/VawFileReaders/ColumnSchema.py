@@ -0,0 +1,211 @@
+'''
+Created on 18.10.2026
+
+@author: yvo
+'''
+
+import operator
+
+class ColumnSchema(object):
+    '''
+    Schema-driven parsing engine for the whitespace separated VAW data files. A reader declares its columns
+    as list of dataflow.DataReaders.VawFileReaders.FileColumn.FileColumn objects. The schema compiles the
+    converters of the columns once and offers two conversions:
+        - convertLine(): Row converter returning a dictionary with the converted values of a single line.
+        - convertBlock(): Block converter returning the converted values of all lines column by column.
+
+    The block converter splits all lines first and converts each column with one call over all its values.
+    Columns with integer or float values and without NaN token or transformation are converted without
+    any Python function call per value. Only if the block contains an invalid line, the lines are converted
+    one by one to identify the invalid lines.
+
+    The data lines are split at whitespaces. As with the former splitting by regular expression of the readers,
+    leading spaces result in an empty first value, unless the schema is set up to skip the leading empty values.
+
+    Attributes:
+        - _columns            Declared columns of the schema.
+        - _converters         Compiled converters of the columns.
+        - _getValues          Function picking the values of all declared columns out of a split data line.
+        - _skipLeadingEmpty   True if empty values at the start of a line (leading spaces) are removed.
+        - _lineIndexes        Index of the data line of each converted row within the converted lines.
+        - _invalidLines       List of tuples with index and exception of the lines which could not be converted.
+    '''
+
+    _columns          = None
+    _converters       = None
+    _getValues        = None
+    _skipLeadingEmpty = False
+
+    _lineIndexes  = None
+    _invalidLines = None
+
+    def __init__(self, columns, skipLeadingEmpty=False):
+        '''
+        Constructor of the schema. The converters of the columns are compiled.
+
+        @type columns: list
+        @param columns: List of dataflow.DataReaders.VawFileReaders.FileColumn.FileColumn objects.
+        @type skipLeadingEmpty: bool
+        @param skipLeadingEmpty: True if empty values at the start of a line (leading spaces) are removed.
+        '''
+
+        self._columns = tuple(columns)
+        self._skipLeadingEmpty = skipLeadingEmpty
+
+        self._converters = tuple([column.compile() for column in self._columns])
+
+        indexes = [column.index for column in self._columns]
+        if len(indexes) == 1:
+            self._getValues = lambda lineParts: (lineParts[indexes[0]],)
+        else:
+            self._getValues = operator.itemgetter(*indexes)
+
+        self._lineIndexes = list()
+        self._invalidLines = list()
+
+    @property
+    def columns(self):
+        '''
+        Declared columns of the schema.
+        '''
+        return self._columns
+
+    @property
+    def names(self):
+        '''
+        Names of the declared columns.
+        '''
+        return [column.name for column in self._columns]
+
+    @property
+    def lineIndexes(self):
+        '''
+        Index of the data line of each converted row within the lines of the last block conversion.
+        '''
+        return self._lineIndexes
+
+    @property
+    def invalidLines(self):
+        '''
+        List of tuples with index and exception of the lines which could not be converted by the last block conversion.
+        '''
+        return self._invalidLines
+
+    def splitLine(self, dataLine):
+        '''
+        Splits a data line into its values.
+
+        @type dataLine: string
+        @param dataLine: Data line of the file.
+
+        @rtype: list
+        @return: Values of the data line as strings.
+        '''
+
+        lineParts = dataLine.split()
+
+        # Leading spaces result in an empty first value as with the former splitting by regular expression.
+        if not self._skipLeadingEmpty and dataLine[:1] == " ":
+            lineParts.insert(0, "")
+
+        return lineParts
+
+    def convertLine(self, dataLine):
+        '''
+        Converts a single data line into a dictionary with the column names as keys.
+
+        @type dataLine: string
+        @param dataLine: Data line of the file.
+
+        @rtype: dict
+        @return: Converted values of the declared columns.
+
+        @raise IndexError: In case the data line contains not enough values.
+        @raise ValueError: In case a value cannot be converted.
+        '''
+
+        values = self._getValues(self.splitLine(dataLine))
+
+        return {column.name: converter(value.strip()) for column, converter, value in zip(self._columns, self._converters, values)}
+
+    def convertBlock(self, dataLines):
+        '''
+        Converts all data lines column by column. Empty lines are ignored. In case of lines which cannot be
+        converted, the lines are converted one by one and the invalid lines are listed in invalidLines.
+
+        @type dataLines: list
+        @param dataLines: Data lines of a file without the header lines.
+
+        @rtype: dict
+        @return: Dictionary with the column names as keys and the lists of the converted values as values.
+        '''
+
+        self._invalidLines = list()
+        self._lineIndexes = [lineIndex for lineIndex, dataLine in enumerate(dataLines) if len(dataLine.strip()) > 0]
+
+        try:
+            splitLine = self.splitLine
+            getValues = self._getValues
+            rows = [getValues(splitLine(dataLines[lineIndex])) for lineIndex in self._lineIndexes]
+
+            values = list(zip(*rows))
+            if len(values) == 0:
+                values = [tuple()] * len(self._columns)
+
+            return {column.name: self._convertColumn(column, converter, columnValues)
+                    for column, converter, columnValues in zip(self._columns, self._converters, values)}
+
+        except (IndexError, ValueError, TypeError):
+            return self._convertLineByLine(dataLines)
+
+    def _convertColumn(self, column, converter, columnValues):
+        '''
+        Converts all values of a single column.
+
+        @type column: dataflow.DataReaders.VawFileReaders.FileColumn.FileColumn
+        @param column: Declaration of the column.
+        @type converter: function
+        @param converter: Compiled converter of the column.
+        @type columnValues: tuple
+        @param columnValues: Values of the column as strings.
+
+        @rtype: list
+        @return: Converted values of the column.
+        '''
+
+        # int() and float() ignore surrounding whitespaces themselves.
+        if column.isPlain and column.dtype in (int, float):
+            return list(map(column.dtype, columnValues))
+        else:
+            return list(map(converter, map(str.strip, columnValues)))
+
+    def _convertLineByLine(self, dataLines):
+        '''
+        Fallback conversion in case of an invalid data block. Each line is converted individually,
+        lines which cannot be converted are listed in invalidLines.
+
+        @type dataLines: list
+        @param dataLines: Data lines of a file without the header lines.
+
+        @rtype: dict
+        @return: Dictionary with the column names as keys and the lists of the converted values of the valid lines as values.
+        '''
+
+        block = {column.name: list() for column in self._columns}
+        validLineIndexes = list()
+
+        for lineIndex in self._lineIndexes:
+
+            try:
+                row = self.convertLine(dataLines[lineIndex])
+            except (IndexError, ValueError, TypeError) as e:
+                self._invalidLines.append((lineIndex, e))
+                continue
+
+            for name, value in row.items():
+                block[name].append(value)
+            validLineIndexes.append(lineIndex)
+
+        self._lineIndexes = validLineIndexes
+
+        return block
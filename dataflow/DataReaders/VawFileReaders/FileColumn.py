@@ -0,0 +1,129 @@
+'''
+Created on 18.10.2026
+
+@author: yvo
+'''
+
+class FileColumn(object):
+    '''
+    Declaration of a single column of a VAW data file as used by the column schema of the readers.
+
+    The conversion of a value of the column is done in the following order:
+        1. The value is stripped.
+        2. In case of the NaN token, the missing value (None or NaN for floats) is returned.
+        3. The transformation (e.g. VawFileReader._notNine or a date parser) is applied.
+        4. The value is converted into the data type of the column.
+
+    Attributes:
+        - _name       Name of the column used as key of the converted values.
+        - _index      Position of the column in the data line (0-based index).
+        - _dtype      Data type of the column (e.g. int, float, str). None if the value is taken as it is.
+        - _nanToken   Token of the file for a missing value (e.g. "NaN"). None if the column has no missing values.
+        - _transform  Function applied to the stripped value before the conversion into the data type.
+    '''
+
+    _name      = None
+    _index     = -1
+    _dtype     = None
+    _nanToken  = None
+    _transform = None
+
+    def __init__(self, name, index, dtype=str, nanToken=None, transform=None):
+        '''
+        Constructor of the column declaration.
+
+        @type name: string
+        @param name: Name of the column used as key of the converted values.
+        @type index: int
+        @param index: Position of the column in the data line (0-based index).
+        @type dtype: type
+        @param dtype: Data type of the column (e.g. int, float, str). None if the value is taken as it is.
+        @type nanToken: string
+        @param nanToken: Token of the file for a missing value (e.g. "NaN").
+        @type transform: function
+        @param transform: Function applied to the stripped value before the conversion into the data type.
+        '''
+
+        self._name      = name
+        self._index     = index
+        self._dtype     = dtype
+        self._nanToken  = nanToken
+        self._transform = transform
+
+    @property
+    def name(self):
+        '''
+        Name of the column used as key of the converted values.
+        '''
+        return self._name
+
+    @property
+    def index(self):
+        '''
+        Position of the column in the data line (0-based index).
+        '''
+        return self._index
+
+    @property
+    def dtype(self):
+        '''
+        Data type of the column.
+        '''
+        return self._dtype
+
+    @property
+    def nanToken(self):
+        '''
+        Token of the file for a missing value.
+        '''
+        return self._nanToken
+
+    @property
+    def transform(self):
+        '''
+        Function applied to the stripped value before the conversion into the data type.
+        '''
+        return self._transform
+
+    @property
+    def isPlain(self):
+        '''
+        True if the value is only converted into the data type (no NaN token and no transformation).
+        Values of plain columns are converted without an additional Python function call per value.
+        '''
+        return self._nanToken == None and self._transform == None and self._dtype != None
+
+    def compile(self):
+        '''
+        Compiles the converter of a single stripped value of the column. The decisions on the NaN token,
+        the transformation and the data type are taken once here and not for each value.
+
+        @rtype: function
+        @return: Converter taking the stripped value and returning the converted value.
+        '''
+
+        dtype     = self._dtype
+        nanToken  = self._nanToken
+        transform = self._transform
+
+        if nanToken != None:
+            missingValue = float("nan") if dtype == float else None
+            convertPresent = FileColumn(self._name, self._index, dtype, None, transform).compile()
+
+            def convertWithNan(value):
+                return missingValue if value == nanToken else convertPresent(value)
+
+            return convertWithNan
+
+        if transform != None and dtype != None:
+            return lambda value: dtype(transform(value))
+        elif transform != None:
+            return transform
+        elif dtype != None:
+            return dtype
+        else:
+            return lambda value: value
+
+    def __str__(self):
+
+        return "{0} @ {1} ({2})".format(self._name, self._index, getattr(self._dtype, "__name__", self._dtype))
@@ -0,0 +1,219 @@
+'''
+Created on 18.10.2026
+
+@author: yvo
+'''
+
+import numpy
+
+class FixedWidthSchema(object):
+    '''
+    Columnar parsing engine for the VAW data files with columns at fixed positions (e.g. length change files).
+    A reader declares its columns as list of tuples (name, start, stop, dtype):
+        - name:   Name of the column used as key of the converted values.
+        - start:  Position of the first character of the column in the data line.
+        - stop:   Position after the last character of the column. None if the column takes the rest of the line.
+        - dtype:  Data type of the column (int, float or str).
+
+    The data lines are padded to the same length, joined and encoded as UCS-4 (the memory layout of NumPy
+    unicode strings) and decoded with one call into a NumPy record array of a structured data type. Each
+    column is a unicode field of the record array at its fixed offset, columns may overlap. The fields are
+    converted column by column into typed arrays: integer columns consisting of digits only (e.g. the parts
+    of dates) arithmetically from the character codes, other integer and float columns by one single NumPy
+    conversion, string columns are copied as they are (not stripped, as sliced). Only if a column contains
+    an invalid value, the values of the column are converted one by one to identify the invalid lines.
+
+    As with the column schema of the whitespace separated files (ColumnSchema), empty lines are ignored
+    and the lines which could not be converted are listed in invalidLines and removed from the arrays.
+
+    Attributes:
+        - _CHARACTER_SIZE Size in bytes of a character of the NumPy unicode strings (UCS-4).
+        - _columns        Declared columns of the schema as tuples (name, start, stop, dtype).
+        - _lineIndexes    Index of the data line of each converted row within the converted lines.
+        - _invalidLines   List of tuples with index and exception of the lines which could not be converted.
+    '''
+
+    _CHARACTER_SIZE = 4
+
+    _columns      = None
+
+    _lineIndexes  = None
+    _invalidLines = None
+
+    def __init__(self, columns):
+        '''
+        Constructor of the schema.
+
+        @type columns: list
+        @param columns: List of tuples (name, start, stop, dtype) declaring the columns.
+
+        @raise ValueError: In case of a column with an unsupported data type.
+        '''
+
+        for name, start, stop, dtype in columns:
+            if dtype not in (int, float, str):
+                raise ValueError("Column {0} has the unsupported data type {1}".format(name, dtype))
+
+        self._columns = tuple(columns)
+
+        self._lineIndexes = list()
+        self._invalidLines = list()
+
+    @property
+    def names(self):
+        '''
+        Names of the declared columns.
+        '''
+        return [column[0] for column in self._columns]
+
+    @property
+    def lineIndexes(self):
+        '''
+        Index of the data line of each converted row within the lines of the last block conversion.
+        '''
+        return self._lineIndexes
+
+    @property
+    def invalidLines(self):
+        '''
+        List of tuples with index and exception of the lines which could not be converted by the last block conversion.
+        '''
+        return self._invalidLines
+
+    def decode(self, dataLines):
+        '''
+        Decodes the non-empty data lines into a record array with one unicode field per column.
+
+        @type dataLines: list
+        @param dataLines: Data lines of a file without the header lines.
+
+        @rtype: numpy.ndarray
+        @return: Record array with one record per non-empty line. The non-empty lines are listed in lineIndexes.
+        '''
+
+        self._lineIndexes = [lineIndex for lineIndex, dataLine in enumerate(dataLines) if len(dataLine.strip()) > 0]
+
+        lines = [dataLines[lineIndex].rstrip("\r\n") for lineIndex in self._lineIndexes]
+
+        # Short lines are padded by NUL characters which are dropped by the NumPy unicode strings: The missing columns are empty.
+        recordLength = max([len(line) for line in lines] + [start + 1 for name, start, stop, dtype in self._columns]
+                           + [stop for name, start, stop, dtype in self._columns if stop != None])
+
+        recordType = numpy.dtype({
+            "names":    [name for name, start, stop, dtype in self._columns],
+            "formats":  ["U{0}".format((recordLength if stop == None else stop) - start) for name, start, stop, dtype in self._columns],
+            "offsets":  [start * self._CHARACTER_SIZE for name, start, stop, dtype in self._columns],
+            "itemsize": recordLength * self._CHARACTER_SIZE})
+
+        content = "".join([line.ljust(recordLength, "\0") for line in lines]).encode("utf-32-le")
+
+        return numpy.frombuffer(content, dtype=recordType)
+
+    def convertBlock(self, dataLines):
+        '''
+        Converts all data lines column by column into typed arrays. Empty lines are ignored. Lines with
+        values which cannot be converted are listed in invalidLines and are not part of the arrays.
+
+        @type dataLines: list
+        @param dataLines: Data lines of a file without the header lines.
+
+        @rtype: dict
+        @return: Dictionary with the column names as keys and the NumPy arrays of the converted values as values.
+        '''
+
+        self._invalidLines = list()
+
+        records = self.decode(dataLines)
+
+        isValid = numpy.ones(len(records), dtype=bool)
+        data = dict()
+
+        # Character codes of all records (records x characters).
+        characterCodes = records.view(numpy.uint32).reshape(len(records), records.dtype.itemsize // self._CHARACTER_SIZE)
+
+        for name, start, stop, dtype in self._columns:
+
+            if dtype == int and stop != None:
+                digits = characterCodes[:, start:stop].astype(numpy.int64) - ord("0")
+                if numpy.all((digits >= 0) & (digits <= 9)):
+                    data[name] = digits @ (10 ** numpy.arange(stop - start - 1, -1, -1, dtype=numpy.int64))
+                    continue
+
+            data[name] = self._convertColumn(records[name], dtype, isValid)
+
+        if len(self._invalidLines) == 0:
+            return data
+
+        self._lineIndexes = [lineIndex for lineIndex, valid in zip(self._lineIndexes, isValid) if valid]
+
+        return {name: values[isValid] for name, values in data.items()}
+
+    def _convertColumn(self, values, dtype, isValid):
+        '''
+        Converts the raw values of a single column. Values which cannot be converted invalidate their line.
+
+        @type values: numpy.ndarray
+        @param values: Raw values of the column as unicode strings.
+        @type dtype: type
+        @param dtype: Data type of the column (int, float or str).
+        @type isValid: numpy.ndarray
+        @param isValid: Mask of the valid lines, updated in case of invalid values.
+
+        @rtype: numpy.ndarray
+        @return: Converted values of the column. Values of invalid lines are undefined.
+        '''
+
+        if dtype == str:
+            return values.copy()
+
+        try:
+            return values.astype(dtype)
+        except ValueError:
+            pass
+
+        convertedValues = list()
+
+        for recordIndex, value in enumerate(values.tolist()):
+
+            try:
+                convertedValues.append(dtype(value.strip()))
+            except ValueError as e:
+                convertedValues.append(dtype(0))
+                if isValid[recordIndex]:
+                    isValid[recordIndex] = False
+                    self._invalidLines.append((self._lineIndexes[recordIndex], e))
+
+        self._invalidLines.sort(key=lambda invalidLine: invalidLine[0])
+
+        return numpy.array(convertedValues, dtype=dtype)
+
+    @staticmethod
+    def toFloats(values):
+        '''
+        Lenient conversion of a column of strings into floats. Values which are not numbers (e.g. empty
+        values or text) are converted into NaN.
+
+        @type values: numpy.ndarray
+        @param values: Values of a string column.
+
+        @rtype: numpy.ndarray
+        @return: Float values of the column with NaN for values which are not numbers.
+        '''
+
+        # Empty values are the most frequent values which are not numbers.
+        values = numpy.where(numpy.char.isspace(values) | (numpy.char.str_len(values) == 0), "NaN", values)
+
+        try:
+            return values.astype(float)
+        except ValueError:
+            pass
+
+        floats = list()
+
+        for value in values.tolist():
+            try:
+                floats.append(float(value))
+            except ValueError:
+                floats.append(numpy.nan)
+
+        return numpy.array(floats, dtype=float)
@@ -3,8 +3,11 @@ Created on 18.05.2018
 
 @author: yvo
 '''
+import numpy
+
 from dataflow.DataReaders.VawFileReaders.VawFileReader import VawFileReader
-from dataflow.DataObjects.LengthChange import LengthChange
+from dataflow.DataReaders.VawFileReaders.FixedWidthSchema import FixedWidthSchema
+from dataflow.DataObjects.LengthChangeSeries import LengthChangeSeries
 from dataflow.DataObjects.Exceptions.GlacierNotFoundError import GlacierNotFoundError
 
 class LengthChangeReader(VawFileReader):
@@ -19,11 +22,40 @@ class LengthChangeReader(VawFileReader):
     #  © VAW / ETH Zürich; 2022; doi:10.18750/lengthchange.2021.r2021; www.glamos.ch
     ---
     
+    The columns are found at fixed positions of the data lines:
+        - [0:10]   Survey date (dd.mm.yyyy, end of the measurement period)
+        - [12:15]  Measurement code (type, method, condition)
+        - [18:28]  Reference date (dd.mm.yyyy, start of the measurement period)
+        - [28:39]  Length change
+        - [44:56]  Minimal elevation of the glacier tongue
+        - [54:]    Observer
+    
     Attributes:
         - ___NUMBER_HEADER_LINES    Number of header lines used in the length change file.
+        - __COLUMNS                 Fixed-width columns of the data lines (name, start, stop, data type).
+        - __MEASUREMENT_TYPES       Measurement types included (measured, reconstructed, observed, estimated).
+        - _series                   Length change series of the last parsing.
     '''
 
     __NUMBER_HEADER_LINES = 4
+    
+    __COLUMNS = [
+        ("dateToDay",             0,  2,    int),
+        ("dateToMonth",           3,  5,    int),
+        ("dateToYear",            6,  10,   int),
+        ("measurementType",       12, 13,   str),
+        ("measurementMethod",     13, 14,   str),
+        ("measurementCondition",  14, 15,   str),
+        ("dateFromDay",           18, 20,   int),
+        ("dateFromMonth",         21, 23,   int),
+        ("dateFromYear",          24, 28,   int),
+        ("variationQuantitative", 28, 39,   float),
+        ("elevationMin",          44, 56,   str),
+        ("observer",              54, None, str)]
+    
+    __MEASUREMENT_TYPES = ["m", "r", "o", "e"]
+    
+    _series = None
 
     def __init__(self, config, fullFileName, glaciers):
         '''
@@ -42,6 +74,13 @@ class LengthChangeReader(VawFileReader):
         except GlacierNotFoundError as glacierNotFoundError:
             raise glacierNotFoundError
     
+    @property
+    def series(self):
+        '''
+        Length change series of the last parsing. None if the file was not parsed yet.
+        '''
+        return self._series
+
     def parse(self):
         '''
         Starts the parsing of the given file. The parser runs through the entire file
@@ -58,95 +97,53 @@ class LengthChangeReader(VawFileReader):
         @return: Entire time series of the length changes of the glacier.
         '''
         
-        lengthChangeList = []
+        lengthChangeList = list(self.parseSeries().iterLengthChanges())
         
-        with open(self._fullFileName, "r", encoding='latin-1') as lc:
-
-            lineCounter = 0
-
-            for line in lc:
-
-                lineCounter += 1
-                
-                try:
-                        
-                    if lineCounter > self.__NUMBER_HEADER_LINES:
-                        data = self._getData(line)
-
-                        if data[4] == "m" or data[4] == "r" or data[4] == "o" or data[4] == "e":
-                            
-                            # Dealing with possible None values of the data:
-                            observer = data[9].strip()
-                            if len(observer) == 0:
-                                observer = None
-                            elevationMin = data[8]
-                            if len(str(elevationMin)) == 0:
-                                elevationMin = None
-                            
-                            # Attributes of the database which are not supported by the ASCII files
-                            remarks = None
-
-                            # Getting an object of type LengthChange with the parsed information.
-                            lengthChange = LengthChange(
-                                        None, 
-                                        data[0], data[1], 
-                                        data[2], data[3],
-                                        data[4], data[5], data[6],
-                                        data[7], "",
-                                        elevationMin, 
-                                        observer,
-                                        remarks)
-                            
-                            lengthChangeList.append(lengthChange)
-                            
-                            self._glacier.addLengthChange(lengthChange)
-                   
-                        
-                except Exception as e:
-
-                    errorMessage = "{0} @ {1}: {2}".format(lc, lineCounter, e)
-                    print(errorMessage)
+        for lengthChange in lengthChangeList:
+            self._glacier.addLengthChange(lengthChange)
                     
         return lengthChangeList
+    
+    def parseSeries(self):
+        '''
+        Parses the entire file in one pass into a length change series of typed arrays. The columns
+        are decoded at their fixed positions by a FixedWidthSchema. Only measurements which are measured,
+        reconstructed, observed or estimated are included, the selection is done by a mask over all lines.
         
-    def _getData(self, dataLine):
+        Lines which cannot be converted (e.g. invalid dates or length changes) are printed and skipped.
+        
+        @rtype: dataflow.DataObjects.LengthChangeSeries.LengthChangeSeries
+        @return: Entire time series of the length changes of the glacier as typed arrays.
         '''
-        Helper function to retrieve all information of a single length change measurement line.
         
-        Each parameter stored in the text file will be parsed and converted into an appropriate type.
+        fixedWidthSchema = FixedWidthSchema(self.__COLUMNS)
+        data = fixedWidthSchema.convertBlock(self._readDataLines())
         
-        @type dataLine: string
-        @param dataLine: Entire line with a measurement of the text file.
+        self._reportInvalidLines(fixedWidthSchema, raiseError=False)
         
-        @rtype: Array
-        @return: Converted data of one length change measurement.
-        '''
-    
-        dateToReformated   = self._reformateDate(dataLine[:10])
-        dateFromReformated = self._reformateDate(dataLine[18:28])
-        dateTo             = dateToReformated[0]
-        dateToQuality      = dateToReformated[1]
-        dateFrom           = dateFromReformated[0]
-        dateFromQuality    = dateFromReformated[1]
-    
-        measurementType = dataLine[12:13]
-        measurementMethod = dataLine[13:14]
-        measurementCondition = dataLine[14:15]
-    
-        variationQuantitative = float(dataLine[28:39].strip())
-
-        elevationMin     = ""
-        elevationMinTemp = dataLine[44:56].strip()
-        if elevationMinTemp != "NaN":
-            try:
-                elevationMin = float(elevationMinTemp)
-            except:
-                elevationMin = ""
-    
-        observer = ""
-        observerTemp = dataLine[54:].strip()
-
-        if observerTemp != "-":
-            observer = observerTemp.replace(",",";")
-
-        return [dateFrom, dateFromQuality, dateTo, dateToQuality, measurementType, measurementMethod, measurementCondition, variationQuantitative, elevationMin, observer]
\ No newline at end of file
+        lineIndexes = numpy.asarray(fixedWidthSchema.lineIndexes, dtype=int)
+        
+        dateTos, dateToQualities, isValidDateTo = self._decodeDatesYyyyMmDd(
+            data["dateToYear"] * 10000 + data["dateToMonth"] * 100 + data["dateToDay"])
+        dateFroms, dateFromQualities, isValidDateFrom = self._decodeDatesYyyyMmDd(
+            data["dateFromYear"] * 10000 + data["dateFromMonth"] * 100 + data["dateFromDay"])
+        
+        for lineIndex in lineIndexes[~(isValidDateTo & isValidDateFrom)]:
+            print("{0} @ {1}: Invalid date".format(self._fullFileName, self._dataLineOffset + lineIndex + 1))
+        
+        isSelected = isValidDateTo & isValidDateFrom & numpy.isin(data["measurementType"], self.__MEASUREMENT_TYPES)
+        
+        observers = numpy.char.replace(numpy.char.strip(data["observer"]), ",", ";")
+        observers[observers == "-"] = ""
+        
+        series = LengthChangeSeries(
+            dateFroms, dateFromQualities, dateTos, dateToQualities,
+            data["measurementType"], data["measurementMethod"], data["measurementCondition"],
+            data["variationQuantitative"],
+            FixedWidthSchema.toFloats(data["elevationMin"]),
+            observers)
+        
+        self._series = series.select(isSelected)
+        self._numberDataLines = len(self._series)
+        
+        return self._series
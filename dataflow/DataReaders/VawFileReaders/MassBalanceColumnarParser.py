@@ -0,0 +1,346 @@
+'''
+Created on 18.10.2026
+
+@author: yvo
+'''
+
+import numpy
+
+class MassBalanceColumnarParser(object):
+    '''
+    Columnar parsing engine for the data block of the VAW mass balance files (*_obs.dat, *_fix.dat).
+
+    The entire data block is converted with one call into NumPy arrays. The twelve unique values of a
+    mass balance are stored as columns of a two-dimensional array with one row per mass balance. The
+    values of the elevation bands are stored as two-dimensional arrays (mass balances x elevation bands).
+    Missing values ('NaN' in the file) are NaN in the arrays.
+
+    The elevation band block of a data line contains either five columns per band (winter balance,
+    number of winter measurements, annual balance, number of annual measurements, surface) or, in older
+    files, three columns per band (winter balance, annual balance, surface). The layout is derived from
+    the number of columns of the data lines.
+
+    Except the surfaces, all values of the file are integers. Lines with a value which is not an integer
+    in one of these columns are listed in invalidLines, as the int() conversion of the former line by line
+    parsing did. The arrays hold integral values only and can be cast to integers without loss.
+
+    Attributes:
+        - _NUMBER_UNIQUE_COLUMNS            Number of columns with unique values of a mass balance.
+        - _UNIQUE_COLUMN_SURFACE            Column of the surface, the only unique value which is not an integer.
+        - _BAND_BLOCKS_WITH_MEASUREMENTS    Number of columns per elevation band including the number of measurements.
+        - _BAND_BLOCKS_WITHOUT_MEASUREMENTS Number of columns per elevation band without the number of measurements.
+        - _numberElevationBuckets           Number of elevation bands as defined in the header line.
+        - _elevationsFrom                   Lower elevation of each elevation band.
+        - _elevationsTo                     Upper elevation of each elevation band.
+        - _uniqueValues                     Unique values of the mass balances (mass balances x _NUMBER_UNIQUE_COLUMNS).
+        - _winterBalances                   Winter balances of the elevation bands (mass balances x elevation bands).
+        - _winterMeasurements               Number of winter measurements of the elevation bands. NaN in older files.
+        - _annualBalances                   Annual balances of the elevation bands (mass balances x elevation bands).
+        - _annualMeasurements               Number of annual measurements of the elevation bands. NaN in older files.
+        - _surfaces                         Surfaces of the elevation bands (mass balances x elevation bands).
+        - _lineIndexes                      Index of the data line of each mass balance within the parsed lines.
+        - _invalidLines                     List of tuples with index and error message of the lines which could not be parsed.
+    '''
+
+    _NUMBER_UNIQUE_COLUMNS            = 12
+    _UNIQUE_COLUMN_SURFACE            = 9
+
+    _BAND_BLOCKS_WITH_MEASUREMENTS    = 5
+    _BAND_BLOCKS_WITHOUT_MEASUREMENTS = 3
+
+    _numberElevationBuckets = -1
+
+    _elevationsFrom      = None
+    _elevationsTo        = None
+
+    _uniqueValues        = None
+    _winterBalances      = None
+    _winterMeasurements  = None
+    _annualBalances      = None
+    _annualMeasurements  = None
+    _surfaces            = None
+
+    _lineIndexes         = None
+    _invalidLines        = None
+
+    def __init__(self, numberElevationBuckets, startElevationBuckets, equidistanceBuckets):
+        '''
+        Constructor of the parsing engine.
+
+        @type numberElevationBuckets: int
+        @param numberElevationBuckets: Number of elevation bands as defined in the header line.
+        @type startElevationBuckets: int
+        @param startElevationBuckets: Start elevation of the lowest elevation band.
+        @type equidistanceBuckets: float
+        @param equidistanceBuckets: Elevation range of each elevation band.
+        '''
+
+        self._numberElevationBuckets = numberElevationBuckets
+
+        self._elevationsFrom = startElevationBuckets + equidistanceBuckets * numpy.arange(numberElevationBuckets)
+        self._elevationsTo   = self._elevationsFrom + equidistanceBuckets
+
+        self._invalidLines = list()
+
+    @property
+    def numberMassBalances(self):
+        '''
+        Number of parsed mass balances (rows of the arrays).
+        '''
+        return len(self._lineIndexes)
+
+    @property
+    def elevationsFrom(self):
+        '''
+        Lower elevation of each elevation band.
+        '''
+        return self._elevationsFrom
+
+    @property
+    def elevationsTo(self):
+        '''
+        Upper elevation of each elevation band.
+        '''
+        return self._elevationsTo
+
+    @property
+    def uniqueValues(self):
+        '''
+        Unique values of the mass balances as two-dimensional array (mass balances x columns of the file).
+        '''
+        return self._uniqueValues
+
+    @property
+    def winterBalances(self):
+        '''
+        Winter balances of the elevation bands as two-dimensional array (mass balances x elevation bands).
+        '''
+        return self._winterBalances
+
+    @property
+    def winterMeasurements(self):
+        '''
+        Number of winter measurements of the elevation bands as two-dimensional array (mass balances x elevation bands).
+        '''
+        return self._winterMeasurements
+
+    @property
+    def annualBalances(self):
+        '''
+        Annual balances of the elevation bands as two-dimensional array (mass balances x elevation bands).
+        '''
+        return self._annualBalances
+
+    @property
+    def annualMeasurements(self):
+        '''
+        Number of annual measurements of the elevation bands as two-dimensional array (mass balances x elevation bands).
+        '''
+        return self._annualMeasurements
+
+    @property
+    def surfaces(self):
+        '''
+        Surfaces of the elevation bands as two-dimensional array (mass balances x elevation bands).
+        '''
+        return self._surfaces
+
+    @property
+    def validBands(self):
+        '''
+        Mask of the elevation bands with winter balance, annual balance and a surface other than zero.
+        '''
+        return ~numpy.isnan(self._winterBalances) & ~numpy.isnan(self._annualBalances) & ~numpy.isnan(self._surfaces) & (self._surfaces != 0.0)
+
+    @property
+    def lineIndexes(self):
+        '''
+        Index of the data line of each mass balance within the parsed lines.
+        '''
+        return self._lineIndexes
+
+    @property
+    def invalidLines(self):
+        '''
+        List of tuples with index and error message of the lines which could not be parsed.
+        '''
+        return self._invalidLines
+
+    def parse(self, dataLines):
+        '''
+        Converts the given data lines of a mass balance file into the arrays of the engine.
+        Empty lines are ignored, lines with an unexpected number of columns, not numeric values or
+        not integer values in the integer columns are listed in invalidLines.
+
+        @type dataLines: list
+        @param dataLines: Data lines of a mass balance file without the header lines.
+
+        @rtype: int
+        @return: Number of parsed mass balances.
+        '''
+
+        self._invalidLines = list()
+
+        lineIndexes = [lineIndex for lineIndex, dataLine in enumerate(dataLines) if dataLine.strip() != ""]
+
+        numberColumnsWithMeasurements    = self._NUMBER_UNIQUE_COLUMNS + self._numberElevationBuckets * self._BAND_BLOCKS_WITH_MEASUREMENTS
+        numberColumnsWithoutMeasurements = self._NUMBER_UNIQUE_COLUMNS + self._numberElevationBuckets * self._BAND_BLOCKS_WITHOUT_MEASUREMENTS
+
+        # Layout of the elevation bands defined by the first non-empty data line.
+        numberColumns = numberColumnsWithMeasurements
+        if len(lineIndexes) > 0 and len(dataLines[lineIndexes[0]].split()) == numberColumnsWithoutMeasurements:
+            numberColumns = numberColumnsWithoutMeasurements
+
+        block = None
+        if len(lineIndexes) > 0:
+            try:
+                # Conversion of the entire data block with one call. 'NaN' is converted into numpy.nan.
+                block = numpy.loadtxt(dataLines, dtype=numpy.float64, ndmin=2)
+            except ValueError:
+                block = None
+
+        if block is None or block.shape != (len(lineIndexes), numberColumns):
+            block, lineIndexes = self._parseLineByLine(dataLines, lineIndexes, numberColumns)
+
+        numberBandBlocks = (numberColumns - self._NUMBER_UNIQUE_COLUMNS) // self._numberElevationBuckets
+
+        block, lineIndexes = self._removeNotIntegerLines(block, lineIndexes, numberBandBlocks)
+
+        self._lineIndexes  = numpy.array(lineIndexes, dtype=numpy.int64)
+        self._uniqueValues = block[:, :self._NUMBER_UNIQUE_COLUMNS]
+
+        bands = block[:, self._NUMBER_UNIQUE_COLUMNS:].reshape(len(lineIndexes), numberBandBlocks, self._numberElevationBuckets)
+
+        if numberColumns == numberColumnsWithMeasurements:
+            self._winterBalances     = bands[:, 0, :]
+            self._winterMeasurements = bands[:, 1, :]
+            self._annualBalances     = bands[:, 2, :]
+            self._annualMeasurements = bands[:, 3, :]
+            self._surfaces           = bands[:, 4, :]
+        else:
+            self._winterBalances     = bands[:, 0, :]
+            self._annualBalances     = bands[:, 1, :]
+            self._surfaces           = bands[:, 2, :]
+            self._winterMeasurements = numpy.full(self._winterBalances.shape, numpy.nan)
+            self._annualMeasurements = numpy.full(self._annualBalances.shape, numpy.nan)
+
+        return self.numberMassBalances
+
+    def bandValuesAsLists(self, values, converter=int):
+        '''
+        Converts a two-dimensional array of elevation band values into nested lists of Python values.
+        NaN values are converted into None.
+
+        @type values: numpy.ndarray
+        @param values: Two-dimensional array of the engine (e.g. winterBalances).
+        @type converter: type
+        @param converter: Python type of the values (int or float).
+
+        @rtype: list
+        @return: List of lists (mass balances x elevation bands) with Python values or None.
+
+        @raise ValueError: Values which are not integers in case of the int converter.
+        '''
+
+        missing = numpy.isnan(values)
+
+        if converter == int:
+            if not self._isInteger(values).all():
+                raise ValueError("Not integer values {0}".format(values[~self._isInteger(values)].tolist()))
+            converted = numpy.where(missing, 0, values).astype(numpy.int64).astype(object)
+        else:
+            converted = values.astype(object)
+
+        converted[missing] = None
+
+        return converted.tolist()
+
+    def _removeNotIntegerLines(self, block, lineIndexes, numberBandBlocks):
+        '''
+        Removes the lines with values which are not integers in the integer columns (all columns except the
+        surface of the mass balance and the surfaces of the elevation bands). The removed lines are listed
+        in invalidLines.
+
+        @type block: numpy.ndarray
+        @param block: Two-dimensional array of the parsed lines.
+        @type lineIndexes: list
+        @param lineIndexes: Indexes of the parsed lines.
+        @type numberBandBlocks: int
+        @param numberBandBlocks: Number of columns per elevation band (the surfaces are the last block).
+
+        @rtype: tuple
+        @return: Two-dimensional array of the lines with integer values only and the list of their indexes.
+        '''
+
+        integerColumns = numpy.ones(block.shape[1], dtype=bool)
+        integerColumns[self._UNIQUE_COLUMN_SURFACE] = False
+        integerColumns[self._NUMBER_UNIQUE_COLUMNS + (numberBandBlocks - 1) * self._numberElevationBuckets:] = False
+
+        notIntegers = ~self._isInteger(block) & integerColumns
+
+        if not notIntegers.any():
+            return block, lineIndexes
+
+        for row in numpy.flatnonzero(notIntegers.any(axis=1)):
+            column = numpy.flatnonzero(notIntegers[row])[0]
+            message = "Not an integer value {0} in column {1}".format(block[row, column], column + 1)
+            self._invalidLines.append((lineIndexes[row], message))
+
+        self._invalidLines.sort()
+
+        validRows = ~notIntegers.any(axis=1)
+
+        return block[validRows], [lineIndex for lineIndex, isValid in zip(lineIndexes, validRows) if isValid]
+
+    def _isInteger(self, values):
+        '''
+        Mask of the values which are missing (NaN) or finite integral numbers.
+
+        @type values: numpy.ndarray
+        @param values: Array of values.
+
+        @rtype: numpy.ndarray
+        @return: Boolean array of the shape of the values.
+        '''
+
+        with numpy.errstate(invalid="ignore"):
+            return numpy.isnan(values) | (numpy.isfinite(values) & (values == numpy.trunc(values)))
+
+    def _parseLineByLine(self, dataLines, lineIndexes, numberColumns):
+        '''
+        Fallback conversion in case of an irregular data block. Each line is converted individually,
+        lines with an unexpected number of columns or not numeric values are listed in invalidLines.
+
+        @type dataLines: list
+        @param dataLines: Data lines of a mass balance file without the header lines.
+        @type lineIndexes: list
+        @param lineIndexes: Indexes of the non-empty lines.
+        @type numberColumns: int
+        @param numberColumns: Expected number of columns.
+
+        @rtype: tuple
+        @return: Two-dimensional array of the valid lines and the list of their indexes.
+        '''
+
+        rows = list()
+        validLineIndexes = list()
+
+        for lineIndex in lineIndexes:
+
+            lineParts = dataLines[lineIndex].split()
+
+            if len(lineParts) != numberColumns:
+                message = "Unexpected number of columns {0} instead of {1}".format(len(lineParts), numberColumns)
+                self._invalidLines.append((lineIndex, message))
+                continue
+
+            try:
+                rows.append(numpy.array(lineParts, dtype=numpy.float64))
+                validLineIndexes.append(lineIndex)
+            except ValueError as e:
+                self._invalidLines.append((lineIndex, str(e)))
+
+        if len(rows) > 0:
+            return numpy.vstack(rows), validLineIndexes
+        else:
+            return numpy.empty((0, numberColumns)), validLineIndexes
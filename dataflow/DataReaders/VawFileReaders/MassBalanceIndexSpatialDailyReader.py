@@ -8,6 +8,9 @@ import re
 import datetime
 
 from dataflow.DataReaders.VawFileReaders.VawFileReader import VawFileReader
+from dataflow.DataReaders.VawFileReaders.ColumnSchema import ColumnSchema
+from dataflow.DataReaders.VawFileReaders.FileColumn import FileColumn
+from dataflow.DataObjects.Glamos import GlamosData
 from dataflow.DataObjects.Exceptions.GlacierNotFoundError import GlacierNotFoundError
 from dataflow.DataObjects.MassBalanceIndexSpatialDaily import MassBalanceIndexSpatialDaily
 from dataflow.DataReaders.Exceptions.InvalidDataFileError import InvalidDataFileError
@@ -30,20 +33,21 @@ class MassBalanceIndexSpatialDailyReader(VawFileReader):
     # Number of header lines.
     __NUMBER_HEADER_LINES = 4
 
-    # Definition of the columns in the point mass balance ASCII files (0-based index).
-    # __FILE_COLUMN_EMPTY = 0 -> first entry is a space
-    __FILE_COLUMN_STAKENAME = 1
-    __FILE_COLUMN_YEAR_HYD = 2
-    __FILE_COLUMN_YEAR = 3
-    __FILE_COLUMN_DOY = 4
-    __FILE_COLUMN_MONTH = 5
-    __FILE_COLUMN_DAY = 6
-    __FILE_COLUMN_BALANCE = 7
-    __FILE_COLUMN_ACCUMULATION = 8
-    __FILE_COLUMN_MELT = 9
-    __FILE_COLUMN_SURFACE_TYPE = 10
-    __FILE_COLUMN_TEMP = 11
-    __FILE_COLUMN_PRECIP = 12
+    # Definition of the columns in the index spatial daily mass balance ASCII files (0-based index).
+    # The data lines start with a space, the first (empty) column is not used.
+    __COLUMNS = (
+        FileColumn("stakeName",        1, str),
+        FileColumn("yearHydrological", 2, int),
+        FileColumn("year",             3, int),
+        FileColumn("dayOfYear",        4, int),
+        FileColumn("month",            5, int),
+        FileColumn("day",              6, int),
+        FileColumn("balance",          7, int),
+        FileColumn("accumulation",     8, int),
+        FileColumn("melt",             9, int),
+        FileColumn("surfaceType",      10, int),
+        FileColumn("temperature",      11, float),
+        FileColumn("precipitation",    12, float))
 
     _massBalanceIndexSpatialDailyCounter = 0
 
@@ -95,56 +99,61 @@ class MassBalanceIndexSpatialDailyReader(VawFileReader):
         pass
 
     def parse(self):
-        with open(self._fullFileName, "r") as mbisd:
 
-            lineCounter = 0
-            self._numberDataLines = 0
+        self._numberDataLines = 0
 
-            dataLines = []
+        massBalanceIndexSpatialDailys = self._parseBlock(self._readDataLines())
 
-            for line in mbisd:
+        # Appended lines not following the last ingested date: The file was rewritten and is parsed entirely.
+        if massBalanceIndexSpatialDailys == None:
+            return self.parse()
 
-                lineCounter += 1
+        # The objects are added with their identifier as key, all identifiers are allocated at once.
+        for massBalanceIndexSpatialDaily in GlamosData.assignPks(massBalanceIndexSpatialDailys):
 
-                try:
+            self._massBalanceIndexSpatialDailyCounter += 1
+            self._glacier.addMassBalanceIndexSpatialDaily(massBalanceIndexSpatialDaily)
 
-                    if lineCounter > self.__NUMBER_HEADER_LINES:
-                        data = self._getData(line)
+    def _parseBlock(self, dataLines, firstLineIndex=0):
+        '''
+        Converts a block of data lines into MassBalanceIndexSpatialDaily objects.
+
+        @type dataLines: list
+        @param dataLines: Block of data lines of the file.
+        @type firstLineIndex: int
+        @param firstLineIndex: Index of the first line of the block within all data lines.
+
+        @rtype: list
+        @return: MassBalanceIndexSpatialDaily objects of the block. None in case of appended lines not following the last ingested date.
+        '''
+
+        columnSchema = ColumnSchema(self.__COLUMNS)
+        data = columnSchema.convertBlock(dataLines)
+
+        self._reportInvalidLines(columnSchema, firstLineIndex=firstLineIndex)
 
-                        massBalanceIndexSpatialDaily = MassBalanceIndexSpatialDaily(
-                            name=data[self.__FILE_COLUMN_STAKENAME],
-                            date=datetime.date(data[self.__FILE_COLUMN_YEAR], data[self.__FILE_COLUMN_MONTH], data[self.__FILE_COLUMN_DAY]),
-                            balance=data[self.__FILE_COLUMN_BALANCE], accumulation=data[self.__FILE_COLUMN_ACCUMULATION], melt=data[self.__FILE_COLUMN_MELT],
-                            surface_type=data[self.__FILE_COLUMN_SURFACE_TYPE], temp=data[self.__FILE_COLUMN_TEMP], precip_solid=data[self.__FILE_COLUMN_PRECIP],
-                            reference=None)
+        dates = [datetime.date(year, month, day) for year, month, day in zip(data["year"], data["month"], data["day"])]
 
-                        self._massBalanceIndexSpatialDailyCounter += 1
-                        self._glacier.addMassBalanceIndexSpatialDaily(massBalanceIndexSpatialDaily)
+        if not self._acceptAppendedDates(dates):
+            return None
 
-                except Exception as e:
+        numberDataLines = len(columnSchema.lineIndexes)
+        self._numberDataLines += numberDataLines
 
-                    errorMessage = "{0} @ {1}: {2}".format(mbisd, lineCounter, e)
-                    print(errorMessage)
-                    raise
+        massBalanceIndexSpatialDailys = list()
 
-    def _getData(self, dataLine):
+        for stakeName, date, balance, accumulation, melt, surfaceType, temperature, precipitation in zip(
+                data["stakeName"], dates,
+                data["balance"], data["accumulation"], data["melt"],
+                data["surfaceType"], data["temperature"], data["precipitation"]):
 
-        # Dictionary with the unique values per point mass balance data line.
-        data = dict()
-        p = re.compile(' +')
-        dataLineParts = p.split(dataLine)
+            massBalanceIndexSpatialDaily = MassBalanceIndexSpatialDaily(
+                name=stakeName,
+                date=date,
+                balance=balance, accumulation=accumulation, melt=melt,
+                surface_type=surfaceType, temp=temperature, precip_solid=precipitation,
+                reference=None)
 
-        data[self.__FILE_COLUMN_STAKENAME] = str(dataLineParts[self.__FILE_COLUMN_STAKENAME].strip())
-        data[self.__FILE_COLUMN_YEAR_HYD] = int(dataLineParts[self.__FILE_COLUMN_YEAR_HYD].strip())
-        data[self.__FILE_COLUMN_YEAR] = int(dataLineParts[self.__FILE_COLUMN_YEAR].strip())
-        data[self.__FILE_COLUMN_DOY] = int(dataLineParts[self.__FILE_COLUMN_DOY].strip())
-        data[self.__FILE_COLUMN_MONTH] = int(dataLineParts[self.__FILE_COLUMN_MONTH].strip())
-        data[self.__FILE_COLUMN_DAY] = int(dataLineParts[self.__FILE_COLUMN_DAY].strip())
-        data[self.__FILE_COLUMN_BALANCE] = int(dataLineParts[self.__FILE_COLUMN_BALANCE].strip())
-        data[self.__FILE_COLUMN_ACCUMULATION] = int(dataLineParts[self.__FILE_COLUMN_ACCUMULATION].strip())
-        data[self.__FILE_COLUMN_MELT] = int(dataLineParts[self.__FILE_COLUMN_MELT].strip())
-        data[self.__FILE_COLUMN_SURFACE_TYPE] = int(dataLineParts[self.__FILE_COLUMN_SURFACE_TYPE].strip())
-        data[self.__FILE_COLUMN_TEMP] = float(dataLineParts[self.__FILE_COLUMN_TEMP].strip())
-        data[self.__FILE_COLUMN_PRECIP] = float(dataLineParts[self.__FILE_COLUMN_PRECIP].strip())
+            massBalanceIndexSpatialDailys.append(massBalanceIndexSpatialDaily)
 
-        return (data)
\ No newline at end of file
+        return massBalanceIndexSpatialDailys
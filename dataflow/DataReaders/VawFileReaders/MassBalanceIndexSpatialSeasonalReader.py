@@ -5,9 +5,11 @@ Created on 8.2.2024
 '''
 
 import re
-import datetime
 
 from dataflow.DataReaders.VawFileReaders.VawFileReader import VawFileReader
+from dataflow.DataReaders.VawFileReaders.ColumnSchema import ColumnSchema
+from dataflow.DataReaders.VawFileReaders.FileColumn import FileColumn
+from dataflow.DataObjects.Glamos import GlamosData
 from dataflow.DataObjects.Exceptions.GlacierNotFoundError import GlacierNotFoundError
 from dataflow.DataObjects.MassBalanceIndexSpatialSeasonal import MassBalanceIndexSpatialSeasonal
 from dataflow.DataReaders.Exceptions.InvalidDataFileError import InvalidDataFileError
@@ -31,31 +33,6 @@ class MassBalanceIndexSpatialSeasonalReader(VawFileReader):
     # Number of header lines.
     __NUMBER_HEADER_LINES = 4
 
-    # Definition of the columns in the point mass balance ASCII files (0-based index).
-    __FILE_COLUMN_EVALUATION_METHOD = 0
-    __FILE_COLUMN_STAKENAME = 1
-    __FILE_COLUMN_DATE_0 = 2
-    __FILE_COLUMN_DATE_FMEAS = 3
-    __FILE_COLUMN_DATE_FMIN = 4
-    __FILE_COLUMN_DATE_SMEAS = 5
-    __FILE_COLUMN_DATE_SMAX = 6
-    __FILE_COLUMN_DATE_1 = 7
-    __FILE_COLUMN_LATITUDE = 8
-    __FILE_COLUMN_LONGITUDE = 9
-    __FILE_COLUMN_ALTITUDE = 10
-    __FILE_COLUMN_B_W_MEAS = 11
-    __FILE_COLUMN_B_A_MEAS = 12
-    __FILE_COLUMN_C_W_OBS = 13
-    __FILE_COLUMN_A_W_OBS = 14
-    __FILE_COLUMN_C_A_OBS = 15
-    __FILE_COLUMN_A_A_OBS = 16
-    __FILE_COLUMN_B_W_FIX = 17
-    __FILE_COLUMN_B_A_FIX = 18
-    __FILE_COLUMN_C_W_FIX = 19
-    __FILE_COLUMN_A_W_FIX = 20
-    __FILE_COLUMN_C_A_FIX = 21
-    __FILE_COLUMN_A_A_FIX = 22
-
     _massBalanceIndexSpatialSeasonalCounter = 0
 
     def __init__(self, config, fullFileName, glaciers):
@@ -105,91 +82,111 @@ class MassBalanceIndexSpatialSeasonalReader(VawFileReader):
     def __str__(self):
         pass
 
+    def _getColumns(self):
+        '''
+        Declaration of the columns in the index spatial seasonal mass balance ASCII files (0-based index).
+        The dates date_fmeas, date_fmin, date_smeas and date_smax are given as mmdd and completed by parse()
+        with the year of date_0 and date_1.
+
+        @rtype: list
+        @return: List of dataflow.DataReaders.VawFileReaders.FileColumn.FileColumn objects.
+        '''
+
+        reformateDate = lambda yyyymmdd: self._reformateDateYyyyMmDd(yyyymmdd)[0]
+
+        return [
+            FileColumn("analysis_method_type", 0, int),
+            FileColumn("name",                 1, str),
+            FileColumn("date_0",               2, None, transform=reformateDate),
+            FileColumn("date_fmeas",           3, str),
+            FileColumn("date_fmin",            4, str),
+            FileColumn("date_smeas",           5, str),
+            FileColumn("date_smax",            6, str),
+            FileColumn("date_1",               7, None, transform=reformateDate),
+            FileColumn("latitude",             8, float),
+            FileColumn("longitude",            9, float),
+            FileColumn("altitude",             10, float),
+            FileColumn("b_w_meas",             11, int),
+            FileColumn("b_a_meas",             12, int),
+            FileColumn("c_w_obs",              13, int),
+            FileColumn("a_w_obs",              14, int),
+            FileColumn("c_a_obs",              15, int),
+            FileColumn("a_a_obs",              16, int),
+            FileColumn("b_w_fix",              17, int),
+            FileColumn("b_a_fix",              18, int),
+            FileColumn("c_w_fix",              19, int),
+            FileColumn("a_w_fix",              20, int),
+            FileColumn("c_a_fix",              21, int),
+            FileColumn("a_a_fix",              22, int)]
+
     def parse(self):
-        with open(self._fullFileName, "r") as mbis:
-
-            lineCounter = 0
-            self._numberDataLines = 0
-
-            dataLines = []
-
-            for line in mbis:
-
-                lineCounter += 1
-
-                try:
-
-                    if lineCounter > self.__NUMBER_HEADER_LINES:
-                        data = self._getData(line)
-
-                        massBalanceIndexSpatialSeasonal = MassBalanceIndexSpatialSeasonal(
-                            name=data[self.__FILE_COLUMN_STAKENAME],
-                            date_0=data[self.__FILE_COLUMN_DATE_0],
-                            date_fmeas=data[self.__FILE_COLUMN_DATE_FMEAS],
-                            date_fmin=data[self.__FILE_COLUMN_DATE_FMIN],
-                            date_smeas=data[self.__FILE_COLUMN_DATE_SMEAS],
-                            date_smax=data[self.__FILE_COLUMN_DATE_SMAX],
-                            date_1=data[self.__FILE_COLUMN_DATE_1],
-                            analysis_method_type=data[self.__FILE_COLUMN_EVALUATION_METHOD],
-                            latitude=data[self.__FILE_COLUMN_LATITUDE],
-                            longitude=data[self.__FILE_COLUMN_LONGITUDE],
-                            altitude=data[self.__FILE_COLUMN_ALTITUDE],
-                            b_w_meas=data[self.__FILE_COLUMN_B_W_MEAS],
-                            b_a_meas=data[self.__FILE_COLUMN_B_A_MEAS],
-                            c_w_obs=data[self.__FILE_COLUMN_C_W_OBS],
-                            c_a_obs=data[self.__FILE_COLUMN_A_W_OBS],
-                            a_w_obs=data[self.__FILE_COLUMN_C_A_OBS],
-                            a_a_obs=data[self.__FILE_COLUMN_A_A_OBS],
-                            b_w_fix=data[self.__FILE_COLUMN_B_W_FIX],
-                            b_a_fix=data[self.__FILE_COLUMN_B_A_FIX],
-                            c_w_fix=data[self.__FILE_COLUMN_C_W_FIX],
-                            c_a_fix=data[self.__FILE_COLUMN_A_W_FIX],
-                            a_w_fix=data[self.__FILE_COLUMN_C_A_FIX],
-                            a_a_fix=data[self.__FILE_COLUMN_A_A_FIX],
-                            reference=None)
-
-                        self._massBalanceIndexSpatialSeasonalCounter += 1
-                        self._glacier.addMassBalanceIndexSpatialSeasonal(massBalanceIndexSpatialSeasonal)
-
-                except Exception as e:
-
-                    errorMessage = "{0} @ {1}: {2}".format(mbis, lineCounter, e)
-                    print(errorMessage)
-                    raise
-
-    def _getData(self, dataLine):
-
-        # Dictionary with the unique values per point mass balance data line.
-        data = dict()
-        p = re.compile(' +')
-        dataLineParts = p.split(dataLine)
-
-        data[self.__FILE_COLUMN_EVALUATION_METHOD] = int(dataLineParts[self.__FILE_COLUMN_EVALUATION_METHOD].strip())
-        data[self.__FILE_COLUMN_STAKENAME] = str(dataLineParts[self.__FILE_COLUMN_STAKENAME].strip())
-        data[self.__FILE_COLUMN_DATE_0] = self._reformateDateYyyyMmDd(dataLineParts[self.__FILE_COLUMN_DATE_0].strip())[0]
-        date_0_year = int(data[self.__FILE_COLUMN_DATE_0].year)
-        data[self.__FILE_COLUMN_DATE_FMEAS] = self._reformateDateMmDd(dataLineParts[self.__FILE_COLUMN_DATE_FMEAS].strip(),date_0_year)[0]
-        data[self.__FILE_COLUMN_DATE_FMIN] = self._reformateDateMmDd(dataLineParts[self.__FILE_COLUMN_DATE_FMIN].strip(),date_0_year)[0]
-
-        data[self.__FILE_COLUMN_DATE_1] = self._reformateDateYyyyMmDd(dataLineParts[self.__FILE_COLUMN_DATE_1].strip())[0]
-        date_1_year = int(data[self.__FILE_COLUMN_DATE_1].year)
-        data[self.__FILE_COLUMN_DATE_SMEAS] = self._reformateDateMmDd(dataLineParts[self.__FILE_COLUMN_DATE_SMEAS].strip(),date_1_year)[0]
-        data[self.__FILE_COLUMN_DATE_SMAX] = self._reformateDateMmDd(dataLineParts[self.__FILE_COLUMN_DATE_SMAX].strip(),date_1_year)[0]
-
-        data[self.__FILE_COLUMN_LATITUDE] = float(dataLineParts[self.__FILE_COLUMN_LATITUDE].strip())
-        data[self.__FILE_COLUMN_LONGITUDE] = float(dataLineParts[self.__FILE_COLUMN_LONGITUDE].strip())
-        data[self.__FILE_COLUMN_ALTITUDE] = float(dataLineParts[self.__FILE_COLUMN_ALTITUDE].strip())
-        data[self.__FILE_COLUMN_B_W_MEAS] = int(dataLineParts[self.__FILE_COLUMN_B_W_MEAS].strip())
-        data[self.__FILE_COLUMN_B_A_MEAS] = int(dataLineParts[self.__FILE_COLUMN_B_A_MEAS].strip())
-        data[self.__FILE_COLUMN_C_W_OBS] = int(dataLineParts[self.__FILE_COLUMN_C_W_OBS].strip())
-        data[self.__FILE_COLUMN_A_W_OBS] = int(dataLineParts[self.__FILE_COLUMN_A_W_OBS].strip())
-        data[self.__FILE_COLUMN_C_A_OBS] = int(dataLineParts[self.__FILE_COLUMN_C_A_OBS].strip())
-        data[self.__FILE_COLUMN_A_A_OBS] = int(dataLineParts[self.__FILE_COLUMN_A_A_OBS].strip())
-        data[self.__FILE_COLUMN_B_W_FIX] = int(dataLineParts[self.__FILE_COLUMN_B_W_FIX].strip())
-        data[self.__FILE_COLUMN_B_A_FIX] = int(dataLineParts[self.__FILE_COLUMN_B_A_FIX].strip())
-        data[self.__FILE_COLUMN_C_W_FIX] = int(dataLineParts[self.__FILE_COLUMN_C_W_FIX].strip())
-        data[self.__FILE_COLUMN_A_W_FIX] = int(dataLineParts[self.__FILE_COLUMN_A_W_FIX].strip())
-        data[self.__FILE_COLUMN_C_A_FIX] = int(dataLineParts[self.__FILE_COLUMN_C_A_FIX].strip())
-        data[self.__FILE_COLUMN_A_A_FIX] = int(dataLineParts[self.__FILE_COLUMN_A_A_FIX].strip())
-
-        return(data)
\ No newline at end of file
+
+        self._numberDataLines = 0
+
+        massBalanceIndexSpatialSeasonals = self._parseBlock(self._readDataLines())
+
+        # The objects are added with their identifier as key, all identifiers are allocated at once.
+        for massBalanceIndexSpatialSeasonal in GlamosData.assignPks(massBalanceIndexSpatialSeasonals):
+
+            self._massBalanceIndexSpatialSeasonalCounter += 1
+            self._glacier.addMassBalanceIndexSpatialSeasonal(massBalanceIndexSpatialSeasonal)
+
+    def _parseBlock(self, dataLines, firstLineIndex=0):
+        '''
+        Converts a block of data lines into MassBalanceIndexSpatialSeasonal objects.
+
+        @type dataLines: list
+        @param dataLines: Block of data lines of the file.
+        @type firstLineIndex: int
+        @param firstLineIndex: Index of the first line of the block within all data lines.
+
+        @rtype: list
+        @return: MassBalanceIndexSpatialSeasonal objects of the block.
+        '''
+
+        columnSchema = ColumnSchema(self._getColumns())
+        data = columnSchema.convertBlock(dataLines)
+
+        self._reportInvalidLines(columnSchema, firstLineIndex=firstLineIndex)
+
+        numberDataLines = len(columnSchema.lineIndexes)
+        self._numberDataLines += numberDataLines
+
+        # The dates given as mmdd are completed with the year of the begin (date_0) and the end (date_1) of the period.
+        for column, yearColumn in [("date_fmeas", "date_0"), ("date_fmin", "date_0"), ("date_smeas", "date_1"), ("date_smax", "date_1")]:
+            data[column] = [self._reformateDateMmDd(mmdd, date.year)[0] for mmdd, date in zip(data[column], data[yearColumn])]
+
+        massBalanceIndexSpatialSeasonals = list()
+
+        for i in range(numberDataLines):
+
+            # Note: The columns a_w_obs and c_a_obs (a_w_fix and c_a_fix) are assigned crosswise as in the former implementation of the reader.
+            massBalanceIndexSpatialSeasonal = MassBalanceIndexSpatialSeasonal(
+                name=data["name"][i],
+                date_0=data["date_0"][i],
+                date_fmeas=data["date_fmeas"][i],
+                date_fmin=data["date_fmin"][i],
+                date_smeas=data["date_smeas"][i],
+                date_smax=data["date_smax"][i],
+                date_1=data["date_1"][i],
+                analysis_method_type=data["analysis_method_type"][i],
+                latitude=data["latitude"][i],
+                longitude=data["longitude"][i],
+                altitude=data["altitude"][i],
+                b_w_meas=data["b_w_meas"][i],
+                b_a_meas=data["b_a_meas"][i],
+                c_w_obs=data["c_w_obs"][i],
+                c_a_obs=data["a_w_obs"][i],
+                a_w_obs=data["c_a_obs"][i],
+                a_a_obs=data["a_a_obs"][i],
+                b_w_fix=data["b_w_fix"][i],
+                b_a_fix=data["b_a_fix"][i],
+                c_w_fix=data["c_w_fix"][i],
+                c_a_fix=data["a_w_fix"][i],
+                a_w_fix=data["c_a_fix"][i],
+                a_a_fix=data["a_a_fix"][i],
+                reference=None)
+
+            massBalanceIndexSpatialSeasonals.append(massBalanceIndexSpatialSeasonal)
+
+        return massBalanceIndexSpatialSeasonals
@@ -8,6 +8,9 @@ import re
 import datetime
 
 from dataflow.DataReaders.VawFileReaders.VawFileReader import VawFileReader
+from dataflow.DataReaders.VawFileReaders.ColumnSchema import ColumnSchema
+from dataflow.DataReaders.VawFileReaders.FileColumn import FileColumn
+from dataflow.DataObjects.Glamos import GlamosData
 from dataflow.DataObjects.Exceptions.GlacierNotFoundError import GlacierNotFoundError
 from dataflow.DataObjects.MassBalanceIndexTimeDaily import MassBalanceIndexTimeDaily
 from dataflow.DataReaders.Exceptions.InvalidDataFileError import InvalidDataFileError
@@ -34,18 +37,19 @@ class MassBalanceIndexTimeDailyReader(VawFileReader):
     # Number of header lines.
     __NUMBER_HEADER_LINES = 4
 
-    # Definition of the columns in the point mass balance ASCII files (0-based index).
-    __FILE_COLUMN_YEAR_HYD = 0
-    __FILE_COLUMN_YEAR = 1
-    __FILE_COLUMN_DOY = 2
-    __FILE_COLUMN_MONTH = 3
-    __FILE_COLUMN_DAY = 4
-    __FILE_COLUMN_BALANCE = 5
-    __FILE_COLUMN_ACCUMULATION = 6
-    __FILE_COLUMN_MELT = 7
-    __FILE_COLUMN_SURFACE_TYPE = 8
-    __FILE_COLUMN_TEMP = 9
-    __FILE_COLUMN_PRECIP = 10
+    # Definition of the columns in the index time daily mass balance ASCII files (0-based index).
+    __COLUMNS = (
+        FileColumn("yearHydrological", 0, int),
+        FileColumn("year",             1, int),
+        FileColumn("dayOfYear",        2, int),
+        FileColumn("month",            3, int),
+        FileColumn("day",              4, int),
+        FileColumn("balance",          5, int),
+        FileColumn("accumulation",     6, int),
+        FileColumn("melt",             7, int),
+        FileColumn("surfaceType",      8, int),
+        FileColumn("temperature",      9, float),
+        FileColumn("precipitation",    10, float))
 
     _massBalanceIndexTimeDailyCounter = 0
 
@@ -102,55 +106,61 @@ class MassBalanceIndexTimeDailyReader(VawFileReader):
         pass
 
     def parse(self):
-        with open(self._fullFileName, "r") as mbid:
 
-            lineCounter = 0
-            self._numberDataLines = 0
+        self._numberDataLines = 0
 
-            dataLines = []
+        massBalanceIndexTimeDailys = self._parseBlock(self._readDataLines())
 
-            for line in mbid:
+        # Appended lines not following the last ingested date: The file was rewritten and is parsed entirely.
+        if massBalanceIndexTimeDailys == None:
+            return self.parse()
 
-                lineCounter += 1
+        # The objects are added with their identifier as key, all identifiers are allocated at once.
+        for massBalanceIndexTimeDaily in GlamosData.assignPks(massBalanceIndexTimeDailys):
 
-                try:
+            self._massBalanceIndexTimeDailyCounter += 1
+            self._glacier.addMassBalanceIndexTimeDaily(massBalanceIndexTimeDaily)
 
-                    if lineCounter > self.__NUMBER_HEADER_LINES:
-                        data = self._getData(line)
+    def _parseBlock(self, dataLines, firstLineIndex=0):
+        '''
+        Converts a block of data lines into MassBalanceIndexTimeDaily objects.
+
+        @type dataLines: list
+        @param dataLines: Block of data lines of the file.
+        @type firstLineIndex: int
+        @param firstLineIndex: Index of the first line of the block within all data lines.
+
+        @rtype: list
+        @return: MassBalanceIndexTimeDaily objects of the block. None in case of appended lines not following the last ingested date.
+        '''
+
+        columnSchema = ColumnSchema(self.__COLUMNS)
+        data = columnSchema.convertBlock(dataLines)
+
+        self._reportInvalidLines(columnSchema, firstLineIndex=firstLineIndex)
 
-                        massBalanceIndexTimeDaily = MassBalanceIndexTimeDaily(
-                            name=self._stakeName,
-                            date=datetime.date(data[self.__FILE_COLUMN_YEAR], data[self.__FILE_COLUMN_MONTH], data[self.__FILE_COLUMN_DAY]),
-                            balance=data[self.__FILE_COLUMN_BALANCE], accumulation=data[self.__FILE_COLUMN_ACCUMULATION], melt=data[self.__FILE_COLUMN_MELT],
-                            surface_type=data[self.__FILE_COLUMN_SURFACE_TYPE], temp=data[self.__FILE_COLUMN_TEMP], precip_solid=data[self.__FILE_COLUMN_PRECIP],
-                            reference=self._dataSource)
+        dates = [datetime.date(year, month, day) for year, month, day in zip(data["year"], data["month"], data["day"])]
 
-                        self._massBalanceIndexTimeDailyCounter += 1
-                        self._glacier.addMassBalanceIndexTimeDaily(massBalanceIndexTimeDaily)
+        if not self._acceptAppendedDates(dates):
+            return None
 
-                except Exception as e:
+        numberDataLines = len(columnSchema.lineIndexes)
+        self._numberDataLines += numberDataLines
 
-                    errorMessage = "{0} @ {1}: {2}".format(mbid, lineCounter, e)
-                    print(errorMessage)
-                    raise
+        massBalanceIndexTimeDailys = list()
 
-    def _getData(self, dataLine):
+        for date, balance, accumulation, melt, surfaceType, temperature, precipitation in zip(
+                dates,
+                data["balance"], data["accumulation"], data["melt"],
+                data["surfaceType"], data["temperature"], data["precipitation"]):
 
-        # Dictionary with the unique values per point mass balance data line.
-        data = dict()
-        p = re.compile(' +')
-        dataLineParts = p.split(dataLine)
+            massBalanceIndexTimeDaily = MassBalanceIndexTimeDaily(
+                name=self._stakeName,
+                date=date,
+                balance=balance, accumulation=accumulation, melt=melt,
+                surface_type=surfaceType, temp=temperature, precip_solid=precipitation,
+                reference=self._dataSource)
 
-        data[self.__FILE_COLUMN_YEAR_HYD] = int(dataLineParts[self.__FILE_COLUMN_YEAR_HYD].strip())
-        data[self.__FILE_COLUMN_YEAR] = int(dataLineParts[self.__FILE_COLUMN_YEAR].strip())
-        data[self.__FILE_COLUMN_DOY] = int(dataLineParts[self.__FILE_COLUMN_DOY].strip())
-        data[self.__FILE_COLUMN_MONTH] = int(dataLineParts[self.__FILE_COLUMN_MONTH].strip())
-        data[self.__FILE_COLUMN_DAY] = int(dataLineParts[self.__FILE_COLUMN_DAY].strip())
-        data[self.__FILE_COLUMN_BALANCE] = int(dataLineParts[self.__FILE_COLUMN_BALANCE].strip())
-        data[self.__FILE_COLUMN_ACCUMULATION] = int(dataLineParts[self.__FILE_COLUMN_ACCUMULATION].strip())
-        data[self.__FILE_COLUMN_MELT] = int(dataLineParts[self.__FILE_COLUMN_MELT].strip())
-        data[self.__FILE_COLUMN_SURFACE_TYPE] = int(dataLineParts[self.__FILE_COLUMN_SURFACE_TYPE].strip())
-        data[self.__FILE_COLUMN_TEMP] = float(dataLineParts[self.__FILE_COLUMN_TEMP].strip())
-        data[self.__FILE_COLUMN_PRECIP] = float(dataLineParts[self.__FILE_COLUMN_PRECIP].strip())
+            massBalanceIndexTimeDailys.append(massBalanceIndexTimeDaily)
 
-        return (data)
\ No newline at end of file
+        return massBalanceIndexTimeDailys
@@ -7,6 +7,9 @@ Created on 22.03.2021
 import re
 
 from dataflow.DataReaders.VawFileReaders.VawFileReader import VawFileReader
+from dataflow.DataReaders.VawFileReaders.ColumnSchema import ColumnSchema
+from dataflow.DataReaders.VawFileReaders.FileColumn import FileColumn
+from dataflow.DataObjects.Glamos import GlamosData
 from dataflow.DataObjects.Exceptions.GlacierNotFoundError import GlacierNotFoundError
 from dataflow.DataObjects.Exceptions.MassBalanceError import ObservationTypeNotDefinedError
 from dataflow.DataObjects.MassBalancePoint import MassBalancePoint
@@ -30,29 +33,6 @@ class MassBalancePointReader(VawFileReader):
     # Number of header lines.
     __NUMBER_HEADER_LINES = 4
 
-    # Definition of the columns in the point mass balance ASCII files (0-based index).
-    __FILE_COLUMN_NAME = 0
-    __FILE_COLUMN_DATE_FROM = 1
-    __FILE_COLUMN_TIME_FROM = 2
-    __FILE_COLUMN_DATE_TO = 3
-    __FILE_COLUMN_TIME_TO = 4
-    __FILE_COLUMN_PERIOD = 5
-    __FILE_COLUMN_DATE_QUALITY = 6
-    __FILE_COLUMN_LATITUDE = 7
-    __FILE_COLUMN_LONGITUDE = 8
-    __FILE_COLUMN_ALTITUDE = 9
-    __FILE_COLUMN_POSITION_ACCURACY = 10
-    __FILE_COLUMN_MASSBALANCE_RAW = 11
-    __FILE_COLUMN_DENSITY = 12
-    __FILE_COLUMN_DENSITY_ACCURACY = 13
-    __FILE_COLUMN_MASSBALANCE_WE = 14
-    __FILE_COLUMN_MASSBALANCE_QUALITY = 15
-    __FILE_COLUMN_MASSBALANCE_TYPE = 16
-    __FILE_COLUMN_MASSBALANCE_ERROR = 17
-    __FILE_COLUMN_READING_ERROR = 18
-    __FILE_COLUMN_DENSITY_ERROR = 19
-    __FILE_COLUMN_SOURCE = 20
-
     _massBalancePointType = ObservationTypeEnum.NotDefinedUnknown
     _massBalancePointCounter = 0
 
@@ -106,112 +86,111 @@ class MassBalancePointReader(VawFileReader):
 
         pass
 
-    def parse(self):
-        with open(self._fullFileName, "r") as mbp:
+    def _getColumns(self):
+        '''
+        Declaration of the columns in the point mass balance ASCII files (0-based index).
 
-            lineCounter = 0
-            self._numberDataLines = 0
+        Values of 9 in the quality and type columns were formerly used in the VAW files as unknown/undefined,
+        in the database undefined/unknown is 0.
 
-            dataLines = []
-            if self._ObservationType == ObservationTypeEnum.Annual:
-                observationType = 1
-            elif self._ObservationType == ObservationTypeEnum.Wintersnow:
-                observationType = 2
-            elif self._ObservationType == ObservationTypeEnum.Intermediate:
-                observationType = 3
-            else:
-                message = "Not defined point mass balance type of file {0}".format(self._fullFileName)
-                raise ObservationTypeNotDefinedError(message)
+        @rtype: list
+        @return: List of dataflow.DataReaders.VawFileReaders.FileColumn.FileColumn objects.
+        '''
 
-            for line in mbp:
+        name = lambda name: name if len(name) > 0 else 'noname'
+
+        return [
+            FileColumn("name",                0,  str, transform=name),
+            FileColumn("dateFrom",            1,  str),
+            FileColumn("timeFrom",            2,  str, transform=self._reformatTime),
+            FileColumn("dateTo",              3,  str),
+            FileColumn("timeTo",              4,  str, transform=self._reformatTime),
+            FileColumn("period",              5,  float),
+            FileColumn("dateAccuracy",        6,  int, transform=self._notNine),
+            FileColumn("latitude",            7,  float),
+            FileColumn("longitude",           8,  float),
+            FileColumn("altitude",            9,  float),
+            FileColumn("positionAccuracy",    10, int, transform=self._notNine),
+            FileColumn("massbalance_raw",     11, int),
+            FileColumn("density",             12, int),
+            FileColumn("densityAccuracy",     13, int, transform=self._notNine),
+            FileColumn("massbalance_we",      14, int),
+            FileColumn("measurement_quality", 15, int, transform=self._notNine),
+            FileColumn("measurement_type",    16, int, transform=self._notNine),
+            FileColumn("massbalance_error",   17, int),
+            FileColumn("reading_error",       18, int),
+            FileColumn("density_error",       19, int),
+            # TODO: Source from abbreviations to full name conversion according to ReadMe.txt
+            FileColumn("source",              20, str)]
 
-                lineCounter += 1
+    def parse(self):
 
-                try:
+        self._numberDataLines = 0
 
-                    if lineCounter > self.__NUMBER_HEADER_LINES:
-                        data = self._getData(line)
+        massBalancePoints = self._parseBlock(self._readDataLines())
 
-                        massBalancePoint = MassBalancePoint(
-                            pk=None,
-                            name=data[self.__FILE_COLUMN_NAME],
-                            observationType=observationType,
-                            dateFrom=data[self.__FILE_COLUMN_DATE_FROM], timeFrom=data[self.__FILE_COLUMN_TIME_FROM],
-                            dateTo=data[self.__FILE_COLUMN_DATE_TO], timeTo=data[self.__FILE_COLUMN_TIME_TO],
-                            period=data[self.__FILE_COLUMN_PERIOD],
-                            dateAccuracy=data[self.__FILE_COLUMN_DATE_QUALITY],
-                            latitude=data[self.__FILE_COLUMN_LATITUDE], longitude=data[self.__FILE_COLUMN_LONGITUDE], altitude=data[self.__FILE_COLUMN_ALTITUDE], positionAccuracy=data[self.__FILE_COLUMN_POSITION_ACCURACY],
-                            massbalance_raw=data[self.__FILE_COLUMN_MASSBALANCE_RAW],
-                            density=data[self.__FILE_COLUMN_DENSITY], densityAccuracy=data[self.__FILE_COLUMN_DENSITY_ACCURACY],
-                            massbalance_we=data[self.__FILE_COLUMN_MASSBALANCE_WE], measurement_quality=data[self.__FILE_COLUMN_MASSBALANCE_QUALITY], measurement_type=data[self.__FILE_COLUMN_MASSBALANCE_TYPE],
-                            massbalance_error=data[self.__FILE_COLUMN_MASSBALANCE_ERROR], reading_error=data[self.__FILE_COLUMN_READING_ERROR], density_error=data[self.__FILE_COLUMN_DENSITY_ERROR],
-                            source=data[self.__FILE_COLUMN_SOURCE])
+        # The objects are added with their identifier as key, all identifiers are allocated at once.
+        for massBalancePoint in GlamosData.assignPks(massBalancePoints):
 
-                        self._massBalancePointCounter += 1
+            self._massBalancePointCounter += 1
+            self._glacier.addMassBalancePoint(massBalancePoint)
 
-                        self._glacier.addMassBalancePoint(massBalancePoint)
+    def _parseBlock(self, dataLines, firstLineIndex=0):
+        '''
+        Converts a block of data lines into MassBalancePoint objects.
 
+        @type dataLines: list
+        @param dataLines: Block of data lines of the file.
+        @type firstLineIndex: int
+        @param firstLineIndex: Index of the first line of the block within all data lines.
 
-                except Exception as e:
+        @rtype: list
+        @return: MassBalancePoint objects of the block.
+        '''
 
-                    errorMessage = "{0} @ {1}: {2}".format(mbp, lineCounter, e)
-                    print(errorMessage)
-                    raise
+        if self._ObservationType == ObservationTypeEnum.Annual:
+            observationType = 1
+        elif self._ObservationType == ObservationTypeEnum.Wintersnow:
+            observationType = 2
+        elif self._ObservationType == ObservationTypeEnum.Intermediate:
+            observationType = 3
+        else:
+            message = "Not defined point mass balance type of file {0}".format(self._fullFileName)
+            raise ObservationTypeNotDefinedError(message)
 
+        columnSchema = ColumnSchema(self._getColumns(), skipLeadingEmpty=True)
+        data = columnSchema.convertBlock(dataLines)
 
-    def _getData(self, dataLine):
+        self._reportInvalidLines(columnSchema, firstLineIndex=firstLineIndex)
 
-        # Dictionary with the unique values per point mass balance data line.
-        data = dict()
-        p = re.compile(' +')
-        dataLineParts = p.split(dataLine)
-        while len(dataLineParts[0]) == 0:
-            dataLineParts = dataLineParts[1:]
+        numberDataLines = len(columnSchema.lineIndexes)
+        self._numberDataLines += numberDataLines
 
-        # Filling up of the parsed data to piped into an object.
-        # ------------------------------------------------------
-        if len(dataLineParts[self.__FILE_COLUMN_NAME].strip()) == 0:
-            data[self.__FILE_COLUMN_NAME] = 'noname'
-        else:
-            data[self.__FILE_COLUMN_NAME] = dataLineParts[self.__FILE_COLUMN_NAME].strip()
+        # If date_from is not available in the VAW files, date_to is used (mainly within _winter.dat-files).
+        data["dateFrom"] = [dateFrom if len(dateFrom) == 8 else dateTo for dateFrom, dateTo in zip(data["dateFrom"], data["dateTo"])]
 
-        # FILE_COLUMN_DATE_FROM: if date_from in vaw-files not available write date_to (mainly within _winter.dat-files)
-        if len(dataLineParts[self.__FILE_COLUMN_DATE_FROM].strip()) != 8:
-            data[self.__FILE_COLUMN_DATE_FROM] = dataLineParts[self.__FILE_COLUMN_DATE_TO].strip()
-        else:
-            data[self.__FILE_COLUMN_DATE_FROM] = dataLineParts[self.__FILE_COLUMN_DATE_FROM].strip()
-
-        data[self.__FILE_COLUMN_TIME_FROM] = self._reformatTime(dataLineParts[self.__FILE_COLUMN_TIME_FROM].strip())
-        data[self.__FILE_COLUMN_DATE_TO] = dataLineParts[self.__FILE_COLUMN_DATE_TO].strip()
-        data[self.__FILE_COLUMN_TIME_TO] = self._reformatTime(dataLineParts[self.__FILE_COLUMN_TIME_TO].strip())
-        data[self.__FILE_COLUMN_PERIOD] = float(dataLineParts[self.__FILE_COLUMN_PERIOD].strip())
-
-        # FILE_COLUMN_DATE_QUALITY: 9 was formerly used in vaw-files as unknown/undefined, in the DB undefined/unknown is 0
-        data[self.__FILE_COLUMN_DATE_QUALITY] = int(self._notNine(dataLineParts[self.__FILE_COLUMN_DATE_QUALITY].strip()))
-
-        data[self.__FILE_COLUMN_LATITUDE] = float(dataLineParts[self.__FILE_COLUMN_LATITUDE].strip())
-        data[self.__FILE_COLUMN_LONGITUDE] = float(dataLineParts[self.__FILE_COLUMN_LONGITUDE].strip())
-        data[self.__FILE_COLUMN_ALTITUDE] = float(dataLineParts[self.__FILE_COLUMN_ALTITUDE].strip())
-        # FILE_COLUMN_DATE_QUALITY: 9 was formerly used in vaw-files as unknown/undefined, in the DB undefined/unknown is 0
-        data[self.__FILE_COLUMN_POSITION_ACCURACY] = int(self._notNine(dataLineParts[self.__FILE_COLUMN_POSITION_ACCURACY].strip()))
-        data[self.__FILE_COLUMN_MASSBALANCE_RAW] = int(dataLineParts[self.__FILE_COLUMN_MASSBALANCE_RAW].strip())
-        data[self.__FILE_COLUMN_DENSITY] = int(dataLineParts[self.__FILE_COLUMN_DENSITY].strip())
-
-        # FILE_COLUMN_DATE_QUALITY: 9 was formerly used in vaw-files as unknown/undefined, in the DB undefined/unknown is 0
-        data[self.__FILE_COLUMN_DENSITY_ACCURACY] = int(self._notNine(dataLineParts[self.__FILE_COLUMN_DENSITY_ACCURACY].strip()))
-        data[self.__FILE_COLUMN_MASSBALANCE_WE] = int(dataLineParts[self.__FILE_COLUMN_MASSBALANCE_WE].strip())
-        data[self.__FILE_COLUMN_MASSBALANCE_QUALITY] = int(self._notNine(dataLineParts[self.__FILE_COLUMN_MASSBALANCE_QUALITY].strip()))
-
-        # FILE_COLUMN_MASSBALANCE_TYPE: 9 was formerly used in vaw-files as unknown/undefined, in the DB undefined/unknown is 0
-        data[self.__FILE_COLUMN_MASSBALANCE_TYPE] = int(self._notNine(dataLineParts[self.__FILE_COLUMN_MASSBALANCE_TYPE].strip()))
-        data[self.__FILE_COLUMN_MASSBALANCE_ERROR] = int(dataLineParts[self.__FILE_COLUMN_MASSBALANCE_ERROR].strip())
-        data[self.__FILE_COLUMN_READING_ERROR] = int(dataLineParts[self.__FILE_COLUMN_READING_ERROR].strip())
-        data[self.__FILE_COLUMN_DENSITY_ERROR] = int(dataLineParts[self.__FILE_COLUMN_DENSITY_ERROR].strip())
-        # TODO: FILE_COLUMN_SOURCE from abbreviations to full name conversion according to ReadMe.txt
-        data[self.__FILE_COLUMN_SOURCE] = dataLineParts[self.__FILE_COLUMN_SOURCE].strip()
-
-        return (data)
+        massBalancePoints = list()
+
+        for i in range(numberDataLines):
+
+            massBalancePoint = MassBalancePoint(
+                pk=None,
+                name=data["name"][i],
+                observationType=observationType,
+                dateFrom=data["dateFrom"][i], timeFrom=data["timeFrom"][i],
+                dateTo=data["dateTo"][i], timeTo=data["timeTo"][i],
+                period=data["period"][i],
+                dateAccuracy=data["dateAccuracy"][i],
+                latitude=data["latitude"][i], longitude=data["longitude"][i], altitude=data["altitude"][i], positionAccuracy=data["positionAccuracy"][i],
+                massbalance_raw=data["massbalance_raw"][i],
+                density=data["density"][i], densityAccuracy=data["densityAccuracy"][i],
+                massbalance_we=data["massbalance_we"][i], measurement_quality=data["measurement_quality"][i], measurement_type=data["measurement_type"][i],
+                massbalance_error=data["massbalance_error"][i], reading_error=data["reading_error"][i], density_error=data["density_error"][i],
+                source=data["source"][i])
+
+            massBalancePoints.append(massBalancePoint)
 
+        return massBalancePoints
 
     def replace_source(self,source):
         # TODO: function not used yet
@@ -5,9 +5,10 @@ Created on 31.05.2018
 '''
 
 import re
-import copy
+import numpy
 
 from dataflow.DataReaders.VawFileReaders.VawFileReader import VawFileReader
+from dataflow.DataReaders.VawFileReaders.MassBalanceColumnarParser import MassBalanceColumnarParser
 from dataflow.DataObjects.MassBalance import MassBalance
 from dataflow.DataObjects.MassBalance import MassBalanceObservation
 from dataflow.DataObjects.MassBalance import MassBalanceFixDate
@@ -46,7 +47,7 @@ class MassBalanceReader(VawFileReader):
         
         __FILE_COLUMN_START_ELEVATION_BANDS  First column of the elevation band data.
         
-        _NOT_A_NUMBER_STRING                 # TODO: Description
+        _dataBlock                           Columnar parsing engine with the data block of the file as NumPy arrays.
     '''
 
     __NUMBER_HEADER_LINES        = 4
@@ -79,13 +80,13 @@ class MassBalanceReader(VawFileReader):
 
     __FILE_COLUMN_START_ELEVATION_BANDS     = 12
     
-    _NOT_A_NUMBER_STRING                    = 'NaN'
-    
     _massBalanceType                        = MassBalanceTypeEnum.NotDefinedUnknown
 
     _massBalanceObservationCounter = 0
     _elevationBandValidCounter     = 0
     _elevationBandInvalidCounter   = 0
+    
+    _dataBlock                     = None
 
     def __init__(self, config, fullFileName, glaciers):
         '''
@@ -188,6 +189,16 @@ class MassBalanceReader(VawFileReader):
         
         return self._elevationBandInvalidCounter + self._elevationBandValidCounter
 
+    @property
+    def dataBlock(self):
+        '''
+        Columnar parsing engine with the data block of the file as NumPy arrays. None if the file was not parsed yet.
+        
+        @rtype: dataflow.DataReaders.VawFileReaders.MassBalanceColumnarParser.MassBalanceColumnarParser
+        '''
+        
+        return self._dataBlock
+
     def parse(self):
         '''
         Main function to start the parsing process. The function
@@ -196,181 +207,134 @@ class MassBalanceReader(VawFileReader):
         The mass-balance objects are added to the corresponding glacier object
         found in the dictionary given in the constructor.
         
+        The data block is converted into NumPy arrays by a MassBalanceColumnarParser with one call,
+        the arrays are available by the dataBlock property.
+        
         @raise MassBalanceTypeNotDefinedError: Exception if mass balance type is not defined.
         '''
-    
-        self._fullFileName
-        
-        massBalance = None
-
-        with open(self._fullFileName, "r") as mb:
-
-            lineCounter = 0
-            self._numberDataLines = 0
-
-            for line in mb:
-
-                lineCounter += 1
-                
-                try:
-                        
-                    if lineCounter > self.__NUMBER_HEADER_LINES:
-                        
-                        # Retrieving all the data of the mass balance data line (unique values and multiple values of the elevation bands).
-                        data = self._getData(line)
-                        
-                        # TODO: Including the self._numberDataLines counter.
-                        
-                        # Creating the main object of a mass balance entry with the unique values depending on the mass balance type.
-                        if self._massBalanceType == MassBalanceTypeEnum.Observation:
-                            
-                            self._massBalanceObservationCounter += 1
-                            
-                            massBalance = MassBalanceObservation(
-                                None,
-                                data[0][self.__FILE_COLUMN_METHOD],
-                                data[0][self.__FILE_COLUMN_DATE_FROM][0],
-                                data[0][self.__FILE_COLUMN_DATE_TO][0],
-                                
-                                data[0][self.__FILE_COLUMN_DATE_MEASUREMENT_FALL][0],
-                                data[0][self.__FILE_COLUMN_DATE_MEASUREMENT_SPRING][0],
-                                
-                                data[0][self.__FILE_COLUMN_MINIMUM_ELEVATION],
-                                data[0][self.__FILE_COLUMN_MAXIMUM_ELEVATION],
-                                data[0][self.__FILE_COLUMN_SURFACE],
-    
-                                data[0][self.__FILE_COLUMN_EQUILIBRIUM_LINE_ALTITUDE],
-                                data[0][self.__FILE_COLUMN_ACCUMULATION_AREA_RATIO],
-    
-                                data[0][self.__FILE_COLUMN_WINTER_BALANCE],
-                                data[0][self.__FILE_COLUMN_ANNUAL_BALANCE])
-                        elif self._massBalanceType == MassBalanceTypeEnum.FixDate:
-                            
-                            yearFrom = data[0][self.__FILE_COLUMN_DATE_FROM][0].year
-                            yearTo   = data[0][self.__FILE_COLUMN_DATE_TO][0].year
-                            
-                            self._massBalanceObservationCounter += 1
-                            
-                            massBalance = MassBalanceFixDate(
-                                None,
-                                data[0][self.__FILE_COLUMN_METHOD],
-                                yearFrom,
-                                yearTo,
-                                 
-                                data[0][self.__FILE_COLUMN_MINIMUM_ELEVATION],
-                                data[0][self.__FILE_COLUMN_MAXIMUM_ELEVATION],
-                                data[0][self.__FILE_COLUMN_SURFACE],
-     
-                                data[0][self.__FILE_COLUMN_EQUILIBRIUM_LINE_ALTITUDE],
-                                data[0][self.__FILE_COLUMN_ACCUMULATION_AREA_RATIO],
-     
-                                data[0][self.__FILE_COLUMN_WINTER_BALANCE],
-                                data[0][self.__FILE_COLUMN_ANNUAL_BALANCE])
-                        else:
-                            message = "Not defined mass balance type of file {0}".format(self._fullFileName)
-                            raise MassBalanceTypeNotDefinedError(message)
-                                             
-                        # Getting all elevation bands as own data objects and adding them to the mass balance.
-                        for elevationBandData in data[1]:
-                            
-                            elevationBand = ElevationBand(
-                                None,
-                                elevationBandData[0], elevationBandData[0] + self._equidistanceBuckets,
-                                elevationBandData[1], elevationBandData[2],
-                                elevationBandData[3], elevationBandData[4], elevationBandData[5])
-
-                            massBalance.addElevationBand(elevationBand)
-                            
-                            # Counting the valid and invalid elevation bands.
-                            if elevationBand.elevationFrom != None and elevationBand.elevationTo != None and elevationBand.annualMassBalance != None and elevationBand.winterMassBalance != None and elevationBand.surface:
-                                self._elevationBandValidCounter += 1
-                            else:
-                                self._elevationBandInvalidCounter += 1
-                        
-                        # Setting the data source if available.
-                        if self._dataSource != None:
-                            massBalance.dataSource = self._dataSource
-                        
-                        # Adding the new mass balance to the collection of mass balances of the glacier.
-                        self._glacier.addMassBalance(massBalance)
-
-                except Exception as e:
-
-                    errorMessage = "{0} @ {1}: {2}".format(mb, lineCounter, e)
-                    print(errorMessage)
-    
-    def _getData(self, dataLine):
-        # TODO: Description
         
-        # Dictionary with the unique values per mass balance.
-        data = dict()
-        # List of data triples of the mass balance elevation band data.
-        dataElevationBands = list()
+        dataLines = self._readDataLines()
         
-        p = re.compile(' +')
+        self._dataBlock = MassBalanceColumnarParser(self._numberElevationBuckets, self._startElevationBuckets, self._equidistanceBuckets)
+        self._dataBlock.parse(dataLines)
         
-        dataLineParts = p.split(dataLine)
+        for lineIndex, message in self._dataBlock.invalidLines:
+            print("{0} @ {1}: {2}".format(self._fullFileName, self.__NUMBER_HEADER_LINES + lineIndex + 1, message))
         
-        data[self.__FILE_COLUMN_METHOD]                    = int(dataLineParts[self.__FILE_COLUMN_METHOD].strip())  
+        self._numberDataLines = self._dataBlock.numberMassBalances
         
-        dateFrom                                           = self._reformateDateYyyyMmDd(dataLineParts[self.__FILE_COLUMN_DATE_FROM].strip())
-        data[self.__FILE_COLUMN_DATE_FROM]                 = dateFrom
-        dateTo                                             = self._reformateDateYyyyMmDd(dataLineParts[self.__FILE_COLUMN_DATE_TO].strip())
-        data[self.__FILE_COLUMN_DATE_TO]                   = dateTo
-
-        data[self.__FILE_COLUMN_DATE_MEASUREMENT_FALL]     = self._reformateDateMmDd(dataLineParts[self.__FILE_COLUMN_DATE_MEASUREMENT_FALL].strip(), dateFrom[0].year)
-        data[self.__FILE_COLUMN_DATE_MEASUREMENT_SPRING]   = self._reformateDateMmDd(dataLineParts[self.__FILE_COLUMN_DATE_MEASUREMENT_SPRING].strip(), dateTo[0].year)
-
-        data[self.__FILE_COLUMN_EQUILIBRIUM_LINE_ALTITUDE] = int(dataLineParts[self.__FILE_COLUMN_EQUILIBRIUM_LINE_ALTITUDE].strip())
-        data[self.__FILE_COLUMN_ACCUMULATION_AREA_RATIO]   = int(dataLineParts[self.__FILE_COLUMN_ACCUMULATION_AREA_RATIO].strip())
-    
-        data[self.__FILE_COLUMN_MINIMUM_ELEVATION]         = int(dataLineParts[self.__FILE_COLUMN_MINIMUM_ELEVATION].strip())
-        data[self.__FILE_COLUMN_MAXIMUM_ELEVATION]         = int(dataLineParts[self.__FILE_COLUMN_MAXIMUM_ELEVATION].strip())
-        data[self.__FILE_COLUMN_SURFACE]                   = float(dataLineParts[self.__FILE_COLUMN_SURFACE].strip())
-
-        data[self.__FILE_COLUMN_WINTER_BALANCE]            = int(dataLineParts[self.__FILE_COLUMN_WINTER_BALANCE].strip())
-        data[self.__FILE_COLUMN_ANNUAL_BALANCE]            = int(dataLineParts[self.__FILE_COLUMN_ANNUAL_BALANCE].strip())
+        # Conversion of the arrays into Python values with one call per array. Lines with values which are not integers
+        # are already rejected by the parser, the missing values are rejected per mass balance below.
+        missingUniqueValues  = numpy.isnan(self._dataBlock.uniqueValues).any(axis=1).tolist()
+        uniqueValues         = numpy.nan_to_num(self._dataBlock.uniqueValues).astype(numpy.int64).tolist()
+        surfaces             = self._dataBlock.uniqueValues[:, self.__FILE_COLUMN_SURFACE].tolist()
+        elevationsFrom       = self._dataBlock.elevationsFrom.tolist()
+        elevationsTo         = self._dataBlock.elevationsTo.tolist()
+        winterBalances       = self._dataBlock.bandValuesAsLists(self._dataBlock.winterBalances)
+        winterMeasurements   = self._dataBlock.bandValuesAsLists(self._dataBlock.winterMeasurements)
+        annualBalances       = self._dataBlock.bandValuesAsLists(self._dataBlock.annualBalances)
+        annualMeasurements   = self._dataBlock.bandValuesAsLists(self._dataBlock.annualMeasurements)
+        bandSurfaces         = self._dataBlock.bandValuesAsLists(self._dataBlock.surfaces, float)
+        validBands           = self._dataBlock.validBands.sum(axis=1).tolist()
         
-        # Reading the elevation bands.
+        # Decoding of the date columns with one call per column. The dates of the measurements in fall and spring
+        # (mmdd) are completed with the year of the begin and the end of the period.
+        datesFrom, qualitiesFrom, validDatesFrom = self._decodeDatesYyyyMmDd(self._dataBlock.uniqueValues[:, self.__FILE_COLUMN_DATE_FROM])
+        datesTo, qualitiesTo, validDatesTo       = self._decodeDatesYyyyMmDd(self._dataBlock.uniqueValues[:, self.__FILE_COLUMN_DATE_TO])
+        yearsFrom = numpy.where(validDatesFrom, datesFrom.astype("datetime64[Y]").astype(numpy.int64) + 1970, 0)
+        yearsTo   = numpy.where(validDatesTo, datesTo.astype("datetime64[Y]").astype(numpy.int64) + 1970, 0)
+        datesFall, qualitiesFall, validDatesFall       = self._decodeDatesYyyyMmDd(yearsFrom * 10000 + self._dataBlock.uniqueValues[:, self.__FILE_COLUMN_DATE_MEASUREMENT_FALL])
+        datesSpring, qualitiesSpring, validDatesSpring = self._decodeDatesYyyyMmDd(yearsTo * 10000 + self._dataBlock.uniqueValues[:, self.__FILE_COLUMN_DATE_MEASUREMENT_SPRING])
+        validDates = (validDatesFrom & validDatesTo).tolist()
+        validMeasurementDates = (validDatesFall & validDatesSpring).tolist()
+        datesFrom   = datesFrom.tolist()
+        datesTo     = datesTo.tolist()
+        datesFall   = datesFall.tolist()
+        datesSpring = datesSpring.tolist()
         
-        for i in range(0, self._numberElevationBuckets):
-            
-            # Calculation of the current columns for the data triple.
-            columnWinterBalance = self.__FILE_COLUMN_START_ELEVATION_BANDS + i
-            columnNrMeasurementsWinter = self.__FILE_COLUMN_START_ELEVATION_BANDS + i + self._numberElevationBuckets
-            columnAnnualBalance = self.__FILE_COLUMN_START_ELEVATION_BANDS + i + (self._numberElevationBuckets * 2)
-            columnNrMeasurementsAnnual = self.__FILE_COLUMN_START_ELEVATION_BANDS + i + (self._numberElevationBuckets * 3)
-            columnSurface       = self.__FILE_COLUMN_START_ELEVATION_BANDS + i + (self._numberElevationBuckets * 4)
-            
-            # Retrieving the data from the data line.
-            winterBalanceString = dataLineParts[columnWinterBalance].strip()
-            nrMeasurementsWinterString = dataLineParts[columnNrMeasurementsWinter].strip()
-            annualBalanceString = dataLineParts[columnAnnualBalance].strip()
-            nrMeasurementsAnnualString = dataLineParts[columnNrMeasurementsAnnual].strip()
-            surfaceString       = dataLineParts[columnSurface].strip()
-            
-            # Preparing the possible None values for missing elevation bands.
-            winterBalance = None
-            nrMeasurementsWinter = None
-            annualBalance = None
-            nrMeasurementsAnnual = None
-            surface       = None
+        for row in range(self._dataBlock.numberMassBalances):
             
-            if winterBalanceString != self._NOT_A_NUMBER_STRING:
-                winterBalance = int(winterBalanceString)
-            if nrMeasurementsWinterString != self._NOT_A_NUMBER_STRING:
-                nrMeasurementsWinter = int(nrMeasurementsWinterString)
-            if annualBalanceString != self._NOT_A_NUMBER_STRING:
-                annualBalance = int(annualBalanceString)
-            if nrMeasurementsAnnualString != self._NOT_A_NUMBER_STRING:
-                nrMeasurementsAnnual = int(nrMeasurementsAnnualString)
-            if surfaceString != self._NOT_A_NUMBER_STRING:
-                surface       = float(surfaceString)
+            values = uniqueValues[row]
             
-            # Deriving the start altitude of the band.
-            startElevationBucket = self._startElevationBuckets + self._equidistanceBuckets * i
+            try:
+                
+                if missingUniqueValues[row]:
+                    raise ValueError("Missing value in the mass balance columns")
+                
+                if not validDates[row]:
+                    raise ValueError("Invalid date {0} or {1}".format(values[self.__FILE_COLUMN_DATE_FROM], values[self.__FILE_COLUMN_DATE_TO]))
+                
+                # Creating the main object of a mass balance entry with the unique values depending on the mass balance type.
+                if self._massBalanceType == MassBalanceTypeEnum.Observation:
+                    
+                    self._massBalanceObservationCounter += 1
+                    
+                    if not validMeasurementDates[row]:
+                        raise ValueError("Invalid date of measurement {0:04d} or {1:04d}".format(values[self.__FILE_COLUMN_DATE_MEASUREMENT_FALL], values[self.__FILE_COLUMN_DATE_MEASUREMENT_SPRING]))
+                    
+                    massBalance = MassBalanceObservation(
+                        None,
+                        values[self.__FILE_COLUMN_METHOD],
+                        datesFrom[row],
+                        datesTo[row],
+                        
+                        datesFall[row],
+                        datesSpring[row],
+                        
+                        values[self.__FILE_COLUMN_MINIMUM_ELEVATION],
+                        values[self.__FILE_COLUMN_MAXIMUM_ELEVATION],
+                        surfaces[row],
+
+                        values[self.__FILE_COLUMN_EQUILIBRIUM_LINE_ALTITUDE],
+                        values[self.__FILE_COLUMN_ACCUMULATION_AREA_RATIO],
+
+                        values[self.__FILE_COLUMN_WINTER_BALANCE],
+                        values[self.__FILE_COLUMN_ANNUAL_BALANCE])
+                elif self._massBalanceType == MassBalanceTypeEnum.FixDate:
+                    
+                    self._massBalanceObservationCounter += 1
+                    
+                    massBalance = MassBalanceFixDate(
+                        None,
+                        values[self.__FILE_COLUMN_METHOD],
+                        datesFrom[row].year,
+                        datesTo[row].year,
+                         
+                        values[self.__FILE_COLUMN_MINIMUM_ELEVATION],
+                        values[self.__FILE_COLUMN_MAXIMUM_ELEVATION],
+                        surfaces[row],
+
+                        values[self.__FILE_COLUMN_EQUILIBRIUM_LINE_ALTITUDE],
+                        values[self.__FILE_COLUMN_ACCUMULATION_AREA_RATIO],
+
+                        values[self.__FILE_COLUMN_WINTER_BALANCE],
+                        values[self.__FILE_COLUMN_ANNUAL_BALANCE])
+                else:
+                    message = "Not defined mass balance type of file {0}".format(self._fullFileName)
+                    raise MassBalanceTypeNotDefinedError(message)
+                                     
+                # Getting all elevation bands as own data objects and adding them to the mass balance.
+                for band in range(self._numberElevationBuckets):
+                    
+                    massBalance.addElevationBand(ElevationBand(
+                        None,
+                        elevationsFrom[band], elevationsTo[band],
+                        winterBalances[row][band], winterMeasurements[row][band],
+                        annualBalances[row][band], annualMeasurements[row][band],
+                        bandSurfaces[row][band]))
+                
+                # Counting the valid and invalid elevation bands.
+                self._elevationBandValidCounter   += validBands[row]
+                self._elevationBandInvalidCounter += self._numberElevationBuckets - validBands[row]
+                
+                # Setting the data source if available.
+                if self._dataSource != None:
+                    massBalance.dataSource = self._dataSource
+                
+                # Adding the new mass balance to the collection of mass balances of the glacier.
+                self._glacier.addMassBalance(massBalance)
 
-            # Preparing the return value
-            dataElevationBands.append([startElevationBucket, winterBalance, nrMeasurementsWinter, annualBalance, nrMeasurementsAnnual, surface])
+            except Exception as e:
 
-        return [data, dataElevationBands]
\ No newline at end of file
+                errorMessage = "{0} @ {1}: {2}".format(self._fullFileName, self.__NUMBER_HEADER_LINES + self._dataBlock.lineIndexes[row] + 1, e)
+                print(errorMessage)
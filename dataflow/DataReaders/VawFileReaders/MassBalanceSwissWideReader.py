@@ -3,8 +3,12 @@ Created on 31.1.2024
 
 @author: elias
 '''
-from dataflow.DataObjects.MassBalanceSwissWide import MassBalanceSwissWide
+import numpy
+
+from dataflow.DataObjects.MassBalanceSwissWideMatrix import MassBalanceSwissWideMatrix
 from dataflow.DataObjects.Exceptions.GlacierNotFoundError import GlacierNotFoundError
+from dataflow.DataObjects.GlacierCatalog import GlacierCatalog
+from dataflow.DataReaders.Exceptions.InvalidDataFileError import InvalidDataFileError
 
 class MassBalanceSwissWideReader():
     '''
@@ -16,21 +20,35 @@ class MassBalanceSwissWideReader():
     #  SGI-ID 1915  1916  1917  1918  1919  1920  1921 ...
     ---
 
+    The three files (area, mass balance evolution, volume evolution) are parsed into aligned matrices
+    (glaciers x years) of type dataflow.DataObjects.MassBalanceSwissWideMatrix.MassBalanceSwissWideMatrix.
+    The matrices are written in bulk by MassBalanceSwissWideWriter.writeMatrix().
+
     Attributes:
         - ___NUMBER_HEADER_LINES    Number of header lines used in the swiss wide mass balance extrapolation file.
+        - _matrix                   Matrices of the last parsing.
     '''
 
     __NUMBER_HEADER_LINES = 2
 
+    _glacier = None
+    _numberOfYears = -1
+    _matrix = None
+
     def __init__(self, config, fullFileNameList, glaciers):
         '''
         Constructor of the class.
 
         @type fullFileName: string
         @param fullFileName: Absolute file path.
+        @type glaciers: dataflow.DataObjects.GlacierCatalog.GlacierCatalog
+        @param glaciers: Catalog with glaciers. A plain dictionary of glaciers is converted into a catalog.
         '''
 
         self._fullFileNameList = fullFileNameList
+
+        if not isinstance(glaciers, GlacierCatalog):
+            glaciers = GlacierCatalog(glaciers)
         self._glaciers = glaciers
 
         # Setting the parameters of the data file.
@@ -57,70 +75,101 @@ class MassBalanceSwissWideReader():
         '''
         return self._numberOfYears
 
+    @property
+    def matrix(self):
+        '''
+        Swiss wide mass balance matrices of the last parsing. None if the files were not parsed yet.
+        '''
+        return self._matrix
+
     def parse(self):
+        '''
+        Parses the area, mass balance evolution and volume evolution files (in this order) into aligned
+        matrices (glaciers x years). Each file is read once and converted with one NumPy call.
+
+        @rtype: dataflow.DataObjects.MassBalanceSwissWideMatrix.MassBalanceSwissWideMatrix
+        @return: Matrices of all glaciers. The MassBalanceSwissWide objects are created on demand by iterMassBalanceSwissWides().
+
+        @raise GlacierNotFoundError: Exception in case of a SGI-ID without corresponding glacier.
+        @raise InvalidDataFileError: Exception in case of files with differing glaciers or years or of lines with another number of values than the line of the area file.
+        '''
 
-        self._fullFileNameList
+        sgiIds, years, numberValues, areas = self._loadMatrix(self._fullFileNameList[0])
 
-        massBalanceSwissWideGlacierList = []
-        massBalanceSwissWideList = []
+        print('Data from', years[0], 'to', years[-1], '->', len(years), 'years will be compared to the entries of the Database')
 
-        with open(self._fullFileNameList[0], "r") as area_file:
-            with open(self._fullFileNameList[1], "r") as mb_evo_file:
-                with open(self._fullFileNameList[2], "r") as vol_evo_file:
-                    print(area_file, mb_evo_file, vol_evo_file)
+        evolutions = list()
+        for fullFileName in self._fullFileNameList[1:3]:
 
-                    lineCounter = 0
+            evolutionSgiIds, evolutionYears, evolutionNumberValues, evolutionValues = self._loadMatrix(fullFileName)
 
-                    # Combining all files line by line and loop through the combined lines
-                    for line_area, line_mb_evo, line_vol_evo in zip(area_file, mb_evo_file, vol_evo_file):
+            if evolutionSgiIds != sgiIds or not numpy.array_equal(evolutionYears, years):
+                message = "The file {0} does not contain the same glaciers and years as {1}.".format(fullFileName, self._fullFileNameList[0])
+                raise InvalidDataFileError(message)
 
-                        # skip first header line contains no
-                        if lineCounter == 0:
-                            lineCounter += 1
-                        elif lineCounter == 1:
-                            years = line_area.split()[1:]
-                            numberOfYears = len(years)
-                            print('Data from',years[0],'to', years[-1], '->',numberOfYears,'years will be compared to the entries of the Database')
-                            lineCounter += 1
-                        else:
-                            line_length = len(line_area.split())
-                            for i in range(line_length-1):
+            # The area file defines the years given for each glacier, the evolution files have to give the same years.
+            differingLines = numpy.flatnonzero(evolutionNumberValues != numberValues)
+            if len(differingLines) > 0:
+                message = "The line of {0} in the file {1} contains {2} values instead of the {3} values of the area file {4}.".format(
+                    sgiIds[differingLines[0]], fullFileName, evolutionNumberValues[differingLines[0]], numberValues[differingLines[0]], self._fullFileNameList[0])
+                raise InvalidDataFileError(message)
 
-                                sgi_id = line_area.split()[0]
+            evolutions.append(evolutionValues)
 
-                                # Looking for the corresponding glacier in the given glacier collection.
-                                glacierFound = None
-                                for glacier in self._glaciers.values():
+        # Looking for the corresponding glaciers by the SGI IDs of the lines.
+        glacierPks = list()
+        for sgiId in sgiIds:
 
-                                    # Comparing the current glacier with the SGI ID of the given line.
-                                    if glacier.pkSgi == sgi_id:
-                                        glacierFound = glacier
-                                        fk_glacier = glacier.pk
-                                if glacierFound != None:
-                                    self._glacier = glacierFound
-                                else:
-                                    message = "No corresponding glacier found."
-                                    raise GlacierNotFoundError(message)
+            glacierFound = self._glaciers.getBySgi(sgiId)
+            if glacierFound != None:
+                self._glacier = glacierFound
+                glacierPks.append(glacierFound.pk)
+            else:
+                message = "No corresponding glacier found."
+                raise GlacierNotFoundError(message)
+
+        self._numberOfYears = len(years)
+        self._matrix = MassBalanceSwissWideMatrix(sgiIds, glacierPks, years, numberValues, areas, evolutions[0], evolutions[1])
+
+        print(len(sgiIds), " lines have been parsed")
+
+        return self._matrix
+
+    def _loadMatrix(self, fullFileName):
+        '''
+        Reads a single swiss wide file into a matrix (glaciers x years). Lines with less values than years
+        are padded by NaN, the number of values of each line is returned to check the lines against the area file.
+
+        @type fullFileName: string
+        @param fullFileName: Absolute file path.
+
+        @rtype: tuple
+        @return: SGI-IDs of the lines, years of the header line, number of values of each line and matrix of the values.
+
+        @raise InvalidDataFileError: Exception in case of lines with more values than years or invalid values.
+        '''
 
-                                #fk_glacier = glacier.pk
-                                year = years[i]
-                                area = line_area.split()[i+1]
-                                mb_evo = line_mb_evo.split()[i+1]
-                                vol_evo = line_vol_evo.split()[i+1]
-                                #print(sgi_id, year, area, mb_evo, vol_evo)
+        with open(fullFileName, "r", encoding="latin-1") as swissWideFile:
+            lines = swissWideFile.readlines()
 
-                                # Getting an object of type Mass Balance Swiss Wide with the parsed information.
-                                massBalanceSwissWide = MassBalanceSwissWide(
-                                    sgi_id, fk_glacier, year, area, mb_evo ,vol_evo)
+        # The years are the numeric parts of the header line with the column names.
+        years = numpy.array([linePart for linePart in lines[self._numberHeaderLines - 1].split() if linePart.isdigit()], dtype=int)
 
-                                massBalanceSwissWideGlacierList.append(massBalanceSwissWide) # currently no use
+        lineParts = [line.split() for line in lines[self._numberHeaderLines:]]
+        lineParts = [parts for parts in lineParts if len(parts) > 1]
 
-                                self._glacier.addMassBalanceSwissWide(massBalanceSwissWide) # if calling write function only last 'glacier' will be written
+        sgiIds = [parts[0] for parts in lineParts]
+        numberValues = numpy.array([len(parts) - 1 for parts in lineParts], dtype=int)
 
-                            massBalanceSwissWideList.append(massBalanceSwissWideGlacierList) # currently no use
+        if len(numberValues) > 0 and numberValues.max() > len(years):
+            message = "The file {0} contains lines with more values than years.".format(fullFileName)
+            raise InvalidDataFileError(message)
 
-                            lineCounter += 1
+        padding = ["nan"] * len(years)
 
-                    print(lineCounter - self._numberHeaderLines, " lines have been parsed")
+        try:
+            values = numpy.array([parts[1:] + padding[:len(years) - len(parts) + 1] for parts in lineParts], dtype=float)
+        except ValueError as valueError:
+            raise InvalidDataFileError("{0}: {1}".format(fullFileName, valueError))
 
-        return massBalanceSwissWideGlacierList # currently no use
\ No newline at end of file
+        return sgiIds, years, numberValues, values.reshape(len(sgiIds), len(years))
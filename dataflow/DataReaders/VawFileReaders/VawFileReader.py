@@ -5,9 +5,14 @@ Created on 18.05.2018
 '''
 
 import datetime
+import functools
+import hashlib
+
+import numpy
 
 from dataflow.DataReaders.FileDataReader import AsciiFileDateReader
 from dataflow.DataObjects.Enumerations.DateEnumerations import DateQualityTypeEnum
+from dataflow.DataObjects.GlacierCatalog import GlacierCatalog
 from dataflow.DataObjects.Exceptions.GlacierNotFoundError import GlacierNotFoundError
 
 class VawFileReader(AsciiFileDateReader):
@@ -28,6 +33,17 @@ class VawFileReader(AsciiFileDateReader):
         - _HEADER_POSITION_VAWIDENTIFIER  Common position in the header line of the VAW identifier.
         - _dataSource                     Source of the data as defined in the header
         - _DATA_SOURCE_PREFIX             Prefix for data source references used (to be removed)
+        - _FILE_ENCODING                  Encoding of the files generated by VAW.
+        - _HASH_CHUNK_SIZE                Number of bytes read at once to hash the lines parsed by a former parsing.
+        - _headerBytes                    Bytes of the header lines read by parseHeader(), the data lines are read by parse().
+        - _fileOpenCounter                Number of times the file was opened by the reader.
+        - _bytesReadCounter               Number of bytes read from the file by the reader.
+        - _DATE_CACHE_SIZE                Maximal number of decoded dates kept by the date caches shared by all readers.
+        - _dataLineOffset                 Number of lines of the file before the first data line handed out by _iterDataBlocks().
+        - _resumeState                    Append state of a former parsing given by resumeAfter(). None for a full parsing.
+        - _appendState                    Append state of the last parsing (offset, prefixHash, lastDate).
+        - _appendedOnly                   True if only the lines appended since the former parsing were handed out.
+        - _DEFAULT_BATCH_SIZE             Default number of data lines parsed per batch by iterBatches().
     '''
     
     _numberHeaderLines = -1
@@ -43,14 +59,36 @@ class VawFileReader(AsciiFileDateReader):
     
     _DATA_SOURCE_PREFIX = "# "
     
+    _FILE_ENCODING = 'latin-1'
+    
+    _HASH_CHUNK_SIZE = 1024 * 1024
+    
+    _headerBytes = None
+    
+    _fileOpenCounter = 0
+    
+    _bytesReadCounter = 0
+    
+    _DATE_CACHE_SIZE = 8192
+    
+    _dataLineOffset = 0
+    
+    _resumeState = None
+    
+    _appendState = None
+    
+    _appendedOnly = False
+    
+    _DEFAULT_BATCH_SIZE = 10000
+    
     def __init__(self, fullFileName, glaciers):
         '''
         Constructor of the class.
         
         @type fullFileName: string
         @param fullFileName: Absolute path of the file.
-        @type glaciers: Dictionary
-        @param glaciers: Dictionary with glaciers.
+        @type glaciers: dataflow.DataObjects.GlacierCatalog.GlacierCatalog
+        @param glaciers: Catalog with glaciers. A plain dictionary of glaciers is converted into a catalog.
         
         @raise GlacierNotFoundError: Exception if glacier was not found or initialised.
         '''
@@ -65,17 +103,18 @@ class VawFileReader(AsciiFileDateReader):
 
         super().__init__(fullFileName)
 
+        self._fileOpenCounter = 0
+        self._bytesReadCounter = 0
+
         self.parseHeader()
         
         givenVawId = int(self._headerLineContent[self._HEADER_POSITION_VAWIDENTIFIER])
 
-        # Looking for the corresponding glacier in the given glacier collection.
-        glacierFound = None
-        for glacier in glaciers.values():
-            
-            # Comparing the current glacier with the VAW internal ID of the given file header.
-            if glacier.pkVaw == givenVawId:
-                glacierFound = glacier
+        if not isinstance(glaciers, GlacierCatalog):
+            glaciers = GlacierCatalog(glaciers)
+
+        # Looking for the corresponding glacier by the VAW internal ID of the given file header.
+        glacierFound = glaciers.getByVaw(givenVawId)
         
         if glacierFound != None:
             self._glacier = glacierFound
@@ -96,48 +135,395 @@ class VawFileReader(AsciiFileDateReader):
         '''
         
         return self._numberDataLines
+    
+    @property
+    def fileOpens(self):
+        '''
+        Returns the number of times the file was opened by the reader.
+        
+        @rtype: integer
+        @return: Number of opens of the file
+        '''
+        
+        return self._fileOpenCounter
+    
+    @property
+    def bytesRead(self):
+        '''
+        Returns the number of bytes read from the file by the reader.
+        
+        @rtype: integer
+        @return: Number of bytes read
+        '''
+        
+        return self._bytesReadCounter
+        
+    @property
+    def appendState(self):
+        '''
+        Returns the append state of the last parsing to be given to resumeAfter() of a later reader of the
+        grown file. None in case the file was not parsed yet.
+        
+        @rtype: dict
+        @return: Dictionary with the parsed byte offset (offset), the SHA-1 hash of the parsed bytes (prefixHash) and the last date parsed as ISO string (lastDate).
+        '''
+        
+        return self._appendState
+    
+    @property
+    def contentHash(self):
+        '''
+        Returns the SHA-1 hash of the content of the file as read by the last parsing, the same hash as
+        IngestionManifest.contentHash() of the file. None in case the file was not parsed entirely yet.
+        
+        @rtype: string
+        @return: Hexadecimal SHA-1 hash of the file content.
+        '''
+        
+        if self._appendState == None:
+            return None
+        
+        return self._appendState["prefixHash"]
+    
+    @property
+    def appendedOnly(self):
+        '''
+        Returns True if the last parsing handled only the lines appended since the state given to resumeAfter().
         
+        @rtype: bool
+        @return: True in case of an appended parsing, False in case of a full parsing.
+        '''
+        
+        return self._appendedOnly
+    
+    def resumeAfter(self, appendState):
+        '''
+        Sets up the parsing of the lines appended since a former parsing of the file. The lines up to the
+        former offset are skipped if the file still starts with the same bytes (same prefix hash). Otherwise
+        the file was rewritten and is parsed entirely.
+        
+        @type appendState: dict
+        @param appendState: Append state of a former reader of the file (see appendState).
+        '''
+        
+        self._resumeState = appendState
+        
+    def iterBatches(self, batchSize=_DEFAULT_BATCH_SIZE):
+        '''
+        Parses the data lines of the file batch by batch. In contrast to parse(), the records are not added to
+        the glacier but handed out as lists, the records of a batch can be released after writing them
+        (e.g. by GlamosDatabaseWriter.writeBatches()). The file is read incrementally, only the data lines
+        of the current batch are kept in memory.
+        
+        In case a resumed parsing (see resumeAfter()) detects a rewritten file, all lines of the file are
+        handed out again starting with the first batch. Batches already written are detected as duplicates
+        by the writers.
+        
+        The generator is supported by the readers implementing _parseBlock().
+        
+        @type batchSize: int
+        @param batchSize: Number of data lines parsed per batch.
+        
+        @rtype: generator
+        @return: Lists of the records of at most batchSize data lines.
+        '''
+        
+        while True:
+            
+            self._numberDataLines = 0
+            dataBlocks = self._iterDataBlocks(batchSize)
+            
+            for firstLineIndex, dataLines in dataBlocks:
+                
+                records = self._parseBlock(dataLines, firstLineIndex)
+                
+                # Appended lines not following the last ingested date: The file was rewritten and is parsed entirely.
+                if records is None:
+                    dataBlocks.close()
+                    break
+                
+                yield records
+            
+            else:
+                return
+    
+    def _parseBlock(self, dataLines, firstLineIndex=0):
+        '''
+        Abstract method converting a block of data lines into the records of the reader. The method has to
+        be implemented by all readers supporting iterBatches().
+        
+        @type dataLines: list
+        @param dataLines: Block of data lines as handed out by _iterDataBlocks().
+        @type firstLineIndex: int
+        @param firstLineIndex: Index of the first line of the block within all data lines (used for error messages).
+        
+        @rtype: list
+        @return: Records of the block. None in case the file has to be parsed entirely again (rewritten file).
+        '''
+        
+        raise NotImplementedError("The reader {0} does not support the parsing of blocks.".format(type(self).__name__))
+    
     def parseHeader(self):
         '''
         Parsing the header information of the text file. The header information
         has to include the pkVaw and the name of the glacier.
         
+        Only the first _numberHeaderLines lines are read from the file, the data lines
+        are read by parse() of the specialised readers.
+        
         During parsing the header, the protected glacier member will be created.
         '''
         
-        with open(self._fullFileName, "r",encoding='latin-1') as vaw:
+        headerLines = list()
+        
+        with open(self._fullFileName, "rb") as vaw:
+            
+            self._fileOpenCounter += 1
+            
+            while len(headerLines) < self._numberHeaderLines:
+                
+                line = vaw.readline()
+                
+                if len(line) == 0:
+                    break
+                
+                headerLines.append(line)
+        
+        self._headerBytes = b"".join(headerLines)
+        self._bytesReadCounter += len(self._headerBytes)
+        
+        for lineCounter, line in enumerate(headerLines, 1):
             
-            lineCounter = 0
+            line = line.decode(self._FILE_ENCODING)
+            
+            try:
+                if lineCounter == 1:
+                    self._getMetadata(line)
+                    
+                if self._numberHeaderLines == lineCounter:
+                    self._dataSource = line.strip()
+                    self._dataSource = self._dataSource.replace(self._DATA_SOURCE_PREFIX, "")
+
+            #TODO: Implementing own exceptions.
+            except Exception as e:
+
+                errorMessage = "{0} @ {1}: {2}".format(self._fullFileName, lineCounter, e)
+                print(errorMessage)
+
+    def _readDataLines(self):
+        '''
+        Returns the data lines of the file without the header lines. In case of a resumed parsing
+        (see resumeAfter()) of a grown file, only the lines appended since the former parsing are returned.
+        The append state of the parsing is set up.
+
+        @rtype: list
+        @return: Data lines of the file.
+        '''
+        
+        dataLines = list()
+        
+        for _, dataBlock in self._iterDataBlocks(self._DEFAULT_BATCH_SIZE):
+            dataLines.extend(dataBlock)
+        
+        return dataLines
+    
+    def _iterDataBlocks(self, blockSize):
+        '''
+        Reads the data lines of the file block by block from the end of the header lines read by parseHeader().
+        In case of a resumed parsing (see resumeAfter()) of a grown file, only the lines appended since the former
+        parsing are handed out. The append state of the parsing is set up, its offset and prefix hash are known
+        after the last block.
+        
+        @type blockSize: int
+        @param blockSize: Maximal number of data lines per block.
+        
+        @rtype: generator
+        @return: Tuples with the index of the first line of the block within all data lines and the data lines of the block.
+        '''
+
+        with open(self._fullFileName, "rb") as vaw:
+            
+            self._fileOpenCounter += 1
+            
+            contentHash = self._seekDataLines(vaw)
+            
+            firstLineIndex = 0
+            dataLines = list()
             
             for line in vaw:
+                
+                contentHash.update(line)
+                self._bytesReadCounter += len(line)
+                
+                dataLines.append(line.decode(self._FILE_ENCODING))
+                
+                if len(dataLines) == blockSize:
+                    
+                    yield firstLineIndex, dataLines
+                    
+                    firstLineIndex += len(dataLines)
+                    dataLines = list()
+            
+            if len(dataLines) > 0:
+                yield firstLineIndex, dataLines
+            
+            self._appendState["offset"] = vaw.tell()
+            self._appendState["prefixHash"] = contentHash.hexdigest()
+    
+    def _seekDataLines(self, vaw):
+        '''
+        Positions the given file handle on the first data line to be parsed and sets up the append state of the
+        parsing. In case of a resumed parsing (see resumeAfter()), the bytes up to the former offset are hashed
+        chunk by chunk. If they are unchanged, the handle is positioned after them. Otherwise the file was rewritten
+        and the handle is positioned after the header lines.
+        
+        @type vaw: io.BufferedReader
+        @param vaw: Binary handle of the file.
+        
+        @rtype: hashlib.sha1
+        @return: Hash of the bytes of the file before the handle position.
+        '''
+        
+        self._appendedOnly = False
+        self._appendState = dict(offset=None, prefixHash=None, lastDate=None)
         
-                lineCounter += 1
+        if self._resumeState != None:
+            
+            offset = self._resumeState["offset"]
+            
+            prefixHash = hashlib.sha1()
+            prefixLength = 0
+            prefixLines = 0
+            
+            while prefixLength < offset:
+                
+                chunk = vaw.read(min(self._HASH_CHUNK_SIZE, offset - prefixLength))
                 
-                try:
-                    if lineCounter == 1:
-                        self._getMetadata(line)
-                        
-                    if self._numberHeaderLines == lineCounter:
-                        self._dataSource = line.strip()
-                        self._dataSource = self._dataSource.replace(self._DATA_SOURCE_PREFIX, "")
+                if len(chunk) == 0:
+                    break
+                
+                prefixHash.update(chunk)
+                prefixLength += len(chunk)
+                prefixLines += chunk.count(b"\n")
+            
+            self._bytesReadCounter += prefixLength
+            
+            if prefixLength == offset and prefixHash.hexdigest() == self._resumeState["prefixHash"]:
+                
+                self._appendedOnly = True
+                self._appendState["lastDate"] = self._resumeState["lastDate"]
+                self._dataLineOffset = prefixLines
+                
+                return prefixHash
+        
+        # The header lines were read by parseHeader(), the data lines are following them.
+        vaw.seek(len(self._headerBytes))
+        
+        self._dataLineOffset = self._numberHeaderLines
+        
+        return hashlib.sha1(self._headerBytes)
+    
+    def _acceptAppendedDates(self, dates):
+        '''
+        Checks the dates of the lines handed out by _readDataLines() and keeps the last date in the append state.
+        Appended lines have to follow the last date of the former parsing. Otherwise the file was rewritten
+        with an unchanged beginning and the append mode is abandoned, the file has to be parsed entirely.
+        
+        @type dates: list
+        @param dates: Dates (datetime.date) of the converted data lines.
+        
+        @rtype: bool
+        @return: True if the dates are accepted, False if the file has to be parsed entirely.
+        '''
+        
+        if len(dates) == 0:
+            return True
+        
+        if self._appendedOnly and self._resumeState["lastDate"] != None:
+            if min(dates) <= datetime.date.fromisoformat(self._resumeState["lastDate"]):
+                self._resumeState = None
+                return False
+        
+        # The dates can be checked block by block (see iterBatches()), the last date is the latest of all blocks.
+        lastDate = max(dates)
+        if self._appendState["lastDate"] != None:
+            lastDate = max(lastDate, datetime.date.fromisoformat(self._appendState["lastDate"]))
+        
+        self._appendState["lastDate"] = lastDate.isoformat()
+        
+        return True
+    
+    def _reportInvalidLines(self, columnSchema, raiseError=True, firstLineIndex=0):
+        '''
+        Prints the lines of the last block conversion of the given column schema which could not be converted.
 
-                #TODO: Implementing own exceptions.
-                except Exception as e:
+        @type columnSchema: dataflow.DataReaders.VawFileReaders.ColumnSchema.ColumnSchema
+        @param columnSchema: Column schema used to convert the data lines of the file.
+        @type raiseError: bool
+        @param raiseError: True if the exception of the first invalid line is raised after printing.
+        @type firstLineIndex: int
+        @param firstLineIndex: Index of the first line of the converted block within all data lines.
+
+        @raise Exception: Exception of the first invalid line in case of raiseError.
+        '''
+
+        for lineIndex, e in columnSchema.invalidLines:
+
+            errorMessage = "{0} @ {1}: {2}".format(self._fullFileName, self._dataLineOffset + firstLineIndex + lineIndex + 1, e)
+            print(errorMessage)
+
+            if raiseError:
+                raise e
 
-                    errorMessage = "{0} @ {1}: {2}".format(vaw, lineCounter, e)
-                    print(errorMessage)
-        
     def _reformateDate(self, dateVaw):
         '''
         Helper function to reformat the VAW format of the date. A VAW format will have
         values as 00.00.2018 identifying a not known date of the year 2018.
         Such kind of values are translated into 01.09. of the corresponding year.
         
+        The decoded dates are cached by _decodeDateDdMmYyyy().
+        
+        @type dateVaw: string
+        @param dateVaw: String-representation of the date as string in the format dd.mm.yyyy
+        
+        @rtype: Tuple (DateTime, integer)
+        @return: Tuple with a correct date object and the quality of the date (e.g. 1 = known, 11 = estimated).
+        '''
+        
+        return VawFileReader._decodeDateDdMmYyyy(dateVaw)
+    
+    def _reformateDateMmDd(self, mmdd, yyyy):
+        
+        return VawFileReader._decodeDateYyyyMmDd("{0}{1}".format(yyyy, mmdd))
+
+    def _reformateDateYyyyMmDd(self, yyyymmdd):
+        '''
+        Helper function to reformat the string YYYYMMDD into a datetime object.
+        
+        The decoded dates are cached by _decodeDateYyyyMmDd().
+        
+        @type dateVaw: string
+        @param dateVaw: String-representation of the date as string in the format yyyymmdd
+        
+        @rtype: Tuple (DateTime, DateQualityTypeEnum)
+        @return: Tuple with a correct date object and the quality of the date (e.g. 1 = known, 11 = estimated).
+        '''
+        
+        return VawFileReader._decodeDateYyyyMmDd(yyyymmdd)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=_DATE_CACHE_SIZE)
+    def _decodeDateDdMmYyyy(dateVaw):
+        '''
+        Decodes a date in the format dd.mm.yyyy. Unknown days (00) are translated into the 1st,
+        unknown months (00) into September. The decoded dates are kept in a bounded cache
+        shared by all readers.
+        
         @type dateVaw: string
         @param dateVaw: String-representation of the date as string in the format dd.mm.yyyy
         
-        @rtype: Array [DateTime, integer]
-        @return: Array with a correct date object and the quality of the date (e.g. 1 = known, 11 = estimated).
+        @rtype: Tuple (DateTime, integer)
+        @return: Tuple with a correct date object and the quality of the date (e.g. 1 = known, 11 = estimated).
         '''
     
         dateVawParts = dateVaw.split(".")
@@ -164,21 +550,21 @@ class VawFileReader(AsciiFileDateReader):
     
         year = int(dateVawParts[2])
     
-        return [datetime.date(year, month, day), quality]
+        return (datetime.date(year, month, day), quality)
     
-    def _reformateDateMmDd(self, mmdd, yyyy):
-        
-        return self._reformateDateYyyyMmDd("{0}{1}".format(yyyy, mmdd))
-
-    def _reformateDateYyyyMmDd(self, yyyymmdd):
+    @staticmethod
+    @functools.lru_cache(maxsize=_DATE_CACHE_SIZE)
+    def _decodeDateYyyyMmDd(yyyymmdd):
         '''
-        Helper function to reformat the string YYYYMMDD into a datetime object.
+        Decodes a date in the format yyyymmdd. Unknown days (00) are translated into the 1st,
+        unknown months (00) into September. The decoded dates are kept in a bounded cache
+        shared by all readers.
         
-        @type dateVaw: string
-        @param dateVaw: String-representation of the date as string in the format yyyymmdd
+        @type yyyymmdd: string
+        @param yyyymmdd: String-representation of the date as string in the format yyyymmdd
         
-        @rtype: Array [DateTime, integer]
-        @return: Array with a correct date object and the quality of the date (e.g. 1 = known, 11 = estimated).
+        @rtype: Tuple (DateTime, DateQualityTypeEnum)
+        @return: Tuple with a correct date object and the quality of the date.
         '''
         
         dateParts = [
@@ -208,7 +594,55 @@ class VawFileReader(AsciiFileDateReader):
     
         year = int(dateParts[2])
     
-        return [datetime.date(year, month, day), quality]
+        return (datetime.date(year, month, day), quality)
+    
+    @staticmethod
+    def _decodeDatesYyyyMmDd(values):
+        '''
+        Decodes an entire column of dates in the format yyyymmdd with one call. Unknown days (00)
+        are translated into the 1st, unknown months (00) into September and get the quality
+        DateQualityTypeEnum.Estimated.
+        
+        Invalid dates (e.g. 20190931 or NaN) are returned as NaT and marked as invalid.
+        
+        @type values: Iterable
+        @param values: Dates in the format yyyymmdd as strings or numbers (e.g. a column of a NumPy array).
+        
+        @rtype: Tuple (numpy.ndarray, numpy.ndarray, numpy.ndarray)
+        @return: Dates as datetime64[D], values of DateQualityTypeEnum as integers and mask of the valid dates.
+                 Invalid dates have the quality DateQualityTypeEnum.NotDefinedUnknown.
+        
+        @raise ValueError: In case of strings not representing numbers.
+        '''
+        
+        yyyymmdd = numpy.asarray(values)
+        
+        if yyyymmdd.dtype.kind in ("U", "S", "O"):
+            yyyymmdd = yyyymmdd.astype(numpy.float64)
+        
+        isNumber = numpy.isfinite(yyyymmdd)
+        yyyymmdd = numpy.where(isNumber, yyyymmdd, 0).astype(numpy.int64)
+        
+        year  = yyyymmdd // 10000
+        month = yyyymmdd // 100 % 100
+        day   = yyyymmdd % 100
+        
+        isEstimated = (month == 0) | (day == 0)
+        
+        month = numpy.where(month == 0, 9, month)
+        day   = numpy.where(day == 0, 1, day)
+        
+        months = ((year - 1970) * 12 + month - 1).astype("datetime64[M]")
+        dates  = months.astype("datetime64[D]") + (day - 1).astype("timedelta64[D]")
+        
+        # Days beyond the end of the month are shifted into the next month by NumPy.
+        isValid = isNumber & (year > 0) & (month <= 12) & (dates.astype("datetime64[M]") == months)
+        dates[~isValid] = numpy.datetime64("NaT")
+        
+        qualities = numpy.where(isEstimated, DateQualityTypeEnum.Estimated.value, DateQualityTypeEnum.Precisely.value)
+        qualities[~isValid] = DateQualityTypeEnum.NotDefinedUnknown.value
+        
+        return dates, qualities, isValid
     
     def _getMetadata(self, metadataLine):
         '''
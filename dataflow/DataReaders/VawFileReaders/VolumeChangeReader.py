@@ -7,6 +7,8 @@ Created on 11.07.2018
 import re
 
 from dataflow.DataReaders.VawFileReaders.VawFileReader import VawFileReader
+from dataflow.DataReaders.VawFileReaders.ColumnSchema import ColumnSchema
+from dataflow.DataReaders.VawFileReaders.FileColumn import FileColumn
 from dataflow.DataObjects.Exceptions.GlacierNotFoundError import GlacierNotFoundError
 from dataflow.DataObjects.VolumeChange import VolumeChange
 from dataflow.DataReaders.Exceptions.InvalidDataFileError import InvalidDataFileError
@@ -30,16 +32,6 @@ class VolumeChangeReader(VawFileReader):
     # Number of header lines.
     __NUMBER_HEADER_LINES            = 3
 
-    # Definition of the columns in the mass balance ASCII files (0-based index).
-    __FILE_COLUMN_DATE               = 1
-    __FILE_COLUMN_AREA               = 3
-    __FILE_COLUMN_ELEVATION_MAXIMUM  = 5
-    __FILE_COLUMN_ELEVATION_MINIMUM  = 6
-    __FILE_COLUMN_VOLUME_CHANGE      = 7
-    __FILE_COLUMN_HEIGHT_CHANGE_MEAN = 8
-    # Secondary / Meta information retrieved from the primary data.
-    __FILE_COLUMN_DATE_QUALITY       = 21
-    
     def __init__(self, config, fullFileName, glaciers):
         '''
         Constructor
@@ -75,88 +67,57 @@ class VolumeChangeReader(VawFileReader):
         
         pass
 
+    def _getColumns(self):
+        '''
+        Declaration of the columns in the volume change ASCII files (0-based index).
+
+        The date column is converted into a list with the date and its quality. Because the VAW files use
+        their own formats for dates, the minus signs are removed first (yyyy-mm-dd).
+
+        @rtype: list
+        @return: List of dataflow.DataReaders.VawFileReaders.FileColumn.FileColumn objects.
+        '''
+
+        reformateDate = lambda date: self._reformateDateYyyyMmDd(date.replace("-", ""))
+
+        return [
+            FileColumn("date",                1, None, transform=reformateDate),
+            FileColumn("area",                3, float),
+            FileColumn("elevationMaximum",    5, float),
+            FileColumn("elevationMinimum",    6, float),
+            FileColumn("volumeChange",        7, float),
+            FileColumn("heightChangeMean",    8, float)]
+
     def parse(self):
-        
-        with open(self._fullFileName, "r") as vc:
-            
-            lineCounter = 0
-            self._numberDataLines = 0
-            
-            dataLines = []
-            
-            for line in vc:
-                
-                lineCounter += 1
-                
-                try:
-                    
-                    if lineCounter > self.__NUMBER_HEADER_LINES:
-                        
-                        data = self._getData(line)
-                    
-                        if len(data) > 0:
-                            self._numberDataLines += 1
-                            # Intermediate storage of the parsed data for the later instances of volume changes.
-                            dataLines.append(data)
-                    
-                except Exception as e:
-
-                    errorMessage = "{0} @ {1}: {2}".format(vc, lineCounter, e)
-                    print(errorMessage)
-                    
-            # Getting the individual volume change readings ready.
-            # An individual volume change reading consists of two data lines: i = reference, i + 1 = observation.
-            referenceReadingIndex = 0
-            changeReadingIndex    = 1
-            
-            for i in range(referenceReadingIndex, len(dataLines) - 1):
-                
-                referenceReadingData    = dataLines[referenceReadingIndex]
-                volumeChangeReadingData = dataLines[changeReadingIndex]
-                
-                # Creating a new volume change object based on the reference and the observation data.
-                volumeChange = VolumeChange(
-                    None,
-                    referenceReadingData[self.__FILE_COLUMN_DATE], referenceReadingData[self.__FILE_COLUMN_DATE_QUALITY], 
-                    volumeChangeReadingData[self.__FILE_COLUMN_DATE], volumeChangeReadingData[self.__FILE_COLUMN_DATE_QUALITY],
-                    referenceReadingData[self.__FILE_COLUMN_AREA], volumeChangeReadingData[self.__FILE_COLUMN_AREA],
-                    HeightCaptureMethodEnum.NotDefinedUnknown, HeightCaptureMethodEnum.NotDefinedUnknown, 
-                    AnalysisMethodEnum.NotDefinedUnknown,
-                    referenceReadingData[self.__FILE_COLUMN_ELEVATION_MAXIMUM], referenceReadingData[self.__FILE_COLUMN_ELEVATION_MINIMUM],
-                    volumeChangeReadingData[self.__FILE_COLUMN_ELEVATION_MAXIMUM], volumeChangeReadingData[self.__FILE_COLUMN_ELEVATION_MINIMUM],
-                    volumeChangeReadingData[self.__FILE_COLUMN_VOLUME_CHANGE],
-                    volumeChangeReadingData[self.__FILE_COLUMN_HEIGHT_CHANGE_MEAN])
-                
-                self._glacier.addVolumeChange(volumeChange)
-            
-                referenceReadingIndex += 1
-                changeReadingIndex    += 1
-
-    def _getData(self, dataLine):
-        # TODO: Description
-        
-        # Dictionary with the unique values per volume change data line.
-        data = dict()
-        
-        p = re.compile(' +')
-        
-        dataLineParts = p.split(dataLine)
-        
-        # Getting the data columns into the dictionary.
-        # Getting the date out of the data. Because every fucking file of VAW has it own format for date, an additional hack is needed (replace the - sign)
-        referenceDateInformation = self._reformateDateYyyyMmDd(dataLineParts[self.__FILE_COLUMN_DATE].strip().replace("-", ""))
-        # Getting the date object
-        referenceDate = referenceDateInformation[0]
-        # Getting the quality index of the reference date
-        referenceDateQuality = DateQualityTypeEnum(referenceDateInformation[1])
-        
-        # Filling up of the parsed data to piped into an object.
-        data[self.__FILE_COLUMN_DATE]               = referenceDate
-        data[self.__FILE_COLUMN_DATE_QUALITY]       = referenceDateQuality
-        data[self.__FILE_COLUMN_AREA]               = float(dataLineParts[self.__FILE_COLUMN_AREA].strip())
-        data[self.__FILE_COLUMN_ELEVATION_MAXIMUM]  = float(dataLineParts[self.__FILE_COLUMN_ELEVATION_MAXIMUM].strip())
-        data[self.__FILE_COLUMN_ELEVATION_MINIMUM]  = float(dataLineParts[self.__FILE_COLUMN_ELEVATION_MINIMUM].strip())
-        data[self.__FILE_COLUMN_VOLUME_CHANGE]      = float(dataLineParts[self.__FILE_COLUMN_VOLUME_CHANGE].strip())
-        data[self.__FILE_COLUMN_HEIGHT_CHANGE_MEAN] = float(dataLineParts[self.__FILE_COLUMN_HEIGHT_CHANGE_MEAN].strip())
-
-        return data
\ No newline at end of file
+
+        columnSchema = ColumnSchema(self._getColumns())
+        data = columnSchema.convertBlock(self._readDataLines())
+
+        # Invalid lines are reported and ignored.
+        self._reportInvalidLines(columnSchema, raiseError=False)
+
+        self._numberDataLines = len(columnSchema.lineIndexes)
+
+        dates        = [dateInformation[0] for dateInformation in data["date"]]
+        datesQuality  = [DateQualityTypeEnum.fromValue(dateInformation[1]) for dateInformation in data["date"]]
+
+        # Getting the individual volume change readings ready.
+        # An individual volume change reading consists of two data lines: i = reference, i + 1 = observation.
+        for referenceReadingIndex in range(0, self._numberDataLines - 1):
+
+            changeReadingIndex = referenceReadingIndex + 1
+
+            # Creating a new volume change object based on the reference and the observation data.
+            volumeChange = VolumeChange(
+                None,
+                dates[referenceReadingIndex], datesQuality[referenceReadingIndex],
+                dates[changeReadingIndex], datesQuality[changeReadingIndex],
+                data["area"][referenceReadingIndex], data["area"][changeReadingIndex],
+                HeightCaptureMethodEnum.NotDefinedUnknown, HeightCaptureMethodEnum.NotDefinedUnknown,
+                AnalysisMethodEnum.NotDefinedUnknown,
+                data["elevationMaximum"][referenceReadingIndex], data["elevationMinimum"][referenceReadingIndex],
+                data["elevationMaximum"][changeReadingIndex], data["elevationMinimum"][changeReadingIndex],
+                data["volumeChange"][changeReadingIndex],
+                data["heightChangeMean"][changeReadingIndex])
+
+            self._glacier.addVolumeChange(volumeChange)
@@ -4,28 +4,116 @@ Created on 22.05.2018
 @author: yvo
 '''
 from dataflow.DataWriters.DatabaseWriter import PostgreSqlWriter
+from dataflow.DataReaders.DatabaseConnectionPool import DatabaseConnectionPool
 from dataflow.DataReaders.Exceptions.DatabaseConnectionError import DatabaseConnectionError
 from dataflow.DataWriters.Exceptions.NotUniqueDataRecordError import NotUniqueDataRecordError
 
-import psycopg2
 from psycopg2 import OperationalError
-import configparser
+from psycopg2.extensions import TRANSACTION_STATUS_INERROR
+from psycopg2.extras import execute_batch, execute_values
+from enum import Enum
+import io
+import itertools
 import logging
+import uuid
 
 class GlamosDatabaseWriter(PostgreSqlWriter):
     '''
-    classdocs
+    Main class of all writers into the GLAMOS database.
+    
+    The writer borrows a connection of the process-wide DatabaseConnectionPool with the first statement
+    and keeps it until releaseConnection() gives it back to the pool.
+    
+    Specialised writers declare the table they write to, the columns written and the natural key of
+    the table (_TABLE, _COLUMNS, _NATURAL_KEY) and implement _recordsToRows(). Based on these
+    declarations upsert() inserts new records and updates changed records. The natural key has to be
+    backed by a unique constraint of the table.
+    
+    Attributes:
+        _TABLE: Name of the table including the schema the writer is writing to.
+        _COLUMNS: Names of the columns written in the order of the values of the rows of _recordsToRows().
+        _NATURAL_KEY: Names of the columns defining a unique record of the table (unique constraint).
+        _DUPLICATE_KEY: Names of the columns defining a duplicate of a stored record for the set-based inserts (writeBatches()).
+        _UPSERT_BATCH_SIZE: Number of rows sent to the database per upsert statement.
+        _BATCH_SIZE: Number of rows sent to the database per round trip by _executeBatch() and _executeValues().
+        _PREPARED_STATEMENT_NAME_TEMPLATE: Template of the names of the server-side prepared statements.
+        _INSERT_TEMPLATE: Template of a parameterised INSERT statement of a single row.
+        _preparedStatementCounter: Counter used to get unique names of the server-side prepared statements.
+        _UPSERT_TEMPLATE: Template of the INSERT ... ON CONFLICT statement of the upsert.
+        _UPSERT_NOTHING_TO_UPDATE_TEMPLATE: Template of the upsert of tables without columns besides primary and natural key.
+        _COPY_STATEMENT_TEMPLATE: Template of the COPY statement used for bulk inserts.
+        _COPY_NULL: Representation of NULL in the text format of COPY.
+        _COPY_ESCAPES: Translation table of the characters to be escaped in the text format of COPY.
+        _CANDIDATE_TABLE: Name of the temporary table holding the candidate rows of the duplicate detection.
+        _CREATE_CANDIDATE_TABLE_TEMPLATE: Template of the creation of the temporary table of the candidate rows.
+        _INSERT_MISSING_TEMPLATE: Template of the anti-join inserting the candidate rows not yet stored.
+        _DROP_CANDIDATE_TABLE_TEMPLATE: Template of the removal of the temporary table of the candidate rows at the end of each batch.
+        _NULLABLE_COLUMNS_STATEMENT: Query of the columns of a table without NOT NULL constraint.
+        _nullableColumnsOfTables: Dictionary of the columns without NOT NULL constraint. Key: table; Value: set of column names.
+        _STATEMENT_SAVEPOINT: Name of the savepoint of a single statement of _writeData().
+        _connection: Connection borrowed from the pool.
+        _cursor: Cursor of the last executed statement.
+        _recordsInsertedCounter: Number of records inserted by upsert().
+        _recordsUpdatedCounter: Number of stored records updated by upsert().
+        _recordsUnchangedCounter: Number of records already stored with the same values found by upsert().
+        _output: File object the messages of the writer are printed to. None for sys.stdout.
     '''
     
     # Getting the common members into a super class for database readers and writers.
     
-    _CONNECTION_STRING_TEMPLATE = "host='{0}' dbname='{1}' user='{2}' password='{3}'"
+    _TABLE = None
+    
+    _COLUMNS = None
+    
+    _NATURAL_KEY = None
+    
+    _DUPLICATE_KEY = None
+    
+    _UPSERT_BATCH_SIZE = 1000
+    
+    _BATCH_SIZE = 1000
+    
+    _PREPARED_STATEMENT_NAME_TEMPLATE = "glamos_prepared_statement_{0}"
+    
+    _INSERT_TEMPLATE = "INSERT INTO {0} ({1}) VALUES ({2});"
+    
+    _preparedStatementCounter = itertools.count()
+    
+    _UPSERT_TEMPLATE = "INSERT INTO {0} AS stored ({1}) VALUES %s ON CONFLICT ({2}) DO UPDATE SET {3} WHERE ({4}) IS DISTINCT FROM ({5}) RETURNING (stored.xmax = 0);"
+    
+    _UPSERT_NOTHING_TO_UPDATE_TEMPLATE = "INSERT INTO {0} AS stored ({1}) VALUES %s ON CONFLICT ({2}) DO NOTHING RETURNING TRUE;"
+    
+    _COPY_STATEMENT_TEMPLATE = "COPY {0} ({1}) FROM STDIN"
+    
+    _COPY_NULL = "\\N"
     
-    _connectionString = ""
+    _CANDIDATE_TABLE = "glamos_candidate_rows"
+    
+    _CREATE_CANDIDATE_TABLE_TEMPLATE = "CREATE TEMPORARY TABLE {0} (LIKE {1} INCLUDING DEFAULTS);"
+    
+    _INSERT_MISSING_TEMPLATE = "INSERT INTO {0} ({1}) SELECT DISTINCT ON ({2}) {3} FROM {4} AS candidate WHERE NOT EXISTS (SELECT 1 FROM {0} AS stored WHERE {5});"
+    
+    _DROP_CANDIDATE_TABLE_TEMPLATE = "DROP TABLE {0};"
+    
+    _NULLABLE_COLUMNS_STATEMENT = "SELECT attname FROM pg_attribute WHERE attrelid = %s::regclass AND attnum > 0 AND NOT attisdropped AND NOT attnotnull;"
+    
+    _nullableColumnsOfTables = dict()
+    
+    _STATEMENT_SAVEPOINT = "glamos_statement"
+    
+    _COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
     
     _connection = None
     
     _cursor = None
+    
+    _recordsInsertedCounter = 0
+    
+    _recordsUpdatedCounter = 0
+    
+    _recordsUnchangedCounter = 0
+    
+    _output = None
 
 
     def __init__(self, accessConfigurationFullFileName):
@@ -38,46 +126,570 @@ class GlamosDatabaseWriter(PostgreSqlWriter):
         self._connection = None
         self._cursor = None
         
-        config = configparser.ConfigParser()
-        config.read(self._accessConfigurationFullFileName)
+        self._recordsInsertedCounter = 0
+        self._recordsUpdatedCounter = 0
+        self._recordsUnchangedCounter = 0
         
-        host = config.get("Access", "host")
-        dbName = config.get("Access", "dbname")
-        dbUser = config.get("Access", "user")
-        dbPassword = config.get("Access", "password")
+        self._output = None
+    
+    @property
+    def recordsInserted(self):
+        '''
+        Get the number of records inserted by upsert().
+        '''
+        return self._recordsInsertedCounter
+    
+    @property
+    def recordsUpdated(self):
+        '''
+        Get the number of stored records updated with changed values by upsert().
+        '''
+        return self._recordsUpdatedCounter
+    
+    @property
+    def recordsUnchanged(self):
+        '''
+        Get the number of records found by upsert() which were already stored with the same values.
+        '''
+        return self._recordsUnchangedCounter
+    
+    @property
+    def output(self):
+        '''
+        Get the file object the messages of the writer are printed to. None for sys.stdout.
+        '''
+        return self._output
+    
+    @output.setter
+    def output(self, value):
+        '''
+        Set the file object the messages of the writer are printed to (e.g. io.StringIO to collect the
+        messages of a writer running in a thread). None prints to sys.stdout.
+        
+        @type value: file object
+        @param value: File object with a write() method or None.
+        '''
+        self._output = value
+    
+    @property
+    def connectionPool(self):
+        '''
+        Get the connection pool shared by all readers and writers with the same access configuration.
+        
+        @rtype: DatabaseConnectionPool
+        @return: Connection pool of the access configuration.
+        '''
+        
+        return DatabaseConnectionPool.getPool(self._accessConfigurationFullFileName)
+    
+    def _borrowConnection(self):
+        '''
+        Borrowing a connection of the pool if the writer does not hold one already.
+        
+        @rtype: connection
+        @return: Connection held by the writer.
         
-        self._connectionString = self._CONNECTION_STRING_TEMPLATE.format(
-            host, dbName, dbUser, dbPassword)
+        @raise DatabaseConnectionError: Error during connecting to database (e.g. timeout).
+        '''
+        
+        if self._connection == None or self._connection.closed:
+            self._connection = self.connectionPool.borrowConnection()
+        
+        return self._connection
+    
+    def releaseConnection(self):
+        '''
+        Giving back the connection held by the writer to the pool. Not committed changes are rolled back.
+        '''
+        
+        if self._cursor != None:
+            if not self._cursor.closed:
+                self._cursor.close()
+            self._cursor = None
+        
+        if self._connection != None:
+            self.connectionPool.returnConnection(self._connection)
+            self._connection = None
         
     def _writeData(self, statement):
-        # TODO: Description
+        '''
+        Executing a single statement within the current transaction of the writer. A failing statement is
+        reported and rolled back to the savepoint taken before it, the transaction stays usable for the
+        following statements. The caller is responsible for the commit.
+        
+        @type statement: string
+        @param statement: SQL statement to be executed.
+        '''
         
         try:
             
-            self._connection = psycopg2.connect(self._connectionString)
-            self._cursor = self._connection.cursor()
+            self._cursor = self._borrowConnection().cursor()
+            
+            self._cursor.execute("SAVEPOINT {0};".format(self._STATEMENT_SAVEPOINT))
             
             self._cursor.execute(statement)
             
+            self._cursor.execute("RELEASE SAVEPOINT {0};".format(self._STATEMENT_SAVEPOINT))
+            
             logging.debug(statement)
             
             if logging.getLogger().getEffectiveLevel() == logging.DEBUG:
-                print(statement)
+                print(statement, file=self._output)
             
         except Exception as e:
             
+            # The error aborts the transaction, all following statements would fail without the rollback.
+            if self._connection != None and not self._connection.closed and self._connection.get_transaction_status() == TRANSACTION_STATUS_INERROR:
+                with self._connection.cursor() as cursor:
+                    cursor.execute("ROLLBACK TO SAVEPOINT {0};".format(self._STATEMENT_SAVEPOINT))
+            
             errorMessage = "Problem during accessing or writing data to the database: {0}".format(e)
-            print(errorMessage)
+            print(errorMessage, file=self._output)
             logging.error('Exception during inserting data into database %s', errorMessage)
         
     
-    def isRecordStored(self, statement):
+    def upsert(self, glacier):
+        '''
+        Writes all records of the given data into the database. Records not yet stored are inserted,
+        stored records with changed values are updated and stored records with the same values are
+        left unchanged. The records are identified by the natural key of the writer. All rows are
+        written in batches in one single transaction.
+        
+        @type glacier: dataflow.DataObjects.Glacier.Glacier
+        @param glacier: Glacier object with the records of the writer to be written into the database.
+        '''
+        
+        rows = self._recordsToRows(glacier)
+        
+        try:
+            
+            inserted, updated, unchanged = self._upsertRows(self._TABLE, self._COLUMNS, self._NATURAL_KEY, rows)
+            
+            if self._connection != None:
+                self._connection.commit()
+            
+            self._recordsInsertedCounter += inserted
+            self._recordsUpdatedCounter += updated
+            self._recordsUnchangedCounter += unchanged
+            
+            print("-> {0}: {1} records inserted, {2} updated, {3} unchanged.".format(self._TABLE, inserted, updated, unchanged), file=self._output)
+        
+        except Exception as exception:
+            
+            if self._connection != None and not self._connection.closed:
+                self._connection.rollback()
+            
+            raise exception
+        
+        finally:
+            
+            self.releaseConnection()
+    
+    def writeBatches(self, glacier, batches):
+        '''
+        Writes the records of the given glacier batch by batch into the database. The batches are consumed
+        one after the other (e.g. from VawFileReader.iterBatches()), only the rows of the current batch are
+        kept in memory. The rows not yet stored are inserted by the set-based duplicate detection on
+        _DUPLICATE_KEY. All batches are written in one single transaction.
+        
+        @type glacier: dataflow.DataObjects.Glacier.Glacier
+        @param glacier: Glacier of the records.
+        @type batches: iterable
+        @param batches: Lists of records of the writer.
+        
+        @rtype: int
+        @return: Number of records handed over by the batches.
+        '''
+        
+        rowsTotal = 0
+        rowsInsertedTotal = 0
+        
+        try:
+            
+            for batch in batches:
+                
+                rows = self._recordsToRows(glacier, batch)
+                
+                rowsInserted = self._insertMissingRows(self._TABLE, self._COLUMNS, self._DUPLICATE_KEY, rows)
+                
+                rowsTotal += len(rows)
+                rowsInsertedTotal += rowsInserted
+            
+            if self._connection != None:
+                self._connection.commit()
+            
+            # Counting only committed records, a failing batch rolls back all batches before.
+            self._countRecordsWritten(rowsInsertedTotal)
+            
+            print("-> {0}: {1} of {2} records were not yet stored in the database.".format(self._TABLE, rowsInsertedTotal, rowsTotal), file=self._output)
+            
+        except Exception as exception:
+            
+            if self._connection != None and not self._connection.closed:
+                self._connection.rollback()
+            
+            raise exception
+        
+        finally:
+            
+            self.releaseConnection()
+        
+        return rowsTotal
+    
+    def _countRecordsWritten(self, recordsWritten):
+        '''
+        Hook of the specialised writers to keep their own counter of the records written by writeBatches().
+        Called once after the commit of all batches.
+        
+        @type recordsWritten: int
+        @param recordsWritten: Number of records inserted by all batches.
+        '''
+        pass
+    
+    def _recordsToRows(self, glacier, records=None):
+        '''
+        Abstract method converting the records of the given glacier into rows of values in the order of _COLUMNS.
+        
+        The method has to be implemented by all writers supporting upsert() and writeBatches().
+        
+        @type glacier: dataflow.DataObjects.Glacier.Glacier
+        @param glacier: Glacier object with the records of the writer.
+        @type records: iterable
+        @param records: Records of the glacier to be converted (e.g. a batch of writeBatches()). All records of the writer of the glacier if not given.
+        
+        @rtype: list
+        @return: List of rows. Each row is a list of values in the order of _COLUMNS.
+        '''
+        raise NotImplementedError("The abstract method _recordsToRows() is not implemented yet.")
+    
+    def _upsertRows(self, table, columns, naturalKey, rows):
+        '''
+        Inserting or updating the given rows by INSERT ... ON CONFLICT DO UPDATE in batches of _UPSERT_BATCH_SIZE rows.
+        The statements are part of the current transaction of the writer. The caller is responsible for the commit.
+        
+        Rows with the same natural key are reduced to the last one, because a single statement
+        cannot update the same record twice. The primary key (pk) of updated records is not changed.
+        
+        @type table: string
+        @param table: Name of the table including the schema.
+        @type columns: list
+        @param columns: Names of the columns in the order of the values of the rows. The primary key (pk) is never updated.
+        @type naturalKey: list
+        @param naturalKey: Names of the columns of the unique constraint identifying a record.
+        @type rows: list
+        @param rows: List of rows. Each row is a sequence of values in the order of the columns.
+        
+        @rtype: tuple
+        @return: Number of inserted, updated and unchanged rows.
+        '''
+        
+        keyIndices = [columns.index(keyColumn) for keyColumn in naturalKey]
+        
+        uniqueRows = dict()
+        for row in rows:
+            parameters = [self._parameterValue(value) for value in row]
+            uniqueRows[tuple([parameters[keyIndex] for keyIndex in keyIndices])] = parameters
+        
+        if len(uniqueRows) == 0:
+            return 0, 0, 0
+        
+        updateColumns = [column for column in columns if column != "pk" and column not in naturalKey]
+        
+        if len(updateColumns) > 0:
+            statement = self._UPSERT_TEMPLATE.format(
+                table,
+                ", ".join(columns),
+                ", ".join(naturalKey),
+                ", ".join(["{0} = EXCLUDED.{0}".format(column) for column in updateColumns]),
+                ", ".join(["stored.{0}".format(column) for column in updateColumns]),
+                ", ".join(["EXCLUDED.{0}".format(column) for column in updateColumns]))
+        else:
+            statement = self._UPSERT_NOTHING_TO_UPDATE_TEMPLATE.format(
+                table,
+                ", ".join(columns),
+                ", ".join(naturalKey))
+        
+        results = self._executeValues(statement, list(uniqueRows.values()), pageSize=self._UPSERT_BATCH_SIZE, fetch=True)
+        
+        inserted = len([result for result in results if result[0] == True])
+        updated = len(results) - inserted
+        unchanged = len(uniqueRows) - len(results)
+        
+        logging.debug("%s: %d inserted, %d updated, %d unchanged", table, inserted, updated, unchanged)
+        
+        return inserted, updated, unchanged
+    
+    def _executeBatch(self, statement, rows, pageSize=None):
+        '''
+        Executing a parameterised statement for all given rows. The statement is prepared once on the
+        server and executed in batches of pageSize rows per round trip. The statements are part of the
+        current transaction of the writer. The caller is responsible for the commit.
+        
+        @type statement: string
+        @param statement: Statement with one %s placeholder per value of a row, e.g. "INSERT INTO t (a, b) VALUES (%s, %s)".
+        @type rows: list
+        @param rows: List of rows. Each row is a sequence of values in the order of the placeholders.
+        @type pageSize: int
+        @param pageSize: Number of rows per round trip. Default: _BATCH_SIZE
+        
+        @rtype: int
+        @return: Number of rows executed.
+        '''
+        
+        if len(rows) == 0:
+            return 0
+        
+        if pageSize == None:
+            pageSize = self._BATCH_SIZE
+        
+        statementName = self._PREPARED_STATEMENT_NAME_TEMPLATE.format(next(GlamosDatabaseWriter._preparedStatementCounter))
+        numberParameters = statement.count("%s")
+        
+        # Replacing the placeholders of psycopg2 by the positional parameters of PREPARE.
+        parts = statement.split("%s")
+        preparedStatement = parts[0] + "".join(["${0}{1}".format(index + 1, part) for index, part in enumerate(parts[1:])])
+        
+        cursor = self._borrowConnection().cursor()
+        
+        cursor.execute("PREPARE {0} AS {1}".format(statementName, preparedStatement))
+        
+        try:
+            execute_batch(
+                cursor,
+                "EXECUTE {0} ({1})".format(statementName, ", ".join(["%s"] * numberParameters)),
+                [[self._parameterValue(value) for value in row] for row in rows],
+                page_size=pageSize)
+        finally:
+            if not cursor.closed and self._connection.get_transaction_status() != TRANSACTION_STATUS_INERROR:
+                cursor.execute("DEALLOCATE {0}".format(statementName))
+            cursor.close()
+        
+        logging.debug("%s: %d rows", statement, len(rows))
+        
+        return len(rows)
+    
+    def _insertStatement(self, table, columns):
+        '''
+        Creating a parameterised INSERT statement of a single row for _executeBatch().
+        
+        @type table: string
+        @param table: Name of the table including the schema.
+        @type columns: list
+        @param columns: Names of the columns in the order of the values of the rows.
+        
+        @rtype: string
+        @return: INSERT statement with one %s placeholder per column.
+        '''
+        
+        return self._INSERT_TEMPLATE.format(table, ", ".join(columns), ", ".join(["%s"] * len(columns)))
+    
+    def _executeValues(self, statement, rows, pageSize=None, fetch=False):
+        '''
+        Executing a statement with a single VALUES %s placeholder for all given rows. The rows are sent as
+        multi-row VALUES lists of pageSize rows per statement. The statements are part of the current
+        transaction of the writer. The caller is responsible for the commit.
+        
+        @type statement: string
+        @param statement: Statement with a single VALUES %s placeholder, e.g. "INSERT INTO t (a, b) VALUES %s".
+        @type rows: list
+        @param rows: List of rows. Each row is a sequence of values. Values have to be adaptable by psycopg2 (see _parameterValue()).
+        @type pageSize: int
+        @param pageSize: Number of rows per statement. Default: _BATCH_SIZE
+        @type fetch: boolean
+        @param fetch: True if the records returned by a RETURNING clause have to be returned.
+        
+        @rtype: list
+        @return: Records returned by the statements if fetch is True, otherwise None.
+        '''
+        
+        if pageSize == None:
+            pageSize = self._BATCH_SIZE
+        
+        cursor = self._borrowConnection().cursor()
+        
+        try:
+            return execute_values(cursor, statement, rows, page_size=pageSize, fetch=fetch)
+        finally:
+            cursor.close()
+    
+    def _parameterValue(self, value):
+        '''
+        Converting a single value into a value psycopg2 is able to adapt as statement parameter.
+        
+        @type value: object
+        @param value: Value to be converted. Enumerations are converted into their value, UUIDs into strings.
+        
+        @rtype: object
+        @return: Value to be used as statement parameter.
+        '''
+        
+        if isinstance(value, Enum):
+            return value.value
+        elif isinstance(value, uuid.UUID):
+            return str(value)
+        else:
+            return value
+    
+    def _copyRows(self, table, columns, rows):
+        '''
+        Streaming the given rows into the table by COPY FROM STDIN. The rows are sent with the connection
+        held by the writer and are part of its current transaction. The caller is responsible for the commit.
+        
+        @type table: string
+        @param table: Name of the table including the schema.
+        @type columns: list
+        @param columns: Names of the columns in the order of the values of the rows.
+        @type rows: list
+        @param rows: List of rows. Each row is a sequence of values in the order of the columns.
+        
+        @rtype: int
+        @return: Number of rows sent to the database.
+        '''
+        
+        buffer = io.StringIO()
+        rowCounter = 0
+        
+        for row in rows:
+            buffer.write("\t".join([self._copyValue(value) for value in row]))
+            buffer.write("\n")
+            rowCounter += 1
+        
+        if rowCounter > 0:
+            buffer.seek(0)
+            
+            statement = self._COPY_STATEMENT_TEMPLATE.format(table, ", ".join(columns))
+            
+            self._cursor = self._borrowConnection().cursor()
+            self._cursor.copy_expert(statement, buffer)
+            
+            logging.debug("%s: %d rows", statement, rowCounter)
+        
+        return rowCounter
+    
+    def _insertMissingRows(self, table, columns, keyColumns, rows):
+        '''
+        Set-based duplicate detection and insert. The candidate rows are streamed into a temporary table,
+        the rows already stored in the table are found by one single anti-join on the key columns (see
+        _keyCondition()) and only the missing rows are inserted. Candidate rows with the same key are inserted once. All statements
+        are part of the current transaction of the writer. The caller is responsible for the commit.
+        
+        @type table: string
+        @param table: Name of the table including the schema.
+        @type columns: list
+        @param columns: Names of the columns in the order of the values of the rows.
+        @type keyColumns: list
+        @param keyColumns: Names of the columns defining a unique record of the table.
+        @type rows: list
+        @param rows: List of candidate rows. Each row is a sequence of values in the order of the columns.
+        
+        @rtype: int
+        @return: Number of rows inserted into the table.
+        '''
+        
+        if len(rows) == 0:
+            return 0
+        
+        cursor = self._borrowConnection().cursor()
+        
+        cursor.execute(self._CREATE_CANDIDATE_TABLE_TEMPLATE.format(self._CANDIDATE_TABLE, table))
+        
+        self._copyRows(self._CANDIDATE_TABLE, columns, rows)
+        
+        keyCondition = self._keyCondition(keyColumns, self._nullableColumns(cursor, table))
+        
+        insertStatement = self._INSERT_MISSING_TEMPLATE.format(
+            table,
+            ", ".join(columns),
+            ", ".join(["candidate.{0}".format(keyColumn) for keyColumn in keyColumns]),
+            ", ".join(["candidate.{0}".format(column) for column in columns]),
+            self._CANDIDATE_TABLE,
+            keyCondition)
+        
+        cursor.execute(insertStatement)
+        rowsInserted = cursor.rowcount
+        
+        logging.debug("%s: %d of %d rows inserted", insertStatement, rowsInserted, len(rows))
+        
+        cursor.execute(self._DROP_CANDIDATE_TABLE_TEMPLATE.format(self._CANDIDATE_TABLE))
+        cursor.close()
+        
+        return rowsInserted
+    
+    def _nullableColumns(self, cursor, table):
+        '''
+        Getting the columns of the table without NOT NULL constraint. The columns are read once per table
+        from the system catalog and kept for all writers of the process.
+        
+        @type cursor: cursor
+        @param cursor: Cursor of the connection held by the writer.
+        @type table: string
+        @param table: Name of the table including the schema.
+        
+        @rtype: set
+        @return: Names of the columns which can be NULL.
+        '''
+        
+        nullableColumns = GlamosDatabaseWriter._nullableColumnsOfTables.get(table)
+        
+        if nullableColumns == None:
+            cursor.execute(self._NULLABLE_COLUMNS_STATEMENT, [table])
+            nullableColumns = set([record[0] for record in cursor.fetchall()])
+            GlamosDatabaseWriter._nullableColumnsOfTables[table] = nullableColumns
+        
+        return nullableColumns
+    
+    def _keyCondition(self, keyColumns, nullableColumns):
+        '''
+        Creating the condition of the anti-join matching a candidate row with a stored row. NOT NULL columns
+        are compared by =, which allows the database to use the index of the key or a hash anti-join. Only the
+        columns which can be NULL match NULL values of both rows in addition.
+        
+        @type keyColumns: list
+        @param keyColumns: Names of the columns defining a unique record of the table.
+        @type nullableColumns: set
+        @param nullableColumns: Names of the columns of the table which can be NULL.
+        
+        @rtype: string
+        @return: Condition on the aliases stored and candidate.
+        '''
+        
+        conditions = list()
+        
+        for keyColumn in keyColumns:
+            if keyColumn in nullableColumns:
+                conditions.append("(stored.{0} = candidate.{0} OR (stored.{0} IS NULL AND candidate.{0} IS NULL))".format(keyColumn))
+            else:
+                conditions.append("stored.{0} = candidate.{0}".format(keyColumn))
+        
+        return " AND ".join(conditions)
+    
+    def _copyValue(self, value):
+        '''
+        Converting a single value into its representation in the text format of COPY.
+        
+        @type value: object
+        @param value: Value to be converted. Enumerations are converted into their value.
+        
+        @rtype: string
+        @return: Representation of the value in the text format of COPY.
+        '''
+        
+        if value == None:
+            return self._COPY_NULL
+        elif isinstance(value, Enum):
+            return str(value.value)
+        else:
+            return str(value).translate(self._COPY_ESCAPES)
+    
+    def isRecordStored(self, statement, parameters=None):
         '''
         Check if a record is already stored in the database. The retrieving of the record is defined
         by the given statement.
         
         @type statement: string
         @param statement: Entire SQL-statement used to retrieve a single record of the database.
+        @type parameters: list
+        @param parameters: Values of the %s placeholders of a parameterised statement.
         
         @rtype: boolean
         @return: True if the record is already stored in the database; False if the record is not yet stored in the database.
@@ -91,11 +703,13 @@ class GlamosDatabaseWriter(PostgreSqlWriter):
         try:
             results = list()
             
-            self._connection = psycopg2.connect(self._connectionString)
-            self._cursor = self._connection.cursor()
+            self._cursor = self._borrowConnection().cursor()
 
             # Getting the records from the database.
-            self._cursor.execute(statement)
+            if parameters != None:
+                parameters = [self._parameterValue(value) for value in parameters]
+            
+            self._cursor.execute(statement, parameters)
             
             for recordReturned in self._cursor:
                 results.append(recordReturned)
@@ -125,13 +739,11 @@ class GlamosDatabaseWriter(PostgreSqlWriter):
         except Exception as e:
             
             errorMessage = "Problem during accessing or retrieving data from the database: {0}".format(e)
-            print(errorMessage)
+            print(errorMessage, file=self._output)
             
             #TODO: Improving the error handling, logging etc.
         
         finally:
-            if self._connection != None:
-                self._connection.close()
             if self._cursor != None:
                 self._cursor.close()
                 
@@ -5,6 +5,7 @@ Created on 22.05.2018
 '''
 
 from dataflow.DataWriters.DatabaseWriters.GlamosDatabaseWriter import GlamosDatabaseWriter
+from dataflow.DataObjects.Glamos import GlamosData
 from dataflow.DataObjects.Glacier import Glacier
 from dataflow.DataObjects.LengthChange import LengthChange
 
@@ -14,9 +15,22 @@ class LengthChangeWriter(GlamosDatabaseWriter):
     Database writer for objects of the type length change
     
     Attributes:
+    _TABLE          string  Table of the length-change observations
+    _COLUMNS        list    Columns of the length-change observations written
+    _DUPLICATE_KEY  list    Columns defining a duplicate of a stored length-change observation
+    _NATURAL_KEY    list    Columns of the unique constraint identifying a length-change observation
     _lengthChangeObservationCounter int  Counter of length-change observations written to the database
     '''
     
+    _TABLE = "length_change.length_change_data"
+    _COLUMNS = [
+        "pk", "fk_glacier", "date_from", "date_from_quality", "date_to", "date_to_quality",
+        "fk_measurement_type", "variation_quantitative", "variation_quantitative_accuracy",
+        "elevation_min", "observer", "remarks", "fk_data_embargo_type",
+        "fk_measurement_method", "fk_measurement_condition"]
+    _NATURAL_KEY = ["fk_glacier", "date_from", "date_to"]
+    _DUPLICATE_KEY = _NATURAL_KEY
+    
     _lengthChangeObservationCounter = 0
 
     @property
@@ -39,93 +53,89 @@ class LengthChangeWriter(GlamosDatabaseWriter):
         '''
         Writes all length-change observations of the given glacier into the database.
         
+        The duplicate detection is done set-based for all observations of the glacier. A unique
+        data record is defined by the following factors:
+        - The same glacier (fk_glacier)
+        - The same start date of the observation (date_from)
+        - The same end date of the observation (date_to)
+        Only the observations not yet stored are inserted, all in one single transaction.
+        
         @type glacier: dataflow.DataObjects.Glacier.Glacier
         @param glacier: Glacier object with length-change data to be written into the database
         '''
 
+        rows = self._recordsToRows(glacier)
+
         try:
             
-            for lengthChange in glacier.lengthChanges.values():
-                
-                # Check if length change is already stored in the database.
-                # The statement has to describe a SELECT which returns a unique record based on the definition of the record set.
-                # In case the length-change data the following factors define a unique data record:
-                # - The same glacier (fk_glacier)
-                # - The same start date of the observation (date_from)
-                # - The same end date of the observation (date_to) 
-                checkStatement = "SELECT * FROM {0} WHERE fk_glacier = '{1}' AND date_from = '{2}' AND date_to = '{3}';".format(
-                    'length_change.length_change_data',
-                    glacier.pkVaw,
-                    lengthChange.dateFrom,
-                    lengthChange.dateTo)
-        
-                # Record is already in database. No further inserts needed.
-                if super().isRecordStored(checkStatement) == True:
-                    
-                    message = "The record {0} is already stored in the database. No further inserts.".format(str(lengthChange))
-                    print(message)
-                
-                # The record is not yet stored in the database. Insert will be done.
-                else:
-                    
-                    message = "The record {0} is not yet stored in the database. Insert will be done ...".format(str(lengthChange))
-                    print(message)
-                    
-                    # Preparing the INSERT of a not yet inserted record.
-                    insertStatement = "INSERT INTO length_change.length_change_data (pk, fk_glacier, date_from, date_from_quality, date_to, date_to_quality, fk_measurement_type, variation_quantitative, variation_quantitative_accuracy, elevation_min, observer, remarks, fk_data_embargo_type, fk_measurement_method, fk_measurement_condition) VALUES ('{0}', {1}, '{2}', {3}, '{4}', {5}, '{6}', '{7}', {8}, {9}, {10}, {11}, {12}, '{13}', '{14}');"
-                
-                    # Handling possible NULL values:
-                    elevationMin = 'NULL'
-                    if lengthChange.elevationMin != None:
-                        elevationMin = lengthChange.elevationMin
-                    observer = 'NULL'
-                    if lengthChange.observer != None:
-                        observer = '\'{0}\''.format(lengthChange.observer)
-                    remarks = 'NULL'
-                    if lengthChange.remarks != None:
-                        remarks = '\'{0}\''.format(lengthChange.remarks)
-                        
-                    # Handling not yet implemented values.
-                    variationQuantitativeAccuracy = 'NULL'
-                    
-                    # Handling not yet implemented default values.
-                    dataEmbargoType = 0
-    
-                    # Getting the final INSERT-statement ready.
-                    insertStatement = insertStatement.format(
-                        lengthChange.pk,
-                        glacier.pkVaw,
-                        lengthChange.dateFrom,
-                        lengthChange.dateFromQuality,
-                        lengthChange.dateTo,
-                        lengthChange.dateToQuality,
-                        lengthChange.measurementType,
-                        lengthChange.variationQuantitative,
-                        variationQuantitativeAccuracy,
-                        elevationMin,
-                        observer,
-                        remarks,
-                        dataEmbargoType,
-                        lengthChange.measurementMethod,
-                        lengthChange.measurementCondition)
-                    print(lengthChange.variationQuantitative)
-                    print(insertStatement)
-                    self._writeData(insertStatement)
-                    self._connection.commit()
-                
-                    self._lengthChangeObservationCounter += 1
+            rowsInserted = self._insertMissingRows(self._TABLE, self._COLUMNS, self._DUPLICATE_KEY, rows)
+            
+            if self._connection != None:
+                self._connection.commit()
+            
+            self._lengthChangeObservationCounter += rowsInserted
+            
+            print("-> {0} of {1} length change observations were not yet stored in the database.".format(rowsInserted, len(rows)), file=self._output)
             
         except Exception as exception:
             
+            if self._connection != None and not self._connection.closed:
+                self._connection.rollback()
+            
             raise exception
         
         finally:
             
-            self._connection.close()
+            self.releaseConnection()
             
-            print("\n")
-            print("-> A total of {0} length change observations were inserted into the database.".format(self._lengthChangeObservationCounter))
+            print("\n", file=self._output)
+            print("-> A total of {0} length change observations were inserted into the database.".format(self._lengthChangeObservationCounter), file=self._output)
     
     def isGlacierLengthChangeStored(self):
         
-        pass
\ No newline at end of file
+        pass
+
+    def _recordsToRows(self, glacier, records=None):
+        '''
+        Converting the length-change observations into rows of values in the order of _COLUMNS.
+
+        @type glacier: dataflow.DataObjects.Glacier.Glacier
+        @param glacier: Glacier object with the length-change observations
+        @type records: iterable
+        @param records: Records of the glacier to be converted. All length-change observations of the glacier if not given.
+
+        @rtype: list
+        @return: List of rows. Each row is a list of values in the order of _COLUMNS.
+        '''
+
+        if records is None:
+            records = glacier.lengthChanges.values()
+
+        rows = list()
+        
+        for lengthChange in GlamosData.assignPks(records):
+            
+            # Handling not yet implemented values.
+            variationQuantitativeAccuracy = None
+            
+            # Handling not yet implemented default values.
+            dataEmbargoType = 0
+            
+            rows.append([
+                lengthChange.pk,
+                glacier.pkVaw,
+                lengthChange.dateFrom,
+                lengthChange.dateFromQuality,
+                lengthChange.dateTo,
+                lengthChange.dateToQuality,
+                lengthChange.measurementType,
+                lengthChange.variationQuantitative,
+                variationQuantitativeAccuracy,
+                lengthChange.elevationMin,
+                lengthChange.observer,
+                lengthChange.remarks,
+                dataEmbargoType,
+                lengthChange.measurementMethod,
+                lengthChange.measurementCondition])
+
+        return rows
@@ -5,6 +5,7 @@ Created on 14.07.2021
 '''
 
 from dataflow.DataWriters.DatabaseWriters.GlamosDatabaseWriter import GlamosDatabaseWriter
+from dataflow.DataObjects.Glamos import GlamosData
 from dataflow.DataObjects.Glacier import Glacier
 from dataflow.DataObjects.MassBalanceIndexTimeDaily import MassBalanceIndexTimeDaily
 import datetime
@@ -14,9 +15,20 @@ class MassBalanceIndexTimeDailyWriter(GlamosDatabaseWriter):
     Database writer for objects of the type mass balance index daily
 
     Attributes:
+    _TABLE          string  Table of the mass balance index daily values
+    _COLUMNS        list    Columns of the mass balance index daily values written
+    _DUPLICATE_KEY  list    Columns defining a duplicate of a stored mass balance index daily value
+    _NATURAL_KEY    list    Columns of the unique constraint identifying a mass balance index daily value
     _MassBalanceIndexDailyCounter int  Counter of mass balance index daily written to the database
     '''
 
+    _TABLE = "mass_balance.index_time_daily"
+    _COLUMNS = [
+        "pk", "fk_glacier", "name", "date", "balance", "accumulation", "melt",
+        "fk_surface_type", "temperature", "precipitation", "reference"]
+    _NATURAL_KEY = ["fk_glacier", "name", "date"]
+    _DUPLICATE_KEY = _NATURAL_KEY
+
     _MassBalanceIndexTimeDailyCounter = 0
 
     @property
@@ -42,79 +54,86 @@ class MassBalanceIndexTimeDailyWriter(GlamosDatabaseWriter):
         '''
         Writes all mass balance index daily data of the given glacier into the database.
 
+        The duplicate detection is done set-based for all daily values of the glacier. A unique
+        data record is defined by the following factors:
+        - The same glacier (fk_glacier)
+        - The same name (name)
+        - The date of daily value (date)
+        Only the daily values not yet stored are inserted, all in one single transaction.
+
         @type glacier: dataflow.DataObjects.Glacier.Glacier
         @param glacier: Glacier object with massbalance index daily data to be written into the database
         '''
 
+        rows = self._recordsToRows(glacier)
+
         try:
-            for massbalanceIndexTimeDaily in glacier.massBalanceIndexTimeDailys.values():
-                # Check if mass balance index daily is already stored in the database.
-                # The statement has to describe a SELECT which returns a unique record based on the definition of the record set.
-                # In case the mass balance data the following factors define a unique data record:
-                # - The same glacier (fk_glacier)
-                # - The same name (name)
-                # - The date of daily value (date)
-                # - The values of entry (balance, accumulation, melt)
-
-                checkStatement = "SELECT * FROM {0} WHERE fk_glacier = '{1}' AND name = '{2}' AND " \
-                                 "date ='{3}' AND balance = '{4}' AND accumulation = '{5}' AND " \
-                                 "melt = '{6}';".format(
-                    'mass_balance.index_time_daily',
-                    glacier.pk,
-                    massbalanceIndexTimeDaily.name,
-                    massbalanceIndexTimeDaily.date,
-                    massbalanceIndexTimeDaily.balance,
-                    massbalanceIndexTimeDaily.accumulation,
-                    massbalanceIndexTimeDaily.melt)
-
-                # Record is already in database. No further inserts needed.
-                if super().isRecordStored(checkStatement) == True:
-                    message = "The record {0} is already stored in the database. No further inserts.".format(
-                        str(massbalanceIndexTimeDaily))
-                    #print(message)
-
-                # The record is not yet stored in the database. Insert will be done.
-                else:
-                    message = "The record {0} is not yet stored in the database. Insert will be done ...".format(
-                        str(massbalanceIndexTimeDaily))
-                    print(message)
-
-                    # Preparing the INSERT of a not yet inserted record.
-                    insertStatement = "INSERT INTO mass_balance.index_time_daily (pk, fk_glacier, name, date, balance, accumulation, melt, fk_surface_type, temperature, precipitation,reference) VALUES ('{0}', '{1}', '{2}', '{3}', '{4}', '{5}', '{6}', '{7}', {8}, {9}, '{10}');"
-
-                    # Handling possible NULL values:
-                    # TODO: if Null values possible
-                    # Handling not yet implemented values.
-                    # TODO: if values are not yet implemented
-                    # Handling not yet implemented default values.
-                    # TODO: if default values not yet implemented
-
-                    # Getting the final INSERT-statement ready.
-                    insertStatement = insertStatement.format(
-                        massbalanceIndexTimeDaily.pk,
-                        glacier.pk,
-                        massbalanceIndexTimeDaily.name,
-                        massbalanceIndexTimeDaily.date,
-                        massbalanceIndexTimeDaily.balance,
-                        massbalanceIndexTimeDaily.accumulation,
-                        massbalanceIndexTimeDaily.melt,
-                        massbalanceIndexTimeDaily.surface_type,
-                        massbalanceIndexTimeDaily.temp,
-                        massbalanceIndexTimeDaily.precip_solid,
-                        massbalanceIndexTimeDaily.reference)
-
-                    self._writeData(insertStatement)
-                    self._connection.commit()
-
-                    self._MassBalanceIndexTimeDailyCounter += 1
+            
+            rowsInserted = self._insertMissingRows(self._TABLE, self._COLUMNS, self._DUPLICATE_KEY, rows)
+            
+            if self._connection != None:
+                self._connection.commit()
+            
+            self._MassBalanceIndexTimeDailyCounter += rowsInserted
+            
+            print("-> {0} of {1} mass balance index time daily were not yet stored in the database.".format(rowsInserted, len(rows)), file=self._output)
+            
         except Exception as exception:
-
+            
+            if self._connection != None and not self._connection.closed:
+                self._connection.rollback()
+            
             raise exception
 
         finally:
 
-            self._connection.close()
+            self.releaseConnection()
 
-            print("\n")
+            print("\n", file=self._output)
             print("-> A total of {0} mass balance index time daily were inserted into the database.".format(
-                self._MassBalanceIndexTimeDailyCounter))
\ No newline at end of file
+                self._MassBalanceIndexTimeDailyCounter), file=self._output)
+
+    def _countRecordsWritten(self, recordsWritten):
+        '''
+        Counting the records written by writeBatches().
+        '''
+
+        self._MassBalanceIndexTimeDailyCounter += recordsWritten
+
+    def _recordsToRows(self, glacier, records=None):
+        '''
+        Converting the mass balance index daily values into rows of values in the order of _COLUMNS.
+
+        @type glacier: dataflow.DataObjects.Glacier.Glacier
+        @param glacier: Glacier object with the mass balance index daily values
+        @type records: iterable
+        @param records: Records of the glacier to be converted. All mass balance index daily values of the glacier if not given.
+
+        @rtype: list
+        @return: List of rows. Each row is a list of values in the order of _COLUMNS.
+        '''
+
+        if records is None:
+            records = glacier.massBalanceIndexTimeDailys.values()
+
+        # Identifiers of the new records are allocated at once for the whole batch.
+        records = GlamosData.assignPks(records)
+
+        rows = list()
+
+        for massbalanceIndexTimeDaily in records:
+
+            rows.append([
+                massbalanceIndexTimeDaily.pk,
+                glacier.pk,
+                massbalanceIndexTimeDaily.name,
+                massbalanceIndexTimeDaily.date,
+                massbalanceIndexTimeDaily.balance,
+                massbalanceIndexTimeDaily.accumulation,
+                massbalanceIndexTimeDaily.melt,
+                massbalanceIndexTimeDaily.surface_type,
+                massbalanceIndexTimeDaily.temp,
+                massbalanceIndexTimeDaily.precip_solid,
+                massbalanceIndexTimeDaily.reference])
+
+        return rows
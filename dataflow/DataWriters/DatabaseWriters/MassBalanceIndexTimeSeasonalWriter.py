@@ -5,6 +5,7 @@ Created on 14.07.2021
 '''
 
 from dataflow.DataWriters.DatabaseWriters.GlamosDatabaseWriter import GlamosDatabaseWriter
+from dataflow.DataObjects.Glamos import GlamosData
 from dataflow.DataObjects.Glacier import Glacier
 from dataflow.DataObjects.MassBalanceIndexTimeSeasonal import MassBalanceIndexTimeSeasonal
 import datetime
@@ -14,9 +15,22 @@ class MassBalanceIndexTimeSeasonalWriter(GlamosDatabaseWriter):
     Database writer for objects of the type mass balance index seasonal
 
     Attributes:
+    _TABLE          string  Table of the mass balance index seasonal values
+    _COLUMNS        list    Columns of the mass balance index seasonal values written
+    _DUPLICATE_KEY  list    Columns defining a duplicate of a stored mass balance index seasonal value
+    _NATURAL_KEY    list    Columns of the unique constraint identifying a mass balance index seasonal value
     _MassBalanceIndexSeasonalCounter int  Counter of mass balance index seasonal written to the database
     '''
 
+    _TABLE = "mass_balance.index_time_seasonal"
+    _COLUMNS = [
+        "pk", "fk_glacier", "fk_embargo_type", "fk_analysis_method_type", "name",
+        "date_from_annual", "date_to_annual", "date_from_winter", "date_to_winter", "date_fall_min", "date_spring_max",
+        "latitude", "longitude", "altitude", "b_w_meas", "b_a_meas", "c_w_obs", "c_a_obs", "a_w_obs", "a_a_obs",
+        "b_w_fix", "b_a_fix", "c_w_fix", "c_a_fix", "a_w_fix", "a_a_fix", "investigator", "reference"]
+    _NATURAL_KEY = ["fk_glacier", "name", "date_from_annual", "date_to_annual"]
+    _DUPLICATE_KEY = _NATURAL_KEY
+
     _MassBalanceIndexTimeSeasonalCounter = 0
 
     @property
@@ -42,96 +56,103 @@ class MassBalanceIndexTimeSeasonalWriter(GlamosDatabaseWriter):
         '''
         Writes all mass balance index seasonal data of the given glacier into the database.
 
+        The duplicate detection is done set-based for all values of the glacier. A unique
+        data record is defined by the following factors:
+        - The same glacier (fk_glacier)
+        - The same name (name)
+        - The start and end date of annual period (date_from_annual, date_to_annual)
+        Only the values not yet stored are inserted, all in one single transaction.
+
         @type glacier: dataflow.DataObjects.Glacier.Glacier
         @param glacier: Glacier object with massbalance index seasonal data to be written into the database
         '''
 
+        rows = self._recordsToRows(glacier)
+
         try:
-            for massbalanceIndexTimeSeasonal in glacier.massBalanceIndexTimeSeasonals.values():
-                # Check if mass balance index daily is already stored in the database.
-                # The statement has to describe a SELECT which returns a unique record based on the definition of the record set.
-                # In case the mass balance data the following factors define a unique data record:
-                # - The same glacier (fk_glacier)
-                # - The same name (name)
-                # - The start and end date of annual period (date_0, date_1)
-                # - The balance values of entry (b_w_meas, b_a_meas)
-
-                checkStatement = "SELECT * FROM {0} WHERE fk_glacier = '{1}' AND name = '{2}' AND " \
-                                 "date_from_annual ='{3}' AND date_to_annual = '{4}' AND b_w_meas = '{5}' AND b_a_meas = '{6}';".format(
-                    'mass_balance.index_time_seasonal',
-                    glacier.pk,
-                    massbalanceIndexTimeSeasonal.name,
-                    massbalanceIndexTimeSeasonal.date_0,
-                    massbalanceIndexTimeSeasonal.date_1,
-                    massbalanceIndexTimeSeasonal.b_w_meas,
-                    massbalanceIndexTimeSeasonal.b_a_meas,)
-
-                # Record is already in database. No further inserts needed.
-                if super().isRecordStored(checkStatement) == True:
-                    message = "The record {0} is already stored in the database. No further inserts.".format(
-                        str(massbalanceIndexTimeSeasonal))
-                    print(message)
-
-                # The record is not yet stored in the database. Insert will be done.
-                else:
-                    message = "The record {0} is not yet stored in the database. Insert will be done ...".format(
-                        str(massbalanceIndexTimeSeasonal))
-                    print(message)
-
-                    # Preparing the INSERT of a not yet inserted record.
-                    insertStatement = "INSERT INTO mass_balance.index_time_seasonal (pk, fk_glacier, fk_embargo_type, fk_analysis_method_type, name, date_from_annual, date_to_annual, date_from_winter, date_to_winter, date_fall_min, date_spring_max, latitude, longitude, altitude, b_w_meas, b_a_meas, c_w_obs, c_a_obs, a_w_obs, a_a_obs, b_w_fix, b_a_fix, c_w_fix, c_a_fix, a_w_fix, a_a_fix, investigator, reference) VALUES ('{0}', '{1}', '{2}', '{3}', '{4}', '{5}', '{6}', '{7}', '{8}', '{9}', '{10}', {11}, {12}, {13}, '{14}', '{15}', '{16}', '{17}', '{18}', '{19}', '{20}', '{21}', '{22}', '{23}', '{24}', '{25}', '{26}', '{27}');"
-
-                    # Handling possible NULL values:
-                    # TODO: if Null values possible
-                    # Handling not yet implemented values.
-                    # TODO: if values are not yet implemented
-                    # Handling not yet implemented default values.
-                    # TODO: if default values not yet implemented
-
-                    # Getting the final INSERT-statement ready.
-                    insertStatement = insertStatement.format(
-                        massbalanceIndexTimeSeasonal.pk,
-                        glacier.pk,
-                        massbalanceIndexTimeSeasonal.embargo_type,
-                        massbalanceIndexTimeSeasonal.analysis_method_type,
-                        massbalanceIndexTimeSeasonal.name,
-                        massbalanceIndexTimeSeasonal.date_0,
-                        massbalanceIndexTimeSeasonal.date_1,
-                        massbalanceIndexTimeSeasonal.date_fmeas,
-                        massbalanceIndexTimeSeasonal.date_smeas,
-                        massbalanceIndexTimeSeasonal.date_fmin,
-                        massbalanceIndexTimeSeasonal.date_smax,
-                        massbalanceIndexTimeSeasonal.latitude,
-                        massbalanceIndexTimeSeasonal.longitude,
-                        massbalanceIndexTimeSeasonal.altitude,
-                        massbalanceIndexTimeSeasonal.b_w_meas,
-                        massbalanceIndexTimeSeasonal.b_a_meas,
-                        massbalanceIndexTimeSeasonal.c_w_obs,
-                        massbalanceIndexTimeSeasonal.c_a_obs,
-                        massbalanceIndexTimeSeasonal.a_w_obs,
-                        massbalanceIndexTimeSeasonal.a_a_obs,
-                        massbalanceIndexTimeSeasonal.b_w_fix,
-                        massbalanceIndexTimeSeasonal.b_a_fix,
-                        massbalanceIndexTimeSeasonal.c_w_fix,
-                        massbalanceIndexTimeSeasonal.c_a_fix,
-                        massbalanceIndexTimeSeasonal.a_w_fix,
-                        massbalanceIndexTimeSeasonal.a_a_fix,
-
-                        massbalanceIndexTimeSeasonal.investigator,
-                        massbalanceIndexTimeSeasonal.reference)
-
-                    self._writeData(insertStatement)
-                    self._connection.commit()
-
-                    self._MassBalanceIndexTimeSeasonalCounter += 1
+
+            rowsInserted = self._insertMissingRows(self._TABLE, self._COLUMNS, self._DUPLICATE_KEY, rows)
+
+            if self._connection != None:
+                self._connection.commit()
+
+            self._MassBalanceIndexTimeSeasonalCounter += rowsInserted
+
+            print("-> {0} of {1} mass balance index time seasonal values were not yet stored in the database.".format(rowsInserted, len(rows)), file=self._output)
+
         except Exception as exception:
 
+            if self._connection != None and not self._connection.closed:
+                self._connection.rollback()
+
             raise exception
 
         finally:
 
-            self._connection.close()
+            self.releaseConnection()
 
-            print("\n")
+            print("\n", file=self._output)
             print("-> A total of {0} mass balance index time seasonal were inserted into the database.".format(
-                self._MassBalanceIndexTimeSeasonalCounter))
\ No newline at end of file
+                self._MassBalanceIndexTimeSeasonalCounter), file=self._output)
+
+    def _countRecordsWritten(self, recordsWritten):
+        '''
+        Counting the records written by writeBatches().
+        '''
+
+        self._MassBalanceIndexTimeSeasonalCounter += recordsWritten
+
+    def _recordsToRows(self, glacier, records=None):
+        '''
+        Converting the mass balance index seasonal data of the glacier into rows of values in the order of _COLUMNS.
+
+        @type glacier: dataflow.DataObjects.Glacier.Glacier
+        @param glacier: Glacier object with mass balance index seasonal data
+        @type records: iterable
+        @param records: Records of the glacier to be converted. All mass balance index seasonal values of the glacier if not given.
+
+        @rtype: list
+        @return: List of rows. Each row is a list of values in the order of _COLUMNS.
+        '''
+
+        if records is None:
+            records = glacier.massBalanceIndexTimeSeasonals.values()
+
+        # Identifiers of the new records are allocated at once for the whole batch.
+        records = GlamosData.assignPks(records)
+
+        rows = list()
+
+        for massbalanceIndexTimeSeasonal in records:
+
+            rows.append([
+                massbalanceIndexTimeSeasonal.pk,
+                glacier.pk,
+                massbalanceIndexTimeSeasonal.embargo_type,
+                massbalanceIndexTimeSeasonal.analysis_method_type,
+                massbalanceIndexTimeSeasonal.name,
+                massbalanceIndexTimeSeasonal.date_0,
+                massbalanceIndexTimeSeasonal.date_1,
+                massbalanceIndexTimeSeasonal.date_fmeas,
+                massbalanceIndexTimeSeasonal.date_smeas,
+                massbalanceIndexTimeSeasonal.date_fmin,
+                massbalanceIndexTimeSeasonal.date_smax,
+                massbalanceIndexTimeSeasonal.latitude,
+                massbalanceIndexTimeSeasonal.longitude,
+                massbalanceIndexTimeSeasonal.altitude,
+                massbalanceIndexTimeSeasonal.b_w_meas,
+                massbalanceIndexTimeSeasonal.b_a_meas,
+                massbalanceIndexTimeSeasonal.c_w_obs,
+                massbalanceIndexTimeSeasonal.c_a_obs,
+                massbalanceIndexTimeSeasonal.a_w_obs,
+                massbalanceIndexTimeSeasonal.a_a_obs,
+                massbalanceIndexTimeSeasonal.b_w_fix,
+                massbalanceIndexTimeSeasonal.b_a_fix,
+                massbalanceIndexTimeSeasonal.c_w_fix,
+                massbalanceIndexTimeSeasonal.c_a_fix,
+                massbalanceIndexTimeSeasonal.a_w_fix,
+                massbalanceIndexTimeSeasonal.a_a_fix,
+                massbalanceIndexTimeSeasonal.investigator,
+                massbalanceIndexTimeSeasonal.reference])
+
+        return rows
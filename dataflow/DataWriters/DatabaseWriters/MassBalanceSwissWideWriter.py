@@ -5,6 +5,8 @@ Created on 1.2.2024
 '''
 
 from dataflow.DataWriters.DatabaseWriters.GlamosDatabaseWriter import GlamosDatabaseWriter
+from dataflow.DataObjects.Glamos import GlamosData
+from dataflow.DataObjects.UuidAllocator import UuidAllocator
 from dataflow.DataObjects.Glacier import Glacier
 from dataflow.DataObjects.LengthChange import LengthChange
 
@@ -14,9 +16,18 @@ class MassBalanceSwissWideWriter(GlamosDatabaseWriter):
     Database writer for objects of the type mass balance swiss wide
 
     Attributes:
+    _TABLE          string  Table of the mass balance swiss wide observations
+    _COLUMNS        list    Columns of the mass balance swiss wide observations written
+    _DUPLICATE_KEY  list    Columns defining a duplicate of a stored mass balance swiss wide observation
+    _NATURAL_KEY    list    Columns of the unique constraint identifying a mass balance swiss wide observation
     _massBalanceSwissWideObservationCounter int  Counter of mass balance swiss wide observations written to the database
     '''
 
+    _TABLE = "mass_balance.swisswide"
+    _COLUMNS = ["pk", "fk_glacier", "year", "area", "mb_evolution", "vol_evolution"]
+    _NATURAL_KEY = ["fk_glacier", "year"]
+    _DUPLICATE_KEY = _NATURAL_KEY
+
     _massBalanceSwissWideCounter = 0
 
     @property
@@ -37,69 +48,112 @@ class MassBalanceSwissWideWriter(GlamosDatabaseWriter):
 
     def write(self, massBalanceSwissWide):
         '''
-        Writes all mass balance swiss wide observations of the given glacier into the database.
+        Writes a single mass balance swiss wide observation into the database.
 
-        @type glacier: dataflow.DataObjects.Glacier.Glacier
-        @param glacier: Glacier object with length-change data to be written into the database
+        @type massBalanceSwissWide: dataflow.DataObjects.MassBalanceSwissWide.MassBalanceSwissWide
+        @param massBalanceSwissWide: Mass balance swiss wide observation to be written into the database
         '''
 
-        try:
+        self.writeAll([massBalanceSwissWide])
 
-            # Check if mass balance swiss wide is already stored in the database.
-            # The statement has to describe a SELECT which returns a unique record based on the definition of the record set.
-            # In case the length-change data the following factors define a unique data record:
-            # - The same glacier (fk_glacier)
-            # - The same corresponding year (year)
+    def writeAll(self, massBalanceSwissWides):
+        '''
+        Writes all given mass balance swiss wide observations into the database.
 
-            checkStatement = "SELECT * FROM {0} WHERE fk_glacier = '{1}' AND year = '{2}';".format(
-                'mass_balance.swisswide',
-                massBalanceSwissWide.fk_glacier,
-                massBalanceSwissWide.year)
+        The duplicate detection is done set-based for all given observations. A unique
+        data record is defined by the following factors:
+        - The same glacier (fk_glacier)
+        - The same corresponding year (year)
+        Only the observations not yet stored are inserted, all in one single transaction.
 
+        @type massBalanceSwissWides: list
+        @param massBalanceSwissWides: List of dataflow.DataObjects.MassBalanceSwissWide.MassBalanceSwissWide objects
+        '''
 
-            # Record is already in database. No further inserts needed.
-            if super().isRecordStored(checkStatement) == True:
+        self._writeRows(self._recordsToRows(None, massBalanceSwissWides))
 
-                message = "The record {0} is already stored in the database. No further inserts.".format(
-                    str(massBalanceSwissWide))
-                #print(message)
+    def writeMatrix(self, massBalanceSwissWideMatrix):
+        '''
+        Writes all cells of the given swiss wide matrices into the database without creating a
+        MassBalanceSwissWide object per cell. The rows are built directly from the matrices, the identifiers
+        of all cells are allocated in one call. The duplicate detection is the same as for writeAll().
 
-            # The record is not yet stored in the database. Insert will be done.
-            else:
+        @type massBalanceSwissWideMatrix: dataflow.DataObjects.MassBalanceSwissWideMatrix.MassBalanceSwissWideMatrix
+        @param massBalanceSwissWideMatrix: Matrices of the swiss wide mass balance extrapolation of all glaciers.
+        '''
 
-                message = "The record {0} is not yet stored in the database. Insert will be done ...".format(
-                    str(massBalanceSwissWide))
-                print(message)
+        glacierIndexes, years, areas, massBalanceEvolutions, volumeEvolutions = massBalanceSwissWideMatrix.cells()
+        glacierPks = massBalanceSwissWideMatrix.glacierPks
 
-                # Preparing the INSERT of a not yet inserted record.
-                insertStatement = "INSERT INTO mass_balance.swisswide (pk, fk_glacier, year, area, mb_evolution, vol_evolution) VALUES ('{0}', '{1}', {2}, {3}, {4}, {5});"
+        pks = UuidAllocator.allocate(len(glacierIndexes))
 
-                # Getting the final INSERT-statement ready.
-                insertStatement = insertStatement.format(
-                    massBalanceSwissWide.pk,
-                    massBalanceSwissWide.fk_glacier,
-                    massBalanceSwissWide.year,
-                    massBalanceSwissWide.area,
-                    massBalanceSwissWide.mb_evolution,
-                    massBalanceSwissWide.vol_evolution)
-                #print(insertStatement)
-                self._writeData(insertStatement)
-                self._connection.commit()
+        rows = [
+            [pk, glacierPks[glacierIndex], year, area, massBalanceEvolution, volumeEvolution]
+            for pk, glacierIndex, year, area, massBalanceEvolution, volumeEvolution in zip(pks, glacierIndexes, years, areas, massBalanceEvolutions, volumeEvolutions)]
 
-                self._massBalanceSwissWideCounter += 1
+        self._writeRows(rows)
 
-        except Exception as exception:
+    def _writeRows(self, rows):
+        '''
+        Inserts the given rows not yet stored in one single transaction.
 
+        @type rows: list
+        @param rows: List of rows. Each row is a list of values in the order of _COLUMNS.
+        '''
+
+        try:
+            
+            rowsInserted = self._insertMissingRows(self._TABLE, self._COLUMNS, self._DUPLICATE_KEY, rows)
+            
+            if self._connection != None:
+                self._connection.commit()
+            
+            self._massBalanceSwissWideCounter += rowsInserted
+            
+            print("-> {0} of {1} mass balance swiss wide observations were not yet stored in the database.".format(rowsInserted, len(rows)), file=self._output)
+            
+        except Exception as exception:
+            
+            if self._connection != None and not self._connection.closed:
+                self._connection.rollback()
+            
             raise exception
 
         finally:
 
-            self._connection.close()
-
-        #print("\n")
-        #print("-> A total of {0} mass balance swiss wide observations were inserted into the database.".format(
-        #       self._massBalanceSwissWideCounter))
+            self.releaseConnection()
 
     def isGlacierMassBalanceSwissWideStored(self):
 
-        pass
\ No newline at end of file
+        pass
+
+    def _recordsToRows(self, glacier, records=None):
+        '''
+        Converting the mass balance swiss wide observations into rows of values in the order of _COLUMNS.
+        The glacier of a row is the glacier of the observation (fk_glacier).
+
+        @type glacier: dataflow.DataObjects.Glacier.Glacier
+        @param glacier: Glacier object with the mass balance swiss wide observations. Not used if the records are given.
+        @type records: iterable
+        @param records: dataflow.DataObjects.MassBalanceSwissWide.MassBalanceSwissWide objects to be converted. All observations of the glacier if not given.
+
+        @rtype: list
+        @return: List of rows. Each row is a list of values in the order of _COLUMNS.
+        '''
+
+        if records is None:
+            records = glacier.massBalanceSwissWide.values()
+
+        rows = list()
+
+        for massBalanceSwissWide in GlamosData.assignPks(records):
+
+            rows.append([
+                massBalanceSwissWide.pk,
+                massBalanceSwissWide.fk_glacier,
+                massBalanceSwissWide.year,
+                massBalanceSwissWide.area,
+                massBalanceSwissWide.mb_evolution,
+                massBalanceSwissWide.vol_evolution])
+
+        return rows
@@ -5,6 +5,9 @@ Created on 15.06.2018
 '''
 
 from .GlamosDatabaseWriter import GlamosDatabaseWriter
+from dataflow.DataObjects.Glamos import GlamosData
+from psycopg2 import Error
+from psycopg2.extras import execute_batch
 import logging
 
 class MassBalanceWriter(GlamosDatabaseWriter):
@@ -12,12 +15,43 @@ class MassBalanceWriter(GlamosDatabaseWriter):
     # TODO: classdocs
     
     Attributes:
+    _TABLE_MASS_BALANCE            string  Table of the seasonal mass balances
+    _COLUMNS_MASS_BALANCE          list    Columns of the seasonal mass balances written by the bulk mode and upsert
+    _NATURAL_KEY_MASS_BALANCE      list    Columns of the unique constraint identifying a seasonal mass balance
+    _SELECT_STORED_MASS_BALANCES_TEMPLATE string  Query of the stored mass balances of a glacier used by the upsert
+    _TABLE_ELEVATION_DISTRIBUTION  string  Table of the elevation bands of the mass balances
+    _COLUMNS_ELEVATION_DISTRIBUTION list   Columns of the elevation bands written by the bulk mode and upsert
+    _NATURAL_KEY_ELEVATION_DISTRIBUTION list Columns of the unique constraint identifying an elevation band
+    _RECORD_SAVEPOINT              string  Name of the savepoint of a single mass balance written by write()
     _massBalanceObservationCounter int  Counter of mass-balance observations written to the database
+    _massBalanceRejectedCounter    int  Counter of mass-balance observations rejected by the database in write()
     _elevationBandValidCounter     int  Counter of valid elevation bands written to the database
     _elevationBandInvalidCounter   int  Counter of invalid elevation bands not written to the database
     '''
 
+    _TABLE_MASS_BALANCE = "mass_balance.glacier_seasonal"
+    _COLUMNS_MASS_BALANCE = [
+        "pk", "fk_glacier", "fk_mass_balance_type", "fk_embargo_type", "fk_analysis_method",
+        "date_from_annual", "date_to_annual", "date_from_winter", "date_to_winter",
+        "area", "mass_balance_annual", "mass_balance_winter",
+        "equilibrium_line_altitude", "accumulation_area_ratio",
+        "elevation_minimum", "elevation_maximum", "remarks", "reference"]
+
+    _NATURAL_KEY_MASS_BALANCE = ["fk_glacier", "fk_mass_balance_type", "date_from_annual", "date_to_annual"]
+
+    _SELECT_STORED_MASS_BALANCES_TEMPLATE = "SELECT pk, {0} FROM {1} WHERE fk_glacier = %s;"
+
+    _TABLE_ELEVATION_DISTRIBUTION = "mass_balance.elevation_distribution"
+    _COLUMNS_ELEVATION_DISTRIBUTION = [
+        "pk", "fk_glacier_seasonal", "elevation_from", "elevation_to",
+        "mass_balance_annual", "mass_balance_winter", "area", "remarks",
+        "n_measurement_annual", "n_measurement_winter"]
+    _NATURAL_KEY_ELEVATION_DISTRIBUTION = ["fk_glacier_seasonal", "elevation_from", "elevation_to"]
+
+    _RECORD_SAVEPOINT = "glamos_mass_balance_record"
+
     _massBalanceObservationCounter = 0
+    _massBalanceRejectedCounter    = 0
     _elevationBandValidCounter     = 0
     _elevationBandInvalidCounter   = 0
 
@@ -37,6 +71,14 @@ class MassBalanceWriter(GlamosDatabaseWriter):
         
         return self._massBalanceObservationCounter
 
+    @property
+    def massBalanceObservationsRejected(self):
+        '''
+        Get the number of mass balances and their elevation bands rejected by the database in write().
+        '''
+        
+        return self._massBalanceRejectedCounter
+
     @property
     def elevationBandsValidWritten(self):
         # TODO: Description
@@ -56,85 +98,268 @@ class MassBalanceWriter(GlamosDatabaseWriter):
         return self._elevationBandValidCounter + self._elevationBandInvalidCounter
 
     def write(self, glacier):
-        # TODO: Description
+        '''
+        Writes all mass balances and valid elevation bands of the glacier into the database. Each mass balance
+        is written together with its valid elevation bands within a savepoint of the glacier transaction. A mass
+        balance rejected by the database (e.g. an invalid value or a constraint violation) is reported and rolled
+        back to its savepoint, the other mass balances of the glacier are written and committed.
         
-        # TODO: Loop over all mass balances
+        @type glacier: DataObjects.Glacier.Glacier
+        @param glacier: Glacier with the mass balances to be written.
+        '''
+        
+        massBalanceRows, elevationBandRows, elevationBandInvalidCounter = self._massBalancesToRows(glacier)
+        
+        # Grouping the elevation bands by the primary key of their mass balance.
+        elevationBandRowsOfMassBalance = dict()
+        for elevationBandRow in elevationBandRows:
+            elevationBandRowsOfMassBalance.setdefault(str(elevationBandRow[1]), list()).append(
+                [self._parameterValue(value) for value in elevationBandRow])
+        
+        massBalanceStatement = self._insertStatement(self._TABLE_MASS_BALANCE, self._COLUMNS_MASS_BALANCE)
+        elevationBandStatement = self._insertStatement(self._TABLE_ELEVATION_DISTRIBUTION, self._COLUMNS_ELEVATION_DISTRIBUTION)
+        
+        massBalanceCounter = 0
+        elevationBandValidCounter = 0
+        massBalanceRejectedCounter = 0
         
-            # TODO: Check if length change is already stored in the database.
-            # statement = SELECT * FROM mass_balance.mass_balance WHERE fk_something = glacier.fk_something
-            # if GlamosDatabaseWriter.isRecordStored(statement) == True:
-                # TODO: Insert mass balance if not in database. 
-                # writeData(insertStatement)
-            # else:
-            #     writeLoggerInformation
-
         try:
             
-            for massBalance in glacier.massBalances.values():
-                
-                # TODO: Getting the hard coded column names into the header or an external lookup file.
-                statement = "INSERT INTO mass_balance.glacier_seasonal (pk, fk_glacier, fk_mass_balance_type, fk_embargo_type, fk_analysis_method, date_from_annual, date_to_annual, date_from_winter, date_to_winter, area, mass_balance_annual, mass_balance_winter, equilibrium_line_altitude, accumulation_area_ratio, elevation_minimum, elevation_maximum, remarks, reference) VALUES ('{0}', '{1}', {2}, {3}, {4}, '{5}', '{6}', '{7}', '{8}', {9}, {10}, {11}, {12}, {13}, {14}, {15}, {16}, '{17}');".format(
-                    massBalance.pk,
-                    glacier.pk,
-                    massBalance.massBalanceType.value,
-                    0,
-                    massBalance.analysisMethodType.value,
-                    massBalance.dateFromAnnual,
-                    massBalance.dateToAnnual,
-                    massBalance.dateFromWinter,
-                    massBalance.dateToWinter,
-                    massBalance.surface,
-                    massBalance.annualMassBalance,
-                    massBalance.winterMassBalance,
-                    massBalance.equilibriumLineAltitude,
-                    massBalance.accumulationAreaRatio,
-                    massBalance.elevationMinimum,
-                    massBalance.elevationMaximum,
-                    'NULL',
-                    massBalance.dataSource
-                    )
+            with self._borrowConnection().cursor() as cursor:
                 
-                self._writeData(statement)
-                self._connection.commit()
-                
-                self._massBalanceObservationCounter += 1
-                
-                # Inserting all the altitude buckets into the database.
-                for elevationBand in massBalance.elevationBands.values():
-                    #print (elevationBand)
-                    # Only valid elevation buckets into the database.
-                    if elevationBand.elevationFrom != None and elevationBand.elevationTo != None and elevationBand.annualMassBalance != None and elevationBand.winterMassBalance != None and elevationBand.surface:
+                for massBalanceRow in massBalanceRows:
+                    
+                    bandRows = elevationBandRowsOfMassBalance.get(str(massBalanceRow[0]), list())
+                    
+                    cursor.execute("SAVEPOINT {0};".format(self._RECORD_SAVEPOINT))
+                    
+                    try:
+                        cursor.execute(massBalanceStatement, [self._parameterValue(value) for value in massBalanceRow])
+                        execute_batch(cursor, elevationBandStatement, bandRows, page_size=self._BATCH_SIZE)
+                        
+                    except Error as error:
+                        
+                        cursor.execute("ROLLBACK TO SAVEPOINT {0};".format(self._RECORD_SAVEPOINT))
+                        
+                        errorMessage = "Mass balance {0} to {1} of glacier {2} not written: {3}".format(
+                            massBalanceRow[5], massBalanceRow[6], glacier.name, str(error).strip())
+                        print(errorMessage, file=self._output)
+                        logging.error(errorMessage)
                         
-                        # TODO: Getting the hard coded column names into the header or an external lookup file.
-                        elevationBandStatement = "INSERT INTO mass_balance.elevation_distribution (pk, fk_glacier_seasonal, elevation_from, elevation_to, mass_balance_annual, mass_balance_winter, area, remarks, n_measurement_annual, n_measurement_winter) VALUES ('{0}', '{1}', {2}, {3}, {4}, {5}, {6},'',{7},{8})".format(
-                            elevationBand.pk, massBalance.pk, 
-                            elevationBand.elevationFrom, elevationBand.elevationTo, 
-                            elevationBand.annualMassBalance,
-                            elevationBand.winterMassBalance,
-                            elevationBand.surface,
-                            elevationBand.n_meas_annual,
-                            elevationBand.n_meas_winter)
-                        #print(elevationBandStatement)
-                        self._writeData(elevationBandStatement)
-                        self._connection.commit()
-                        self._elevationBandValidCounter += 1
-                        #print(elevationBandStatement)
+                        massBalanceRejectedCounter += 1
                         
                     else:
-                        message = "Incomplete elevation band: {0}".format(elevationBand)
-                        logging.info(message)
+                        cursor.execute("RELEASE SAVEPOINT {0};".format(self._RECORD_SAVEPOINT))
                         
-                        if logging.getLogger().getEffectiveLevel() == logging.DEBUG:
-                            print(message)
-                            
-                        self._elevationBandInvalidCounter += 1
+                        massBalanceCounter += 1
+                        elevationBandValidCounter += len(bandRows)
+            
+            self._connection.commit()
+            
+            self._massBalanceObservationCounter += massBalanceCounter
+            self._massBalanceRejectedCounter += massBalanceRejectedCounter
+            self._elevationBandValidCounter += elevationBandValidCounter
+            self._elevationBandInvalidCounter += elevationBandInvalidCounter
+        
+        except Exception as exception:
+            
+            if self._connection != None and not self._connection.closed:
+                self._connection.rollback()
+            
+            raise exception
+        
+        finally:
+            
+            self.releaseConnection()
 
+    def writeBulk(self, glacier):
+        '''
+        Bulk mode of write(). All mass balances and valid elevation bands of the glacier are streamed
+        by COPY FROM STDIN into the database and committed in one single transaction. In contrast to
+        write(), a single mass balance rejected by the database rolls back the whole glacier: nothing of
+        the glacier is written and the counters are not changed.
+        
+        @type glacier: DataObjects.Glacier.Glacier
+        @param glacier: Glacier with the mass balances to be written.
+        '''
+        
+        massBalanceRows, elevationBandRows, elevationBandInvalidCounter = self._massBalancesToRows(glacier)
+        
+        try:
+            
+            massBalanceCounter = self._copyRows(self._TABLE_MASS_BALANCE, self._COLUMNS_MASS_BALANCE, massBalanceRows)
+            elevationBandValidCounter = self._copyRows(self._TABLE_ELEVATION_DISTRIBUTION, self._COLUMNS_ELEVATION_DISTRIBUTION, elevationBandRows)
+            
+            if self._connection != None:
+                self._connection.commit()
+            
+            self._massBalanceObservationCounter += massBalanceCounter
+            self._elevationBandValidCounter += elevationBandValidCounter
+            self._elevationBandInvalidCounter += elevationBandInvalidCounter
+        
         except Exception as exception:
             
+            if self._connection != None and not self._connection.closed:
+                self._connection.rollback()
+            
             raise exception
         
         finally:
             
-            self._connection.close()
+            self.releaseConnection()
+
+    def upsert(self, glacier):
+        '''
+        Upsert of all mass balances and valid elevation bands of the glacier. Mass balances are identified
+        by their natural key _NATURAL_KEY_MASS_BALANCE, elevation bands by the stored mass balance and
+        _NATURAL_KEY_ELEVATION_DISTRIBUTION. New records are inserted, changed records are updated, all
+        in one single transaction. Elevation bands of already stored mass balances are attached to the
+        stored mass balance.
+        
+        @type glacier: DataObjects.Glacier.Glacier
+        @param glacier: Glacier with the mass balances to be written.
+        '''
+        
+        massBalanceRows, elevationBandRows, elevationBandInvalidCounter = self._massBalancesToRows(glacier)
+        
+        try:
+            
+            massBalanceResults = self._upsertRows(self._TABLE_MASS_BALANCE, self._COLUMNS_MASS_BALANCE, self._NATURAL_KEY_MASS_BALANCE, massBalanceRows)
+            
+            # Getting the primary keys of all stored mass balances of the glacier to link the elevation bands.
+            storedMassBalancePks = dict()
+            
+            cursor = self._borrowConnection().cursor()
+            cursor.execute(self._SELECT_STORED_MASS_BALANCES_TEMPLATE.format(
+                ", ".join(self._NATURAL_KEY_MASS_BALANCE), self._TABLE_MASS_BALANCE), (str(glacier.pk),))
+            
+            for storedMassBalance in cursor:
+                storedMassBalancePks[self._naturalKey(storedMassBalance[1:])] = storedMassBalance[0]
+            
+            cursor.close()
+            
+            keyIndices = [self._COLUMNS_MASS_BALANCE.index(keyColumn) for keyColumn in self._NATURAL_KEY_MASS_BALANCE]
+            
+            massBalancePks = dict()
+            for massBalanceRow in massBalanceRows:
+                naturalKey = self._naturalKey([massBalanceRow[keyIndex] for keyIndex in keyIndices])
+                massBalancePks[str(massBalanceRow[0])] = storedMassBalancePks.get(naturalKey, massBalanceRow[0])
+            
+            for elevationBandRow in elevationBandRows:
+                elevationBandRow[1] = massBalancePks[str(elevationBandRow[1])]
+            
+            elevationBandResults = self._upsertRows(self._TABLE_ELEVATION_DISTRIBUTION, self._COLUMNS_ELEVATION_DISTRIBUTION, self._NATURAL_KEY_ELEVATION_DISTRIBUTION, elevationBandRows)
+            
+            self._connection.commit()
+            
+            self._massBalanceObservationCounter += massBalanceResults[0] + massBalanceResults[1]
+            self._elevationBandValidCounter += elevationBandResults[0] + elevationBandResults[1]
+            self._elevationBandInvalidCounter += elevationBandInvalidCounter
+            
+            self._recordsInsertedCounter += massBalanceResults[0] + elevationBandResults[0]
+            self._recordsUpdatedCounter += massBalanceResults[1] + elevationBandResults[1]
+            self._recordsUnchangedCounter += massBalanceResults[2] + elevationBandResults[2]
+            
+            print("-> {0}: {1} records inserted, {2} updated, {3} unchanged.".format(self._TABLE_MASS_BALANCE, *massBalanceResults), file=self._output)
+            print("-> {0}: {1} records inserted, {2} updated, {3} unchanged.".format(self._TABLE_ELEVATION_DISTRIBUTION, *elevationBandResults), file=self._output)
+        
+        except Exception as exception:
+            
+            if self._connection != None and not self._connection.closed:
+                self._connection.rollback()
+            
+            raise exception
+        
+        finally:
+            
+            self.releaseConnection()
+
+    def _massBalancesToRows(self, glacier):
+        '''
+        Converting the mass balances and the valid elevation bands of the glacier into rows of values in the
+        order of _COLUMNS_MASS_BALANCE and _COLUMNS_ELEVATION_DISTRIBUTION. Invalid elevation bands are counted only.
+        
+        @type glacier: DataObjects.Glacier.Glacier
+        @param glacier: Glacier with the mass balances.
+        
+        @rtype: tuple
+        @return: Rows of the mass balances, rows of the valid elevation bands, number of invalid elevation bands.
+        '''
+        
+        massBalanceRows = list()
+        elevationBandRows = list()
+        elevationBandInvalidCounter = 0
+        
+        for massBalance in GlamosData.assignPks(glacier.massBalances.values()):
             
-            
\ No newline at end of file
+            massBalanceRows.append([
+                massBalance.pk,
+                glacier.pk,
+                massBalance.massBalanceType,
+                0,
+                massBalance.analysisMethodType,
+                massBalance.dateFromAnnual,
+                massBalance.dateToAnnual,
+                massBalance.dateFromWinter,
+                massBalance.dateToWinter,
+                massBalance.surface,
+                massBalance.annualMassBalance,
+                massBalance.winterMassBalance,
+                massBalance.equilibriumLineAltitude,
+                massBalance.accumulationAreaRatio,
+                massBalance.elevationMinimum,
+                massBalance.elevationMaximum,
+                None,
+                massBalance.dataSource])
+            
+            for elevationBand in GlamosData.assignPks(massBalance.elevationBands.values()):
+                
+                # Only valid elevation buckets into the database.
+                if self._isValidElevationBand(elevationBand):
+                    
+                    elevationBandRows.append([
+                        elevationBand.pk, massBalance.pk,
+                        elevationBand.elevationFrom, elevationBand.elevationTo,
+                        elevationBand.annualMassBalance,
+                        elevationBand.winterMassBalance,
+                        elevationBand.surface,
+                        "",
+                        elevationBand.n_meas_annual,
+                        elevationBand.n_meas_winter])
+                    
+                else:
+                    message = "Incomplete elevation band: {0}".format(elevationBand)
+                    logging.info(message)
+                    
+                    if logging.getLogger().getEffectiveLevel() == logging.DEBUG:
+                        print(message, file=self._output)
+                    
+                    elevationBandInvalidCounter += 1
+        
+        return massBalanceRows, elevationBandRows, elevationBandInvalidCounter
+
+    def _naturalKey(self, values):
+        '''
+        Normalising the values of a natural key to compare values of the parsed objects with stored values.
+        
+        @type values: list
+        @param values: Values of the natural key.
+        
+        @rtype: tuple
+        @return: Comparable representation of the natural key.
+        '''
+        
+        return tuple([str(self._parameterValue(value)) for value in values])
+
+    def _isValidElevationBand(self, elevationBand):
+        '''
+        Check if an elevation band is complete enough to be written into the database.
+        
+        @type elevationBand: DataObjects.MassBalance.ElevationBand
+        @param elevationBand: Elevation band to be checked.
+        
+        @rtype: boolean
+        @return: True if elevation range, annual and winter mass balance and surface are available.
+        '''
+        
+        return elevationBand.elevationFrom != None and elevationBand.elevationTo != None and elevationBand.annualMassBalance != None and elevationBand.winterMassBalance != None and elevationBand.surface
@@ -5,17 +5,30 @@ Created on 11.07.2018
 '''
 
 from dataflow.DataWriters.DatabaseWriters.GlamosDatabaseWriter import GlamosDatabaseWriter
+from dataflow.DataObjects.Glamos import GlamosData
 from dataflow.DataObjects.Enumerations.DataEnumerations import DataEmbargoTypeEnum
-import logging
 
 class VolumeChangeWriter(GlamosDatabaseWriter):
     '''
     # TODO: classdocs
     
     Attributes:
+    _TABLE          string  Table of the volume change observations
+    _COLUMNS        list    Columns of the volume change observations written
+    _DUPLICATE_KEY  list    Columns defining a duplicate of a stored volume change observation
+    _NATURAL_KEY    list    Columns of the unique constraint identifying a volume change observation
     _volumeChangeObservationCounter int  Counter of volume change observations written to the database
     '''
 
+    _TABLE = "volume_change.volume_change"
+    _COLUMNS = [
+        "pk", "fk_glacier", "date_from", "date_to", "area_from", "area_to",
+        "fk_height_capture_method_from", "fk_height_capture_method_to", "fk_analysis_method",
+        "elevation_maximum_from", "elevation_minimum_from", "elevation_maximum_to", "elevation_minimum_to",
+        "volume_change", "height_change_mean", "fk_data_embargo_type", "fk_date_from_quality", "fk_date_to_quality"]
+    _NATURAL_KEY = ["fk_glacier", "date_from", "date_to"]
+    _DUPLICATE_KEY = _NATURAL_KEY
+
     _volumeChangeObservationCounter = 0
 
 
@@ -43,66 +56,77 @@ class VolumeChangeWriter(GlamosDatabaseWriter):
         '''
         Writes all volume change observations of the given glacier into the database.
         
+        The duplicate detection is done set-based for all observations of the glacier. A unique
+        data record is defined by the following factors:
+        - The same glacier (fk_glacier)
+        - The same start date of the observation (date_from)
+        - The same end date of the observation (date_to)
+        Only the observations not yet stored are inserted, all in one single transaction.
+        
         @type glacier: DataObjects.Glacier.Glacier
         @param glacier: Glacier with volume change observations to be written into the database.
         '''
         
-        try:
+        rows = self._recordsToRows(glacier)
         
-            for volumeChange in glacier.volumeChanges.values():
-                
-                # Check if volume change is already stored in the database.
-                # The statement has to describe a SELECT which returns a unique record based on the definition of the record set.
-                # In case the length-change data the following factors define a unique data record:
-                # - The same glacier (fk_glacier)
-                # - The same start date of the observation (date_from)
-                # - The same end date of the observation (date_to) 
-                checkStatement = "SELECT * FROM {0} WHERE fk_glacier = '{1}' AND date_from = '{2}' AND date_to = '{3}';".format(
-                    'volume_change.volume_change',
-                    glacier.pk,
-                    volumeChange.dateFrom,
-                    volumeChange.dateTo)
-        
-                # Record is already in database. No further inserts needed.
-                if super().isRecordStored(checkStatement) == True:
-                    
-                    message = "The record {0} is already stored in the database. No further inserts.".format(str(volumeChange))
-                    print(message)
-                
-                # Record is already in database. No further inserts needed.
-                else:
-                    
-                    message = "The record {0} is not yet stored in the database. Insert will be done ...".format(str(volumeChange))
-                    print(message)
-                    
-                    # Handling of not yet implemented values:
-                    dataEmbargoType = DataEmbargoTypeEnum.Public
-                               
-                    statement = "INSERT INTO volume_change.volume_change (pk, fk_glacier, date_from, date_to, area_from, area_to, fk_height_capture_method_from, fk_height_capture_method_to, fk_analysis_method, elevation_maximum_from, elevation_minimum_from, elevation_maximum_to, elevation_minimum_to, volume_change, height_change_mean, fk_data_embargo_type, fk_date_from_quality, fk_date_to_quality) VALUES ('{0}', '{1}', '{2}', '{3}', {4}, {5}, {6}, {7}, {8}, {9}, {10}, {11}, {12}, {13}, {14}, {15}, {16}, {17});".format(
-                        volumeChange.pk,
-                        glacier.pk,
-                        volumeChange.dateFrom, volumeChange.dateTo,
-                        volumeChange.areaFrom, volumeChange.areaTo,
-                        volumeChange.heightCaptureMethodFrom.value, volumeChange.heightCaptureMethodTo.value,
-                        volumeChange.analysisMethod.value,
-                        volumeChange.elevationMaximumFrom, volumeChange.elevationMinimumFrom,
-                        volumeChange.elevationMaximumTo, volumeChange.elevationMinimumTo,
-                        volumeChange.volumeChange,
-                        volumeChange.heightChangeMean,
-                        dataEmbargoType.value,
-                        volumeChange.dateFromQuality.value,
-                        volumeChange.dateToQuality.value)
-    
-                    self._writeData(statement)
-                    self._connection.commit()
-                    
-                    self._volumeChangeObservationCounter += 1
+        try:
+            
+            rowsInserted = self._insertMissingRows(self._TABLE, self._COLUMNS, self._DUPLICATE_KEY, rows)
+            
+            if self._connection != None:
+                self._connection.commit()
+            
+            self._volumeChangeObservationCounter += rowsInserted
+            
+            print("-> {0} of {1} volume change observations were not yet stored in the database.".format(rowsInserted, len(rows)), file=self._output)
         
         except Exception as exception:
             
+            if self._connection != None and not self._connection.closed:
+                self._connection.rollback()
+            
             raise exception
         
         finally:
             
-            self._connection.close()
-
+            self.releaseConnection()
+    
+    def _recordsToRows(self, glacier, records=None):
+        '''
+        Converting the volume change observations of the glacier into rows of values in the order of _COLUMNS.
+        
+        @type glacier: DataObjects.Glacier.Glacier
+        @param glacier: Glacier with volume change observations.
+        @type records: iterable
+        @param records: Records of the glacier to be converted. All volume change observations of the glacier if not given.
+        
+        @rtype: list
+        @return: List of rows. Each row is a list of values in the order of _COLUMNS.
+        '''
+        
+        if records is None:
+            records = glacier.volumeChanges.values()
+        
+        rows = list()
+        
+        # Handling of not yet implemented values:
+        dataEmbargoType = DataEmbargoTypeEnum.Public
+        
+        for volumeChange in GlamosData.assignPks(records):
+            
+            rows.append([
+                volumeChange.pk,
+                glacier.pk,
+                volumeChange.dateFrom, volumeChange.dateTo,
+                volumeChange.areaFrom, volumeChange.areaTo,
+                volumeChange.heightCaptureMethodFrom, volumeChange.heightCaptureMethodTo,
+                volumeChange.analysisMethod,
+                volumeChange.elevationMaximumFrom, volumeChange.elevationMinimumFrom,
+                volumeChange.elevationMaximumTo, volumeChange.elevationMinimumTo,
+                volumeChange.volumeChange,
+                volumeChange.heightChangeMean,
+                dataEmbargoType,
+                volumeChange.dateFromQuality,
+                volumeChange.dateToQuality])
+        
+        return rows
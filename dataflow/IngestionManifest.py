@@ -0,0 +1,210 @@
+'''
+Created on 18.10.2026
+
+@author: yvo
+
+Persistent manifest of the VAW data files already imported into the GLAMOS database.
+'''
+
+import datetime
+import hashlib
+import json
+import os
+
+class IngestionManifest(object):
+    '''
+    Manifest of the VAW data files imported by the insertDatabase* scripts. The manifest is stored as
+    JSON file (by default next to dataflow.cfg) and records for each imported file its size, modification
+    time, content hash and the number of records written into the database. For growing files imported in
+    append mode, the append state of the reader is recorded as well.
+
+    The entries are grouped by the name of the ingestion (e.g. the collection of the glacier filled by the
+    readers), as the same file can be imported by several scripts (e.g. daily and seasonal index data).
+
+    A file is unchanged if its size and modification time correspond to the recorded values. Only in case
+    of the same size but a different modification time (e.g. copied files), the content hash is compared.
+    An unchanged data tree is therefore checked without reading any file.
+
+    Attributes:
+        - DEFAULT_FILE_NAME       Default file name of the manifest, relative to the working directory of the scripts.
+        - _VERSION                Version of the format of the manifest file.
+        - _HASH_BLOCK_SIZE        Size in bytes of the blocks read for the content hash.
+        - _fullFileName           Full file name of the manifest file.
+        - _ingestions             Dictionary of all recorded files. Key: Name of ingestion; Value: Dictionary with the absolute file path as key and the recorded entry as value.
+    '''
+
+    DEFAULT_FILE_NAME = "ingestionManifest.json"
+
+    _VERSION = 1
+
+    _HASH_BLOCK_SIZE = 1 << 20
+
+    _fullFileName = None
+    _ingestions = None
+
+    @property
+    def fullFileName(self):
+        '''
+        Full file name of the manifest file.
+        '''
+        return self._fullFileName
+
+    def __init__(self, fullFileName=DEFAULT_FILE_NAME):
+        '''
+        Constructor of the manifest. An existing manifest file is loaded.
+
+        @type fullFileName: string
+        @param fullFileName: Full file name of the manifest file.
+
+        @raise ValueError: In case the existing manifest file is not a valid manifest.
+        '''
+
+        self._fullFileName = fullFileName
+        self._ingestions = dict()
+
+        if os.path.isfile(self._fullFileName):
+
+            with open(self._fullFileName, "r", encoding="utf-8") as manifestFile:
+                content = json.load(manifestFile)
+
+            if not isinstance(content, dict) or content.get("version") != self._VERSION:
+                raise ValueError("Manifest file {0} has an unknown format".format(self._fullFileName))
+
+            self._ingestions = content.get("ingestions", dict())
+
+    def signature(self, filePath):
+        '''
+        Gets the signature of the given file without its content hash.
+
+        @type filePath: string
+        @param filePath: Path of the data file.
+
+        @rtype: dict
+        @return: Dictionary with the absolute path, size and modification time (nanoseconds) of the file.
+        '''
+
+        fileStatus = os.stat(filePath)
+
+        return dict(path=os.path.abspath(filePath), size=fileStatus.st_size, mtime=fileStatus.st_mtime_ns)
+
+    def isUnchanged(self, ingestionName, filePath, signature=None):
+        '''
+        Checks if the given file was recorded by the ingestion and is unchanged since.
+
+        @type ingestionName: string
+        @param ingestionName: Name of the ingestion (e.g. massBalances).
+        @type filePath: string
+        @param filePath: Path of the data file.
+        @type signature: dict
+        @param signature: Signature of the file if already retrieved by signature().
+
+        @rtype: bool
+        @return: True if the file is recorded and unchanged.
+        '''
+
+        if signature == None:
+            signature = self.signature(filePath)
+
+        entry = self._ingestions.get(ingestionName, dict()).get(signature["path"])
+
+        if entry == None or entry["size"] != signature["size"]:
+            return False
+
+        if entry["mtime"] == signature["mtime"]:
+            return True
+
+        # Same size but touched: Only the content decides.
+        if entry["hash"] == IngestionManifest.contentHash(filePath):
+            entry["mtime"] = signature["mtime"]
+            return True
+        else:
+            return False
+
+    def record(self, ingestionName, filePath, recordsWritten, signature=None, appendState=None, contentHash=None):
+        '''
+        Records the given file as imported by the ingestion.
+
+        @type ingestionName: string
+        @param ingestionName: Name of the ingestion (e.g. massBalances).
+        @type filePath: string
+        @param filePath: Path of the data file.
+        @type recordsWritten: int
+        @param recordsWritten: Number of records of the file written into the database.
+        @type signature: dict
+        @param signature: Signature of the file taken before the parsing. Changes of the file during the import are detected by the next run.
+        @type appendState: dict
+        @param appendState: Optional append state of the reader (offset, prefixHash, lastDate) for the next import of the grown file.
+        @type contentHash: string
+        @param contentHash: Content hash of the bytes of the file parsed by the reader (e.g. VawFileReader.contentHash). Calculated if not given.
+        '''
+
+        if signature == None:
+            signature = self.signature(filePath)
+
+        if contentHash == None:
+            contentHash = IngestionManifest.contentHash(filePath)
+
+        entry = dict(signature)
+        entry["hash"] = contentHash
+        entry["records"] = recordsWritten
+        entry["ingested"] = datetime.datetime.now().isoformat(timespec="seconds")
+
+        if appendState != None:
+            entry["append"] = appendState
+
+        self._ingestions.setdefault(ingestionName, dict())[signature["path"]] = entry
+
+    def entry(self, ingestionName, filePath):
+        '''
+        Gets the recorded entry of the given file.
+
+        @type ingestionName: string
+        @param ingestionName: Name of the ingestion (e.g. massBalances).
+        @type filePath: string
+        @param filePath: Path of the data file.
+
+        @rtype: dict
+        @return: Recorded entry with path, size, mtime, hash, records, ingested and optionally append. None if the file is not recorded.
+        '''
+
+        return self._ingestions.get(ingestionName, dict()).get(os.path.abspath(filePath))
+
+    def save(self):
+        '''
+        Writes the manifest file. The file is replaced atomically, an interrupted run keeps the former manifest.
+        '''
+
+        temporaryFileName = self._fullFileName + ".tmp"
+
+        with open(temporaryFileName, "w", encoding="utf-8") as manifestFile:
+            json.dump(dict(version=self._VERSION, ingestions=self._ingestions), manifestFile, indent=1, sort_keys=True)
+
+        os.replace(temporaryFileName, self._fullFileName)
+
+    @staticmethod
+    def contentHash(filePath):
+        '''
+        Calculates the SHA-1 hash of the content of the given file.
+
+        @type filePath: string
+        @param filePath: Path of the data file.
+
+        @rtype: string
+        @return: Hexadecimal SHA-1 hash of the file content.
+        '''
+
+        contentHash = hashlib.sha1()
+
+        with open(filePath, "rb") as dataFile:
+            for block in iter(lambda: dataFile.read(IngestionManifest._HASH_BLOCK_SIZE), b""):
+                contentHash.update(block)
+
+        return contentHash.hexdigest()
+
+    def __len__(self):
+
+        return sum([len(files) for files in self._ingestions.values()])
+
+    def __str__(self):
+
+        return "Ingestion manifest {0}: {1} files recorded".format(self._fullFileName, len(self))
@@ -0,0 +1,491 @@
+'''
+Created on 18.10.2026
+
+@author: yvo
+
+Runner of the insertDatabase* scripts parsing the VAW data files of a directory in parallel.
+'''
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import argparse
+import io
+import os
+import sys
+import threading
+
+from dataflow.DataReaders.DatabaseConnectionPool import DatabaseConnectionPool
+
+class ParallelIngestionRunner(object):
+    '''
+    Runner importing all VAW data files of a directory into the GLAMOS database.
+
+    The parsing of the files is fanned out over a ProcessPoolExecutor with the given number of jobs.
+    Each worker process gets its own copy of the glaciers and of the configuration once at its start
+    and returns the reader with the parsed glacier to the main process. The parsed glaciers are written
+    by writers running in a thread pool of the main process, each writer borrows its own connection
+    of the DatabaseConnectionPool. The number of writing threads is therefore limited to the maximum
+    number of connections of the pool. Each writer prints into its own buffer (output of the writers),
+    the buffer is printed after the file is written.
+
+    With one job the files are parsed and written one after the other in the main process, as done
+    by the former scripts.
+
+    With an ingestion manifest (dataflow.IngestionManifest.IngestionManifest), files already imported
+    and unchanged since are skipped, unless the run is forced. Each successfully written file is recorded
+    in the manifest with the number of records of its collection and the content hash of the bytes parsed
+    (contentHash of the reader). The hash is calculated by the reader while parsing, in the worker process.
+
+    In append mode (readers of growing daily files only), the append state of each file is kept in the
+    manifest as well. A grown file is parsed from the recorded offset on and only the appended records are
+    written. The readers fall back to a full parsing in case the file was rewritten.
+
+    With a batch size (one job and readers with iterBatches() only), the files are streamed: The records
+    are not collected by the glacier but written batch by batch by writeBatches() of the writer, only one
+    batch of records is kept in memory.
+
+    The scripts keep printing their statistics by the callbacks given to run(). All callbacks are called
+    in the main process and never concurrently, the statistics of the workers can be aggregated
+    without additional locking:
+        - starting(inputFilePath): Before the parsing (one job) or after the parsing (several jobs) of a file.
+        - parsed(reader): After the parsing of a file, before the writing.
+        - written(reader, writer): After the writing of a file.
+
+    Attributes:
+        - _WRITE_METHOD_NAME        Default name of the method of the writers writing a glacier.
+        - _config                   Configuration of the dataflow.
+        - _readerClass              Class of the VAW file readers.
+        - _collectionName           Name of the collection of the glacier filled by the readers (e.g. massBalances).
+        - _writerClass              Class of the database writers.
+        - _accessConfiguration      Full file name of the database access configuration of the writers.
+        - _jobs                     Number of worker processes parsing files.
+        - _writerThreads            Number of threads writing files, at most the maximum number of connections of the pool.
+        - _writeMethodName          Name of the method of the writers writing a glacier (e.g. write, writeBulk).
+        - _handledErrors            Tuple of exceptions printed by their message without aborting the run.
+        - _manifest                 Ingestion manifest of the imported files. None if all files are imported.
+        - _force                    True if all files are imported regardless of the manifest.
+        - _append                   True if grown files are parsed from the offset recorded in the manifest on.
+        - _batchSize                Number of data lines parsed and written per batch when streaming the files. None if the files are parsed entirely.
+        - _signatures               Signatures of the files taken before parsing. Key: Path of file; Value: Signature
+        - _callbackLock             Lock serialising the callbacks of the writing threads.
+        - _workerState              Configuration, glaciers and reader declaration of a worker process.
+    '''
+
+    _WRITE_METHOD_NAME = "write"
+
+    _config = None
+    _readerClass = None
+    _collectionName = None
+    _writerClass = None
+    _accessConfiguration = None
+    _jobs = 1
+    _writerThreads = 1
+    _writeMethodName = _WRITE_METHOD_NAME
+    _handledErrors = tuple()
+    _manifest = None
+    _force = False
+    _append = False
+    _batchSize = None
+    _signatures = None
+    _callbackLock = None
+
+    _workerState = None
+
+    @staticmethod
+    def parseArguments(description, appendable=False, streamable=False, bulk=False, columnar=False, accessConfiguration=None):
+        '''
+        Parses the command line arguments of the insertDatabase* scripts.
+
+        By default the writers write all records of a file in one single transaction, a single record
+        rejected by the database rolls back all records of the file. Writers writing record by record by
+        default and skipping the rejected records only offer the option --bulk, which writes all records
+        of a file by COPY in one single transaction instead. The option --upsert writes by upsert() of the
+        writers and updates the stored records with changed values as well.
+
+        @type description: string
+        @param description: Description of the script.
+        @type appendable: bool
+        @param appendable: True if the readers of the script support the append mode (option --append).
+        @type streamable: bool
+        @param streamable: True if the readers and writers of the script support the streaming of batches (option --batch-size).
+        @type bulk: bool
+        @param bulk: True if the writers of the script write record by record by default and support the writing of all records by COPY in one transaction (option --bulk).
+        @type columnar: bool
+        @param columnar: True if the collection of the script is stored as columnar series by glaciers read with GlacierReader.columnarSeries (option --columnar-series).
+        @type accessConfiguration: string
+        @param accessConfiguration: Optional full file name of the database access configuration of the writers. More jobs than connections of its pool are rejected.
+
+        @rtype: argparse.Namespace
+        @return: Parsed arguments with the number of jobs (jobs), the forced import (force), the append mode (append, if appendable), the batch size (batch_size, if streamable), the bulk mode (bulk, if bulk), the columnar series (columnar_series, if columnar) and the upsert mode (upsert).
+        '''
+
+        parser = argparse.ArgumentParser(
+            description=description,
+            epilog="Records rejected by the database are skipped one by one: Only the bulk mode rolls back the whole data file." if bulk else
+                   "All records of a data file are written in one transaction: A single record rejected by the database rolls back the whole file.")
+        parser.add_argument("--jobs", type=int, default=1,
+                            help="Number of processes parsing the data files and of connections writing into the database (default: 1)")
+        parser.add_argument("--force", action="store_true",
+                            help="Import all data files, including the files recorded unchanged in the ingestion manifest")
+        parser.add_argument("--upsert", action="store_true",
+                            help="Update the stored records with changed values instead of inserting only the records not yet stored")
+        if appendable:
+            parser.add_argument("--append", action="store_true",
+                                help="Import only the lines appended to the data files since the last import")
+        if streamable:
+            parser.add_argument("--batch-size", type=int, default=None,
+                                help="Stream the data files by writing batches of the given number of data lines (only with --jobs 1)")
+        if bulk:
+            parser.add_argument("--bulk", action="store_true",
+                                help="Write all records of a data file by COPY in one transaction: A single record rejected by the database rolls back the whole file (faster)")
+
+        if columnar:
+            parser.add_argument("--columnar-series", action="store_true",
+                                help="Keep the parsed values of a glacier in typed arrays instead of one object per value (less memory)")
+
+        arguments = parser.parse_args()
+
+        if arguments.jobs < 1:
+            parser.error("--jobs has to be at least 1")
+
+        if accessConfiguration != None:
+            maximumConnections = DatabaseConnectionPool.maximumConnections(accessConfiguration)
+            if arguments.jobs > maximumConnections:
+                parser.error("--jobs is limited to the {0} connections of the database pool (maxConnections of the section [Pool] of {1})".format(
+                    maximumConnections, accessConfiguration))
+
+        if streamable and arguments.batch_size != None:
+            if arguments.batch_size < 1:
+                parser.error("--batch-size has to be at least 1")
+            if arguments.jobs > 1:
+                parser.error("--batch-size is only supported with --jobs 1")
+            if arguments.upsert:
+                parser.error("--batch-size is not supported with --upsert")
+
+        if bulk and arguments.bulk and arguments.upsert:
+            parser.error("--bulk is not supported with --upsert")
+
+        return arguments
+
+    def __init__(self, config, readerClass, collectionName, writerClass, accessConfiguration, jobs=1, writeMethodName=_WRITE_METHOD_NAME, handledErrors=tuple(), manifest=None, force=False, append=False, batchSize=None):
+        '''
+        Constructor of the runner.
+
+        @type config: configparser.ConfigParser
+        @param config: Configuration of the dataflow.
+        @type readerClass: type
+        @param readerClass: Class of the VAW file readers (constructor with config, file path and glaciers).
+        @type collectionName: string
+        @param collectionName: Name of the collection of the glacier filled by the readers. The collection is cleared before parsing.
+        @type writerClass: type
+        @param writerClass: Class of the database writers (constructor with the access configuration).
+        @type accessConfiguration: string
+        @param accessConfiguration: Full file name of the database access configuration of the writers.
+        @type jobs: int
+        @param jobs: Number of worker processes parsing files and threads writing files. The writing threads are limited to the maximum number of connections of the pool.
+        @type writeMethodName: string
+        @param writeMethodName: Name of the method of the writers writing a glacier (e.g. write, writeBulk).
+        @type handledErrors: tuple
+        @param handledErrors: Exceptions with message member printed without aborting the run (e.g. GlacierNotFoundError).
+        @type manifest: dataflow.IngestionManifest.IngestionManifest
+        @param manifest: Optional ingestion manifest to skip unchanged files and to record the imported files.
+        @type force: bool
+        @param force: True if all files are imported regardless of the manifest. The imported files are still recorded.
+        @type append: bool
+        @param append: True if grown files are parsed from the offset recorded in the manifest on. Needs a manifest and readers with resumeAfter().
+        @type batchSize: int
+        @param batchSize: Number of data lines parsed and written per batch. Needs one job, readers with iterBatches() and writers with writeBatches().
+
+        @raise ValueError: In case of a batch size with several jobs or with another write method than write().
+        '''
+
+        if batchSize != None and jobs > 1:
+            raise ValueError("Streaming of batches is only supported with one job")
+
+        if batchSize != None and writeMethodName != ParallelIngestionRunner._WRITE_METHOD_NAME:
+            raise ValueError("Streaming of batches is only supported by writeBatches() of the writers, not by {0}()".format(writeMethodName))
+
+        self._config = config
+        self._readerClass = readerClass
+        self._collectionName = collectionName
+        self._writerClass = writerClass
+        self._accessConfiguration = accessConfiguration
+        self._jobs = max(1, jobs)
+        self._writerThreads = min(self._jobs, DatabaseConnectionPool.maximumConnections(accessConfiguration))
+        self._writeMethodName = writeMethodName
+        self._handledErrors = tuple(handledErrors)
+        self._manifest = manifest
+        self._force = force
+        self._append = append and manifest != None
+        self._batchSize = batchSize
+        self._signatures = dict()
+        self._callbackLock = threading.Lock()
+
+    @property
+    def jobs(self):
+        '''
+        Number of worker processes parsing files.
+        '''
+        return self._jobs
+
+    @property
+    def writerThreads(self):
+        '''
+        Number of threads writing files, at most the maximum number of connections of the pool.
+        '''
+        return self._writerThreads
+
+    def run(self, dataDirectoryPath, glaciers, starting=None, parsed=None, written=None):
+        '''
+        Parses and writes all files of the given directory.
+
+        @type dataDirectoryPath: string
+        @param dataDirectoryPath: Directory with the VAW data files.
+        @type glaciers: Dictionary
+        @param glaciers: Dictionary of all glaciers stored in the database. Key: SGI-ID; Value: Glacier
+        @type starting: function
+        @param starting: Optional callback with the path of a file.
+        @type parsed: function
+        @param parsed: Optional callback with the reader after the parsing of a file.
+        @type written: function
+        @param written: Optional callback with the reader and the writer after the writing of a file.
+
+        @raise Exception: Exception of a reader or writer not part of the handled errors.
+        '''
+
+        inputFilePaths = [os.path.join(dataDirectoryPath, inputFileName) for inputFileName in os.listdir(dataDirectoryPath)]
+        inputFilePaths = [inputFilePath for inputFilePath in inputFilePaths if os.path.isfile(inputFilePath)]
+
+        if self._manifest != None:
+            inputFilePaths = self._filterUnchanged(inputFilePaths)
+
+        if self._jobs == 1:
+            self._runSerial(inputFilePaths, glaciers, starting, parsed, written)
+        else:
+            self._runParallel(inputFilePaths, glaciers, starting, parsed, written)
+
+    def _filterUnchanged(self, inputFilePaths):
+        '''
+        Takes the signatures of the files and removes the files recorded unchanged in the manifest. The files
+        are not read, the content hashes of the files to be imported are calculated by the readers. A file
+        changed during its import is recorded with the hash of the parsed content and detected by the next run.
+        '''
+
+        self._signatures = {inputFilePath: self._manifest.signature(inputFilePath) for inputFilePath in inputFilePaths}
+
+        if self._force:
+            changedFilePaths = inputFilePaths
+        else:
+            changedFilePaths = [inputFilePath for inputFilePath in inputFilePaths
+                                if not self._manifest.isUnchanged(self._collectionName, inputFilePath, self._signatures[inputFilePath])]
+
+            print("-> {0} of {1} files unchanged since the last import, skipped (use --force to import them).".format(
+                len(inputFilePaths) - len(changedFilePaths), len(inputFilePaths)))
+
+        return changedFilePaths
+
+    def _runSerial(self, inputFilePaths, glaciers, starting, parsed, written):
+        '''
+        Parses and writes the files one after the other in the main process.
+        '''
+
+        for inputFilePath in inputFilePaths:
+
+            self._callback(starting, inputFilePath)
+
+            if self._batchSize != None:
+                self._streamFile(glaciers, inputFilePath, parsed, written)
+                continue
+
+            reader, errorMessage = ParallelIngestionRunner._parseFile(
+                self._config, self._readerClass, self._collectionName, self._handledErrors, glaciers, inputFilePath,
+                self._getResumeState(inputFilePath))
+
+            if reader != None:
+                self._callback(parsed, reader)
+                self._writeFile(reader, written)
+            else:
+                print(errorMessage)
+
+    def _streamFile(self, glaciers, inputFilePath, parsed, written):
+        '''
+        Parses and writes the given file batch by batch in the main process. The parsed callback is called
+        before the first batch is parsed, the glacier of the reader stays empty.
+        '''
+
+        try:
+            reader = self._readerClass(self._config, inputFilePath, glaciers)
+
+            resumeState = self._getResumeState(inputFilePath)
+            if resumeState != None:
+                reader.resumeAfter(resumeState)
+
+            self._callback(parsed, reader)
+
+            writer = self._writerClass(self._accessConfiguration)
+
+            try:
+                recordsWritten = writer.writeBatches(reader.glacier, reader.iterBatches(self._batchSize))
+                self._callback(written, reader, writer)
+                self._callback(self._recordFile, reader, recordsWritten)
+            finally:
+                writer.releaseConnection()
+
+        except self._handledErrors as handledError:
+            print(handledError.message)
+
+    def _runParallel(self, inputFilePaths, glaciers, starting, parsed, written):
+        '''
+        Parses the files by a pool of worker processes and writes the parsed glaciers by a pool of threads.
+        '''
+
+        workerArguments = (self._config, self._readerClass, self._collectionName, self._handledErrors, glaciers)
+
+        with ProcessPoolExecutor(max_workers=self._jobs, initializer=ParallelIngestionRunner._initialiseWorker, initargs=workerArguments) as parsers, \
+             ThreadPoolExecutor(max_workers=self._writerThreads) as writers:
+
+            parsings = {parsers.submit(ParallelIngestionRunner._parseFileInWorker, inputFilePath, self._getResumeState(inputFilePath)): inputFilePath
+                        for inputFilePath in inputFilePaths}
+            writings = list()
+
+            for parsing in as_completed(parsings):
+
+                reader, errorMessage = parsing.result()
+
+                self._callback(starting, parsings[parsing])
+
+                if reader != None:
+                    self._callback(parsed, reader)
+                    writings.append(writers.submit(self._writeFile, reader, written, True))
+                else:
+                    print(errorMessage)
+
+            # Raising possible exceptions of the writers.
+            for writing in writings:
+                writing.result()
+
+    def _getResumeState(self, inputFilePath):
+        '''
+        Gets the append state of the former import of the given file recorded in the manifest.
+
+        @rtype: dict
+        @return: Append state to be given to the reader. None if the file has to be parsed entirely.
+        '''
+
+        if not self._append or self._force:
+            return None
+
+        entry = self._manifest.entry(self._collectionName, inputFilePath)
+
+        if entry == None:
+            return None
+        else:
+            return entry.get("append")
+
+    def _writeFile(self, reader, written, collectOutput=False):
+        '''
+        Writes the glacier of the given reader by a new writer with its own connection of the pool. The messages
+        of a writer running in a thread are collected by its output and printed at once after the writing.
+        '''
+
+        writer = self._writerClass(self._accessConfiguration)
+
+        try:
+            if not collectOutput:
+                getattr(writer, self._writeMethodName)(reader.glacier)
+            else:
+                writer.output = io.StringIO()
+                try:
+                    getattr(writer, self._writeMethodName)(reader.glacier)
+                finally:
+                    self._callback(sys.stdout.write, writer.output.getvalue())
+
+            self._callback(written, reader, writer)
+            self._callback(self._recordFile, reader)
+        finally:
+            writer.releaseConnection()
+
+    def _recordFile(self, reader, recordsWritten=None):
+        '''
+        Records the written file of the given reader in the manifest. The manifest file is saved after each
+        file to keep the progress of an interrupted run. The number of records written is taken from the
+        collection of the glacier unless given (streamed files).
+        '''
+
+        if self._manifest != None:
+
+            inputFilePath = reader.fullFileName
+
+            if recordsWritten == None:
+                recordsWritten = len(getattr(reader.glacier, self._collectionName))
+
+            appendState = None
+
+            if self._append:
+                appendState = reader.appendState
+
+                # Only the appended records were written, the records of the former imports are added.
+                if reader.appendedOnly:
+                    recordsWritten += self._manifest.entry(self._collectionName, inputFilePath)["records"]
+
+            self._manifest.record(
+                self._collectionName, inputFilePath, recordsWritten, self._signatures.get(inputFilePath), appendState,
+                reader.contentHash)
+            self._manifest.save()
+
+    def _callback(self, callback, *arguments):
+        '''
+        Calls the given callback of the script. The callbacks are never called concurrently.
+        '''
+
+        if callback != None:
+            with self._callbackLock:
+                callback(*arguments)
+
+    @staticmethod
+    def _initialiseWorker(config, readerClass, collectionName, handledErrors, glaciers):
+        '''
+        Initialisation of a worker process with its copy of the configuration and the glaciers.
+        '''
+
+        ParallelIngestionRunner._workerState = (config, readerClass, collectionName, handledErrors, glaciers)
+
+    @staticmethod
+    def _parseFileInWorker(inputFilePath, resumeState):
+        '''
+        Parses the given file in a worker process. Not handled errors are given to the main process as
+        RuntimeError, the exceptions of the dataflow are not picklable.
+        '''
+
+        try:
+            return ParallelIngestionRunner._parseFile(*ParallelIngestionRunner._workerState, inputFilePath, resumeState)
+        except Exception as e:
+            raise RuntimeError("{0}: {1}: {2}".format(inputFilePath, type(e).__name__, getattr(e, "message", e)))
+
+    @staticmethod
+    def _parseFile(config, readerClass, collectionName, handledErrors, glaciers, inputFilePath, resumeState=None):
+        '''
+        Parses the given file.
+
+        The glacier object is still alive and could have objects of a parsing process before. To have a
+        redundancy free insert into the database, the collection of the glacier is cleared before parsing.
+        With an append state of a former import, the reader parses only the lines appended since.
+
+        @rtype: tuple
+        @return: Reader with the parsed glacier and None or None and the message of a handled error.
+        '''
+
+        try:
+            reader = readerClass(config, inputFilePath, glaciers)
+
+            getattr(reader.glacier, collectionName).clear()
+
+            if resumeState != None:
+                reader.resumeAfter(resumeState)
+
+            reader.parse()
+
+            return reader, None
+
+        # The handled errors are not picklable, only their message is returned to the main process.
+        except handledErrors as handledError:
+            return None, handledError.message
@@ -0,0 +1,193 @@
+'''
+Created on 18.10.2026
+
+@author: yvo
+
+Benchmark reporting the memory in bytes per record of the high-volume data objects:
+- baseline: the data objects of the given git revision (e.g. the revision before __slots__)
+- current: the data objects of the working tree
+
+The data objects of the baseline revision are exported by git archive into a temporary directory and
+measured by a second run of this script importing the exported dataflow package. The records are created
+with the same synthetic values by both runs. The memory is measured by tracemalloc and includes the values.
+
+Usage: python benchmarkDataObjectMemory.py [--baseline <git revision>] [--records <number of records>]
+'''
+
+from dataflow.DataObjects.MassBalance import ElevationBand
+from dataflow.DataObjects.MassBalanceIndexTimeDaily import MassBalanceIndexTimeDaily
+from dataflow.DataObjects.MassBalanceIndexSpatialDaily import MassBalanceIndexSpatialDaily
+from dataflow.DataObjects.MassBalancePoint import MassBalancePoint
+from dataflow.DataObjects.MassBalanceSwissWide import MassBalanceSwissWide
+
+import argparse
+import datetime
+import gc
+import io
+import json
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+import tracemalloc
+import uuid
+
+NUMBER_RECORDS = 100000
+
+START_DATE = datetime.date(2000, 10, 1)
+
+GLACIER_PK = uuid.uuid1()
+
+def createElevationBand(index):
+
+    return ElevationBand(None, 2000 + index % 40 * 50, 2050 + index % 40 * 50, -1000 - index % 700, 12, -2000 - index % 900, 15, 0.125 + index % 13)
+
+def createMassBalanceIndexTimeDaily(index):
+
+    return MassBalanceIndexTimeDaily(
+        None, "P0", START_DATE + datetime.timedelta(days=index % 20000), 46.8 + index % 7, 8.9 + index % 3, 2700.0 + index % 100,
+        -index % 5000, index % 3000, -index % 4000, 1, 0.5 + index % 11, 1.5 + index % 17, "VAW / ETHZ")
+
+def createMassBalanceIndexSpatialDaily(index):
+
+    return MassBalanceIndexSpatialDaily(
+        None, "clariden", START_DATE + datetime.timedelta(days=index % 20000), None, None, None,
+        -index % 5000, index % 3000, -index % 4000, None, 0.5 + index % 11, 1.5 + index % 17, "VAW / ETHZ")
+
+def createMassBalancePoint(index):
+
+    return MassBalancePoint(
+        None, "P{0}".format(index % 50), 1,
+        START_DATE + datetime.timedelta(days=index % 20000), None, START_DATE + datetime.timedelta(days=index % 20000 + 200), None,
+        200.0, 1, 46.8 + index % 7, 8.9 + index % 3, 2700.0 + index % 100, 1,
+        -index % 3000, 900, 1, -index % 2700, 1, 1, 50, 20, 10, "VAW")
+
+def createMassBalanceSwissWide(index):
+
+    return MassBalanceSwissWide("A50i/19", GLACIER_PK, 1900 + index % 120, 5.0 + index % 7, -0.5 - index % 3, -0.01 - index % 5)
+
+RECORD_FACTORIES = [
+    ("ElevationBand",                createElevationBand),
+    ("MassBalanceIndexTimeDaily",    createMassBalanceIndexTimeDaily),
+    ("MassBalanceIndexSpatialDaily", createMassBalanceIndexSpatialDaily),
+    ("MassBalancePoint",             createMassBalancePoint),
+    ("MassBalanceSwissWide",         createMassBalanceSwissWide)]
+
+def measureBytesPerRecord(createRecord, numberRecords):
+    '''
+    Measuring the memory of the given number of records.
+
+    @type createRecord: function
+    @param createRecord: Function creating the record of the given index.
+    @type numberRecords: int
+    @param numberRecords: Number of records created.
+
+    @rtype: float
+    @return: Memory in bytes per record.
+    '''
+
+    gc.collect()
+    tracemalloc.start()
+
+    records = [createRecord(index) for index in range(numberRecords)]
+
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del records
+
+    return memory / numberRecords
+
+def measureDataObjects(numberRecords):
+    '''
+    Measuring the memory of all high-volume data objects of the imported dataflow package.
+
+    @type numberRecords: int
+    @param numberRecords: Number of records created per data object.
+
+    @rtype: dict
+    @return: Memory in bytes per record. Key: Name of the data object; Value: Bytes per record
+    '''
+
+    return {name: measureBytesPerRecord(createRecord, numberRecords) for name, createRecord in RECORD_FACTORIES}
+
+def measureRevision(revision, numberRecords):
+    '''
+    Measuring the memory of the data objects of the given git revision in a separate process.
+
+    @type revision: string
+    @param revision: Git revision of the repository of this script.
+    @type numberRecords: int
+    @param numberRecords: Number of records created per data object.
+
+    @rtype: dict
+    @return: Memory in bytes per record. Key: Name of the data object; Value: Bytes per record
+    '''
+
+    repositoryPath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    with tempfile.TemporaryDirectory() as exportPath:
+
+        archive = subprocess.run(["git", "archive", "--format=tar", revision, "dataflow"], cwd=repositoryPath, capture_output=True, check=True)
+
+        with tarfile.open(fileobj=io.BytesIO(archive.stdout)) as archiveFile:
+            archiveFile.extractall(exportPath)
+
+        # The script of the working tree imports the dataflow package of the revision.
+        measurement = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--records", str(numberRecords), "--json"],
+            env=dict(os.environ, PYTHONPATH=exportPath), cwd=exportPath, capture_output=True, text=True, check=True)
+
+    return json.loads(measurement.stdout)
+
+def benchmarkDataObjectMemory(numberRecords, baselineRevision=None):
+    '''
+    Running the benchmark of all high-volume data objects.
+
+    @type numberRecords: int
+    @param numberRecords: Number of records created per data object and layout.
+    @type baselineRevision: string
+    @param baselineRevision: Optional git revision with the data objects to be compared with.
+    '''
+
+    currentBytes = measureDataObjects(numberRecords)
+
+    if baselineRevision == None:
+
+        print("-> {0:<30}: {1:>15}".format("Data object", "current"))
+
+        for name, bytesCurrent in currentBytes.items():
+            print("-> {0:<30}: {1:>9.0f} B/rec".format(name, bytesCurrent))
+
+        return
+
+    baselineBytes = measureRevision(baselineRevision, numberRecords)
+
+    print("-> {0:<30}: {1:>15} {2:>15} {3:>8}".format("Data object", baselineRevision, "current", "saved"))
+
+    for name, bytesCurrent in currentBytes.items():
+
+        bytesBaseline = baselineBytes[name]
+
+        print("-> {0:<30}: {1:>9.0f} B/rec {2:>9.0f} B/rec {3:>7.0%}".format(
+            name, bytesBaseline, bytesCurrent, 1.0 - bytesCurrent / bytesBaseline))
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description="Benchmark of the memory of the high-volume data objects.")
+    parser.add_argument("--baseline", default=None,
+                        help="Git revision of the data objects to be compared with (e.g. the revision before __slots__)")
+    parser.add_argument("--records", type=int, default=NUMBER_RECORDS,
+                        help="Number of records created per data object (default: {0})".format(NUMBER_RECORDS))
+    parser.add_argument("--json", action="store_true", help=argparse.SUPPRESS)
+
+    arguments = parser.parse_args()
+
+    if arguments.json:
+        print(json.dumps(measureDataObjects(arguments.records)))
+    else:
+        print("Memory of {0} records per data object:".format(arguments.records))
+
+        benchmarkDataObjectMemory(arguments.records, arguments.baseline)
@@ -0,0 +1,167 @@
+'''
+Created on 18.10.2026
+
+@author: yvo
+
+Benchmark comparing the rows per second of the different write paths of the GLAMOS database writers:
+- one str.format INSERT statement and commit per row (write path before the parameterised execution layer)
+- write(): set-based insert of the rows not yet stored (COPY into a candidate table and anti-join)
+- upsert(): multi-row INSERT ... ON CONFLICT statements
+- writeBatches(): set-based insert of the rows batch by batch
+
+All rows are written by the public methods of a MassBalanceIndexTimeDailyWriter into an unlogged copy of
+mass_balance.index_time_daily. The copy is dropped at the end, nothing is stored permanently.
+
+Usage: python benchmarkDatabaseWriters.py <database access configuration> [--rows <number of rows>]
+'''
+
+from dataflow.DataWriters.DatabaseWriters.MassBalanceIndexTimeDailyWriter import MassBalanceIndexTimeDailyWriter
+from dataflow.DataReaders.DatabaseConnectionPool import DatabaseConnectionPool
+from dataflow.DataObjects.Glacier import Glacier
+from dataflow.DataObjects.MassBalanceIndexTimeDaily import MassBalanceIndexTimeDaily
+
+import argparse
+import contextlib
+import datetime
+import io
+import time
+import uuid
+
+BENCHMARK_TABLE = "glamos_benchmark_index_time_daily"
+
+NUMBER_ROWS = 5000
+
+BATCH_SIZE = 1000
+
+class BenchmarkWriter(MassBalanceIndexTimeDailyWriter):
+    '''
+    Writer of mass balance index daily values into the benchmark table instead of mass_balance.index_time_daily.
+    '''
+
+    _TABLE = BENCHMARK_TABLE
+
+def createGlacier(numberRows):
+    '''
+    Creating a glacier with synthetic mass balance index daily values.
+
+    @type numberRows: int
+    @param numberRows: Number of daily values to be created.
+
+    @rtype: dataflow.DataObjects.Glacier.Glacier
+    @return: Glacier with the daily values.
+    '''
+
+    glacier = Glacier(uuid.uuid1(), 0, "benchmark", "benchmark")
+    startDate = datetime.date(2000, 10, 1)
+
+    for index in range(numberRows):
+        glacier.addMassBalanceIndexTimeDaily(MassBalanceIndexTimeDaily(
+            None, "benchmark", startDate + datetime.timedelta(days=index), None, None, None,
+            -index, index, -2 * index, 1, 0.5, 0.0, "benchmark"))
+
+    return glacier
+
+def executeStatement(connection, statement):
+    '''
+    Executing a single statement by the benchmark connection and committing it.
+
+    @type connection: connection
+    @param connection: Connection of the benchmark borrowed from the pool.
+    @type statement: string
+    @param statement: Statement to be executed.
+    '''
+
+    with connection.cursor() as cursor:
+        cursor.execute(statement)
+
+    connection.commit()
+
+def benchmarkWritePath(connection, name, writeFunction, glacier):
+    '''
+    Measuring the rows per second of a single write path. The benchmark table is emptied before.
+
+    @type connection: connection
+    @param connection: Connection of the benchmark borrowed from the pool.
+    @type name: string
+    @param name: Name of the write path.
+    @type writeFunction: function
+    @param writeFunction: Function writing all daily values of the given glacier.
+    @type glacier: dataflow.DataObjects.Glacier.Glacier
+    @param glacier: Glacier with the daily values to be written.
+    '''
+
+    executeStatement(connection, "TRUNCATE {0};".format(BENCHMARK_TABLE))
+
+    numberRows = len(glacier.massBalanceIndexTimeDailys)
+
+    # The per-glacier output of the writers is not part of the benchmark.
+    with contextlib.redirect_stdout(io.StringIO()):
+        startTime = time.perf_counter()
+        writeFunction(glacier)
+        duration = time.perf_counter() - startTime
+
+    print("-> {0:<30}: {1:>8} rows in {2:8.3f} s = {3:>10.0f} rows/s".format(name, numberRows, duration, numberRows / duration))
+
+def benchmarkDatabaseWriters(accessConfiguration, numberRows):
+    '''
+    Running the benchmark of all write paths.
+
+    @type accessConfiguration: string
+    @param accessConfiguration: Full file name of the database access configuration.
+    @type numberRows: int
+    @param numberRows: Number of rows written by each write path.
+    '''
+
+    connectionPool = DatabaseConnectionPool.getPool(accessConfiguration)
+    connection = connectionPool.borrowConnection()
+
+    glacier = createGlacier(numberRows)
+
+    try:
+        executeStatement(connection, "CREATE UNLOGGED TABLE {0} (LIKE {1} INCLUDING ALL);".format(
+            BENCHMARK_TABLE, MassBalanceIndexTimeDailyWriter._TABLE))
+
+        def writeFormatted(glacier):
+            statementTemplate = "INSERT INTO {0} ({1}) VALUES ('{{0}}', '{{1}}', '{{2}}', '{{3}}', {{4}}, {{5}}, {{6}}, {{7}}, {{8}}, {{9}}, '{{10}}');".format(
+                BENCHMARK_TABLE, ", ".join(BenchmarkWriter._COLUMNS))
+            with connection.cursor() as cursor:
+                for massBalanceIndexTimeDaily in glacier.massBalanceIndexTimeDailys.values():
+                    cursor.execute(statementTemplate.format(
+                        uuid.uuid1(), glacier.pk, massBalanceIndexTimeDaily.name, massBalanceIndexTimeDaily.date,
+                        massBalanceIndexTimeDaily.balance, massBalanceIndexTimeDaily.accumulation, massBalanceIndexTimeDaily.melt,
+                        massBalanceIndexTimeDaily.surface_type, massBalanceIndexTimeDaily.temp,
+                        massBalanceIndexTimeDaily.precip_solid, massBalanceIndexTimeDaily.reference))
+                    connection.commit()
+
+        def writeSetBased(glacier):
+            BenchmarkWriter(accessConfiguration).write(glacier)
+
+        def writeUpsert(glacier):
+            BenchmarkWriter(accessConfiguration).upsert(glacier)
+
+        def writeBatches(glacier):
+            records = list(glacier.massBalanceIndexTimeDailys.values())
+            BenchmarkWriter(accessConfiguration).writeBatches(
+                glacier, (records[index:index + BATCH_SIZE] for index in range(0, len(records), BATCH_SIZE)))
+
+        benchmarkWritePath(connection, "str.format, commit per row", writeFormatted, glacier)
+        benchmarkWritePath(connection, "write(), set-based", writeSetBased, glacier)
+        benchmarkWritePath(connection, "upsert(), multi-row VALUES", writeUpsert, glacier)
+        benchmarkWritePath(connection, "writeBatches()", writeBatches, glacier)
+
+    finally:
+        connection.rollback()
+        executeStatement(connection, "DROP TABLE IF EXISTS {0};".format(BENCHMARK_TABLE))
+        connectionPool.returnConnection(connection)
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description="Benchmark of the write paths of the GLAMOS database writers.")
+    parser.add_argument("accessConfiguration",
+                        help="Full file name of the database access configuration (e.g. databaseAccessConfiguration.gldirw.cfg)")
+    parser.add_argument("--rows", type=int, default=NUMBER_ROWS,
+                        help="Number of rows written by each write path (default: {0})".format(NUMBER_ROWS))
+
+    arguments = parser.parse_args()
+
+    benchmarkDatabaseWriters(arguments.accessConfiguration, arguments.rows)
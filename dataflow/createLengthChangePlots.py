@@ -16,7 +16,6 @@ Preconditions:
 # Import of the reader objects.
 from dataflow.DataReaders.DatabaseReaders.GlacierReader import GlacierReader
 from dataflow.DataReaders.DatabaseReaders.LengthChangeReader import LengthChangeReader
-import pandas as pd
 import matplotlib.pyplot as plt
 
 # Private configuration file for the database access.
@@ -41,19 +40,9 @@ def getGlacierLengthChangeBySgi(pkSgi):
     print(foundGlacier.name + '(' + foundGlacier.pkSgi + ')')
     print("Number of measurements: {0}".format(len(foundGlacier.lengthChanges)))
 
-    df = pd.DataFrame(columns=['date_from','date_to','variation'])
-
-    for lengthChange in foundGlacier.lengthChanges.values():
-        date_from = lengthChange.dateFrom
-        date_to = lengthChange.dateTo
-        variation = lengthChange.variationQuantitative
-
-        # Create a new row
-        new_data = {'date_from': date_from, 'date_to': date_to, 'variation': variation}
-
-        # Add it to the dataframe
-        df = pd.concat([df, pd.DataFrame([new_data])], ignore_index=True)
-
+    # Data frame of the entire time series built column by column.
+    df = foundGlacier.lengthChangeDataFrame[['dateFrom', 'dateTo', 'variationQuantitative']].rename(
+        columns={'dateFrom': 'date_from', 'dateTo': 'date_to', 'variationQuantitative': 'variation'})
 
     print(df)
     # Output:
@@ -10,6 +10,9 @@ from dataflow.DataWriters.DatabaseWriters.MassBalanceWriter import MassBalanceWr
 from dataflow.DataReaders.VawFileReaders.MassBalanceReader import MassBalanceReader
 from dataflow.DataReaders.DatabaseReaders.GlacierReader import GlacierReader
 from dataflow.DataObjects.Exceptions.GlacierNotFoundError import GlacierNotFoundError
+from dataflow.DataReaders.DatabaseConnectionPool import DatabaseConnectionPool
+from dataflow.ParallelIngestionRunner import ParallelIngestionRunner
+from dataflow.IngestionManifest import IngestionManifest
 
 import configparser
 import os
@@ -20,12 +23,22 @@ config.read("dataflow.cfg")
 
 privateDatabaseAccessConfiguration = r".\databaseAccessConfiguration.gldirw.cfg"
 
-def insertDatabaseMassbalance(allGlaciers):
+def insertDatabaseMassbalance(allGlaciers, jobs=1, force=False, bulk=False, upsert=False):
     '''
     Parsing and writing all mass-balance data from VAW data-files into GLAMOS database.
     
     @type allGlaciers: Dictionary
     @param allGlaciers: Dictionary of all glaciers stored in the database. Key: SGI-ID; Value: Glacier
+    @type jobs: int
+    @param jobs: Number of processes parsing the data files and of connections writing into the database.
+    @type force: bool
+    @param force: True if also the files recorded unchanged in the ingestion manifest are imported.
+    @type bulk: bool
+    @param bulk: True if all mass balances of a glacier are written by COPY in one transaction and a single rejected
+                 mass balance rolls back the whole glacier. Otherwise the mass balances are written one by one and
+                 rejected mass balances are skipped.
+    @type upsert: bool
+    @param upsert: True if changed records already stored are updated (upsert() of the writers) instead of inserting the records not yet stored only.
     '''
     
     rootDirectoryPath = config.get("MassBalance", "rootDirectoryInput")
@@ -33,111 +46,86 @@ def insertDatabaseMassbalance(allGlaciers):
     
     dataDirectoryPath = os.path.join(rootDirectoryPath, dataDirectoryName)
     
-    massBalanceReader = None
-    
     # Getting the overall statics of the parsing and writing ready.
     # Quality assurance: Same amount of parsed data have to be written into the database.
-    massBalanceObservationsParsedTotal  = 0
-    elevationBandsParsedTotal           = 0
-    elevationBandsValidParsedTotal      = 0
-    elevationBandsInvalidParsedTotal    = 0
+    statistics = dict(
+        massBalanceObservationsParsedTotal   = 0,
+        elevationBandsParsedTotal            = 0,
+        elevationBandsValidParsedTotal       = 0,
+        elevationBandsInvalidParsedTotal     = 0,
+        massBalanceObservationsWrittenTotal  = 0,
+        massBalanceObservationsRejectedTotal = 0,
+        elevationBandsHandledTotal           = 0,
+        elevationBandsValidWrittenTotal      = 0,
+        elevationBandsInvalidNotWrittenTotal = 0)
     
-    massBalanceObservationsWrittenTotal    = 0
-    elevationBandsHandledTotal             = 0
-    elevationBandsValidWrittenTotal        = 0
-    elevationBandsInvalidNotWrittenTotal   = 0
+    def parsed(massBalanceReader):
+        
+        # Getting the statistics of the parsing for overall information and print to the user as control.
+        statistics["massBalanceObservationsParsedTotal"] += massBalanceReader.massBalanceObservationsParsed
+        statistics["elevationBandsParsedTotal"]          += massBalanceReader.elevationBandsParsed
+        statistics["elevationBandsValidParsedTotal"]     += massBalanceReader.elevationBandsValidParsed
+        statistics["elevationBandsInvalidParsedTotal"]   += massBalanceReader.elevationBandsInvalidParsed
+        print("-> {0}:\n\t- {1} Mass balance observations parsed\n\t- {2} Elevation bands parsed\n\t- {3} Valid elevation bands parsed\n\t- {4} Invalid elevation bands parsed".format(
+            massBalanceReader.fullFileName,
+            massBalanceReader.massBalanceObservationsParsed,
+            massBalanceReader.elevationBandsParsed,
+            massBalanceReader.elevationBandsValidParsed,
+            massBalanceReader.elevationBandsInvalidParsed))
+        
+        print("\n--- Start writing to the database. Will take a while ... take a break ... ---\n")
     
-    if os.path.exists(dataDirectoryPath):
-
-        # Loop over all mass-balance data files in the directory.
-        for inputFileName in os.listdir(dataDirectoryPath):
-            
-            inputFilePath = os.path.join(dataDirectoryPath, inputFileName)
-            
-            # Start with parsing the data file.
-            if os.path.isfile(inputFilePath):
-
-                try:
-                    # Getting the reader object and start parsing.
-                    massBalanceReader = MassBalanceReader(config, inputFilePath, allGlaciers)
-                    
-                    # Important note:
-                    # The glacier object is still alive and could have mass-balance objects of a 
-                    # parsing process before. To have a redundancy free insert into the database,
-                    # possible mass-balance readings have to be removed.
-                    massBalanceReader.glacier.massBalances.clear()
-                    
-                    # Start of parsing the given data file.
-                    massBalanceReader.parse()
-                    
-                    # Getting the statistics of the parsing for overall information and print to the user as control.
-                    massBalanceObservationsParsedTotal += massBalanceReader.massBalanceObservationsParsed
-                    elevationBandsParsedTotal          += massBalanceReader.elevationBandsParsed
-                    elevationBandsValidParsedTotal     += massBalanceReader.elevationBandsValidParsed
-                    elevationBandsInvalidParsedTotal   += massBalanceReader.elevationBandsInvalidParsed
-                    print("-> {0}:\n\t- {1} Mass balance observations parsed\n\t- {2} Elevation bands parsed\n\t- {3} Valid elevation bands parsed\n\t- {4} Invalid elevation bands parsed".format(
-                        massBalanceReader.fullFileName,
-                        massBalanceReader.massBalanceObservationsParsed,
-                        massBalanceReader.elevationBandsParsed,
-                        massBalanceReader.elevationBandsValidParsed,
-                        massBalanceReader.elevationBandsInvalidParsed))
-                    
-                    # In case of a successful parsing process, a writer will be instantiated for immediate writing into the database.
-                    if massBalanceReader != None:
-                        
-                        print("\n--- Start writing to the database. Will take a while ... take a break ... ---\n")
+    def written(massBalanceReader, massBalanceWriter):
         
-                        # Getting the writer object ready and start inserting into the database.
-                        massBalanceWriter = MassBalanceWriter(privateDatabaseAccessConfiguration)
-                        massBalanceWriter.write(massBalanceReader.glacier)
+        # Getting the statistics of the inserting for overall information and print to the user as control (parsed informations == written informations)
+        statistics["massBalanceObservationsWrittenTotal"]  += massBalanceWriter.massBalanceObservationsWritten
+        statistics["massBalanceObservationsRejectedTotal"] += massBalanceWriter.massBalanceObservationsRejected
+        statistics["elevationBandsValidWrittenTotal"]      += massBalanceWriter.elevationBandsValidWritten
+        statistics["elevationBandsInvalidNotWrittenTotal"] += massBalanceWriter.elevationBandsInvalidNotWritten
+        statistics["elevationBandsHandledTotal"]           += massBalanceWriter.elevationBandsHandled
+        print("-> {0}:\n\t- {1} Mass balance observations written\n\t- {2} Elevation bands handled\n\t- {3} Valid elevation bands written\n\t- {4} Invalid elevation bands not written".format(
+            massBalanceReader.fullFileName,
+            massBalanceWriter.massBalanceObservationsWritten,
+            massBalanceWriter.elevationBandsHandled,
+            massBalanceWriter.elevationBandsValidWritten,
+            massBalanceWriter.elevationBandsInvalidNotWritten))
+    
+    if os.path.exists(dataDirectoryPath):
         
-                        # Getting the statistics of the inserting for overall information and print to the user as control (parsed informations == written informations)
-                        massBalanceObservationsWrittenTotal  += massBalanceWriter.massBalanceObservationsWritten
-                        elevationBandsValidWrittenTotal      += massBalanceWriter.elevationBandsValidWritten
-                        elevationBandsInvalidNotWrittenTotal += massBalanceWriter.elevationBandsInvalidNotWritten
-                        elevationBandsHandledTotal           += massBalanceWriter.elevationBandsHandled
-                        print("-> {0}:\n\t- {1} Mass balance observations written\n\t- {2} Elevation bands handled\n\t- {3} Valid elevation bands written\n\t- {4} Invalid elevation bands not written".format(
-                            massBalanceReader.fullFileName,
-                            massBalanceWriter.massBalanceObservationsWritten,
-                            massBalanceWriter.elevationBandsHandled,
-                            massBalanceWriter.elevationBandsValidWritten,
-                            massBalanceWriter.elevationBandsInvalidNotWritten))
-
-                    else:
-                        raise Exception("MassBalanceReader is None")
-                    
-                except GlacierNotFoundError as glacierNotFoundError:
-                    print(glacierNotFoundError.message)
-
-                finally:
-                    if massBalanceReader != None:
-                        massBalanceReader = None
-                        del(massBalanceReader)
-                    if massBalanceWriter != None:
-                        massBalanceWriter = None
-                        del(massBalanceWriter)
+        # Parsing the new or changed files by the given number of processes and writing them one transaction per glacier.
+        # A rejected mass balance is skipped only, unless the bulk mode rolls back the whole glacier.
+        runner = ParallelIngestionRunner(
+            config, MassBalanceReader, "massBalances", MassBalanceWriter, privateDatabaseAccessConfiguration,
+            jobs=jobs, writeMethodName="upsert" if upsert else "writeBulk" if bulk else "write", handledErrors=(GlacierNotFoundError,),
+            manifest=IngestionManifest(), force=force)
+        runner.run(dataDirectoryPath, allGlaciers, parsed=parsed, written=written)
         
     else:
         raise Exception("Data directory not existing")
 
     print("-------------- Summary parsing and writing --------------")
     print("-> Mass balance observations parsed vs. written: {0} vs. {1} (difference: {2})".format(
-        massBalanceObservationsParsedTotal, massBalanceObservationsWrittenTotal,
-        massBalanceObservationsParsedTotal - massBalanceObservationsWrittenTotal))
+        statistics["massBalanceObservationsParsedTotal"], statistics["massBalanceObservationsWrittenTotal"],
+        statistics["massBalanceObservationsParsedTotal"] - statistics["massBalanceObservationsWrittenTotal"]))
+    if not bulk and not upsert:
+        print("-> Mass balance observations rejected by the database: {0}".format(statistics["massBalanceObservationsRejectedTotal"]))
     print("-> Mass balance observations parsed vs. handled: {0} vs. {1} (difference: {2}".format(
-        elevationBandsParsedTotal, elevationBandsHandledTotal,
-        elevationBandsParsedTotal - elevationBandsHandledTotal))
+        statistics["elevationBandsParsedTotal"], statistics["elevationBandsHandledTotal"],
+        statistics["elevationBandsParsedTotal"] - statistics["elevationBandsHandledTotal"]))
     print("-> Valid elevation based parsed vs. written: {0} vs. {1} (difference: {2}".format(
-        elevationBandsValidParsedTotal, elevationBandsValidWrittenTotal,
-        elevationBandsValidParsedTotal - elevationBandsValidWrittenTotal))
+        statistics["elevationBandsValidParsedTotal"], statistics["elevationBandsValidWrittenTotal"],
+        statistics["elevationBandsValidParsedTotal"] - statistics["elevationBandsValidWrittenTotal"]))
     print("-> Invalid elevation based parsed vs. not written: {0} vs. {1} (difference: {2}".format(
-        elevationBandsInvalidParsedTotal, elevationBandsInvalidNotWrittenTotal,
-        elevationBandsInvalidParsedTotal - elevationBandsInvalidNotWrittenTotal))
+        statistics["elevationBandsInvalidParsedTotal"], statistics["elevationBandsInvalidNotWrittenTotal"],
+        statistics["elevationBandsInvalidParsedTotal"] - statistics["elevationBandsInvalidNotWrittenTotal"]))
+    print("-> " + str(DatabaseConnectionPool.getPool(privateDatabaseAccessConfiguration)))
 
 if __name__ == '__main__':
     
+    arguments = ParallelIngestionRunner.parseArguments("Import of all VAW mass-balance data files into the GLAMOS database.", bulk=True, accessConfiguration=privateDatabaseAccessConfiguration)
+    
     # Getting all glacier read from the database.
     glacierReader = GlacierReader(privateDatabaseAccessConfiguration)
     allGlaciers = glacierReader.getAllGlaciers()
     
-    insertDatabaseMassbalance(allGlaciers)
\ No newline at end of file
+    insertDatabaseMassbalance(allGlaciers, arguments.jobs, arguments.force, arguments.bulk, arguments.upsert)
\ No newline at end of file
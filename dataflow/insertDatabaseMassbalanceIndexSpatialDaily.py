@@ -14,18 +14,30 @@ from dataflow.DataObjects.Exceptions.GlacierNotFoundError import GlacierNotFound
 from dataflow.DataWriters.DatabaseWriters.MassBalanceIndexSpatialDailyWriter import MassBalanceIndexSpatialDailyWriter
 from dataflow.DataReaders.VawFileReaders.MassBalanceIndexSpatialDailyReader import MassBalanceIndexSpatialDailyReader
 from dataflow.DataReaders.Exceptions.InvalidDataFileError import InvalidDataFileError
+from dataflow.ParallelIngestionRunner import ParallelIngestionRunner
+from dataflow.IngestionManifest import IngestionManifest
 
 config = configparser.ConfigParser()
 config.read("dataflow.cfg")
 
 privateDatabaseAccessConfiguration = r".\databaseAccessConfiguration.gldirw.cfg"
 
-def insertDatabaseMassbalanceIndexSpatialDaily(allGlaciers):
+def insertDatabaseMassbalanceIndexSpatialDaily(allGlaciers, jobs=1, force=False, append=False, batchSize=None, upsert=False):
     '''
     Parsing and writing all mass balance index spatial daily data from VAW data-files into GLAMOS database.
 
     @type allGlaciers: Dictionary
     @param allGlaciers: Dictionary of all glaciers stored in the database. Key: SGI-ID; Value: Glacier
+    @type jobs: int
+    @param jobs: Number of processes parsing the data files and of connections writing into the database.
+    @type force: bool
+    @param force: True if also the files recorded unchanged in the ingestion manifest are imported.
+    @type append: bool
+    @param append: True if only the lines appended since the last import are parsed and written.
+    @type batchSize: int
+    @param batchSize: Number of data lines parsed and written per batch to stream the data files. None to parse each file entirely.
+    @type upsert: bool
+    @param upsert: True if changed records already stored are updated (upsert() of the writers) instead of inserting the records not yet stored only.
     '''
 
     rootDirectoryPath = config.get("MassBalanceIndexSpatialDaily", "rootDirectoryInput")
@@ -33,65 +45,31 @@ def insertDatabaseMassbalanceIndexSpatialDaily(allGlaciers):
 
     dataDirectoryPath = os.path.join(rootDirectoryPath, dataDirectoryName)
 
-    if os.path.exists(dataDirectoryPath):
-        # Loop over all mass-balance index spatial daily data files in the directory.
-        for inputFileName in os.listdir(dataDirectoryPath):
-
-            inputFilePath = os.path.join(dataDirectoryPath, inputFileName)
-
-            # Start with parsing the data file.
-            massBalanceIndexSpatialDailyReader = None
-            massBalanceIndexSpatialDailyWriter = None
-
-            try:
-                # Getting the reader object and start parsing.
-                massBalanceIndexSpatialDailyReader = MassBalanceIndexSpatialDailyReader(config, inputFilePath, allGlaciers)
-
-                # Important note:
-                # The glacier object is still alive and could have mass-balance index spatial daily objects of a
-                # parsing process before. To have a redundancy free insert into the database,
-                # possible mass-balance index spatial daily readings have to be removed.
-                massBalanceIndexSpatialDailyReader.glacier.massBalanceIndexSpatialDailys.clear()
-
-                # Start of parsing the given data file.
-                massBalanceIndexSpatialDailyReader.parse()
-
-                # In case of a successful parsing process, a writer will be instantiated for immediate writing into the database.
-                if massBalanceIndexSpatialDailyReader != None:
-
-                    print("\n" + str(inputFileName))
-                    print("--- Start writing to the database. Will take a while ... take a break ... ---\n")
-
-                    # Getting the writer object ready and start inserting into the database.
-                    massBalanceIndexSpatialDailyWriter = MassBalanceIndexSpatialDailyWriter(privateDatabaseAccessConfiguration)
-                    massBalanceIndexSpatialDailyWriter.write(massBalanceIndexSpatialDailyReader.glacier)
-                else:
-                    raise Exception("MassBalanceIndexDailyReader is None")
-
-            except GlacierNotFoundError as glacierNotFoundError:
-                print(glacierNotFoundError.message)
-            except InvalidDataFileError as invalidDataFileError:
-                print(invalidDataFileError.message)
-
-            finally:
-                if massBalanceIndexSpatialDailyReader != None:
-                    massBalanceIndexSpatialDailyReader = None
-                    del (massBalanceIndexSpatialDailyReader)
-                if massBalanceIndexSpatialDailyWriter != None:
-                    massBalanceIndexSpatialDailyWriter = None
-                    del (massBalanceIndexSpatialDailyWriter)
-    else:
-        raise Exception("Data directory not existing")
-
+    def parsed(reader):
 
+        print("\n" + os.path.basename(reader.fullFileName))
+        print("--- Start writing to the database. Will take a while ... take a break ... ---\n")
 
+    if os.path.exists(dataDirectoryPath):
 
+        # Parsing the new or changed files by the given number of processes and writing them by the same number of connections.
+        runner = ParallelIngestionRunner(
+            config, MassBalanceIndexSpatialDailyReader, "massBalanceIndexSpatialDailys", MassBalanceIndexSpatialDailyWriter, privateDatabaseAccessConfiguration,
+            jobs=jobs, writeMethodName="upsert" if upsert else "write", handledErrors=(GlacierNotFoundError, InvalidDataFileError),
+            manifest=IngestionManifest(), force=force, append=append, batchSize=batchSize)
+        runner.run(dataDirectoryPath, allGlaciers, parsed=parsed)
 
+    else:
+        raise Exception("Data directory not existing")
 
 
 if __name__ == '__main__':
+
+    arguments = ParallelIngestionRunner.parseArguments("Import of all VAW mass balance index spatial daily data files into the GLAMOS database.", appendable=True, streamable=True, columnar=True, accessConfiguration=privateDatabaseAccessConfiguration)
+
     # Getting all glacier read from the database.
     glacierReader = GlacierReader(privateDatabaseAccessConfiguration)
+    glacierReader.columnarSeries = arguments.columnar_series
     allGlaciers = glacierReader.getAllGlaciers()
 
-    insertDatabaseMassbalanceIndexSpatialDaily(allGlaciers)
\ No newline at end of file
+    insertDatabaseMassbalanceIndexSpatialDaily(allGlaciers, arguments.jobs, arguments.force, arguments.append, arguments.batch_size, arguments.upsert)
\ No newline at end of file
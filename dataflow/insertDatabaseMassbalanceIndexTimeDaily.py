@@ -14,18 +14,30 @@ from dataflow.DataObjects.Exceptions.GlacierNotFoundError import GlacierNotFound
 from dataflow.DataWriters.DatabaseWriters.MassBalanceIndexTimeDailyWriter import MassBalanceIndexTimeDailyWriter
 from dataflow.DataReaders.VawFileReaders.MassBalanceIndexTimeDailyReader import MassBalanceIndexTimeDailyReader
 from dataflow.DataReaders.Exceptions.InvalidDataFileError import InvalidDataFileError
+from dataflow.ParallelIngestionRunner import ParallelIngestionRunner
+from dataflow.IngestionManifest import IngestionManifest
 
 config = configparser.ConfigParser()
 config.read("dataflow.cfg")
 
 privateDatabaseAccessConfiguration = r".\databaseAccessConfiguration.gldirw.cfg"
 
-def insertDatabaseMassbalanceIndexTimeDaily(allGlaciers):
+def insertDatabaseMassbalanceIndexTimeDaily(allGlaciers, jobs=1, force=False, append=False, batchSize=None, upsert=False):
     '''
     Parsing and writing all mass balance index daily data from VAW data-files into GLAMOS database.
 
     @type allGlaciers: Dictionary
     @param allGlaciers: Dictionary of all glaciers stored in the database. Key: SGI-ID; Value: Glacier
+    @type jobs: int
+    @param jobs: Number of processes parsing the data files and of connections writing into the database.
+    @type force: bool
+    @param force: True if also the files recorded unchanged in the ingestion manifest are imported.
+    @type append: bool
+    @param append: True if only the lines appended since the last import are parsed and written.
+    @type batchSize: int
+    @param batchSize: Number of data lines parsed and written per batch to stream the data files. None to parse each file entirely.
+    @type upsert: bool
+    @param upsert: True if changed records already stored are updated (upsert() of the writers) instead of inserting the records not yet stored only.
     '''
 
     rootDirectoryPath = config.get("MassBalanceIndexTimeDaily", "rootDirectoryInput")
@@ -33,65 +45,31 @@ def insertDatabaseMassbalanceIndexTimeDaily(allGlaciers):
 
     dataDirectoryPath = os.path.join(rootDirectoryPath, dataDirectoryName)
 
-    if os.path.exists(dataDirectoryPath):
-        # Loop over all mass-balance index daily data files in the directory.
-        for inputFileName in os.listdir(dataDirectoryPath):
-
-            inputFilePath = os.path.join(dataDirectoryPath, inputFileName)
-
-            # Start with parsing the data file.
-            massBalanceIndexTimeDailyReader = None
-            massBalanceIndexTimeDailyWriter = None
-
-            try:
-                # Getting the reader object and start parsing.
-                massBalanceIndexTimeDailyReader = MassBalanceIndexTimeDailyReader(config, inputFilePath, allGlaciers)
-
-                # Important note:
-                # The glacier object is still alive and could have mass-balance index daily objects of a
-                # parsing process before. To have a redundancy free insert into the database,
-                # possible mass-balance index daily readings have to be removed.
-                massBalanceIndexTimeDailyReader.glacier.massBalanceIndexTimeDailys.clear()
-
-                # Start of parsing the given data file.
-                massBalanceIndexTimeDailyReader.parse()
-
-                # In case of a successful parsing process, a writer will be instantiated for immediate writing into the database.
-                if massBalanceIndexTimeDailyReader != None:
-
-                    print("\n" + str(inputFileName))
-                    print("--- Start writing to the database. Will take a while ... take a break ... ---\n")
-
-                    # Getting the writer object ready and start inserting into the database.
-                    massBalanceIndexTimeDailyWriter = MassBalanceIndexTimeDailyWriter(privateDatabaseAccessConfiguration)
-                    massBalanceIndexTimeDailyWriter.write(massBalanceIndexTimeDailyReader.glacier)
-                else:
-                    raise Exception("MassBalanceIndexDailyReader is None")
-
-            except GlacierNotFoundError as glacierNotFoundError:
-                print(glacierNotFoundError.message)
-            except InvalidDataFileError as invalidDataFileError:
-                print(invalidDataFileError.message)
-
-            finally:
-                if massBalanceIndexTimeDailyReader != None:
-                    massBalanceIndexTimeDailyReader = None
-                    del (massBalanceIndexTimeDailyReader)
-                if massBalanceIndexTimeDailyWriter != None:
-                    massBalanceIndexTimeDailyWriter = None
-                    del (massBalanceIndexTimeDailyWriter)
-    else:
-        raise Exception("Data directory not existing")
-
+    def parsed(reader):
 
+        print("\n" + os.path.basename(reader.fullFileName))
+        print("--- Start writing to the database. Will take a while ... take a break ... ---\n")
 
+    if os.path.exists(dataDirectoryPath):
 
+        # Parsing the new or changed files by the given number of processes and writing them by the same number of connections.
+        runner = ParallelIngestionRunner(
+            config, MassBalanceIndexTimeDailyReader, "massBalanceIndexTimeDailys", MassBalanceIndexTimeDailyWriter, privateDatabaseAccessConfiguration,
+            jobs=jobs, writeMethodName="upsert" if upsert else "write", handledErrors=(GlacierNotFoundError, InvalidDataFileError),
+            manifest=IngestionManifest(), force=force, append=append, batchSize=batchSize)
+        runner.run(dataDirectoryPath, allGlaciers, parsed=parsed)
 
+    else:
+        raise Exception("Data directory not existing")
 
 
 if __name__ == '__main__':
+
+    arguments = ParallelIngestionRunner.parseArguments("Import of all VAW mass balance index daily data files (_cum) into the GLAMOS database.", appendable=True, streamable=True, columnar=True, accessConfiguration=privateDatabaseAccessConfiguration)
+
     # Getting all glacier read from the database.
     glacierReader = GlacierReader(privateDatabaseAccessConfiguration)
+    glacierReader.columnarSeries = arguments.columnar_series
     allGlaciers = glacierReader.getAllGlaciers()
 
-    insertDatabaseMassbalanceIndexTimeDaily(allGlaciers)
\ No newline at end of file
+    insertDatabaseMassbalanceIndexTimeDaily(allGlaciers, arguments.jobs, arguments.force, arguments.append, arguments.batch_size, arguments.upsert)
\ No newline at end of file
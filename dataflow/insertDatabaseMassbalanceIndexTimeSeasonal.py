@@ -14,78 +14,58 @@ from dataflow.DataObjects.Exceptions.GlacierNotFoundError import GlacierNotFound
 from dataflow.DataWriters.DatabaseWriters.MassBalanceIndexTimeSeasonalWriter import MassBalanceIndexTimeSeasonalWriter
 from dataflow.DataReaders.VawFileReaders.MassBalanceIndexTimeSeasonalReader import MassBalanceIndexTimeSeasonalReader
 from dataflow.DataReaders.Exceptions.InvalidDataFileError import InvalidDataFileError
+from dataflow.ParallelIngestionRunner import ParallelIngestionRunner
+from dataflow.IngestionManifest import IngestionManifest
 
 config = configparser.ConfigParser()
 config.read("dataflow.cfg")
 
 privateDatabaseAccessConfiguration = r".\databaseAccessConfiguration.gldirw.cfg"
 
-def insertDatabaseMassbalanceIndexTimeSeasonal(allGlaciers):
+def insertDatabaseMassbalanceIndexTimeSeasonal(allGlaciers, jobs=1, force=False, batchSize=None, upsert=False):
     '''
     Parsing and writing all mass balance index seasonal data from VAW data-files into GLAMOS database.
 
     @type allGlaciers: Dictionary
     @param allGlaciers: Dictionary of all glaciers stored in the database. Key: SGI-ID; Value: Glacier
+    @type jobs: int
+    @param jobs: Number of processes parsing the data files and of connections writing into the database.
+    @type force: bool
+    @param force: True if also the files recorded unchanged in the ingestion manifest are imported.
+    @type batchSize: int
+    @param batchSize: Number of data lines parsed and written per batch to stream the data files. None to parse each file entirely.
+    @type upsert: bool
+    @param upsert: True if changed records already stored are updated (upsert() of the writers) instead of inserting the records not yet stored only.
     '''
 
     rootDirectoryPath = config.get("MassBalanceIndexTimeSeasonal", "rootDirectoryInput")
     dataDirectoryName = config.get("MassBalanceIndexTimeSeasonal", "indexTimeSeasonalDirectoryInput")
 
     dataDirectoryPath = os.path.join(rootDirectoryPath, dataDirectoryName)
+    def parsed(reader):
+
+        print("\n" + os.path.basename(reader.fullFileName))
+        print("--- Start writing to the database. Will take a while ... take a break ... ---\n")
+
     if os.path.exists(dataDirectoryPath):
-        # Loop over all mass-balance index seasonal data files in the directory.
-        for inputFileName in os.listdir(dataDirectoryPath):
-
-            inputFilePath = os.path.join(dataDirectoryPath, inputFileName)
-
-            # Start with parsing the data file.
-            massBalanceIndexTimeSeasonalReader = None
-            massBalanceIndexTimeSeasonalWriter = None
-
-            try:
-                # Getting the reader object and start parsing.
-                massBalanceIndexTimeSeasonalReader = MassBalanceIndexTimeSeasonalReader(config, inputFilePath, allGlaciers)
-
-                # Important note:
-                # The glacier object is still alive and could have mass-balance index seasonal objects of a
-                # parsing process before. To have a redundancy free insert into the database,
-                # possible mass-balance index seasonal readings have to be removed.
-                massBalanceIndexTimeSeasonalReader.glacier.massBalanceIndexTimeSeasonals.clear()
-
-                # Start of parsing the given data file.
-                massBalanceIndexTimeSeasonalReader.parse()
-
-                # In case of a successful parsing process, a writer will be instantiated for immediate writing into the database.
-                if massBalanceIndexTimeSeasonalReader != None:
-
-                    print("\n" + str(inputFileName))
-                    print("--- Start writing to the database. Will take a while ... take a break ... ---\n")
-
-                    # Getting the writer object ready and start inserting into the database.
-                    massBalanceIndexTimeSeasonalWriter = MassBalanceIndexTimeSeasonalWriter(privateDatabaseAccessConfiguration)
-                    massBalanceIndexTimeSeasonalWriter.write(massBalanceIndexTimeSeasonalReader.glacier)
-                else:
-                    raise Exception("MassBalanceIndexSeasonalReader is None")
-
-            except GlacierNotFoundError as glacierNotFoundError:
-                print(glacierNotFoundError.message)
-            except InvalidDataFileError as invalidDataFileError:
-                print(invalidDataFileError.message)
-
-            finally:
-                if massBalanceIndexTimeSeasonalReader != None:
-                    massBalanceIndexTimeSeasonalReader = None
-                    del (massBalanceIndexTimeSeasonalReader)
-                if massBalanceIndexTimeSeasonalWriter != None:
-                    massBalanceIndexTimeSeasonalWriter = None
-                    del (massBalanceIndexTimeSeasonalWriter)
+
+        # Parsing the new or changed files by the given number of processes and writing them by the same number of connections.
+        runner = ParallelIngestionRunner(
+            config, MassBalanceIndexTimeSeasonalReader, "massBalanceIndexTimeSeasonals", MassBalanceIndexTimeSeasonalWriter, privateDatabaseAccessConfiguration,
+            jobs=jobs, writeMethodName="upsert" if upsert else "write", handledErrors=(GlacierNotFoundError, InvalidDataFileError),
+            manifest=IngestionManifest(), force=force, batchSize=batchSize)
+        runner.run(dataDirectoryPath, allGlaciers, parsed=parsed)
+
     else:
         raise Exception("Data directory not existing")
 
 
 if __name__ == '__main__':
+
+    arguments = ParallelIngestionRunner.parseArguments("Import of all VAW mass balance index time seasonal data files into the GLAMOS database.", streamable=True, accessConfiguration=privateDatabaseAccessConfiguration)
+
     # Getting all glacier read from the database.
     glacierReader = GlacierReader(privateDatabaseAccessConfiguration)
     allGlaciers = glacierReader.getAllGlaciers()
 
-    insertDatabaseMassbalanceIndexTimeSeasonal(allGlaciers)
\ No newline at end of file
+    insertDatabaseMassbalanceIndexTimeSeasonal(allGlaciers, arguments.jobs, arguments.force, arguments.batch_size, arguments.upsert)
\ No newline at end of file
@@ -14,6 +14,8 @@ from dataflow.DataObjects.Exceptions.GlacierNotFoundError import GlacierNotFound
 from dataflow.DataWriters.DatabaseWriters.MassBalancePointWriter import MassBalancePointWriter
 from dataflow.DataReaders.VawFileReaders.MassBalancePointReader import MassBalancePointReader
 from dataflow.DataReaders.Exceptions.InvalidDataFileError import InvalidDataFileError
+from dataflow.ParallelIngestionRunner import ParallelIngestionRunner
+from dataflow.IngestionManifest import IngestionManifest
 
 config = configparser.ConfigParser()
 config.read("dataflow.cfg")
@@ -21,12 +23,20 @@ config.read("dataflow.cfg")
 privateDatabaseAccessConfiguration = r".\databaseAccessConfiguration.gldirw.cfg"
 
 
-def insertDatabaseMassbalancePoint(allGlaciers):
+def insertDatabaseMassbalancePoint(allGlaciers, jobs=1, force=False, batchSize=None, upsert=False):
     '''
     Parsing and writing all mass balance point data from VAW data-files into GLAMOS database.
 
     @type allGlaciers: Dictionary
     @param allGlaciers: Dictionary of all glaciers stored in the database. Key: SGI-ID; Value: Glacier
+    @type jobs: int
+    @param jobs: Number of processes parsing the data files and of connections writing into the database.
+    @type force: bool
+    @param force: True if also the files recorded unchanged in the ingestion manifest are imported.
+    @type batchSize: int
+    @param batchSize: Number of data lines parsed and written per batch to stream the data files. None to parse each file entirely.
+    @type upsert: bool
+    @param upsert: True if changed records already stored are updated (upsert() of the writers) instead of inserting the records not yet stored only.
     '''
 
     rootDirectoryPath = config.get("MassBalancePoint", "rootDirectoryInput")
@@ -34,62 +44,31 @@ def insertDatabaseMassbalancePoint(allGlaciers):
 
     dataDirectoryPath = os.path.join(rootDirectoryPath, dataDirectoryName)
 
+    def parsed(reader):
+
+        print("\n" + os.path.basename(reader.fullFileName))
+        print("--- Start writing to the database. Will take a while ... take a break ... ---\n")
+
     if os.path.exists(dataDirectoryPath):
-        # Loop over all mass-balance data files in the directory.
-        for inputFileName in os.listdir(dataDirectoryPath):
-
-            inputFilePath = os.path.join(dataDirectoryPath, inputFileName)
-
-            # Start with parsing the data file.
-            if os.path.isfile(inputFilePath):
-                massBalancePointReader = None
-                massBalancePointWriter = None
-
-            try:
-                # Getting the reader object and start parsing.
-                massBalancePointReader = MassBalancePointReader(config, inputFilePath, allGlaciers)
-
-                # Important note:
-                # The glacier object is still alive and could have mass-balance point objects of a
-                # parsing process before. To have a redundancy free insert into the database,
-                # possible mass-balance point readings have to be removed.
-                massBalancePointReader.glacier.massBalancePoints.clear()
-
-                # Start of parsing the given data file.
-                massBalancePointReader.parse()
-
-                # In case of a successful parsing process, a writer will be instantiated for immediate writing into the database.
-                if massBalancePointReader != None:
-
-                    print("\n" + str(inputFileName))
-                    print("--- Start writing to the database. Will take a while ... take a break ... ---\n")
-
-                    # Getting the writer object ready and start inserting into the database.
-                    massBalancePointWriter = MassBalancePointWriter(privateDatabaseAccessConfiguration)
-                    massBalancePointWriter.write(massBalancePointReader.glacier)
-
-                else:
-                    raise Exception("MassBalancePointReader is None")
-
-            except GlacierNotFoundError as glacierNotFoundError:
-                print(glacierNotFoundError.message)
-            except InvalidDataFileError as invalidDataFileError:
-                print(invalidDataFileError.message)
-
-            finally:
-                if massBalancePointReader != None:
-                    massBalancePointReader = None
-                    del (massBalancePointReader)
-                if massBalancePointWriter != None:
-                    massBalancePointWriter = None
-                    del (massBalancePointWriter)
+
+        # Parsing the new or changed files by the given number of processes and writing them by the same number of connections.
+        runner = ParallelIngestionRunner(
+            config, MassBalancePointReader, "massBalancePoints", MassBalancePointWriter, privateDatabaseAccessConfiguration,
+            jobs=jobs, writeMethodName="upsert" if upsert else "write", handledErrors=(GlacierNotFoundError, InvalidDataFileError),
+            manifest=IngestionManifest(), force=force, batchSize=batchSize)
+        runner.run(dataDirectoryPath, allGlaciers, parsed=parsed)
+
     else:
         raise Exception("Data directory not existing")
 
 
 if __name__ == '__main__':
+
+    arguments = ParallelIngestionRunner.parseArguments("Import of all VAW mass balance point data files into the GLAMOS database.", streamable=True, columnar=True, accessConfiguration=privateDatabaseAccessConfiguration)
+
     # Getting all glacier read from the database.
     glacierReader = GlacierReader(privateDatabaseAccessConfiguration)
+    glacierReader.columnarSeries = arguments.columnar_series
     allGlaciers = glacierReader.getAllGlaciers()
 
-    insertDatabaseMassbalancePoint(allGlaciers)
\ No newline at end of file
+    insertDatabaseMassbalancePoint(allGlaciers, arguments.jobs, arguments.force, arguments.batch_size, arguments.upsert)
\ No newline at end of file
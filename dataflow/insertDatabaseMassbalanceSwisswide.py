@@ -10,6 +10,7 @@ from dataflow.DataWriters.DatabaseWriters.MassBalanceSwissWideWriter import Mass
 from dataflow.DataReaders.VawFileReaders.MassBalanceSwissWideReader import MassBalanceSwissWideReader
 from dataflow.DataReaders.DatabaseReaders.GlacierReader import GlacierReader
 from dataflow.DataObjects.Exceptions.GlacierNotFoundError import GlacierNotFoundError
+from dataflow.DataReaders.Exceptions.InvalidDataFileError import InvalidDataFileError
 
 import configparser
 import os
@@ -56,25 +57,20 @@ def insertDatabaseMassbalanceSwissWide(allGlaciers):
             # possible mass-balance readings have to be removed.
             # MassBalanceReaderSwissWide.glacier.massBalancesSwissWide.clear()
 
-            # Start of parsing the given data file.
-            parsedMassBalanceSwissWideList = massBalanceSwissWideReader.parse()
-            print(len(parsedMassBalanceSwissWideList), 'are ready to be compared with entries in the Database')
+            # Start of parsing the given data files into matrices (glaciers x years).
+            massBalanceSwissWideMatrix = massBalanceSwissWideReader.parse()
+            print(len(massBalanceSwissWideMatrix), 'are ready to be compared with entries in the Database')
 
-            counter = 0
             print("\n--- Start writing to the database. Will take a while ... take a break ... ---\n")
 
-            for parsedMassBalanceSwissWideObject in parsedMassBalanceSwissWideList:
-
-                # Getting the writer object ready and start inserting into the database.
-                massBalanceSwissWideWriter = MassBalanceSwissWideWriter(privateDatabaseAccessConfiguration)
-                massBalanceSwissWideWriter.write(parsedMassBalanceSwissWideObject)
-                counter +=1
-                #print(counter, 'have been checked')
-
-
+            # Getting the writer object ready and start inserting all observations into the database.
+            massBalanceSwissWideWriter = MassBalanceSwissWideWriter(privateDatabaseAccessConfiguration)
+            massBalanceSwissWideWriter.writeMatrix(massBalanceSwissWideMatrix)
 
         except GlacierNotFoundError as glacierNotFoundError:
             print(glacierNotFoundError.message)
+        except InvalidDataFileError as invalidDataFileError:
+            print(invalidDataFileError.message)
 
         finally:
             if massBalanceSwissWideReader != None:
@@ -83,8 +79,9 @@ def insertDatabaseMassbalanceSwissWide(allGlaciers):
             if massBalanceSwissWideWriter != None:
                 massBalanceSwissWideWriter = None
                 del (massBalanceSwissWideWriter)
-            else:
-                raise Exception("Data directory not existing")
+
+    else:
+        raise Exception("Data directory not existing")
 
     print("-------------- Summary parsing and writing --------------")
 
@@ -62,9 +62,7 @@ if __name__ == '__main__':
             
             print("The GLAMOS database is available. Glacier objects are read from the database.")
             
-            for focusGlacier in focusGlaciers:
-                glacierFound = glacierReader.getGlacierBySgi(focusGlacier)
-                glaciers[glacierFound.pkSgi] = glacierFound
+            glaciers.update(glacierReader.getGlaciersBySgi(focusGlaciers))
 
             # Getting the attributes from the database.
             for glacier in glaciers.values():
@@ -83,16 +83,12 @@ if __name__ == '__main__':
             
             print("The GLAMOS database is available. Glacier objects are read from the database.")
             
-            for focusGlacier in focusGlaciers:
-                glacierFound = glacierReader.getGlacierBySgi(focusGlacier)
-                glaciers[glacierFound.pkSgi] = glacierFound
+            glaciers.update(glacierReader.getGlaciersBySgi(focusGlaciers))
 
-            # Getting the attributes from the database.
-            for glacier in glaciers.values():
-                
-                # Polymorphistic approach to read attribute data by a list of readers.
-                for dataReader in dataReaders:
-                    dataReader.getData(glacier)
+            # Getting the attributes of all glaciers from the database.
+            # Polymorphistic approach to read attribute data by a list of readers.
+            for dataReader in dataReaders:
+                dataReader.getDataForGlaciers(list(glaciers.values()))
             
             # Printing the glaciers and their attributes to the console.  
             listData(glaciers)
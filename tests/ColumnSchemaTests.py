@@ -0,0 +1,74 @@
+'''
+Created on 18.10.2026
+
+@author: yvo
+'''
+import math
+import unittest
+
+from dataflow.DataReaders.VawFileReaders.ColumnSchema import ColumnSchema
+from dataflow.DataReaders.VawFileReaders.FileColumn import FileColumn
+
+
+class ColumnSchemaTests(unittest.TestCase):
+    '''
+    Unit-test class for the schema-driven parsing engine of the VAW data files.
+    '''
+
+    def setUp(self):
+        '''
+        Setup of a schema with plain, transformed and missing values.
+        '''
+
+        notNine = lambda value: 0 if value == '9' else value
+
+        self._columnSchema = ColumnSchema([
+            FileColumn("name",    1, str),
+            FileColumn("year",    2, int),
+            FileColumn("quality", 3, int, transform=notNine),
+            FileColumn("balance", 4, float, nanToken="NaN"),
+            FileColumn("source",  5, str, nanToken="-")])
+
+    def testConvertLine(self):
+        '''
+        Test of the row converter including the empty first value of lines starting with a space.
+        '''
+
+        row = self._columnSchema.convertLine(" P1  2020 9 -1234.5 vaw\n")
+
+        self.assertEqual({"name": "P1", "year": 2020, "quality": 0, "balance": -1234.5, "source": "vaw"}, row, "Converted values")
+
+    def testConvertBlock(self):
+        '''
+        Test of the block converter with missing values and an empty line.
+        '''
+
+        data = self._columnSchema.convertBlock([" P1 2020 1 12.5 vaw\n", "\n", " P2 2021 9 NaN -\n"])
+
+        self.assertEqual([0, 2], self._columnSchema.lineIndexes,      "Indexes of the converted lines")
+        self.assertEqual(["P1", "P2"], data["name"],                   "Values of a string column")
+        self.assertEqual([2020, 2021], data["year"],                   "Values of a plain integer column")
+        self.assertEqual([1, 0], data["quality"],                      "Values of a transformed column")
+        self.assertTrue(math.isnan(data["balance"][1]),                "Missing value of a float column")
+        self.assertEqual(["vaw", None], data["source"],               "Missing value of a string column")
+
+    def testInvalidLines(self):
+        '''
+        Test of the fallback to the row converter in case of invalid lines.
+        '''
+
+        data = self._columnSchema.convertBlock([" P1 2020 1 12.5 vaw\n", " P2 20x1 1 12.5 vaw\n", " P3 2022\n"])
+
+        self.assertEqual([0], self._columnSchema.lineIndexes,          "Indexes of the converted lines")
+        self.assertEqual(["P1"], data["name"],                         "Values of the valid lines")
+        self.assertEqual([1, 2], [lineIndex for lineIndex, e in self._columnSchema.invalidLines], "Indexes of the invalid lines")
+        self.assertIsInstance(self._columnSchema.invalidLines[0][1], ValueError, "Exception of the invalid value")
+
+    def testSkipLeadingEmpty(self):
+        '''
+        Test of the removal of the empty first value.
+        '''
+
+        columnSchema = ColumnSchema([FileColumn("name", 0, str)], skipLeadingEmpty=True)
+
+        self.assertEqual({"name": "P1"}, columnSchema.convertLine("   P1 2020\n"), "Value without leading spaces")
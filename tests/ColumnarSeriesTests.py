@@ -0,0 +1,157 @@
+'''
+Created on 18.10.2026
+
+@author: yvo
+'''
+import configparser
+import datetime
+import math
+import unittest
+import uuid
+
+import pandas
+
+from dataflow.DataObjects.ColumnarSeries import ColumnarSeries
+from dataflow.DataObjects.Glacier import Glacier
+from dataflow.DataObjects.MassBalanceIndexTimeDaily import MassBalanceIndexTimeDaily
+from dataflow.DataObjects.MassBalancePoint import MassBalancePoint
+from dataflow.DataReaders.DatabaseReaders.GlacierReader import GlacierReader
+from dataflow.DataReaders.VawFileReaders.MassBalanceIndexTimeDailyReader import MassBalanceIndexTimeDailyReader
+from dataflow.DataReaders.VawFileReaders.MassBalanceIndexSpatialDailyReader import MassBalanceIndexSpatialDailyReader
+from dataflow.DataReaders.VawFileReaders.MassBalancePointReader import MassBalancePointReader
+
+from Helper import UnitTestHelper
+
+
+class ColumnarSeriesTests(unittest.TestCase):
+    '''
+    Unit-test class for the struct-of-arrays storage of the high-volume series of a glacier.
+    '''
+
+    def setUp(self):
+        '''
+        Setup of a glacier with columnar series and three daily index mass balances.
+        '''
+
+        self._glacier = Glacier(uuid.uuid1(), 141, "A50i/19", "Clariden", columnarSeries=True)
+
+        self._massBalanceIndexTimeDailys = [
+            MassBalanceIndexTimeDaily(
+                None, "P0", datetime.date(2020, 10, day), None, None, None,
+                -10 * day, 2 * day, -12 * day, 1, 0.5 * day, float("nan"), "VAW / ETHZ")
+            for day in range(1, 4)]
+
+        for massBalanceIndexTimeDaily in self._massBalanceIndexTimeDailys:
+            self._glacier.addMassBalanceIndexTimeDaily(massBalanceIndexTimeDaily)
+
+    def testObjectViews(self):
+        '''
+        Test of the data objects created from the rows of the series.
+        '''
+
+        series = self._glacier.massBalanceIndexTimeDailys
+        original = self._massBalanceIndexTimeDailys[1]
+        view = series[original.pk]
+
+        self.assertIsInstance(series, ColumnarSeries,                                  "Columnar series of the glacier")
+        self.assertEqual(3, len(series),                                               "Number of rows")
+        self.assertEqual([m.pk for m in self._massBalanceIndexTimeDailys], list(series), "Keys in the order of insertion")
+        self.assertEqual(original.pk, view.pk,                                         "Primary key of the object view")
+        self.assertEqual(datetime.date(2020, 10, 2), view.date,                        "Date of the object view")
+        self.assertEqual(-20, view.balance,                                            "Integer value")
+        self.assertIsInstance(view.balance, int,                                       "Type of an integer value")
+        self.assertIsNone(view.latitude,                                               "Missing float value")
+        self.assertTrue(math.isnan(view.precip_solid),                                 "NaN value")
+        self.assertEqual([str(m) for m in self._massBalanceIndexTimeDailys],
+                         [str(m) for m in series.values()],                            "Object views of all rows")
+
+    def testColumns(self):
+        '''
+        Test of the NumPy columns of the series.
+        '''
+
+        series = self._glacier.massBalanceIndexTimeDailys
+
+        self.assertEqual([-10, -20, -30], series.column("balance").tolist(),           "Integer column")
+        self.assertEqual("datetime64[D]", str(series.column("date").dtype),            "Date column")
+        self.assertTrue(all(math.isnan(value) for value in series.column("latitude")), "Missing values of a float column")
+        self.assertEqual(-60, series.toDataFrame()["balance"].sum(),                   "Data frame of the series")
+
+    def testUpdateAndRemoval(self):
+        '''
+        Test of overwriting and removing rows.
+        '''
+
+        series = self._glacier.massBalanceIndexTimeDailys
+        first, second, third = self._massBalanceIndexTimeDailys
+
+        series[second.pk] = first
+        del series[first.pk]
+
+        self.assertEqual([second.pk, third.pk], list(series),                          "Keys after removal")
+        self.assertEqual(-10, series[second.pk].balance,                               "Overwritten row")
+        self.assertEqual([-10, -30], series.column("balance").tolist(),                "Column after removal")
+
+    def testMissingIntegers(self):
+        '''
+        Test of an integer column with missing values.
+        '''
+
+        series = self._glacier.massBalancePoints
+        massBalancePoint = MassBalancePoint(None, "P1", 1, "20200401", None, "20200930", None, 182.0, None)
+        self._glacier.addMassBalancePoint(massBalancePoint)
+
+        self.assertIsNone(series[massBalancePoint.pk].dateAccuracy,                    "Missing integer value")
+        self.assertTrue(math.isnan(series.column("dateAccuracy")[0]),                  "Missing integer value as NaN")
+        self.assertEqual([1], series.column("observationType").tolist(),               "Integer column without missing values")
+
+    def testUnsupportedType(self):
+        '''
+        Test of the error in case of a data object type without columns.
+        '''
+
+        with self.assertRaises(ValueError):
+            ColumnarSeries(Glacier)
+
+    def testGlacierReader(self):
+        '''
+        Test of the glaciers created with columnar series by the glacier reader.
+        '''
+
+        glacierReader = GlacierReader(UnitTestHelper.getDatabaseAccessConfigurationFilePath())
+        glacierRecord = [None, str(uuid.uuid1()), 141, None, None, "A50i/19", None, "Clariden"]
+
+        self.assertIsInstance(glacierReader._recordToObject(glacierRecord).massBalancePoints, dict,    "Dictionary by default")
+
+        glacierReader.columnarSeries = True
+
+        self.assertIsInstance(glacierReader._recordToObject(glacierRecord).massBalancePoints, ColumnarSeries, "Columnar series if enabled")
+
+    def testReaders(self):
+        '''
+        Test of the same data frames of the series filled by the readers into dictionaries and into columnar series.
+        '''
+
+        configuration = configparser.ConfigParser()
+        configuration.read(UnitTestHelper.getDataflowConfigurationFilePath())
+
+        pk = uuid.uuid1()
+
+        for readerClass, fileName, dataFrameName in [
+            (MassBalanceIndexTimeDailyReader, "clariden_P0_cum.dat", "massBalanceIndexTimeDailyDataFrame"),
+            (MassBalanceIndexSpatialDailyReader, "clariden_cumulative.dat", "massBalanceIndexSpatialDailyDataFrame"),
+            (MassBalancePointReader, "clariden_annual.dat", "massBalancePointDataFrame")]:
+
+            dataFrames = list()
+
+            for columnarSeries in [False, True]:
+
+                glaciers = {"A50i/19": Glacier(pk, 141, "A50i/19", "Clariden", columnarSeries=columnarSeries)}
+
+                reader = readerClass(configuration, "./VawDataFiles/" + fileName, glaciers)
+                reader.parse()
+
+                dataFrame = getattr(reader.glacier, dataFrameName)
+                dataFrames.append(dataFrame.drop(columns=["pk"], errors="ignore").sort_values(list(dataFrame.columns[1:3])).reset_index(drop=True))
+
+            pandas.testing.assert_frame_equal(dataFrames[0], dataFrames[1])
@@ -0,0 +1,132 @@
+'''
+Created on 18.10.2026
+
+@author: yvo
+'''
+import datetime
+import unittest
+import uuid
+
+import numpy
+import pandas
+
+from dataflow.DataObjects.DataFrameBuilder import DataFrameBuilder
+from dataflow.DataObjects.Glacier import Glacier
+from dataflow.DataObjects.LengthChange import LengthChange
+from dataflow.DataObjects.MassBalance import ElevationBand
+from dataflow.DataObjects.MassBalance import MassBalance
+from dataflow.DataObjects.MassBalance import MassBalanceObservation
+from dataflow.DataObjects.MassBalanceIndexTimeDaily import MassBalanceIndexTimeDaily
+from dataflow.DataObjects.Enumerations.DateEnumerations import DateQualityTypeEnum
+from dataflow.DataObjects.Enumerations.MassBalanceEnumerations import MassBalanceTypeEnum
+
+
+class DataFrameBuilderTests(unittest.TestCase):
+    '''
+    Unit-test class for the column-oriented data frames of the series of a glacier.
+    '''
+
+    def testTypedColumns(self):
+        '''
+        Test of the types and the missing values of the columns of a length change series.
+        '''
+
+        glacier = Glacier(uuid.uuid1(), 141, "A50i/19", "Clariden")
+        glacier.addLengthChange(LengthChange(
+            None, datetime.date(1990, 9, 1), 1, datetime.date(1991, 9, 1), DateQualityTypeEnum.Estimated,
+            "m", None, None, -12.5, None, 2450.0, "G. Kappenberger", None))
+        glacier.addLengthChange(LengthChange(
+            None, datetime.date(1991, 9, 1), DateQualityTypeEnum.Estimated, None, None,
+            "r", None, None, None, None, None, None, None))
+
+        dataFrame = glacier.lengthChangeDataFrame
+
+        self.assertEqual(2, len(dataFrame),                                                    "Number of rows")
+        self.assertEqual("datetime64[ns]", str(dataFrame["dateFrom"].dtype),                  "Date column")
+        self.assertEqual(pandas.Timestamp(1990, 9, 1), dataFrame["dateFrom"][0],               "Date value")
+        self.assertTrue(pandas.isna(dataFrame["dateTo"][1]),                                   "Missing date")
+        self.assertIsInstance(dataFrame["dateFromQuality"].dtype, pandas.CategoricalDtype,     "Enumeration column")
+        self.assertEqual(["Precisely", "Estimated"], dataFrame["dateFromQuality"].tolist(),    "Members given as code and as member")
+        self.assertTrue(pandas.isna(dataFrame["dateToQuality"][1]),                            "Missing member")
+        self.assertEqual(-12.5, dataFrame["variationQuantitative"][0],                         "Float value")
+        self.assertTrue(numpy.isnan(dataFrame["elevationMin"][1]),                             "Missing float value")
+        self.assertTrue(dataFrame["pk"].isna().all(),                                          "Identifiers not yet created")
+        self.assertTrue(all(lengthChange._pk == None for lengthChange in glacier.lengthChanges.values()), "No identifiers created by the data frame")
+
+    def testIntegerColumn(self):
+        '''
+        Test of the nullable integer columns, the not integral values and the invalid codes of an enumeration column.
+        '''
+
+        integers = DataFrameBuilder.toColumn([3, None, -1], int)
+
+        self.assertEqual("Int64", str(integers.dtype),                                         "Nullable integer column")
+        self.assertEqual([3, -1], integers[~integers.isna()].tolist(),                         "Integer values")
+        self.assertTrue(pandas.isna(integers[1]),                                              "Missing integer value")
+
+        integers = DataFrameBuilder.toColumn(numpy.array([2.0, numpy.nan]), int)
+
+        self.assertEqual([2], integers[~integers.isna()].tolist(),                             "Integral float values")
+        self.assertTrue(pandas.isna(integers[1]),                                              "NaN as missing integer value")
+
+        with self.assertRaises(ValueError):
+            DataFrameBuilder.toColumn([1, 2.5], int)
+
+        with self.assertRaises(ValueError):
+            DataFrameBuilder.toColumn([1, 5], DateQualityTypeEnum)
+
+    def testElevationBandDataFrame(self):
+        '''
+        Test of the long-format data frame of the elevation bands of a mass balance series.
+        '''
+
+        glacier = Glacier(uuid.uuid1(), 141, "A50i/19", "Clariden")
+
+        for year in [2018, 2019]:
+            massBalance = MassBalanceObservation(
+                None, 1, datetime.date(year, 10, 1), datetime.date(year + 1, 9, 30),
+                datetime.date(year, 10, 1), datetime.date(year + 1, 4, 30),
+                2500, 3200, 5.0, 2900, 50, 1200, -800)
+            for elevationFrom in range(2500, 3200, 100):
+                massBalance.addElevationBand(ElevationBand(
+                    None, elevationFrom, elevationFrom + 100, 1000, 2, elevationFrom - 3000, 3, 0.5))
+            glacier.addMassBalance(massBalance)
+
+        massBalanceDataFrame = glacier.massBalanceDataFrame
+        massBalanceExtendedDataFrame = glacier.massBalanceExtendedDataFrame
+        elevationBandDataFrame = glacier.elevationBandDataFrame
+
+        self.assertEqual(['dateFromAnnual', 'dateToWinter', 'dateToAnnual', 'winterMassBalance', 'annualMassBalance', 'massBalanceType'],
+                         list(massBalanceDataFrame.columns),                                   "Original columns of the data frame")
+        self.assertEqual([datetime.date(2018, 10, 1), datetime.date(2019, 10, 1)],
+                         massBalanceDataFrame["dateFromAnnual"].tolist(),                      "Original dates of the mass balances")
+        self.assertEqual([MassBalanceTypeEnum.Observation] * 2, massBalanceDataFrame["massBalanceType"].tolist(), "Original type of the mass balances")
+        self.assertEqual([name for name, columnType in MassBalance.COLUMNS],
+                         list(massBalanceExtendedDataFrame.columns),                           "Columns of the extended data frame")
+        self.assertEqual(["Observation", "Observation"], massBalanceExtendedDataFrame["massBalanceType"].tolist(), "Categories of the type of the mass balances")
+        self.assertEqual(14, len(elevationBandDataFrame),                                      "One row per elevation band")
+        self.assertEqual([pandas.Timestamp(2018, 10, 1)] * 7 + [pandas.Timestamp(2019, 10, 1)] * 7,
+                         elevationBandDataFrame["dateFromAnnual"].tolist(),                    "Repeated dates of the mass balances")
+        self.assertEqual(list(range(-500, 200, 100)) * 2,
+                         elevationBandDataFrame["annualMassBalance"].tolist(),                 "Mass balance of the bands")
+
+    def testColumnarSeries(self):
+        '''
+        Test of the same data frame for a dictionary and a columnar series.
+        '''
+
+        dataFrames = []
+
+        for columnarSeries in [False, True]:
+
+            glacier = Glacier(uuid.uuid1(), 141, "A50i/19", "Clariden", columnarSeries=columnarSeries)
+
+            for day in range(1, 4):
+                glacier.addMassBalanceIndexTimeDaily(MassBalanceIndexTimeDaily(
+                    uuid.UUID(int=day), "P0", datetime.date(2020, 10, day), None, None, None,
+                    -10 * day, 2 * day, -12 * day, day, 0.5 * day, None, "VAW / ETHZ"))
+
+            dataFrames.append(glacier.massBalanceIndexTimeDailyDataFrame)
+
+        pandas.testing.assert_frame_equal(dataFrames[0], dataFrames[1])
+        self.assertEqual(["Ice", "Firn", "Snow"], dataFrames[0]["surface_type"].tolist(),      "Surface types of the codes")
@@ -0,0 +1,106 @@
+'''
+Created on 18.10.2026
+
+@author: yvo
+'''
+import configparser
+import os
+import shutil
+import tempfile
+import unittest
+import uuid
+
+from dataflow.DataReaders.VawFileReaders.MassBalanceReader import MassBalanceReader
+from dataflow.DataReaders.VawFileReaders.MassBalancePointReader import MassBalancePointReader
+from dataflow.DataReaders.VawFileReaders.MassBalanceIndexTimeDailyReader import MassBalanceIndexTimeDailyReader
+from dataflow.DataReaders.VawFileReaders.MassBalanceIndexSpatialDailyReader import MassBalanceIndexSpatialDailyReader
+from dataflow.DataReaders.VawFileReaders.MassBalanceSwissWideReader import MassBalanceSwissWideReader
+from dataflow.DataObjects.Glacier import Glacier
+
+from Helper import UnitTestHelper
+
+
+class DataObjectSlotsTests(unittest.TestCase):
+    '''
+    Unit-test class for the high-volume data objects stored in __slots__. The data objects are created by
+    their readers, a per-instance dictionary of any class of the hierarchy would be found by these tests.
+    '''
+
+    def setUp(self):
+        '''
+        Setup of the configuration and the glaciers of the test files.
+        '''
+
+        self._configuration = configparser.ConfigParser()
+        self._configuration.read(UnitTestHelper.getDataflowConfigurationFilePath())
+
+        self._clariden = Glacier(uuid.uuid1(), 141, "A50i/19", "Clariden")
+        self._glaciers = {self._clariden.pkSgi: self._clariden}
+
+    def _assertSlotted(self, dataObjects):
+
+        dataObjects = list(dataObjects)
+
+        self.assertTrue(len(dataObjects) > 0,                                                   "Data objects parsed")
+
+        for dataObject in dataObjects:
+            self.assertFalse(hasattr(dataObject, "__dict__"),                                   "No __dict__ of " + type(dataObject).__name__)
+
+    def _parse(self, readerClass, fileName):
+
+        reader = readerClass(self._configuration, "./VawDataFiles/" + fileName, self._glaciers)
+        reader.parse()
+
+        return reader.glacier
+
+    def testElevationBand(self):
+        '''
+        Test of the elevation bands of a mass balance file.
+        '''
+
+        glacier = self._parse(MassBalanceReader, "clariden_obs.dat")
+
+        self._assertSlotted(elevationBand for massBalance in glacier.massBalances.values() for elevationBand in massBalance.elevationBands.values())
+
+    def testMassBalancePoint(self):
+        '''
+        Test of the point mass balances of an annual file.
+        '''
+
+        self._assertSlotted(self._parse(MassBalancePointReader, "clariden_annual.dat").massBalancePoints.values())
+
+    def testMassBalanceIndexTimeDaily(self):
+        '''
+        Test of the daily index mass balances of a _cum file.
+        '''
+
+        self._assertSlotted(self._parse(MassBalanceIndexTimeDailyReader, "clariden_P0_cum.dat").massBalanceIndexTimeDailys.values())
+
+    def testMassBalanceIndexSpatialDaily(self):
+        '''
+        Test of the daily spatial index mass balances of a _cumulative file.
+        '''
+
+        self._assertSlotted(self._parse(MassBalanceIndexSpatialDailyReader, "clariden_cumulative.dat").massBalanceIndexSpatialDailys.values())
+
+    def testMassBalanceSwissWide(self):
+        '''
+        Test of the swiss wide mass balances created from the matrices of the swiss wide files.
+        '''
+
+        directory = tempfile.mkdtemp()
+
+        try:
+            fullFileNames = list()
+
+            for fileName in ["area.dat", "mb_evo.dat", "vol_evo.dat"]:
+                fullFileNames.append(os.path.join(directory, fileName))
+                with open(fullFileNames[-1], "w", encoding="latin-1") as swissWideFile:
+                    swissWideFile.write("#  Swiss wide values\n#  SGI-ID 2020  2021\nA50i/19 5.1 5.0\n")
+
+            matrix = MassBalanceSwissWideReader(None, fullFileNames, self._glaciers).parse()
+
+            self._assertSlotted(matrix.iterMassBalanceSwissWides())
+
+        finally:
+            shutil.rmtree(directory)
@@ -18,6 +18,13 @@ this list only.
 
 import unittest
 
+import ColumnarSeriesTests
+import DataFrameBuilderTests
+import DataObjectSlotsTests
+import GlacierCatalogTests
+import GlamosEnumTests
+import UuidAllocatorTests
+
 def getTestModules():
     '''
     Defines a list of all modules in the package with UnitTests which have
@@ -29,7 +36,12 @@ def getTestModules():
     @return: List of modules in the package with UnitTests which have to run.
     '''
     return [
-
+        ColumnarSeriesTests,
+        DataFrameBuilderTests,
+        DataObjectSlotsTests,
+        GlacierCatalogTests,
+        GlamosEnumTests,
+        UuidAllocatorTests
         ]
 
 def createTestSuite():
@@ -18,9 +18,18 @@ this list only.
 
 import unittest
 
+import ColumnSchemaTests
+import DatabaseConnectionPoolTests
+import FixedWidthSchemaTests
 import GlacierReaderTests
+import LengthChangeReaderTests
+import MassBalanceColumnarParserTests
 import MassBalanceDatabaseReaderTests
+import MassBalanceIndexSeasonalReaderTests
+import MassBalanceIndexTimeDailyReaderTests
+import MassBalancePointReaderTests
 import MassBalanceReaderTests
+import MassBalanceSwissWideReaderTests
 import VolumeChangeReaderTests
 
 def getTestModules():
@@ -35,8 +44,17 @@ def getTestModules():
     '''
     return [
         MassBalanceDatabaseReaderTests,
+        DatabaseConnectionPoolTests,
         GlacierReaderTests,
         MassBalanceReaderTests,
+        MassBalanceSwissWideReaderTests,
+        MassBalanceColumnarParserTests,
+        MassBalanceIndexTimeDailyReaderTests,
+        MassBalanceIndexSeasonalReaderTests,
+        MassBalancePointReaderTests,
+        ColumnSchemaTests,
+        FixedWidthSchemaTests,
+        LengthChangeReaderTests,
         VolumeChangeReaderTests
         ]
 
@@ -18,6 +18,8 @@ this list only.
 
 import unittest
 
+import MassBalanceSwissWideWriterTests
+
 def getTestModules():
     '''
     Defines a list of all modules in the package with UnitTests which have
@@ -29,7 +31,7 @@ def getTestModules():
     @return: List of modules in the package with UnitTests which have to run.
     '''
     return [
-
+        MassBalanceSwissWideWriterTests
         ]
 
 def createTestSuite():
@@ -0,0 +1,117 @@
+'''
+Created on 18.10.2026
+
+@author: yvo
+'''
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+import unittest.mock
+
+from psycopg2 import extensions
+
+from dataflow.DataReaders.DatabaseConnectionPool import DatabaseConnectionPool
+
+
+class StubConnectionInfo(object):
+    '''
+    Connection information of an idle stub connection.
+    '''
+
+    transaction_status = extensions.TRANSACTION_STATUS_IDLE
+
+
+class StubConnection(object):
+    '''
+    Connection handed out by the pool instead of a connection to the database.
+    '''
+
+    def __init__(self, *args, **kwargs):
+
+        self.closed = 0
+        self.info = StubConnectionInfo()
+
+    def close(self):
+
+        self.closed = 1
+
+
+class DatabaseConnectionPoolTests(unittest.TestCase):
+    '''
+    Unit-test class for the sharing of the connection pool by several threads. The connections of the pool
+    are stub connections, no database is needed.
+    '''
+
+    def setUp(self):
+        '''
+        Setup of a temporary access configuration file and of the stub connections.
+        '''
+
+        self._directory = tempfile.mkdtemp()
+
+        patcher = unittest.mock.patch("psycopg2.connect", StubConnection)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+
+        shutil.rmtree(self._directory)
+
+    def _createPool(self, maximumConnections):
+
+        accessConfigurationFullFileName = os.path.join(self._directory, "databaseAccessConfiguration.cfg")
+
+        with open(accessConfigurationFullFileName, "w") as configurationFile:
+            configurationFile.write("[Access]\nhost=localhost\ndbname=glamos\nuser=glamos\npassword=glamos\n")
+            configurationFile.write("[Pool]\nminConnections={0}\nmaxConnections={0}\n".format(maximumConnections))
+
+        return DatabaseConnectionPool(accessConfigurationFullFileName)
+
+    def testBlockingBorrow(self):
+        '''
+        Test of the borrowing of an exhausted pool waiting for a connection given back by another thread.
+        '''
+
+        pool = self._createPool(1)
+        connection = pool.borrowConnection()
+
+        borrowedConnections = list()
+        borrowingThread = threading.Thread(target=lambda: borrowedConnections.append(pool.borrowConnection()))
+        borrowingThread.start()
+        borrowingThread.join(0.2)
+
+        self.assertTrue(borrowingThread.is_alive(),                                            "Borrowing waits for a connection")
+
+        pool.returnConnection(connection)
+        borrowingThread.join(5)
+
+        self.assertEqual([connection], borrowedConnections,                                    "Connection given back reused")
+        self.assertEqual(1, pool.connectionsOpened,                                            "Opened connections")
+        self.assertEqual(2, pool.connectionsBorrowed,                                          "Borrowed connections")
+
+    def testConcurrentStatistics(self):
+        '''
+        Test of the statistics of a pool shared by more threads than connections.
+        '''
+
+        pool = self._createPool(3)
+        errors = list()
+
+        def borrowAndReturn():
+            try:
+                for _ in range(200):
+                    pool.returnConnection(pool.borrowConnection())
+            except Exception as exception:
+                errors.append(exception)
+
+        threads = [threading.Thread(target=borrowAndReturn) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([], errors,                                                           "No errors of an exhausted pool")
+        self.assertEqual(1600, pool.connectionsBorrowed,                                       "Borrowed connections")
+        self.assertEqual(3, pool.connectionsOpened,                                            "Opened connections of the pool")
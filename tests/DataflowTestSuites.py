@@ -15,6 +15,7 @@ import unittest
 import DataReadersTestSuites
 import DataObjectsTestSuites
 import DataWritersTestSuites
+import IngestionTestSuites
 
 if __name__ == '__main__':
     
@@ -25,6 +26,7 @@ if __name__ == '__main__':
     testSuites.extend(DataReadersTestSuites.createTestSuite())
     testSuites.extend(DataObjectsTestSuites.createTestSuite())
     testSuites.extend(DataWritersTestSuites.createTestSuite())
+    testSuites.extend(IngestionTestSuites.createTestSuite())
     
     # Combining all UnitTest-Suites into one major TestSuite.
     bigSuite = unittest.TestSuite(testSuites)
@@ -0,0 +1,67 @@
+'''
+Created on 18.10.2026
+
+@author: yvo
+'''
+import math
+import unittest
+
+import numpy
+
+from dataflow.DataReaders.VawFileReaders.FixedWidthSchema import FixedWidthSchema
+
+
+class FixedWidthSchemaTests(unittest.TestCase):
+    '''
+    Unit-test class for the columnar parsing engine of the VAW data files with fixed-width columns.
+    '''
+
+    def setUp(self):
+        '''
+        Setup of a schema with digit, float, string and overlapping columns.
+        '''
+
+        self._fixedWidthSchema = FixedWidthSchema([
+            ("year",    0, 4,    int),
+            ("code",    5, 6,    str),
+            ("value",   6, 12,   float),
+            ("comment", 10, None, str)])
+
+    def testConvertBlock(self):
+        '''
+        Test of the typed arrays with an empty line, a short line and a missing value.
+        '''
+
+        data = self._fixedWidthSchema.convertBlock(["2020 m  12.5 ok\n", "\n", "2021  NaN\n", "1999 x   -3\n"])
+
+        self.assertEqual([0, 2, 3], self._fixedWidthSchema.lineIndexes,  "Indexes of the converted lines")
+        self.assertEqual([2020, 2021, 1999], data["year"].tolist(),       "Values of a digit column")
+        self.assertEqual(["m", " ", "x"], data["code"].tolist(),          "Values of a string column")
+        self.assertEqual(12.5, data["value"][0],                          "Value of a float column")
+        self.assertTrue(math.isnan(data["value"][1]),                     "Missing value of a float column")
+        self.assertEqual(".5 ok", data["comment"][0],                        "Value of an overlapping column")
+        self.assertEqual("", data["comment"][1],                          "Value of a column beyond a short line")
+
+    def testInvalidLines(self):
+        '''
+        Test of the removal of lines with values which cannot be converted.
+        '''
+
+        data = self._fixedWidthSchema.convertBlock(["2020 m  12.5\n", "20x1 m  12.5\n", "2022 m   abc\n", " 203 m   1.0\n"])
+
+        self.assertEqual([0, 3], self._fixedWidthSchema.lineIndexes,      "Indexes of the valid lines")
+        self.assertEqual([1, 2], [lineIndex for lineIndex, e in self._fixedWidthSchema.invalidLines], "Indexes of the invalid lines")
+        self.assertEqual([2020, 203], data["year"].tolist(),              "Values of a digit column with a leading space")
+        self.assertEqual([12.5, 1.0], data["value"].tolist(),             "Values of the valid lines")
+
+    def testToFloats(self):
+        '''
+        Test of the lenient conversion of a string column into floats.
+        '''
+
+        floats = FixedWidthSchema.toFloats(numpy.array([" 2.5 ", "   ", "", "n/a"]))
+
+        self.assertEqual(2.5, floats[0],                                  "Number")
+        self.assertTrue(math.isnan(floats[1]),                            "Blank value")
+        self.assertTrue(math.isnan(floats[2]),                            "Empty value")
+        self.assertTrue(math.isnan(floats[3]),                            "Text")
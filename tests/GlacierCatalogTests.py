@@ -0,0 +1,67 @@
+'''
+Created on 18.10.2026
+
+@author: yvo
+'''
+import unittest
+import uuid
+
+from dataflow.DataObjects.Glacier import Glacier
+from dataflow.DataObjects.GlacierCatalog import GlacierCatalog
+
+
+class GlacierCatalogTests(unittest.TestCase):
+    '''
+    Unit-test class for the indexed glacier catalog.
+    '''
+
+    def setUp(self):
+        '''
+        Setup of a catalog with two test glaciers.
+        '''
+
+        self._clariden = Glacier(uuid.uuid1(), 141, "A50i/19", "Clariden")
+        self._plaineMorte = Glacier(uuid.uuid1(), 65, "A55f/03", "Glacier de la Plaine Morte")
+
+        self._catalog = GlacierCatalog([self._clariden, self._plaineMorte])
+
+    def testLookups(self):
+        '''
+        Test of the lookups by the different keys of the glaciers.
+        '''
+
+        self.assertEqual(2, len(self._catalog),                                                "Number of glaciers in the catalog")
+        self.assertIs(self._clariden, self._catalog["A50i/19"],                                "Lookup by SGI identifier")
+        self.assertIs(self._clariden, self._catalog.getByPk(self._clariden.pk),                "Lookup by primary key")
+        self.assertIs(self._plaineMorte, self._catalog.getByVaw(65),                           "Lookup by VAW identifier")
+        self.assertEqual([self._plaineMorte], self._catalog.getByName("glacier de la plaine-morte"), "Lookup by normalised name")
+        self.assertIsNone(self._catalog.getByVaw(5),                                           "Lookup of missing VAW identifier")
+
+    def testRemoval(self):
+        '''
+        Test of the update of all indexes after removing a glacier.
+        '''
+
+        del self._catalog["A50i/19"]
+
+        self.assertEqual(["A55f/03"], list(self._catalog.keys()),                              "Keys after removal")
+        self.assertIsNone(self._catalog.getByVaw(141),                                         "VAW index after removal")
+        self.assertIsNone(self._catalog.getByPk(self._clariden.pk),                            "Primary key index after removal")
+        self.assertEqual([], self._catalog.getByName("Clariden"),                              "Name index after removal")
+
+    def testConversionOfDictionary(self):
+        '''
+        Test of the conversion of a plain dictionary of glaciers into a catalog.
+        '''
+
+        catalog = GlacierCatalog({self._clariden.pkSgi: self._clariden})
+
+        self.assertIs(self._clariden, catalog.getByVaw(141),                                   "Lookup in converted dictionary")
+
+    def testNormaliseName(self):
+        '''
+        Test of the normalisation of glacier names.
+        '''
+
+        self.assertEqual("glacier de tsanfleuron", GlacierCatalog.normaliseName(" Glacier de  Tsanfleuron"), "Whitespaces and case")
+        self.assertEqual("gietro", GlacierCatalog.normaliseName("Giétro"),                     "Accents")
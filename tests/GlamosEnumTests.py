@@ -0,0 +1,46 @@
+'''
+Created on 18.10.2026
+
+@author: yvo
+'''
+import unittest
+
+import numpy
+
+from dataflow.DataObjects.Enumerations.DateEnumerations import DateQualityTypeEnum
+from dataflow.DataObjects.Enumerations.MassBalanceEnumerations import AnalysisMethodEnum
+
+
+class GlamosEnumTests(unittest.TestCase):
+    '''
+    Unit-test class for the lookup tables of the enumerations of the data objects.
+    '''
+
+    def testFromValue(self):
+        '''
+        Test of the conversion of single codes and members.
+        '''
+
+        self.assertIs(DateQualityTypeEnum.Estimated, DateQualityTypeEnum.fromValue(11),                        "Member of a code")
+        self.assertIs(DateQualityTypeEnum.Precisely, DateQualityTypeEnum.fromValue(numpy.int64(1)),           "Member of a NumPy code")
+        self.assertIs(AnalysisMethodEnum.AnnualStakeObservations,
+                      AnalysisMethodEnum.fromValue(AnalysisMethodEnum.AnnualStakeObservations),               "Member given")
+
+        for invalidValue in [5, 12, -1, "1"]:
+            with self.assertRaises(ValueError, msg="Invalid code {0}".format(invalidValue)):
+                DateQualityTypeEnum.fromValue(invalidValue)
+
+    def testFromValues(self):
+        '''
+        Test of the vectorised conversions between codes and members.
+        '''
+
+        codes = numpy.array([11, 0, 1, 11])
+        members = DateQualityTypeEnum.fromValues(codes)
+
+        self.assertEqual([DateQualityTypeEnum.Estimated, DateQualityTypeEnum.NotDefinedUnknown,
+                          DateQualityTypeEnum.Precisely, DateQualityTypeEnum.Estimated], members.tolist(), "Members of the codes")
+        self.assertEqual(codes.tolist(), DateQualityTypeEnum.toValues(members).tolist(),                    "Codes of the members")
+
+        with self.assertRaises(ValueError):
+            DateQualityTypeEnum.fromValues([1, 5, 12])
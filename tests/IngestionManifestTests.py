@@ -0,0 +1,92 @@
+'''
+Created on 18.10.2026
+
+@author: yvo
+'''
+import os
+import shutil
+import tempfile
+import unittest
+
+from dataflow.IngestionManifest import IngestionManifest
+
+
+class IngestionManifestTests(unittest.TestCase):
+    '''
+    Unit-test class for the manifest of the imported VAW data files.
+    '''
+
+    def setUp(self):
+        '''
+        Setup of a temporary directory with a data file and the manifest file.
+        '''
+
+        self._directory = tempfile.mkdtemp()
+
+        self._dataFilePath = os.path.join(self._directory, "clariden_obs.dat")
+        self._writeDataFile("1 2 3\n")
+
+        self._manifestFilePath = os.path.join(self._directory, IngestionManifest.DEFAULT_FILE_NAME)
+
+    def tearDown(self):
+
+        shutil.rmtree(self._directory)
+
+    def _writeDataFile(self, content, mtime=None):
+
+        with open(self._dataFilePath, "w") as dataFile:
+            dataFile.write(content)
+
+        if mtime != None:
+            os.utime(self._dataFilePath, ns=(mtime, mtime))
+
+    def testRecordedFileUnchanged(self):
+        '''
+        Test of the detection of a recorded and unchanged file after reloading the manifest.
+        '''
+
+        manifest = IngestionManifest(self._manifestFilePath)
+
+        self.assertFalse(manifest.isUnchanged("massBalances", self._dataFilePath),             "Not recorded file")
+
+        manifest.record("massBalances", self._dataFilePath, 12)
+        manifest.save()
+
+        manifest = IngestionManifest(self._manifestFilePath)
+
+        self.assertTrue(manifest.isUnchanged("massBalances", self._dataFilePath),              "Recorded file")
+        self.assertFalse(manifest.isUnchanged("massBalancePoints", self._dataFilePath),        "File recorded by other ingestion")
+        self.assertEqual(12, manifest.entry("massBalances", self._dataFilePath)["records"],    "Recorded number of records")
+        self.assertEqual(1, len(manifest),                                                     "Number of recorded files")
+
+    def testChangedFile(self):
+        '''
+        Test of the detection of changed files by size and content hash.
+        '''
+
+        manifest = IngestionManifest(self._manifestFilePath)
+        manifest.record("massBalances", self._dataFilePath, 1)
+
+        mtime = os.stat(self._dataFilePath).st_mtime_ns
+
+        # Same content, only touched.
+        self._writeDataFile("1 2 3\n", mtime + 1000000000)
+        self.assertTrue(manifest.isUnchanged("massBalances", self._dataFilePath),              "Touched file with same content")
+
+        # Same size, different content.
+        self._writeDataFile("1 2 4\n", mtime + 2000000000)
+        self.assertFalse(manifest.isUnchanged("massBalances", self._dataFilePath),             "Changed content with same size")
+
+        # Appended data.
+        self._writeDataFile("1 2 3\n4 5 6\n", mtime)
+        self.assertFalse(manifest.isUnchanged("massBalances", self._dataFilePath),             "Changed size")
+
+    def testInvalidManifestFile(self):
+        '''
+        Test of the rejection of a manifest file with unknown format.
+        '''
+
+        with open(self._manifestFilePath, "w") as manifestFile:
+            manifestFile.write("[]")
+
+        self.assertRaises(ValueError, IngestionManifest, self._manifestFilePath)
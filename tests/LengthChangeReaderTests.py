@@ -0,0 +1,106 @@
+'''
+Created on 18.10.2026
+
+@author: yvo
+'''
+import datetime
+import math
+import os
+import shutil
+import tempfile
+import unittest
+import uuid
+
+from dataflow.DataReaders.VawFileReaders.LengthChangeReader import LengthChangeReader
+from dataflow.DataObjects.Glacier import Glacier
+
+
+class LengthChangeReaderTests(unittest.TestCase):
+    '''
+    Unit-test class for the VAW-file-based data-reader for length change files with fixed-width columns.
+    '''
+
+    _HEADER = (
+        "#  Length Change; Clariden; 141; 6.50\n"
+        "#  surv.date; m-code; ref.date; lc; clc; h_min; observer\n"
+        "#  dt:ddmmyyyy; ; dt:ddmmyyyy; (m); (m); (m asl);\n"
+        "#  VAW / ETH Zurich; 2022; doi:10.18750/lengthchange.2021.r2021; www.glamos.ch\n")
+
+    _MEASUREMENTS = [
+        ("12.09.2019", "mfx", "15.09.2018", "-12.5", "2450.0", "A. Bauder, M. Funk"),
+        ("00.00.2020", "r",   "12.09.2019", "NaN",   "NaN",    "-"),
+        None,
+        ("30.09.2021", "nxx", "00.00.2020", "-3.0",  "2449.0", "-"),
+        ("31.02.2022", "mxx", "30.09.2021", "-1.0",  "2448.0", "-"),
+        ("15.09.2023", "mxx", "31.08.2022", "abc",   "2448.0", "-"),
+        ("15.09.2024", "oxx", "15.09.2023", "4.5",   "",       "G. Kappenberger")]
+
+    def _dataLine(self, measurement):
+        '''
+        Data line with the values of the measurement at the fixed positions. Empty line if no measurement is given.
+        '''
+
+        if measurement == None:
+            return "\n"
+
+        surveyDate, code, referenceDate, lengthChange, elevation, observer = measurement
+
+        return "{0:<12}{1:<6}{2}{3:>11}     {4:>10}  {5}\n".format(surveyDate, code, referenceDate, lengthChange, elevation, observer)
+
+    def setUp(self):
+        '''
+        Setup of a temporary length change file.
+        '''
+
+        self._glaciers = {"A50i/19": Glacier(uuid.uuid1(), 141, "A50i/19", "Clariden")}
+
+        self._directory = tempfile.mkdtemp()
+        self._dataFilePath = os.path.join(self._directory, "clariden_lc.dat")
+
+        with open(self._dataFilePath, "w", encoding="latin-1") as dataFile:
+            dataFile.write(self._HEADER)
+            dataFile.writelines([self._dataLine(measurement) for measurement in self._MEASUREMENTS])
+
+        self._reader = LengthChangeReader(None, self._dataFilePath, self._glaciers)
+        self._reader.glacier.lengthChanges.clear()
+
+    def tearDown(self):
+
+        shutil.rmtree(self._directory)
+
+    def testSeries(self):
+        '''
+        Test of the typed arrays of the measurements included. Measurements of other types (n) and invalid lines are skipped.
+        '''
+
+        series = self._reader.parseSeries()
+
+        self.assertEqual(3, len(series),                                          "Number of measurements included")
+        self.assertEqual(["m", "r", "o"], series.measurementTypes.tolist(),      "Measurement types included")
+        self.assertEqual(datetime.date(2020, 9, 1), series.dateTos.tolist()[1],  "Estimated survey date")
+        self.assertTrue(math.isnan(series.variationQuantitatives[1]),            "Missing length change")
+        self.assertTrue(math.isnan(series.elevationMins[2]),                     "Empty elevation")
+        self.assertEqual(0, len(self._reader.glacier.lengthChanges),             "No objects created")
+
+    def testLengthChanges(self):
+        '''
+        Test of the LengthChange objects created from the arrays.
+        '''
+
+        lengthChanges = self._reader.parse()
+
+        self.assertEqual(3, len(lengthChanges),                                   "Number of objects")
+        self.assertEqual(3, len(self._reader.glacier.lengthChanges),              "Number of objects of the glacier")
+
+        lengthChange = lengthChanges[0]
+        self.assertEqual(datetime.date(2018, 9, 15), lengthChange.dateFrom,       "Reference date")
+        self.assertEqual(1, lengthChange.dateFromQuality,                         "Quality of the reference date")
+        self.assertEqual("f", lengthChange.measurementMethod,                     "Measurement method")
+        self.assertEqual(-12.5, lengthChange.variationQuantitative,               "Length change")
+        self.assertEqual(2450.0, lengthChange.elevationMin,                       "Elevation")
+        self.assertEqual("A. Bauder; M. Funk", lengthChange.observer,             "Observers")
+
+        lengthChange = lengthChanges[1]
+        self.assertEqual(11, lengthChange.dateToQuality,                          "Quality of the estimated survey date")
+        self.assertEqual(None, lengthChange.elevationMin,                         "Missing elevation")
+        self.assertEqual(None, lengthChange.observer,                             "Missing observer")
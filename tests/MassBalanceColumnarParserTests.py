@@ -0,0 +1,82 @@
+'''
+Created on 18.10.2026
+
+@author: yvo
+'''
+import unittest
+
+import numpy
+
+from dataflow.DataReaders.VawFileReaders.MassBalanceColumnarParser import MassBalanceColumnarParser
+
+
+class MassBalanceColumnarParserTests(unittest.TestCase):
+    '''
+    Unit-test class for the columnar parsing engine of the VAW mass-balance files.
+    '''
+
+    _NUMBER_HEADER_LINES = 4
+
+    def setUp(self):
+        '''
+        Setup of the data lines of the Clariden observations (12 elevation bands of 100 m starting at 2100 m asl.).
+        '''
+
+        with open("./VawDataFiles/clariden_obs.dat", "r", encoding="latin-1") as mb:
+            self._dataLines = mb.readlines()[self._NUMBER_HEADER_LINES:]
+
+        self._parser = MassBalanceColumnarParser(12, 2100, 100.0)
+
+    def testParsingDataBlock(self):
+        '''
+        Test of the shape and values of the arrays of the data block.
+        '''
+
+        self.assertEqual(103, self._parser.parse(self._dataLines),                 "Number of parsed mass-balances")
+        self.assertEqual((103, 12), self._parser.uniqueValues.shape,               "Shape of the unique values")
+        self.assertEqual((103, 12), self._parser.annualBalances.shape,             "Shape of the annual balances of the elevation bands")
+        self.assertEqual(19140928, self._parser.uniqueValues[0, 1],                "Date of the first mass-balance")
+        self.assertEqual(234, self._parser.winterBalances[0, 0],                   "Winter balance of the first elevation band")
+        self.assertEqual(-18237, self._parser.annualBalances[0, 0],                "Annual balance of the first elevation band")
+        self.assertEqual(0.0125, self._parser.surfaces[0, 0],                      "Surface of the first elevation band")
+        self.assertTrue(numpy.isnan(self._parser.winterMeasurements).all(),        "Missing number of measurements in files with three columns per band")
+        self.assertEqual(1064, self._parser.validBands.sum(),                      "Number of valid elevation bands")
+
+    def testInvalidLines(self):
+        '''
+        Test of the handling of empty lines and lines with unexpected number of columns.
+        '''
+
+        dataLines = self._dataLines[:2] + ["\n", "1 19150808 0923\n"] + self._dataLines[2:3]
+
+        self.assertEqual(3, self._parser.parse(dataLines),                         "Number of parsed mass-balances")
+        self.assertEqual([0, 1, 4], self._parser.lineIndexes.tolist(),             "Indexes of the parsed lines")
+        self.assertEqual(1, len(self._parser.invalidLines),                        "Number of invalid lines")
+        self.assertEqual(3, self._parser.invalidLines[0][0],                       "Index of the invalid line")
+
+    def testBandValuesAsLists(self):
+        '''
+        Test of the conversion of NaN values into None.
+        '''
+
+        values = numpy.array([[1.0, numpy.nan], [numpy.nan, -4.0]])
+
+        self.assertEqual([[1, None], [None, -4]], self._parser.bandValuesAsLists(values), "Conversion of the band values")
+
+    def testNotIntegerValues(self):
+        '''
+        Test of the rejection of lines with values which are not integers in the integer columns.
+        '''
+
+        lineParts = self._dataLines[1].split()
+        lineParts[6] = "-1234.5"
+        dataLines = [self._dataLines[0], " ".join(lineParts) + "\n", self._dataLines[2]]
+
+        self.assertEqual(2, self._parser.parse(dataLines),                         "Number of parsed mass-balances")
+        self.assertEqual([0, 2], self._parser.lineIndexes.tolist(),                "Indexes of the parsed lines")
+        self.assertEqual(1, len(self._parser.invalidLines),                        "Number of invalid lines")
+        self.assertEqual(1, self._parser.invalidLines[0][0],                       "Index of the invalid line")
+        self.assertEqual(0.0125, self._parser.surfaces[0, 0],                      "Surfaces are not integers")
+
+        with self.assertRaises(ValueError):
+            self._parser.bandValuesAsLists(numpy.array([[1.5, numpy.nan]]))
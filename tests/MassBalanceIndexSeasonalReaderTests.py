@@ -0,0 +1,109 @@
+'''
+Created on 18.10.2026
+
+@author: yvo
+'''
+import configparser
+import datetime
+import unittest
+import uuid
+
+from dataflow.DataReaders.VawFileReaders.MassBalanceIndexTimeSeasonalReader import MassBalanceIndexTimeSeasonalReader
+from dataflow.DataReaders.VawFileReaders.MassBalanceIndexSpatialSeasonalReader import MassBalanceIndexSpatialSeasonalReader
+from dataflow.DataReaders.VawFileReaders.MassBalanceIndexSpatialDailyReader import MassBalanceIndexSpatialDailyReader
+from dataflow.DataObjects.Glacier import Glacier
+
+from Helper import UnitTestHelper
+
+
+class MassBalanceIndexSeasonalReaderTests(unittest.TestCase):
+    '''
+    Unit-test class for the VAW-file-based data-readers for seasonal index mass balances (_mb files) and
+    for spatial index mass balances (_pointmb and _cumulative files).
+
+    The expected values are the values of the readers before the declarative column schema.
+    '''
+
+    def setUp(self):
+        '''
+        Setup of the configuration and the glacier of the test files.
+        '''
+
+        self._configuration = configparser.ConfigParser()
+        self._configuration.read(UnitTestHelper.getDataflowConfigurationFilePath())
+
+        self._glaciers = {"A50i/19": Glacier(uuid.uuid1(), 141, "A50i/19", "Clariden")}
+
+    def _parse(self, readerClass, fileName, collectionName, sortKey):
+
+        reader = readerClass(self._configuration, "./VawDataFiles/" + fileName, self._glaciers)
+        getattr(reader.glacier, collectionName).clear()
+        reader.parse()
+
+        return sorted(getattr(reader.glacier, collectionName).values(), key=sortKey)
+
+    def testTimeSeasonal(self):
+        '''
+        Test of the values of the seasonal index mass balances of a stake.
+        '''
+
+        massBalances = self._parse(MassBalanceIndexTimeSeasonalReader, "clariden_P1_mb.dat", "massBalanceIndexTimeSeasonals",
+                                    lambda massBalance: massBalance.date_0)
+
+        self.assertEqual(2, len(massBalances),                                                "Number of seasonal index mass balances")
+
+        massBalance = massBalances[0]
+
+        self.assertEqual("P1", massBalance.name,                                              "Stake name of the header")
+        self.assertEqual(3, massBalance.analysis_method_type,                                 "Analysis method")
+        self.assertEqual(datetime.date(2017, 10, 1), massBalance.date_0,                      "Date of the begin")
+        self.assertEqual(datetime.date(2017, 9, 25), massBalance.date_fmeas,                  "Fall measurement with the year of the begin")
+        self.assertEqual(datetime.date(2017, 10, 12), massBalance.date_fmin,                  "Fall minimum with the year of the begin")
+        self.assertEqual(datetime.date(2018, 5, 2), massBalance.date_smeas,                   "Spring measurement with the year of the end")
+        self.assertEqual(datetime.date(2018, 4, 20), massBalance.date_smax,                   "Spring maximum with the year of the end")
+        self.assertEqual(datetime.date(2018, 9, 30), massBalance.date_1,                      "Date of the end")
+        self.assertEqual((712255.0, 186905.0, 2812.0), (massBalance.latitude, massBalance.longitude, massBalance.altitude), "Position")
+        self.assertEqual((1020, -1450), (massBalance.b_w_meas, massBalance.b_a_meas),         "Measured balances")
+        self.assertEqual((1180, 1630, -160, -3080),
+                         (massBalance.c_w_obs, massBalance.a_w_obs, massBalance.c_a_obs, massBalance.a_a_obs), "Observed components assigned crosswise")
+        self.assertEqual((1040, -1490, 1210, 1690, -170, -3180),
+                         (massBalance.b_w_fix, massBalance.b_a_fix, massBalance.c_w_fix, massBalance.a_w_fix, massBalance.c_a_fix, massBalance.a_a_fix), "Fixed date components")
+        self.assertEqual("VAW / ETHZ ; 2020.11.20 ; Huss and Bauder, 2008, Annals of Glaciology; www.glamos.ch", massBalance.reference, "Reference of the header")
+
+    def testSpatialSeasonal(self):
+        '''
+        Test of the values of the spatial index mass balances of several stakes.
+        '''
+
+        massBalances = self._parse(MassBalanceIndexSpatialSeasonalReader, "clariden_pointmb.dat", "massBalanceIndexSpatialSeasonals",
+                                    lambda massBalance: massBalance.name)
+
+        self.assertEqual(["P1", "P2"], [massBalance.name for massBalance in massBalances],   "Stake names of the data lines")
+
+        massBalance = massBalances[1]
+
+        self.assertEqual(datetime.date(2018, 10, 8), massBalance.date_fmin,                   "Fall minimum with the year of the begin")
+        self.assertEqual(datetime.date(2019, 4, 16), massBalance.date_smax,                   "Spring maximum with the year of the end")
+        self.assertEqual((712890.5, 187120.5, 2950.5), (massBalance.latitude, massBalance.longitude, massBalance.altitude), "Position")
+        self.assertEqual((1210, -640), (massBalance.b_w_meas, massBalance.b_a_meas),         "Measured balances")
+        self.assertEqual((1330, 1575, -120, -2215),
+                         (massBalance.c_w_obs, massBalance.a_w_obs, massBalance.c_a_obs, massBalance.a_a_obs), "Observed components assigned crosswise")
+        self.assertEqual((1190, -660, 1320, 1560, -130, -2220),
+                         (massBalance.b_w_fix, massBalance.b_a_fix, massBalance.c_w_fix, massBalance.a_w_fix, massBalance.c_a_fix, massBalance.a_a_fix), "Fixed date components")
+        self.assertIsNone(massBalance.reference,                                              "No reference")
+
+    def testSpatialDaily(self):
+        '''
+        Test of the values of the daily spatial index mass balances of several stakes.
+        '''
+
+        massBalances = self._parse(MassBalanceIndexSpatialDailyReader, "clariden_cumulative.dat", "massBalanceIndexSpatialDailys",
+                                    lambda massBalance: (massBalance.name, massBalance.date))
+
+        self.assertEqual([("P1", datetime.date(2018, 10, 1)), ("P1", datetime.date(2018, 10, 2)), ("P2", datetime.date(2018, 10, 1))],
+                         [(massBalance.name, massBalance.date) for massBalance in massBalances], "Stake names and dates")
+        self.assertEqual([(0, 0, 0), (-4, 0, -4), (12, 12, 0)],
+                         [(massBalance.balance, massBalance.accumulation, massBalance.melt) for massBalance in massBalances], "Balance, accumulation and melt")
+        self.assertEqual([1, 1, 2], [massBalance.surface_type for massBalance in massBalances], "Surface types")
+        self.assertEqual([2.35, 3.1, -1.2], [massBalance.temp for massBalance in massBalances], "Temperatures")
+        self.assertEqual([0.0, 0.0, 12.4], [massBalance.precip_solid for massBalance in massBalances], "Solid precipitation")
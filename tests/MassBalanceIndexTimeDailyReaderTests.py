@@ -0,0 +1,173 @@
+'''
+Created on 18.10.2026
+
+@author: yvo
+'''
+import configparser
+import os
+import shutil
+import tempfile
+import unittest
+import uuid
+
+from dataflow.DataReaders.VawFileReaders.MassBalanceIndexTimeDailyReader import MassBalanceIndexTimeDailyReader
+from dataflow.DataObjects.Glacier import Glacier
+from dataflow.IngestionManifest import IngestionManifest
+
+from Helper import UnitTestHelper
+
+
+class MassBalanceIndexTimeDailyReaderTests(unittest.TestCase):
+    '''
+    Unit-test class for the VAW-file-based data-reader for mass balance index daily (_cum) files,
+    with focus on the append mode of growing files.
+    '''
+
+    _HEADER = (
+        "# Point mass balance ;  clariden  ;  141 ; is ;   P0\n"
+        "# Hyd.year ; year ; DOY ; Month ; Day ;  balance(b) ; accumulation(c) ; melt(a) ;  surface  ; T  ; Psolid\n"
+        "# (yyyy) ; (yyyy) ; (ddd) ; (mm) ; (dd) ;  (mm w.e.) ; (mm w.e.) ; (mm w.e.) ;  (-) ; (degC) ; (mm)\n"
+        "# VAW / ETHZ ; 2020.11.20 ; Huss and Bauder, 2008, Annals of Glaciology; www.glamos.ch\n")
+
+    def setUp(self):
+        '''
+        Setup of a temporary _cum file with three days of data.
+        '''
+
+        self._configuration = configparser.ConfigParser()
+        self._configuration.read(UnitTestHelper.getDataflowConfigurationFilePath())
+
+        self._glaciers = {"A50i/19": Glacier(uuid.uuid1(), 141, "A50i/19", "Clariden")}
+
+        self._directory = tempfile.mkdtemp()
+        self._dataFilePath = os.path.join(self._directory, "clariden_P0_cum.dat")
+
+        self._writeDataFile([1, 2, 3])
+
+    def tearDown(self):
+
+        shutil.rmtree(self._directory)
+
+    def _writeDataFile(self, days, mode="w"):
+
+        with open(self._dataFilePath, mode, encoding="latin-1") as dataFile:
+            if mode == "w":
+                dataFile.write(self._HEADER)
+            for day in days:
+                dataFile.write("2021 2020 {0} 10 {0} -{0}0 {0} -{0} 1 0.50 1.5\n".format(day))
+
+    def _parse(self, appendState=None):
+
+        reader = MassBalanceIndexTimeDailyReader(self._configuration, self._dataFilePath, self._glaciers)
+        reader.glacier.massBalanceIndexTimeDailys.clear()
+
+        if appendState != None:
+            reader.resumeAfter(appendState)
+
+        reader.parse()
+
+        return reader
+
+    def _days(self, reader):
+
+        return sorted([massBalance.date.day for massBalance in reader.glacier.massBalanceIndexTimeDailys.values()])
+
+    def testAppendedLines(self):
+        '''
+        Test of the parsing of the lines appended since a former parsing.
+        '''
+
+        reader = self._parse()
+
+        self.assertEqual([1, 2, 3], self._days(reader),                         "Dates of the full parsing")
+        self.assertEqual(IngestionManifest.contentHash(self._dataFilePath), reader.contentHash, "Content hash of the parsed file")
+        self.assertEqual("2020-10-03", reader.appendState["lastDate"],          "Last date of the full parsing")
+
+        self._writeDataFile([4, 5], "a")
+        reader = self._parse(reader.appendState)
+
+        self.assertTrue(reader.appendedOnly,                                    "Appended parsing")
+        self.assertEqual([4, 5], self._days(reader),                            "Dates of the appended lines")
+        self.assertEqual(os.path.getsize(self._dataFilePath), reader.appendState["offset"], "Offset after the appended parsing")
+        self.assertEqual("2020-10-05", reader.appendState["lastDate"],          "Last date of the appended parsing")
+
+        self.assertEqual(IngestionManifest.contentHash(self._dataFilePath), reader.contentHash, "Content hash of the grown file")
+
+        reader = self._parse(reader.appendState)
+
+        self.assertTrue(reader.appendedOnly,                                    "Appended parsing of an unchanged file")
+        self.assertEqual([], self._days(reader),                                "No new lines")
+
+    def testRewrittenFile(self):
+        '''
+        Test of the fallback to the full parsing of rewritten files.
+        '''
+
+        appendState = self._parse().appendState
+
+        # Rewritten history.
+        self._writeDataFile([1, 2, 7, 8])
+        reader = self._parse(appendState)
+
+        self.assertFalse(reader.appendedOnly,                                   "Full parsing of a rewritten file")
+        self.assertEqual([1, 2, 7, 8], self._days(reader),                      "Dates of the rewritten file")
+
+        # Same beginning but appended lines before the last date.
+        appendState = reader.appendState
+        self._writeDataFile([3], "a")
+        reader = self._parse(appendState)
+
+        self.assertFalse(reader.appendedOnly,                                   "Full parsing of appended lines with earlier dates")
+        self.assertEqual([1, 2, 3, 7, 8], self._days(reader),                   "Dates of the file with earlier appended dates")
+
+    def testBatches(self):
+        '''
+        Test of the parsing of the data lines batch by batch.
+        '''
+
+        reader = MassBalanceIndexTimeDailyReader(self._configuration, self._dataFilePath, self._glaciers)
+        reader.glacier.massBalanceIndexTimeDailys.clear()
+
+        batches = list(reader.iterBatches(2))
+
+        self.assertEqual([2, 1], [len(batch) for batch in batches],             "Number of records per batch")
+        self.assertEqual(3, batches[-1][0].date.day,                            "Date of the last batch")
+        self.assertEqual(3, reader.numberDataLines,                             "Number of data lines of all batches")
+        self.assertEqual("2020-10-03", reader.appendState["lastDate"],          "Last date of all batches")
+        self.assertEqual([], self._days(reader),                                "No records added to the glacier")
+
+    def testBatchesReadIncrementally(self):
+        '''
+        Test of the reading of the file batch by batch: A batch is handed out before the next lines are read.
+        '''
+
+        reader = MassBalanceIndexTimeDailyReader(self._configuration, self._dataFilePath, self._glaciers)
+
+        batches = reader.iterBatches(1)
+        next(batches)
+
+        self.assertLess(reader.bytesRead, os.path.getsize(self._dataFilePath),  "File not read entirely after the first batch")
+
+        self.assertEqual(2, len(list(batches)),                                 "Number of the remaining batches")
+        self.assertEqual(os.path.getsize(self._dataFilePath), reader.bytesRead, "File read once after all batches")
+        self.assertEqual(os.path.getsize(self._dataFilePath), reader.appendState["offset"], "Offset after all batches")
+
+    def testBatchesOfRewrittenFile(self):
+        '''
+        Test of the fallback to the full parsing of a rewritten file detected by the batches.
+        '''
+
+        appendState = self._parse().appendState
+
+        # Same beginning but appended lines before the last date.
+        self._writeDataFile([4, 2], "a")
+
+        reader = MassBalanceIndexTimeDailyReader(self._configuration, self._dataFilePath, self._glaciers)
+        reader.resumeAfter(appendState)
+
+        batches = list(reader.iterBatches(1))
+
+        self.assertFalse(reader.appendedOnly,                                   "Full parsing of the rewritten file")
+        self.assertEqual([4, 1, 2, 3, 4, 2], [batch[0].date.day for batch in batches], "Appended batch followed by all batches of the file")
+        self.assertEqual(5, reader.numberDataLines,                             "Number of data lines of the full parsing")
+        self.assertEqual("2020-10-04", reader.appendState["lastDate"],          "Last date of the full parsing")
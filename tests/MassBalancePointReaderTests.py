@@ -5,24 +5,88 @@ Created on 06.04.2021
 '''
 import unittest
 import configparser
+import uuid
 
 from dataflow.DataReaders.VawFileReaders.MassBalancePointReader import MassBalancePointReader
 from dataflow.DataObjects.Glacier import Glacier
-from dataflow.DataObjects.MassBalance import MassBalanceObservation
-from dataflow.DataObjects.MassBalance import MassBalanceFixDate
 
 from Helper import UnitTestHelper
 
 
-class MassBalanceReaderTests(unittest.TestCase):
+class MassBalancePointReaderTests(unittest.TestCase):
     '''
-    Unit-test class for the VAW-file-based data-reader for mass-balance observations.
+    Unit-test class for the VAW-file-based data-reader for point mass balances.
+
+    The expected values are the values of the reader before the declarative column schema.
     '''
 
-    _glaciers = dict()
+    def setUp(self):
+        '''
+        Setup of the configuration and the glacier of the test file.
+        '''
+
+        self._configuration = configparser.ConfigParser()
+        self._configuration.read(UnitTestHelper.getDataflowConfigurationFilePath())
+
+        self._glaciers = {"A50i/19": Glacier(uuid.uuid1(), 141, "A50i/19", "Clariden")}
+
+    def _parse(self):
+
+        reader = MassBalancePointReader(self._configuration, "./VawDataFiles/clariden_annual.dat", self._glaciers)
+        reader.glacier.massBalancePoints.clear()
+        reader.parse()
+
+        return sorted(reader.glacier.massBalancePoints.values(), key=lambda massBalancePoint: massBalancePoint.name)
+
+    def testParsingAnnual(self):
+        '''
+        Test of the values of a point mass balance of an annual file.
+        '''
+
+        massBalancePoints = self._parse()
+
+        self.assertEqual(3, len(massBalancePoints),                                           "Number of point mass balances")
+
+        massBalancePoint = massBalancePoints[0]
+
+        self.assertEqual("P1", massBalancePoint.name,                                         "Name of the stake")
+        self.assertEqual(1, massBalancePoint.observationType,                                 "Observation type of an annual file")
+        self.assertEqual("20180925", massBalancePoint.dateFrom,                               "Date from")
+        self.assertEqual("1200", massBalancePoint.timeFrom,                                   "Time from")
+        self.assertEqual("20190924", massBalancePoint.dateTo,                                 "Date to")
+        self.assertEqual("1030", massBalancePoint.timeTo,                                     "Time to")
+        self.assertEqual(364.0, massBalancePoint.period,                                      "Period")
+        self.assertEqual((712255.0, 186905.0, 2812.0),
+                         (massBalancePoint.latitude, massBalancePoint.longitude, massBalancePoint.altitude), "Position")
+        self.assertEqual((-245, 900, -2205),
+                         (massBalancePoint.massbalance_raw, massBalancePoint.density, massBalancePoint.massbalance_we), "Mass balance")
+        self.assertEqual((150, 50, 90),
+                         (massBalancePoint.massbalance_error, massBalancePoint.reading_error, massBalancePoint.density_error), "Errors")
+        self.assertEqual("glrep", massBalancePoint.source,                                    "Source")
+
+    def testUnknownValues(self):
+        '''
+        Test of the conversion of the unknown qualities and types (9) into 0.
+        '''
+
+        massBalancePoint = self._parse()[1]
+
+        self.assertEqual(0, massBalancePoint.dateAccuracy,                                    "Unknown date accuracy")
+        self.assertEqual(0, massBalancePoint.positionAccuracy,                                "Unknown position accuracy")
+        self.assertEqual(0, massBalancePoint.densityAccuracy,                                 "Unknown density accuracy")
+        self.assertEqual(0, massBalancePoint.measurement_quality,                             "Unknown measurement quality")
+        self.assertEqual(0, massBalancePoint.measurement_type,                                "Unknown measurement type")
+        self.assertEqual(720, massBalancePoint.massbalance_we,                                "Mass balance")
 
-    _vawDataFiles = []
+    def testMissingDateFrom(self):
+        '''
+        Test of the replacement of a missing date from by the date to and of short times by noon.
+        '''
 
-    _configuration = configparser.ConfigParser()
+        massBalancePoint = self._parse()[2]
 
-    _DATAFLOW_CONFIGURATION = UnitTestHelper.getDataflowConfigurationFilePath()
\ No newline at end of file
+        self.assertEqual("20190501", massBalancePoint.dateFrom,                               "Date to used as date from")
+        self.assertEqual("1200", massBalancePoint.timeFrom,                                   "Missing time from")
+        self.assertEqual("1200", massBalancePoint.timeTo,                                     "Time to without hours")
+        self.assertEqual(0.0, massBalancePoint.period,                                        "Period")
+        self.assertEqual((2, 3), (massBalancePoint.measurement_quality, massBalancePoint.measurement_type), "Known quality and type")
@@ -5,11 +5,13 @@ Created on 06.07.2018
 '''
 import unittest
 import configparser
+import datetime
 
 from dataflow.DataReaders.VawFileReaders.MassBalanceReader import MassBalanceReader
 from dataflow.DataObjects.Glacier import Glacier
 from dataflow.DataObjects.MassBalance import MassBalanceObservation
 from dataflow.DataObjects.MassBalance import MassBalanceFixDate
+from dataflow.DataObjects.Enumerations.DateEnumerations import DateQualityTypeEnum
 
 from Helper import UnitTestHelper
 
@@ -89,6 +91,23 @@ class MassBalanceReaderTests(unittest.TestCase):
         for massbalance in self._massBalanceParsers[1].glacier.massBalances.values():
             self.assertTrue(isinstance(massbalance, MassBalanceFixDate),                 "Test of mass-balance type")
 
+    def testDecodingDates(self):
+        '''
+        Test method for the decoding of single dates and entire date columns incl. estimated dates.
+        '''
+        
+        massBalanceParser = self._massBalanceParsers[0]
+        
+        self.assertEqual((datetime.date(2020, 9, 1), DateQualityTypeEnum.Estimated), massBalanceParser._reformateDateYyyyMmDd("20200000"), "Estimated date")
+        self.assertEqual((datetime.date(2020, 9, 30), DateQualityTypeEnum.Precisely), massBalanceParser._reformateDateYyyyMmDd("20200930"), "Precisely known date")
+        
+        dates, qualities, isValid = massBalanceParser._decodeDatesYyyyMmDd(["20200930", "20200000", "20190931"])
+        
+        self.assertEqual([datetime.date(2020, 9, 30), datetime.date(2020, 9, 1), None], dates.tolist(), "Dates of the column")
+        self.assertEqual([DateQualityTypeEnum.Precisely.value, DateQualityTypeEnum.Estimated.value, DateQualityTypeEnum.NotDefinedUnknown.value], 
+                         qualities.tolist(),                                                    "Qualities of the dates")
+        self.assertEqual([True, True, False], isValid.tolist(),                                 "Valid dates")
+
 
 if __name__ == "__main__":
     #import sys;sys.argv = ['', 'Test.testName']
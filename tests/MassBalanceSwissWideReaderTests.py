@@ -0,0 +1,109 @@
+'''
+Created on 18.10.2026
+
+@author: yvo
+'''
+import math
+import os
+import shutil
+import tempfile
+import unittest
+import uuid
+
+from dataflow.DataReaders.VawFileReaders.MassBalanceSwissWideReader import MassBalanceSwissWideReader
+from dataflow.DataReaders.Exceptions.InvalidDataFileError import InvalidDataFileError
+from dataflow.DataObjects.Glacier import Glacier
+
+
+class MassBalanceSwissWideReaderTests(unittest.TestCase):
+    '''
+    Unit-test class for the reader of the swiss wide mass balance extrapolation files.
+    '''
+
+    def setUp(self):
+        '''
+        Setup of the three swiss wide files of two glaciers in a temporary directory.
+        '''
+
+        self._clariden = Glacier(uuid.uuid1(), 141, "A50i/19", "Clariden")
+        self._adler = Glacier(uuid.uuid1(), 16, "B56/03", "Adler")
+        self._glaciers = {self._clariden.pkSgi: self._clariden, self._adler.pkSgi: self._adler}
+
+        self._directory = tempfile.mkdtemp()
+
+        self._fullFileNames = [
+            self._writeFile("area.dat",   "Area in km2", ["A50i/19 5.1 5.0 4.9", "B56/03 1.2 1.1"]),
+            self._writeFile("mb_evo.dat", "Mass balance in m w.e.", ["A50i/19 -0.5 NaN -0.7", "B56/03 -0.2 -0.3"]),
+            self._writeFile("vol_evo.dat", "Volume change in km3", ["A50i/19 -0.01 -0.02 -0.03", "B56/03 0.0 -0.001"])]
+
+    def tearDown(self):
+
+        shutil.rmtree(self._directory)
+
+    def _writeFile(self, fileName, title, dataLines):
+
+        fullFileName = os.path.join(self._directory, fileName)
+
+        with open(fullFileName, "w", encoding="latin-1") as swissWideFile:
+            swissWideFile.write("#  {0} for individual Swiss glaciers\n".format(title))
+            swissWideFile.write("#  SGI-ID 2020  2021  2022\n")
+            for dataLine in dataLines:
+                swissWideFile.write(dataLine + "\n")
+
+        return fullFileName
+
+    def testMatrix(self):
+        '''
+        Test of the aligned matrices of the three files.
+        '''
+
+        matrix = MassBalanceSwissWideReader(None, self._fullFileNames, self._glaciers).parse()
+
+        self.assertEqual(["A50i/19", "B56/03"], matrix.sgiIds,                     "SGI-IDs of the rows")
+        self.assertEqual([2020, 2021, 2022], matrix.years.tolist(),                "Years of the columns")
+        self.assertEqual([self._clariden.pk, self._adler.pk], matrix.glacierPks,   "Glaciers of the rows")
+        self.assertEqual((2, 3), matrix.areas.shape,                               "Shape of the matrices")
+        self.assertEqual(5, len(matrix),                                           "Number of values given by the files")
+        self.assertTrue(math.isnan(matrix.massBalanceEvolutions[0, 1]),            "Missing value of the file")
+        self.assertTrue(math.isnan(matrix.areas[1, 2]),                            "Padding of a short line")
+
+    def testLazyObjects(self):
+        '''
+        Test of the objects created on demand from the matrices.
+        '''
+
+        matrix = MassBalanceSwissWideReader(None, self._fullFileNames, self._glaciers).parse()
+
+        massBalanceSwissWides = list(matrix.iterMassBalanceSwissWides())
+
+        self.assertEqual(5, len(massBalanceSwissWides),                           "Number of objects")
+
+        massBalanceSwissWide = massBalanceSwissWides[-1]
+        self.assertEqual("B56/03", massBalanceSwissWide.sgi_id,                    "SGI-ID of the last object")
+        self.assertEqual(self._adler.pk, massBalanceSwissWide.fk_glacier,          "Glacier of the last object")
+        self.assertEqual(2021, massBalanceSwissWide.year,                          "Year of the last object")
+        self.assertEqual(1.1, massBalanceSwissWide.area,                           "Area of the last object")
+        self.assertEqual(-0.3, massBalanceSwissWide.mb_evolution,                  "Mass balance evolution of the last object")
+        self.assertEqual(-0.001, massBalanceSwissWide.vol_evolution,               "Volume evolution of the last object")
+
+    def testMisalignedFiles(self):
+        '''
+        Test of the rejection of files with different glaciers.
+        '''
+
+        self._fullFileNames[2] = self._writeFile("vol_evo.dat", "Volume change in km3", ["B56/03 0.0 -0.001", "A50i/19 -0.01 -0.02 -0.03"])
+
+        reader = MassBalanceSwissWideReader(None, self._fullFileNames, self._glaciers)
+
+        self.assertRaises(InvalidDataFileError, reader.parse)
+
+    def testLineLengthMismatch(self):
+        '''
+        Test of the rejection of evolution lines with another number of values than the line of the area file.
+        '''
+
+        self._fullFileNames[1] = self._writeFile("mb_evo.dat", "Mass balance in m w.e.", ["A50i/19 -0.5 NaN", "B56/03 -0.2 -0.3"])
+
+        reader = MassBalanceSwissWideReader(None, self._fullFileNames, self._glaciers)
+
+        self.assertRaises(InvalidDataFileError, reader.parse)
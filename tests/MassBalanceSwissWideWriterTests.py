@@ -0,0 +1,76 @@
+'''
+Created on 18.10.2026
+
+@author: yvo
+'''
+import unittest
+import uuid
+
+import numpy
+
+from dataflow.DataWriters.DatabaseWriters.MassBalanceSwissWideWriter import MassBalanceSwissWideWriter
+from dataflow.DataObjects.MassBalanceSwissWide import MassBalanceSwissWide
+from dataflow.DataObjects.MassBalanceSwissWideMatrix import MassBalanceSwissWideMatrix
+
+
+class RowsCapturingWriter(MassBalanceSwissWideWriter):
+    '''
+    Writer keeping the rows of writeMatrix() instead of writing them into the database.
+    '''
+
+    def _writeRows(self, rows):
+
+        self.rows = rows
+
+
+class MassBalanceSwissWideWriterTests(unittest.TestCase):
+    '''
+    Unit-test class for the rows of the swiss wide mass balance writer, without database.
+    '''
+
+    def testMatrixRows(self):
+        '''
+        Test of the rows of the cells of the matrices with one identifier per cell.
+        '''
+
+        glacierPks = [uuid.uuid1(), uuid.uuid1()]
+        nan = float("nan")
+
+        matrix = MassBalanceSwissWideMatrix(
+            ["A50i/19", "B56/03"], glacierPks, numpy.array([2020, 2021, 2022]), numpy.array([3, 2]),
+            numpy.array([[5.1, 5.0, 4.9], [1.2, 1.1, nan]]),
+            numpy.array([[-0.5, nan, -0.7], [-0.2, -0.3, nan]]),
+            numpy.array([[-0.01, -0.02, -0.03], [0.0, -0.001, nan]]))
+
+        writer = RowsCapturingWriter(None)
+        writer.writeMatrix(matrix)
+
+        self.assertEqual(5, len(writer.rows),                                                  "One row per cell given by the files")
+        self.assertEqual(5, len(set(row[0] for row in writer.rows)),                           "Unique identifiers")
+        self.assertTrue(all(row[0].version == 1 for row in writer.rows),                       "Time-based identifiers")
+        self.assertEqual([glacierPks[1], 2021, 1.1, -0.3, -0.001], writer.rows[-1][1:],        "Values of the last cell")
+
+    def testRecordsArray(self):
+        '''
+        Test of the rows of the observations given as NumPy array instead of a list.
+        '''
+
+        glacierPk = uuid.uuid1()
+        massBalanceSwissWides = numpy.array(
+            [MassBalanceSwissWide("A50i/19", glacierPk, year, 5.0, -0.5, -0.01) for year in [2020, 2021]], dtype=object)
+
+        rows = RowsCapturingWriter(None)._recordsToRows(None, massBalanceSwissWides)
+
+        self.assertEqual([2020, 2021], [row[2] for row in rows],                               "One row per observation")
+        self.assertTrue(all(row[0] != None for row in rows),                                   "Identifiers of the new observations")
+
+    def testDuplicateKeyCondition(self):
+        '''
+        Test of the anti-join condition comparing only the columns which can be NULL with NULL values.
+        '''
+
+        keyCondition = RowsCapturingWriter(None)._keyCondition(["fk_glacier", "year"], {"year", "area"})
+
+        self.assertEqual(
+            "stored.fk_glacier = candidate.fk_glacier AND (stored.year = candidate.year OR (stored.year IS NULL AND candidate.year IS NULL))",
+            keyCondition,                                                                      "Condition of the key columns")
@@ -0,0 +1,235 @@
+'''
+Created on 18.10.2026
+
+@author: yvo
+'''
+import contextlib
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from dataflow.ParallelIngestionRunner import ParallelIngestionRunner
+from dataflow.IngestionManifest import IngestionManifest
+from dataflow.DataObjects.Exceptions.GlacierNotFoundError import GlacierNotFoundError
+
+
+class StubGlacier(object):
+    '''
+    Glacier of the stub reader with a collection of the lines of a file.
+    '''
+
+    def __init__(self):
+
+        self.lines = dict()
+
+
+class StubReader(object):
+    '''
+    Reader adding each line of a file to the glacier and hashing the bytes parsed. A file with the line "unknown"
+    raises a handled GlacierNotFoundError, a file with the line "broken" raises a not handled ValueError. A file
+    with the line "rewrite" is rewritten with the same size while parsing.
+    '''
+
+    def __init__(self, config, fullFileName, glaciers):
+
+        self.fullFileName = fullFileName
+        self.glacier = glaciers["stub"]
+        self.contentHash = None
+
+    def parse(self):
+
+        with open(self.fullFileName, "rb") as dataFile:
+            content = dataFile.read()
+
+        self.contentHash = hashlib.sha1(content).hexdigest()
+
+        for line in content.decode().split():
+
+            if line == "unknown":
+                raise GlacierNotFoundError("Glacier of {0} not found".format(os.path.basename(self.fullFileName)))
+            if line == "broken":
+                raise ValueError("Broken line")
+            if line == "rewrite":
+                with open(self.fullFileName, "w") as rewrittenFile:
+                    rewrittenFile.write("REWRITE\n")
+
+            self.glacier.lines[line] = line
+
+
+class StubWriter(object):
+    '''
+    Writer keeping the lines of the written glaciers instead of writing them into the database. A glacier with
+    the line "fail" raises a RuntimeError.
+    '''
+
+    written = list()
+    released = 0
+
+    def __init__(self, accessConfiguration):
+
+        self.output = None
+
+    def write(self, glacier):
+
+        if "fail" in glacier.lines:
+            raise RuntimeError("Writing failed")
+
+        print("-> {0} lines written.".format(len(glacier.lines)), file=self.output)
+
+        StubWriter.written.append(sorted(glacier.lines))
+
+    def releaseConnection(self):
+
+        StubWriter.released += 1
+
+
+class ParallelIngestionRunnerTests(unittest.TestCase):
+    '''
+    Unit-test class for the runner of the insertDatabase* scripts with a stub reader and a stub writer.
+    '''
+
+    def setUp(self):
+        '''
+        Setup of a temporary data directory with three data files and of the manifest file.
+        '''
+
+        self._directory = tempfile.mkdtemp()
+        self._dataDirectory = os.path.join(self._directory, "data")
+        os.mkdir(self._dataDirectory)
+
+        self._writeDataFile("a.dat", "a1 a2\n")
+        self._writeDataFile("b.dat", "b1\n")
+        self._writeDataFile("c.dat", "c1 c2 c3\n")
+
+        self._manifestFilePath = os.path.join(self._directory, IngestionManifest.DEFAULT_FILE_NAME)
+
+        StubWriter.written = list()
+        StubWriter.released = 0
+
+    def tearDown(self):
+
+        shutil.rmtree(self._directory)
+
+    def _writeDataFile(self, fileName, content):
+
+        with open(os.path.join(self._dataDirectory, fileName), "w") as dataFile:
+            dataFile.write(content)
+
+    def _run(self, jobs=1, manifest=None, **callbacks):
+
+        runner = ParallelIngestionRunner(
+            None, StubReader, "lines", StubWriter, os.path.join(self._directory, "missing.cfg"),
+            jobs=jobs, handledErrors=(GlacierNotFoundError,), manifest=manifest)
+
+        output = io.StringIO()
+
+        with contextlib.redirect_stdout(output):
+            runner.run(self._dataDirectory, {"stub": StubGlacier()}, **callbacks)
+
+        return output.getvalue()
+
+    def testSequential(self):
+        '''
+        Test of the parsing and writing of the files one after the other with the callbacks of each file.
+        '''
+
+        calls = list()
+
+        self._run(
+            starting=lambda inputFilePath: calls.append(("starting", os.path.basename(inputFilePath))),
+            parsed=lambda reader: calls.append(("parsed", os.path.basename(reader.fullFileName))),
+            written=lambda reader, writer: calls.append(("written", os.path.basename(reader.fullFileName))))
+
+        self.assertEqual([["a1", "a2"], ["b1"], ["c1", "c2", "c3"]], sorted(StubWriter.written),  "Lines of each file written once")
+        self.assertEqual(3, StubWriter.released,                                                  "Connection of each writer released")
+
+        for fileName in ["a.dat", "b.dat", "c.dat"]:
+            self.assertEqual(["starting", "parsed", "written"],
+                             [call for call, callFileName in calls if callFileName == fileName],  "Callbacks of " + fileName)
+
+    def testParallel(self):
+        '''
+        Test of the parsing by worker processes and the writing by threads with the output collected per file.
+        '''
+
+        output = self._run(jobs=3)
+
+        self.assertEqual([["a1", "a2"], ["b1"], ["c1", "c2", "c3"]], sorted(StubWriter.written),  "Lines of each file written once")
+        self.assertEqual(3, StubWriter.released,                                                  "Connection of each writer released")
+        self.assertEqual(["-> 1 lines written.", "-> 2 lines written.", "-> 3 lines written."],
+                         sorted(output.splitlines()),                                             "Complete output lines of the writers")
+
+    def testWriterThreads(self):
+        '''
+        Test of the limitation of the writing threads to the maximum number of connections of the pool.
+        '''
+
+        runner = ParallelIngestionRunner(None, StubReader, "lines", StubWriter, os.path.join(self._directory, "missing.cfg"), jobs=24)
+
+        self.assertEqual(24, runner.jobs,                                                         "Parsing processes")
+        self.assertEqual(10, runner.writerThreads,                                                "Writing threads of the default pool")
+
+    def testManifestSkip(self):
+        '''
+        Test of the skipping of the files recorded unchanged in the manifest.
+        '''
+
+        self._run(manifest=IngestionManifest(self._manifestFilePath))
+
+        manifest = IngestionManifest(self._manifestFilePath)
+
+        self.assertEqual(3, len(manifest),                                                        "Recorded files")
+        self.assertEqual(3, manifest.entry("lines", os.path.join(self._dataDirectory, "c.dat"))["records"], "Recorded number of records")
+
+        StubWriter.written = list()
+        self._writeDataFile("b.dat", "b1 b2\n")
+
+        output = self._run(manifest=manifest)
+
+        self.assertEqual([["b1", "b2"]], StubWriter.written,                                     "Only the changed file written")
+        self.assertIn("2 of 3 files unchanged", output,                                          "Skipped files reported")
+
+    def testFileChangedWhileParsing(self):
+        '''
+        Test of the content hash of the parsed bytes: A file rewritten with the same size during its import is imported again.
+        '''
+
+        self._writeDataFile("d.dat", "rewrite\n")
+        contentHash = IngestionManifest.contentHash(os.path.join(self._dataDirectory, "d.dat"))
+
+        manifest = IngestionManifest(self._manifestFilePath)
+        self._run(manifest=manifest)
+
+        self.assertEqual(contentHash, manifest.entry("lines", os.path.join(self._dataDirectory, "d.dat"))["hash"], "Hash of the parsed content")
+
+        StubWriter.written = list()
+        self._run(manifest=manifest)
+
+        self.assertEqual([["REWRITE"]], StubWriter.written,                                      "Rewritten file imported again")
+
+    def testErrorPropagation(self):
+        '''
+        Test of the handled errors skipping a file and of the other errors aborting the run.
+        '''
+
+        self._writeDataFile("d.dat", "unknown\n")
+
+        output = self._run()
+
+        self.assertEqual(3, len(StubWriter.written),                                             "Files without error written")
+        self.assertIn("Glacier of d.dat not found", output,                                      "Message of the handled error")
+
+        for jobs in [1, 2]:
+
+            self._writeDataFile("d.dat", "fail\n")
+
+            with self.assertRaises(RuntimeError):
+                self._run(jobs=jobs)
+
+            self._writeDataFile("d.dat", "broken\n")
+
+            with self.assertRaises(ValueError if jobs == 1 else RuntimeError):
+                self._run(jobs=jobs)
@@ -0,0 +1,57 @@
+'''
+Created on 18.10.2026
+
+@author: yvo
+'''
+import unittest
+import uuid
+
+from dataflow.DataObjects.Glamos import GlamosData
+from dataflow.DataObjects.MassBalanceIndexTimeDaily import MassBalanceIndexTimeDaily
+from dataflow.DataObjects.UuidAllocator import UuidAllocator
+
+
+class UuidAllocatorTests(unittest.TestCase):
+    '''
+    Unit-test class for the batched allocation and the lazy creation of the identifiers of the data objects.
+    '''
+
+    def testAllocate(self):
+        '''
+        Test of the UUIDs of two subsequent batches.
+        '''
+
+        firstBatch = UuidAllocator.allocate(100)
+        secondBatch = UuidAllocator.allocate(50)
+
+        self.assertEqual(150, len(set(firstBatch + secondBatch)),                      "Unique identifiers")
+        self.assertEqual({1}, set([pk.version for pk in firstBatch]),                 "Time-based identifiers")
+        self.assertEqual(uuid.RFC_4122, firstBatch[0].variant,                        "Variant of the identifiers")
+        self.assertEqual(uuid.getnode(), firstBatch[0].node,                          "Node of the host")
+        self.assertLess(firstBatch[-1].time, secondBatch[0].time,                     "Not overlapping batches")
+        self.assertEqual([], UuidAllocator.allocate(0),                               "Empty batch")
+
+    def testLazyPk(self):
+        '''
+        Test of the identifier created on the first access.
+        '''
+
+        massBalanceIndexTimeDaily = MassBalanceIndexTimeDaily()
+        pk = uuid.uuid1()
+
+        self.assertIsNotNone(massBalanceIndexTimeDaily.pk,                            "Identifier created on access")
+        self.assertEqual(massBalanceIndexTimeDaily.pk, massBalanceIndexTimeDaily.pk,  "Stable identifier")
+        self.assertEqual(pk, MassBalanceIndexTimeDaily(pk).pk,                        "Given identifier")
+
+    def testAssignPks(self):
+        '''
+        Test of the identifiers assigned to a batch of data objects.
+        '''
+
+        pk = uuid.uuid1()
+        massBalanceIndexTimeDailys = [MassBalanceIndexTimeDaily(pk)] + [MassBalanceIndexTimeDaily() for i in range(9)]
+
+        GlamosData.assignPks(massBalanceIndexTimeDailys)
+
+        self.assertEqual(pk, massBalanceIndexTimeDailys[0].pk,                        "Given identifier kept")
+        self.assertEqual(10, len(set([m.pk for m in massBalanceIndexTimeDailys])),    "Unique identifiers")